@@ -26,6 +26,7 @@ from nexus.db.session import get_session_factory
 from nexus.jobs.registry import get_default_registry, get_task_contract_digest
 from nexus.jobs.worker import JobWorker
 from nexus.logging import configure_logging, get_logger
+from nexus.metrics import start_metrics_server
 from nexus.runtime_health import get_runtime_identity
 from nexus.services.rate_limit import RateLimiter, set_rate_limiter
 
@@ -134,6 +135,11 @@ def main() -> None:
     worker = create_worker(
         successful_cycle_callback=publisher.publish if publisher is not None else None
     )
+    if settings.metrics_enabled and settings.worker_metrics_port is not None:
+        start_metrics_server(
+            port=settings.worker_metrics_port,
+            token=cast(str, settings.metrics_token),
+        )
     logger.info(
         "postgres_worker_started",
         worker_id=worker.worker_id,
@@ -0,0 +1,111 @@
+"""Add incrementally maintained Consumption activity slot rollups.
+
+Revision ID: 0212
+Revises: 0211
+Create Date: 2026-10-18
+
+Stats reads are snapshots bounded by ``created_at <= as_of``. A rollup slot sums
+every span folded into it, so a slot that absorbed a span after the snapshot's
+``as_of`` cannot answer that snapshot. ``folded_through`` is the latest folded
+span's ``created_at``; reads use a slot only when it is at or before ``as_of``
+and replay the slot's spans otherwise.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0212"
+down_revision: str | Sequence[str] | None = "0211"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE consumption_activity_rollups (
+            user_id                     uuid        NOT NULL,
+            media_id                    uuid        NOT NULL,
+            modality                    text        NOT NULL,
+            device_id                   text        NOT NULL,
+            device_class                text        NOT NULL,
+            slot_start                  timestamptz NOT NULL,
+            active_ms                   numeric     NOT NULL,
+            forward_word_position       bigint      NOT NULL,
+            forward_media_position_ms   bigint      NOT NULL,
+            first_observed_at           timestamptz NOT NULL,
+            last_observed_at            timestamptz NOT NULL,
+            folded_through              timestamptz NOT NULL,
+
+            PRIMARY KEY (user_id, slot_start, media_id, modality, device_id, device_class),
+            CONSTRAINT fk_consumption_activity_rollups_user
+                FOREIGN KEY (user_id) REFERENCES users(id),
+            CONSTRAINT fk_consumption_activity_rollups_media
+                FOREIGN KEY (media_id) REFERENCES media(id),
+            CONSTRAINT ck_consumption_activity_rollups_slot_aligned
+                CHECK (
+                    slot_start = date_bin(
+                        interval '15 minutes', slot_start, timestamptz '1970-01-01 00:00:00+00'
+                    )
+                )
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX ix_consumption_activity_rollups_user_device_slot
+            ON consumption_activity_rollups (user_id, device_id, slot_start)
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX ix_consumption_activity_rollups_media
+            ON consumption_activity_rollups (media_id)
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO consumption_activity_rollups (
+            user_id, media_id, modality, device_id, device_class, slot_start,
+            active_ms, forward_word_position, forward_media_position_ms,
+            first_observed_at, last_observed_at, folded_through
+        )
+        SELECT s.user_id, s.media_id, s.modality, s.device_id, s.device_class, slot.slot_start,
+               sum(extract(epoch FROM
+                   LEAST(s.ended_at, slot.slot_start + interval '15 minutes')
+                   - GREATEST(s.occurred_at, slot.slot_start)
+               ) * 1000),
+               sum(CASE WHEN slot.slot_start = s.start_slot
+                        THEN greatest(0, coalesce(s.word_end - s.word_start, 0)) ELSE 0 END),
+               sum(CASE WHEN slot.slot_start = s.start_slot
+                        THEN greatest(0, coalesce(
+                            s.media_position_end_ms - s.media_position_start_ms, 0
+                        )) ELSE 0 END),
+               min(GREATEST(s.occurred_at, slot.slot_start)),
+               max(LEAST(s.ended_at, slot.slot_start + interval '15 minutes')),
+               max(s.created_at)
+        FROM (
+            SELECT spans.*,
+                   spans.occurred_at + spans.duration_ms * interval '1 millisecond' AS ended_at,
+                   date_bin(
+                       interval '15 minutes', spans.occurred_at,
+                       timestamptz '1970-01-01 00:00:00+00'
+                   ) AS start_slot
+            FROM consumption_activity_spans spans
+        ) s
+        CROSS JOIN LATERAL generate_series(
+            s.start_slot,
+            date_bin(
+                interval '15 minutes', s.ended_at - interval '1 microsecond',
+                timestamptz '1970-01-01 00:00:00+00'
+            ),
+            interval '15 minutes'
+        ) slot(slot_start)
+        GROUP BY s.user_id, s.media_id, s.modality, s.device_id, s.device_class, slot.slot_start
+        """
+    )
+
+
+def downgrade() -> None:
+    raise NotImplementedError("0212 is a hard cutover migration and has no downgrade path")
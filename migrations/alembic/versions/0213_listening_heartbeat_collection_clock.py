@@ -0,0 +1,28 @@
+"""Track when a listening heartbeat last advanced the viewer's collections.
+
+Revision ID: 0213
+Revises: 0212
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0213"
+down_revision: str | Sequence[str] | None = "0212"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE podcast_listening_states
+            ADD COLUMN collections_bumped_at timestamptz NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    raise NotImplementedError("0213 is a hard cutover migration and has no downgrade path")
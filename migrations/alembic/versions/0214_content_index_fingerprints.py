@@ -0,0 +1,52 @@
+"""Persist media content fingerprints on content index states.
+
+Revision ID: 0214
+Revises: 0213
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0214"
+down_revision: str | Sequence[str] | None = "0213"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE content_index_states
+            ADD COLUMN chunk_hashes jsonb NULL,
+            ADD COLUMN content_fingerprint text NULL
+        """
+    )
+    # Backfill the ordered per-chunk SHA-256 list so legacy media never re-read
+    # chunk text. content_fingerprint stays NULL until the next state write; the
+    # reader derives it from chunk_hashes in the meantime.
+    op.execute(
+        """
+        UPDATE content_index_states s
+        SET chunk_hashes = COALESCE(
+            (
+                SELECT jsonb_agg(
+                    jsonb_build_array(
+                        c.chunk_idx,
+                        encode(sha256(convert_to(c.chunk_text, 'UTF8')), 'hex')
+                    )
+                    ORDER BY c.chunk_idx
+                )
+                FROM content_chunks c
+                WHERE c.owner_kind = 'media' AND c.owner_id = s.owner_id
+            ),
+            '[]'::jsonb
+        )
+        WHERE s.owner_kind = 'media'
+        """
+    )
+
+
+def downgrade() -> None:
+    raise NotImplementedError("0214 is a hard cutover migration and has no downgrade path")
@@ -0,0 +1,65 @@
+"""Materialize per-fragment char counts and cumulative document offsets.
+
+Revision ID: 0215
+Revises: 0214
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0215"
+down_revision: str | Sequence[str] | None = "0214"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE fragments
+            ADD COLUMN canonical_text_char_count integer
+                GENERATED ALWAYS AS (char_length(canonical_text)) STORED,
+            ADD COLUMN document_word_start bigint NOT NULL DEFAULT 0,
+            ADD COLUMN document_char_start bigint NOT NULL DEFAULT 0
+        """
+    )
+    op.execute(
+        """
+        ALTER TABLE fragments
+            ADD CONSTRAINT ck_fragments_document_offsets_nonnegative
+            CHECK (document_word_start >= 0 AND document_char_start >= 0)
+        """
+    )
+    # Fragment writers replace or append a media's whole fragment set and then
+    # refresh these prefix sums once; backfill every existing set the same way.
+    op.execute(
+        """
+        UPDATE fragments f
+        SET document_word_start = o.document_word_start,
+            document_char_start = o.document_char_start
+        FROM (
+            SELECT
+                id,
+                COALESCE(
+                    SUM(canonical_text_word_count) OVER prior_fragments, 0
+                ) AS document_word_start,
+                COALESCE(
+                    SUM(canonical_text_char_count) OVER prior_fragments, 0
+                ) AS document_char_start
+            FROM fragments
+            WINDOW prior_fragments AS (
+                PARTITION BY media_id
+                ORDER BY idx
+                ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING
+            )
+        ) o
+        WHERE f.id = o.id
+          AND (o.document_word_start, o.document_char_start) <> (0, 0)
+        """
+    )
+
+
+def downgrade() -> None:
+    raise NotImplementedError("0215 is a hard cutover migration and has no downgrade path")
@@ -0,0 +1,54 @@
+"""Track callback-delivered provider requests on podcast transcription jobs.
+
+Revision ID: 0216
+Revises: 0215
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0216"
+down_revision: str | Sequence[str] | None = "0215"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE podcast_transcription_jobs
+            ADD COLUMN provider_request_id text NULL,
+            ADD COLUMN provider_diarize boolean NULL,
+            ADD COLUMN provider_submitted_at timestamptz NULL,
+            ADD COLUMN provider_result jsonb NULL,
+            ADD COLUMN provider_result_received_at timestamptz NULL,
+            ADD CONSTRAINT ck_podcast_transcription_jobs_provider_request CHECK (
+                (
+                    provider_request_id IS NULL
+                    AND provider_diarize IS NULL
+                    AND provider_submitted_at IS NULL
+                    AND provider_result IS NULL
+                    AND provider_result_received_at IS NULL
+                )
+                OR (
+                    provider_request_id IS NOT NULL
+                    AND provider_diarize IS NOT NULL
+                    AND provider_submitted_at IS NOT NULL
+                    AND (provider_result IS NULL) = (provider_result_received_at IS NULL)
+                )
+            )
+        """
+    )
+    op.execute(
+        """
+        CREATE UNIQUE INDEX uq_podcast_transcription_jobs_provider_request_id
+            ON podcast_transcription_jobs (provider_request_id)
+            WHERE provider_request_id IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    raise NotImplementedError("0216 is a hard cutover migration and has no downgrade path")
@@ -0,0 +1,53 @@
+"""Replace the content-embedding IVFFlat index with HNSW.
+
+Revision ID: 0217
+Revises: 0216
+Create Date: 2026-10-18
+
+IVFFlat was built once (0069) with ``lists = 100`` over whatever rows existed
+then; its recall drifts as the corpus grows and it has no iterative scan, so a
+viewer-filtered ``ORDER BY ... LIMIT`` can come back short. HNSW needs no
+training data and pgvector >= 0.8 can keep walking the graph until enough rows
+pass the filter (``hnsw.iterative_scan``).
+
+Build parameters come from ``CONTENT_EMBEDDINGS_HNSW_M`` (default 16) and
+``CONTENT_EMBEDDINGS_HNSW_EF_CONSTRUCTION`` (default 64); the restart-safe
+concurrent build is shared with 0218 (``nexus.db.concurrent_index``). Raise
+``maintenance_work_mem`` for the migration session on large corpora: a graph
+that does not fit is built much more slowly.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0217"
+down_revision: str | Sequence[str] | None = "0216"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_HNSW_INDEX_NAME = "ix_content_embeddings_vector_hnsw"
+_IVFFLAT_INDEX_NAME = "ix_content_embeddings_vector_ann"
+
+
+def upgrade() -> None:
+    from nexus.db.concurrent_index import build_hnsw_index_concurrently, hnsw_build_parameters
+
+    m, ef_construction = hnsw_build_parameters("0217")
+    # Concurrent build and drop keep embedding writes available; the old
+    # IVFFlat index is dropped only once the HNSW index is valid.
+    build_hnsw_index_concurrently(
+        op,
+        revision="0217",
+        index_name=_HNSW_INDEX_NAME,
+        column="embedding_vector",
+        opclass="vector_cosine_ops",
+        m=m,
+        ef_construction=ef_construction,
+    )
+    with op.get_context().autocommit_block():
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {_IVFFLAT_INDEX_NAME}")
+
+
+def downgrade() -> None:
+    raise RuntimeError("0217 is a hard cutover migration and has no downgrade path")
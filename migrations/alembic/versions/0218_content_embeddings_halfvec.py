@@ -0,0 +1,51 @@
+"""Add a half-precision shadow of content embeddings with its own HNSW index.
+
+Revision ID: 0218
+Revises: 0217
+Create Date: 2026-10-18
+
+``embedding_halfvec`` holds ``embedding_vector`` at 16-bit precision; its HNSW
+index is half the size of the full-precision one, so the quantized candidate
+stage of hybrid search (``SEARCH_QUANTIZED_CANDIDATES``) stays in
+shared_buffers on large corpora. The column starts NULL: new embeddings write
+both columns, and ``content_embedding_halfvec_backfill_job`` fills existing
+rows in id order. Adding a nullable column without a default is a catalog-only
+change, and the index is built while the column is still empty, so neither
+step rewrites or long-locks the table.
+
+Build parameters and the restart-safe concurrent build are shared with 0217
+(``nexus.db.concurrent_index``).
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0218"
+down_revision: str | Sequence[str] | None = "0217"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_HNSW_INDEX_NAME = "ix_content_embeddings_halfvec_hnsw"
+
+
+def upgrade() -> None:
+    from nexus.db.concurrent_index import build_hnsw_index_concurrently, hnsw_build_parameters
+
+    m, ef_construction = hnsw_build_parameters("0218")
+    op.execute(
+        "ALTER TABLE content_embeddings ADD COLUMN IF NOT EXISTS embedding_halfvec halfvec(256)"
+    )
+    build_hnsw_index_concurrently(
+        op,
+        revision="0218",
+        index_name=_HNSW_INDEX_NAME,
+        column="embedding_halfvec",
+        opclass="halfvec_cosine_ops",
+        m=m,
+        ef_construction=ef_construction,
+    )
+
+
+def downgrade() -> None:
+    raise RuntimeError("0218 is a hard cutover migration and has no downgrade path")
@@ -0,0 +1,364 @@
+"""Store lexical-search tsvectors and index them with GIN.
+
+Revision ID: 0219
+Revises: 0218
+Create Date: 2026-10-18
+
+The lexical retrievers parsed their source text with ``to_tsvector`` in both the
+match predicate and the rank, once per visible row per query. Each single-table
+source now carries a generated tsvector (the ``messages.content_tsv`` /
+``content_chunks.chunk_text_tsv`` pattern) with a GIN index, and the retrievers
+read the stored column.
+
+Media and podcast search also match contributor names, which come from the
+credit rows rather than the owner row. ``contributor_search_tsv`` stores that
+half on the owner row: credited name, contributor display name and every alias
+of each credit, the composition of ``contributor_credits_rollup_cte_sql``. One
+GIN expression index over ``search_tsv || contributor_search_tsv`` per table
+serves the whole document, so a query may still match a title word and an
+author name together.
+
+Row triggers on credits, aliases and contributor display names recompute the
+owners a change can affect, through ``contributor_search_tsv_refresh``. Every
+trigger first takes transaction-scoped advisory locks on the contributors and
+then the owners it touches, so two changes that can affect the same owner
+recompute one after the other. A credit holds its contributor's lock shared and
+an alias or display-name change holds it exclusively, so only the latter
+serialize against credit writes.
+
+Adding a stored generated column rewrites the table under an exclusive lock;
+``fragments`` is the long one. The GIN indexes are then built concurrently
+after the schema part commits (``nexus.db.concurrent_index``), so that part is
+written to be rerun after a killed build, as in 0210.
+
+Contributor search text includes viewer-visible credited names and cannot be
+stored on the contributor row; it is not covered here.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0219"
+down_revision: str | Sequence[str] | None = "0218"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, column, document expression). Expressions must be immutable, so text is
+# joined with || over COALESCEd columns rather than concat_ws (which is stable).
+# Extra separators do not change the lexemes or their positions.
+_TSVECTOR_COLUMNS: tuple[tuple[str, str, str], ...] = (
+    ("highlights", "search_tsv", "exact || ' ' || prefix || ' ' || suffix"),
+    (
+        "media",
+        "search_tsv",
+        "COALESCE(title, '') || ' ' || COALESCE(description, '') || ' ' || COALESCE(publisher, '')",
+    ),
+    ("podcasts", "search_tsv", "COALESCE(title, '') || ' ' || COALESCE(description, '')"),
+    ("conversations", "title_tsv", "COALESCE(title, '')"),
+    ("artifact_revisions", "content_text_tsv", "content_text"),
+    ("fragments", "canonical_text_tsv", "canonical_text"),
+    ("evidence_spans", "span_text_tsv", "span_text"),
+    (
+        "reader_apparatus_items",
+        "search_tsv",
+        "COALESCE(label, '') || ' ' || kind || ' ' || COALESCE(body_text, '')",
+    ),
+    (
+        "message_retrievals",
+        "search_tsv",
+        "source_id || ' ' || COALESCE(source_title, '') || ' ' || COALESCE(deep_link, '') "
+        "|| ' ' || COALESCE(exact_snippet, '') || ' ' || COALESCE(result_ref->>'title', '') "
+        "|| ' ' || COALESCE(result_ref->>'url', '') "
+        "|| ' ' || COALESCE(result_ref->>'display_url', '') "
+        "|| ' ' || COALESCE(result_ref->>'source_name', '') "
+        "|| ' ' || COALESCE(result_ref->>'snippet', '')",
+    ),
+)
+
+
+_OWNER_TABLES = ("media", "podcasts")
+
+# (trigger, table, events, function)
+_TRIGGERS: tuple[tuple[str, str, str, str], ...] = (
+    (
+        "trg_contributor_search_tsv_credits",
+        "contributor_credits",
+        "INSERT OR DELETE OR UPDATE",
+        "contributor_search_tsv_on_credit",
+    ),
+    (
+        "trg_contributor_search_tsv_aliases",
+        "contributor_aliases",
+        "INSERT OR DELETE OR UPDATE OF alias, contributor_id",
+        "contributor_search_tsv_on_alias",
+    ),
+    (
+        "trg_contributor_search_tsv_contributors",
+        "contributors",
+        "UPDATE OF display_name",
+        "contributor_search_tsv_on_contributor",
+    ),
+)
+
+
+def upgrade() -> None:
+    from nexus.db.concurrent_index import build_index_concurrently
+
+    for table, column, document in _TSVECTOR_COLUMNS:
+        op.execute(
+            f"""
+            ALTER TABLE {table}
+            ADD COLUMN IF NOT EXISTS {column} tsvector
+            GENERATED ALWAYS AS (to_tsvector('english'::regconfig, {document})) STORED
+            """
+        )
+    for table in _OWNER_TABLES:
+        # A constant default is catalog-only: no table rewrite.
+        op.execute(
+            f"""
+            ALTER TABLE {table}
+            ADD COLUMN IF NOT EXISTS contributor_search_tsv tsvector
+            NOT NULL DEFAULT ''::tsvector
+            """
+        )
+
+    # The contributor text of one owner; exactly one argument is non-NULL.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION contributor_search_tsv(p_media_id uuid, p_podcast_id uuid)
+        RETURNS tsvector
+        LANGUAGE sql
+        STABLE
+        AS $$
+            SELECT to_tsvector(
+                'english',
+                COALESCE(
+                    string_agg(
+                        concat_ws(
+                            ' ',
+                            cc.credited_name,
+                            c.display_name,
+                            COALESCE(alias_text.aliases, '')
+                        ),
+                        ' '
+                        ORDER BY cc.ordinal, cc.id
+                    ),
+                    ''
+                )
+            )
+            FROM contributor_credits cc
+            JOIN contributors c ON c.id = cc.contributor_id
+            LEFT JOIN LATERAL (
+                SELECT string_agg(a.alias, ' ' ORDER BY a.alias) AS aliases
+                FROM contributor_aliases a
+                WHERE a.contributor_id = c.id
+            ) alias_text ON true
+            WHERE cc.media_id = p_media_id OR cc.podcast_id = p_podcast_id
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION contributor_search_tsv_lock(
+            p_scope text, p_ids uuid[], p_shared boolean DEFAULT false
+        )
+        RETURNS void
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            lock_id uuid;
+            lock_key bigint;
+        BEGIN
+            FOR lock_id IN
+                SELECT DISTINCT id FROM unnest(p_ids) AS ids(id) WHERE id IS NOT NULL ORDER BY id
+            LOOP
+                lock_key := hashtextextended(
+                    'contributor_search_tsv:' || p_scope || ':' || lock_id::text, 0
+                );
+                IF p_shared THEN
+                    PERFORM pg_advisory_xact_lock_shared(lock_key);
+                ELSE
+                    PERFORM pg_advisory_xact_lock(lock_key);
+                END IF;
+            END LOOP;
+        END;
+        $$
+        """
+    )
+    # Callers take the locks first; each statement here then reads with a
+    # snapshot taken after the locks. Unchanged documents are not rewritten.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION contributor_search_tsv_refresh(p_media_ids uuid[], p_podcast_ids uuid[])
+        RETURNS void
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            UPDATE media m
+            SET contributor_search_tsv = document.tsv
+            FROM (
+                SELECT ids.id, contributor_search_tsv(ids.id, NULL) AS tsv
+                FROM (SELECT DISTINCT id FROM unnest(p_media_ids) AS u(id)) ids
+                WHERE ids.id IS NOT NULL
+            ) document
+            WHERE m.id = document.id
+              AND m.contributor_search_tsv IS DISTINCT FROM document.tsv;
+            UPDATE podcasts p
+            SET contributor_search_tsv = document.tsv
+            FROM (
+                SELECT ids.id, contributor_search_tsv(NULL, ids.id) AS tsv
+                FROM (SELECT DISTINCT id FROM unnest(p_podcast_ids) AS u(id)) ids
+                WHERE ids.id IS NOT NULL
+            ) document
+            WHERE p.id = document.id
+              AND p.contributor_search_tsv IS DISTINCT FROM document.tsv;
+        END;
+        $$
+        """
+    )
+    # Every owner credited to the given contributors.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION contributor_search_tsv_refresh_contributors(p_contributor_ids uuid[])
+        RETURNS void
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            media_ids uuid[];
+            podcast_ids uuid[];
+        BEGIN
+            PERFORM contributor_search_tsv_lock('contributor', p_contributor_ids);
+            media_ids := ARRAY(
+                SELECT cc.media_id
+                FROM contributor_credits cc
+                WHERE cc.contributor_id = ANY(p_contributor_ids)
+                  AND cc.media_id IS NOT NULL
+            );
+            podcast_ids := ARRAY(
+                SELECT cc.podcast_id
+                FROM contributor_credits cc
+                WHERE cc.contributor_id = ANY(p_contributor_ids)
+                  AND cc.podcast_id IS NOT NULL
+            );
+            PERFORM contributor_search_tsv_lock('media', media_ids);
+            PERFORM contributor_search_tsv_lock('podcast', podcast_ids);
+            PERFORM contributor_search_tsv_refresh(media_ids, podcast_ids);
+        END;
+        $$
+        """
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION contributor_search_tsv_on_credit()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            changed contributor_credits;
+        BEGIN
+            FOREACH changed IN ARRAY ARRAY[OLD, NEW] LOOP
+                CONTINUE WHEN changed IS NULL
+                    OR (changed.media_id IS NULL AND changed.podcast_id IS NULL);
+                -- Shared: credits of one contributor on different owners do
+                -- not wait on each other, only on that contributor's renames.
+                PERFORM contributor_search_tsv_lock(
+                    'contributor', ARRAY[changed.contributor_id], true
+                );
+                PERFORM contributor_search_tsv_lock('media', ARRAY[changed.media_id]);
+                PERFORM contributor_search_tsv_lock('podcast', ARRAY[changed.podcast_id]);
+                PERFORM contributor_search_tsv_refresh(
+                    ARRAY[changed.media_id], ARRAY[changed.podcast_id]
+                );
+            END LOOP;
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION contributor_search_tsv_on_alias()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            changed contributor_aliases;
+        BEGIN
+            FOREACH changed IN ARRAY ARRAY[OLD, NEW] LOOP
+                CONTINUE WHEN changed IS NULL;
+                PERFORM contributor_search_tsv_refresh_contributors(ARRAY[changed.contributor_id]);
+            END LOOP;
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION contributor_search_tsv_on_contributor()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            PERFORM contributor_search_tsv_refresh_contributors(ARRAY[NEW.id]);
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+    for trigger, table, events, function in _TRIGGERS:
+        op.execute(
+            f"""
+            CREATE OR REPLACE TRIGGER {trigger}
+            AFTER {events} ON {table}
+            FOR EACH ROW
+            EXECUTE FUNCTION {function}()
+            """
+        )
+
+    op.execute(
+        """
+        UPDATE media m
+        SET contributor_search_tsv = contributor_search_tsv(m.id, NULL)
+        WHERE EXISTS (SELECT 1 FROM contributor_credits cc WHERE cc.media_id = m.id)
+        """
+    )
+    op.execute(
+        """
+        UPDATE podcasts p
+        SET contributor_search_tsv = contributor_search_tsv(NULL, p.id)
+        WHERE EXISTS (SELECT 1 FROM contributor_credits cc WHERE cc.podcast_id = p.id)
+        """
+    )
+
+    for table, column, _ in _TSVECTOR_COLUMNS:
+        if table in _OWNER_TABLES:
+            continue
+        build_index_concurrently(
+            op,
+            revision="0219",
+            table=table,
+            index_name=f"ix_{table}_{column}",
+            using=f"gin ({column})",
+            expected_definition=(
+                f"CREATE INDEX ix_{table}_{column} ON public.{table} USING gin ({column})"
+            ),
+        )
+    for table in _OWNER_TABLES:
+        build_index_concurrently(
+            op,
+            revision="0219",
+            table=table,
+            index_name=f"ix_{table}_search_document",
+            using="gin ((search_tsv || contributor_search_tsv))",
+            expected_definition=(
+                f"CREATE INDEX ix_{table}_search_document ON public.{table} "
+                "USING gin (((search_tsv || contributor_search_tsv)))"
+            ),
+        )
+
+
+def downgrade() -> None:
+    raise RuntimeError("0219 is a hard cutover migration and has no downgrade path")
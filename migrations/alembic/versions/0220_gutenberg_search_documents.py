@@ -0,0 +1,217 @@
+"""Add precomputed Project Gutenberg catalog search documents.
+
+Revision ID: 0220
+Revises: 0219
+Create Date: 2026-10-18
+
+Browse search over the catalog aggregated every Gutenberg credit and parsed
+title/names/subjects/bookshelves for the whole catalog on each request. One row
+per ebook now holds that tsvector and the contributor JSON; search is a GIN
+lookup plus a join back to the catalog row. Gutenberg credits are public (see
+``visible_content_credit_rows_sql``), so the document is the same for every
+viewer.
+
+The document lives in ``project_gutenberg_search_documents_refresh``, which the
+catalog sync calls for the whole catalog and row triggers call for the ebooks a
+change can affect: a Gutenberg credit's ebook, or every ebook credited to a
+renamed contributor. A curator's rename therefore reaches Browse without a sync.
+
+Locking follows 0219 and reuses its contributor lock: a credit holds its
+contributor's lock shared and a rename holds it exclusively. Each ebook then
+takes its own lock, under a catalog-wide lock held shared, which the full
+refresh holds exclusively instead of locking every ebook.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0220"
+down_revision: str | Sequence[str] | None = "0219"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "project_gutenberg_search_documents",
+        sa.Column("ebook_id", sa.BigInteger(), nullable=False),
+        sa.Column("search_tsv", postgresql.TSVECTOR(), nullable=False),
+        sa.Column(
+            "contributors",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'[]'::jsonb"),
+        ),
+        sa.Column(
+            "refreshed_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.ForeignKeyConstraint(
+            ["ebook_id"],
+            ["project_gutenberg_catalog.ebook_id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("ebook_id"),
+    )
+    op.create_index(
+        "ix_project_gutenberg_search_documents_search_tsv",
+        "project_gutenberg_search_documents",
+        ["search_tsv"],
+        postgresql_using="gin",
+    )
+    # NULL refreshes the whole catalog. Returns the number of rows written.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION project_gutenberg_search_documents_refresh(p_ebook_ids bigint[])
+        RETURNS integer
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            lock_id bigint;
+            written integer;
+        BEGIN
+            IF p_ebook_ids IS NULL THEN
+                PERFORM pg_advisory_xact_lock(
+                    hashtextextended('project_gutenberg_search_documents:all', 0)
+                );
+            ELSE
+                PERFORM pg_advisory_xact_lock_shared(
+                    hashtextextended('project_gutenberg_search_documents:all', 0)
+                );
+                FOR lock_id IN
+                    SELECT DISTINCT id FROM unnest(p_ebook_ids) AS ids(id)
+                    WHERE id IS NOT NULL ORDER BY id
+                LOOP
+                    PERFORM pg_advisory_xact_lock(
+                        hashtextextended('project_gutenberg_search_documents:' || lock_id, 0)
+                    );
+                END LOOP;
+            END IF;
+
+            INSERT INTO project_gutenberg_search_documents (
+                ebook_id, search_tsv, contributors, refreshed_at
+            )
+            SELECT
+                pg.ebook_id,
+                to_tsvector(
+                    'english',
+                    concat_ws(' ', pg.title, credits.names, pg.subjects, pg.bookshelves)
+                ),
+                COALESCE(credits.contributors, '[]'::jsonb),
+                now()
+            FROM project_gutenberg_catalog pg
+            LEFT JOIN (
+                SELECT
+                    cc.project_gutenberg_catalog_ebook_id AS ebook_id,
+                    jsonb_agg(
+                        jsonb_build_object(
+                            'contributor_handle', c.handle,
+                            'contributor_display_name', c.display_name,
+                            'href', '/authors/' || c.handle,
+                            'credited_name', cc.credited_name,
+                            'role', cc.role,
+                            'raw_role', cc.raw_role,
+                            'ordinal', cc.ordinal
+                        )
+                        ORDER BY cc.ordinal
+                    ) AS contributors,
+                    string_agg(cc.credited_name || ' ' || c.display_name, ' ') AS names
+                FROM contributor_credits cc
+                JOIN contributors c ON c.id = cc.contributor_id
+                WHERE cc.project_gutenberg_catalog_ebook_id IS NOT NULL
+                  AND (
+                        p_ebook_ids IS NULL
+                        OR cc.project_gutenberg_catalog_ebook_id = ANY(p_ebook_ids)
+                  )
+                GROUP BY cc.project_gutenberg_catalog_ebook_id
+            ) credits ON credits.ebook_id = pg.ebook_id
+            WHERE p_ebook_ids IS NULL OR pg.ebook_id = ANY(p_ebook_ids)
+            ON CONFLICT (ebook_id) DO UPDATE
+            SET search_tsv = EXCLUDED.search_tsv,
+                contributors = EXCLUDED.contributors,
+                refreshed_at = EXCLUDED.refreshed_at
+            WHERE project_gutenberg_search_documents.search_tsv
+                    IS DISTINCT FROM EXCLUDED.search_tsv
+               OR project_gutenberg_search_documents.contributors
+                    IS DISTINCT FROM EXCLUDED.contributors;
+            GET DIAGNOSTICS written = ROW_COUNT;
+            RETURN written;
+        END;
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION project_gutenberg_search_documents_on_credit()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            changed contributor_credits;
+        BEGIN
+            FOREACH changed IN ARRAY ARRAY[OLD, NEW] LOOP
+                CONTINUE WHEN changed IS NULL
+                    OR changed.project_gutenberg_catalog_ebook_id IS NULL;
+                PERFORM contributor_search_tsv_lock(
+                    'contributor', ARRAY[changed.contributor_id], true
+                );
+                PERFORM project_gutenberg_search_documents_refresh(
+                    ARRAY[changed.project_gutenberg_catalog_ebook_id]
+                );
+            END LOOP;
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION project_gutenberg_search_documents_on_contributor()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            PERFORM contributor_search_tsv_lock('contributor', ARRAY[NEW.id]);
+            PERFORM project_gutenberg_search_documents_refresh(
+                ARRAY(
+                    SELECT cc.project_gutenberg_catalog_ebook_id
+                    FROM contributor_credits cc
+                    WHERE cc.contributor_id = NEW.id
+                      AND cc.project_gutenberg_catalog_ebook_id IS NOT NULL
+                )
+            );
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE TRIGGER trg_project_gutenberg_search_documents_credits
+        AFTER INSERT OR DELETE OR UPDATE ON contributor_credits
+        FOR EACH ROW
+        EXECUTE FUNCTION project_gutenberg_search_documents_on_credit()
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE TRIGGER trg_project_gutenberg_search_documents_contributors
+        AFTER UPDATE OF display_name, handle ON contributors
+        FOR EACH ROW
+        WHEN (
+            OLD.display_name IS DISTINCT FROM NEW.display_name
+            OR OLD.handle IS DISTINCT FROM NEW.handle
+        )
+        EXECUTE FUNCTION project_gutenberg_search_documents_on_contributor()
+        """
+    )
+    op.execute("SELECT project_gutenberg_search_documents_refresh(NULL)")
+
+
+def downgrade() -> None:
+    raise RuntimeError("0220 is a hard cutover migration and has no downgrade path")
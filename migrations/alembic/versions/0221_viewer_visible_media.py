@@ -0,0 +1,443 @@
+"""Materialize the per-viewer visible-media set.
+
+Revision ID: 0221
+Revises: 0220
+Create Date: 2026-10-18
+
+``visible_media_ids_cte_sql`` evaluated the readability rule for every row of
+``media`` on every read and search query. ``viewer_visible_media`` holds the
+(user, media) pairs the rule admits; row triggers on each input of the rule
+(memberships, library entries, resource grants, highlight anchors, tombstones
+and teardown intents) recompute exactly the pairs a change can affect, through
+``viewer_media_visible`` — the rule as one SQL function.
+
+Two concurrent writes can each miss the other's uncommitted row (a membership
+added while an entry is added to the same library, a grant revoked while the
+membership is removed). Every trigger therefore takes transaction-scoped
+advisory locks on the libraries, users and media it touches before it reads, so
+any two changes that can affect the same pair share a lock and the second one
+recomputes after the first commits. Keys are taken library, user, media; only
+teardown locks its media before that media's libraries and can deadlock with
+an entry change, which Postgres resolves by aborting one of them.
+
+``viewer_visible_media_rebuild_job`` walks users and repairs any drift through
+``viewer_visible_media_repair``, which holds the same locks.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0221"
+down_revision: str | Sequence[str] | None = "0220"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (trigger, table, events, function)
+_TRIGGERS: tuple[tuple[str, str, str, str], ...] = (
+    (
+        "trg_viewer_visible_media_memberships",
+        "memberships",
+        "INSERT OR DELETE OR UPDATE OF library_id, user_id",
+        "viewer_visible_media_on_membership",
+    ),
+    (
+        "trg_viewer_visible_media_library_entries",
+        "library_entries",
+        "INSERT OR DELETE OR UPDATE OF library_id, media_id",
+        "viewer_visible_media_on_library_entry",
+    ),
+    (
+        "trg_viewer_visible_media_resource_grants",
+        "resource_grants",
+        "INSERT OR DELETE OR UPDATE",
+        "viewer_visible_media_on_resource_grant",
+    ),
+    (
+        "trg_viewer_visible_media_highlights",
+        "highlights",
+        "DELETE OR UPDATE OF anchor_media_id",
+        "viewer_visible_media_on_highlight",
+    ),
+    (
+        "trg_viewer_visible_media_user_media_deletions",
+        "user_media_deletions",
+        "INSERT OR DELETE OR UPDATE OF user_id, media_id",
+        "viewer_visible_media_on_user_media_deletion",
+    ),
+    (
+        "trg_viewer_visible_media_media_teardown_intents",
+        "media_teardown_intents",
+        "INSERT OR DELETE OR UPDATE OF media_id",
+        "viewer_visible_media_on_media_teardown_intent",
+    ),
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "viewer_visible_media",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("media_id", sa.UUID(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["media_id"], ["media.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "media_id"),
+    )
+    op.create_index("ix_viewer_visible_media_media_id", "viewer_visible_media", ["media_id"])
+
+    # The readability rule of nexus.auth.permissions, for one (user, media) pair.
+    op.execute(
+        """
+        CREATE FUNCTION viewer_media_visible(p_user_id uuid, p_media_id uuid)
+        RETURNS boolean
+        LANGUAGE sql
+        STABLE
+        AS $$
+            SELECT EXISTS (SELECT 1 FROM media m WHERE m.id = p_media_id)
+               AND (
+                    EXISTS (
+                        SELECT 1
+                        FROM library_entries le
+                        JOIN memberships membership
+                          ON membership.library_id = le.library_id
+                        WHERE membership.user_id = p_user_id
+                          AND le.media_id = p_media_id
+                    )
+                    OR EXISTS (
+                        SELECT 1
+                        FROM resource_grants g
+                        LEFT JOIN highlights h
+                          ON g.subject_scheme = 'highlight'
+                         AND h.id = g.subject_id
+                        WHERE (
+                                (g.subject_scheme = 'media' AND g.subject_id = p_media_id)
+                                OR h.anchor_media_id = p_media_id
+                              )
+                          AND (g.grantee_user_id = p_user_id OR g.created_by_user_id = p_user_id)
+                    )
+               )
+               AND NOT EXISTS (
+                    SELECT 1
+                    FROM user_media_deletions umd
+                    WHERE umd.user_id = p_user_id
+                      AND umd.media_id = p_media_id
+               )
+               AND NOT EXISTS (
+                    SELECT 1
+                    FROM media_teardown_intents mti
+                    WHERE mti.media_id = p_media_id
+               )
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION viewer_visible_media_lock(p_scope text, p_ids uuid[])
+        RETURNS void
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            lock_id uuid;
+        BEGIN
+            FOR lock_id IN
+                SELECT DISTINCT id FROM unnest(p_ids) AS ids(id) WHERE id IS NOT NULL ORDER BY id
+            LOOP
+                PERFORM pg_advisory_xact_lock(
+                    hashtextextended('viewer_visible_media:' || p_scope || ':' || lock_id::text, 0)
+                );
+            END LOOP;
+        END;
+        $$
+        """
+    )
+    # Recompute the cross product of users × media. Callers take the locks first;
+    # each statement here then reads with a snapshot taken after the locks.
+    op.execute(
+        """
+        CREATE FUNCTION viewer_visible_media_refresh(p_user_ids uuid[], p_media_ids uuid[])
+        RETURNS void
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            DELETE FROM viewer_visible_media vvm
+            WHERE vvm.user_id = ANY(p_user_ids)
+              AND vvm.media_id = ANY(p_media_ids)
+              AND NOT viewer_media_visible(vvm.user_id, vvm.media_id);
+            INSERT INTO viewer_visible_media (user_id, media_id)
+            SELECT DISTINCT u.user_id, m.media_id
+            FROM unnest(p_user_ids) AS u(user_id)
+            CROSS JOIN unnest(p_media_ids) AS m(media_id)
+            WHERE u.user_id IS NOT NULL
+              AND m.media_id IS NOT NULL
+              AND viewer_media_visible(u.user_id, m.media_id)
+            ON CONFLICT DO NOTHING;
+        END;
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION viewer_visible_media_repair(p_user_id uuid, p_media_id uuid)
+        RETURNS void
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            PERFORM viewer_visible_media_lock('user', ARRAY[p_user_id]);
+            PERFORM viewer_visible_media_lock('media', ARRAY[p_media_id]);
+            PERFORM viewer_visible_media_refresh(ARRAY[p_user_id], ARRAY[p_media_id]);
+        END;
+        $$
+        """
+    )
+
+    op.execute(
+        """
+        CREATE FUNCTION viewer_visible_media_on_membership()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            changed memberships;
+        BEGIN
+            FOREACH changed IN ARRAY ARRAY[OLD, NEW] LOOP
+                CONTINUE WHEN changed IS NULL OR changed.user_id IS NULL;
+                PERFORM viewer_visible_media_lock('library', ARRAY[changed.library_id]);
+                PERFORM viewer_visible_media_lock('user', ARRAY[changed.user_id]);
+                PERFORM viewer_visible_media_refresh(
+                    ARRAY[changed.user_id],
+                    ARRAY(
+                        SELECT le.media_id
+                        FROM library_entries le
+                        WHERE le.library_id = changed.library_id
+                          AND le.media_id IS NOT NULL
+                    )
+                );
+            END LOOP;
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION viewer_visible_media_on_library_entry()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            changed library_entries;
+        BEGIN
+            FOREACH changed IN ARRAY ARRAY[OLD, NEW] LOOP
+                CONTINUE WHEN changed IS NULL OR changed.media_id IS NULL;
+                PERFORM viewer_visible_media_lock('library', ARRAY[changed.library_id]);
+                PERFORM viewer_visible_media_lock('media', ARRAY[changed.media_id]);
+                PERFORM viewer_visible_media_refresh(
+                    ARRAY(
+                        SELECT membership.user_id
+                        FROM memberships membership
+                        WHERE membership.library_id = changed.library_id
+                    ),
+                    ARRAY[changed.media_id]
+                );
+            END LOOP;
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION viewer_visible_media_on_resource_grant()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            changed resource_grants;
+            affected_media uuid[];
+        BEGIN
+            FOREACH changed IN ARRAY ARRAY[OLD, NEW] LOOP
+                CONTINUE WHEN changed IS NULL
+                    OR changed.subject_scheme NOT IN ('media', 'highlight');
+                IF changed.subject_scheme = 'media' THEN
+                    affected_media := ARRAY[changed.subject_id];
+                ELSE
+                    affected_media := ARRAY(
+                        SELECT h.anchor_media_id
+                        FROM highlights h
+                        WHERE h.id = changed.subject_id
+                          AND h.anchor_media_id IS NOT NULL
+                    );
+                END IF;
+                PERFORM viewer_visible_media_lock(
+                    'user', ARRAY[changed.grantee_user_id, changed.created_by_user_id]
+                );
+                PERFORM viewer_visible_media_lock('media', affected_media);
+                PERFORM viewer_visible_media_refresh(
+                    ARRAY[changed.grantee_user_id, changed.created_by_user_id],
+                    affected_media
+                );
+            END LOOP;
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION viewer_visible_media_on_highlight()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            grant_users uuid[];
+            affected_media uuid[];
+        BEGIN
+            grant_users := ARRAY(
+                SELECT g.grantee_user_id
+                FROM resource_grants g
+                WHERE g.subject_scheme = 'highlight'
+                  AND g.subject_id = OLD.id
+                  AND g.grantee_user_id IS NOT NULL
+                UNION
+                SELECT g.created_by_user_id
+                FROM resource_grants g
+                WHERE g.subject_scheme = 'highlight'
+                  AND g.subject_id = OLD.id
+            );
+            IF cardinality(grant_users) = 0 THEN
+                RETURN NULL;
+            END IF;
+            IF TG_OP = 'DELETE' THEN
+                affected_media := ARRAY[OLD.anchor_media_id];
+            ELSE
+                affected_media := ARRAY[OLD.anchor_media_id, NEW.anchor_media_id];
+            END IF;
+            PERFORM viewer_visible_media_lock('user', grant_users);
+            PERFORM viewer_visible_media_lock('media', affected_media);
+            PERFORM viewer_visible_media_refresh(grant_users, affected_media);
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION viewer_visible_media_on_user_media_deletion()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            changed user_media_deletions;
+        BEGIN
+            FOREACH changed IN ARRAY ARRAY[OLD, NEW] LOOP
+                CONTINUE WHEN changed IS NULL;
+                PERFORM viewer_visible_media_lock('user', ARRAY[changed.user_id]);
+                PERFORM viewer_visible_media_lock('media', ARRAY[changed.media_id]);
+                PERFORM viewer_visible_media_refresh(
+                    ARRAY[changed.user_id], ARRAY[changed.media_id]
+                );
+            END LOOP;
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+    # Teardown affects every viewer of the media: members of any library holding
+    # it, grant holders, and whoever currently has a row.
+    op.execute(
+        """
+        CREATE FUNCTION viewer_visible_media_on_media_teardown_intent()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            changed media_teardown_intents;
+        BEGIN
+            FOREACH changed IN ARRAY ARRAY[OLD, NEW] LOOP
+                CONTINUE WHEN changed IS NULL;
+                PERFORM viewer_visible_media_lock('media', ARRAY[changed.media_id]);
+                PERFORM viewer_visible_media_lock(
+                    'library',
+                    ARRAY(
+                        SELECT le.library_id
+                        FROM library_entries le
+                        WHERE le.media_id = changed.media_id
+                    )
+                );
+                PERFORM viewer_visible_media_refresh(
+                    ARRAY(
+                        SELECT membership.user_id
+                        FROM library_entries le
+                        JOIN memberships membership
+                          ON membership.library_id = le.library_id
+                        WHERE le.media_id = changed.media_id
+                        UNION
+                        SELECT unnest(ARRAY[g.grantee_user_id, g.created_by_user_id])
+                        FROM resource_grants g
+                        LEFT JOIN highlights h
+                          ON g.subject_scheme = 'highlight'
+                         AND h.id = g.subject_id
+                        WHERE (g.subject_scheme = 'media' AND g.subject_id = changed.media_id)
+                           OR h.anchor_media_id = changed.media_id
+                        UNION
+                        SELECT vvm.user_id
+                        FROM viewer_visible_media vvm
+                        WHERE vvm.media_id = changed.media_id
+                    ),
+                    ARRAY[changed.media_id]
+                );
+            END LOOP;
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+    for trigger, table, events, function in _TRIGGERS:
+        op.execute(
+            f"""
+            CREATE TRIGGER {trigger}
+            AFTER {events} ON {table}
+            FOR EACH ROW
+            EXECUTE FUNCTION {function}()
+            """
+        )
+
+    op.execute(
+        """
+        INSERT INTO viewer_visible_media (user_id, media_id)
+        SELECT pairs.user_id, pairs.media_id
+        FROM (
+            SELECT membership.user_id, le.media_id
+            FROM library_entries le
+            JOIN memberships membership ON membership.library_id = le.library_id
+            WHERE le.media_id IS NOT NULL
+            UNION
+            SELECT grant_user.user_id, COALESCE(h.anchor_media_id, g.subject_id) AS media_id
+            FROM resource_grants g
+            LEFT JOIN highlights h
+              ON g.subject_scheme = 'highlight'
+             AND h.id = g.subject_id
+            CROSS JOIN LATERAL unnest(ARRAY[g.grantee_user_id, g.created_by_user_id])
+                AS grant_user(user_id)
+            WHERE grant_user.user_id IS NOT NULL
+              AND (g.subject_scheme = 'media' OR h.anchor_media_id IS NOT NULL)
+        ) pairs
+        JOIN media m ON m.id = pairs.media_id
+        WHERE NOT EXISTS (
+                SELECT 1
+                FROM user_media_deletions umd
+                WHERE umd.user_id = pairs.user_id
+                  AND umd.media_id = pairs.media_id
+              )
+          AND NOT EXISTS (
+                SELECT 1
+                FROM media_teardown_intents mti
+                WHERE mti.media_id = pairs.media_id
+              )
+        """
+    )
+
+
+def downgrade() -> None:
+    raise RuntimeError("0221 is a hard cutover migration and has no downgrade path")
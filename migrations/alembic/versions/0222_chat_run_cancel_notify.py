@@ -0,0 +1,48 @@
+"""Notify trigger for chat-run cancellation.
+
+Revision ID: 0222
+Revises: 0221
+Create Date: 2026-10-18
+
+The executor learned of a cancel by polling ``chat_runs.cancel_requested_at``
+once per interval per active provider stream and once after every tool call.
+An AFTER UPDATE trigger now publishes the run id on ``chat_run_cancel`` when
+the column first becomes non-null, in the 0122 style, and the worker waits on
+one shared LISTEN per process instead.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0222"
+down_revision: str | Sequence[str] | None = "0221"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE FUNCTION notify_chat_run_cancel() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            PERFORM pg_notify('chat_run_cancel', NEW.id::text);
+            RETURN NULL;
+        END;
+        $$;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER chat_runs_cancel_notify
+        AFTER UPDATE OF cancel_requested_at ON chat_runs
+        FOR EACH ROW
+        WHEN (OLD.cancel_requested_at IS NULL AND NEW.cancel_requested_at IS NOT NULL)
+        EXECUTE FUNCTION notify_chat_run_cancel();
+        """
+    )
+
+
+def downgrade() -> None:
+    raise RuntimeError("0222 is a hard cutover migration and has no downgrade path")
@@ -0,0 +1,49 @@
+"""Store each user's atlas projection axes.
+
+Revision ID: 0223
+Revises: 0222
+Create Date: 2026-10-18
+
+A full atlas projection now keeps the affine map it fitted: the mean embedding,
+the two principal components, and the fitted coordinate bounds. A placement job
+projects newly indexed works through it instead of re-projecting the library,
+so works already on the map keep their positions. Rows appear with the next
+full projection; until then placement falls back to a full projection.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0223"
+down_revision: str | Sequence[str] | None = "0222"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "media_atlas_projection_axes",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("mean", postgresql.ARRAY(sa.Float()), nullable=False),
+        sa.Column("pc1", postgresql.ARRAY(sa.Float()), nullable=False),
+        sa.Column("pc2", postgresql.ARRAY(sa.Float()), nullable=False),
+        sa.Column("x_min", sa.Float(), nullable=False),
+        sa.Column("x_max", sa.Float(), nullable=False),
+        sa.Column("y_min", sa.Float(), nullable=False),
+        sa.Column("y_max", sa.Float(), nullable=False),
+        sa.Column(
+            "computed_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+
+
+def downgrade() -> None:
+    raise RuntimeError("0223 is a hard cutover migration and has no downgrade path")
@@ -115,6 +115,10 @@ def create_api_router() -> APIRouter:
         from nexus.api.routes.email_ingest import router as email_ingest_router
 
         api_router.include_router(email_ingest_router)
+    if settings.metrics_enabled:
+        from nexus.api.routes.metrics import router as metrics_router
+
+        api_router.include_router(metrics_router)
 
     # Browser-callable SSE event streams (all under /stream/) + the BFF
     # stream-token mint. Tags are self-declared on each router.
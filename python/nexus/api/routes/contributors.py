@@ -13,16 +13,18 @@ violations 404 without revealing whether an internal record exists (spec 6).
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query, Request
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
 from pydantic import AfterValidator
 from sqlalchemy.orm import Session
 
 from nexus.auth.middleware import Viewer, get_viewer
 from nexus.db.session import get_db, get_repeatable_read_db
 from nexus.errors import ApiErrorCode, NotFoundError
-from nexus.responses import ok
+from nexus.responses import conditional_json_response, ok
 from nexus.schemas.contributors import ContributorRenameRequest
+from nexus.services import collection_http_cache
 from nexus.services import contributors as contributors_service
+from nexus.services.collection_revisions import CollectionFamily
 from nexus.services.contributor_taxonomy import (
     ContributorHandle,
     parse_contributor_handle,
@@ -83,20 +85,33 @@ def list_contributor_works(
     contributor_handle: str,
     viewer: Annotated[Viewer, Depends(get_viewer)],
     db: Annotated[Session, Depends(get_repeatable_read_db)],
-) -> dict:
-    view, query = contributors_service.parse_contributor_works_query(
-        request.query_params.multi_items()
-    )
-    page = contributors_service.list_contributor_works(
+    if_none_match: Annotated[str | None, Header(alias="If-None-Match")] = None,
+) -> Response:
+    query_items = request.query_params.multi_items()
+    view, query = contributors_service.parse_contributor_works_query(query_items)
+    handle = _parse_handle(contributor_handle)
+    result = collection_http_cache.read_collection_page(
         db,
         viewer_id=viewer.user_id,
-        contributor_handle=_parse_handle(contributor_handle),
-        view=view,
-        cursor=query.cursor,
-        collection_revision=query.collection_revision,
-        limit=query.limit,
+        family=CollectionFamily.AuthorWorks,
+        path=request.url.path,
+        query_items=query_items,
+        if_none_match=if_none_match,
+        load=lambda: contributors_service.list_contributor_works(
+            db,
+            viewer_id=viewer.user_id,
+            contributor_handle=handle,
+            view=view,
+            cursor=query.cursor,
+            collection_revision=query.collection_revision,
+            limit=query.limit,
+        ),
+    )
+    return conditional_json_response(
+        etag=result.etag,
+        body=result.body,
+        cache_control=collection_http_cache.COLLECTION_CACHE_CONTROL,
     )
-    return ok(page, by_alias=True)
 
 
 @router.patch("/{contributor_handle}")
@@ -16,32 +16,36 @@ Error envelope: {"error": {"code": "...", "message": "...", "request_id": "..."}
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Body, Depends, Request
+from fastapi import APIRouter, Body, Depends, Header, Request, Response
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy.orm import Session
 
 from nexus.auth.middleware import Viewer, get_viewer
 from nexus.db.session import get_db, get_repeatable_read_db
 from nexus.errors import ApiErrorCode, NotFoundError
-from nexus.responses import ok, ok_page
+from nexus.responses import conditional_json_response, ok, ok_page
 from nexus.schemas.collection_page import parse_manual_page_query
+from nexus.services import collection_http_cache
 from nexus.services import conversations as conversations_service
+from nexus.services.collection_revisions import CollectionFamily
 
 router = APIRouter(tags=["conversations"])
 
 
-@router.get("/conversations")
+@router.get("/conversations", response_model=None)
 def list_conversations(
     request: Request,
     viewer: Annotated[Viewer, Depends(get_viewer)],
     db: Annotated[Session, Depends(get_repeatable_read_db)],
-) -> dict:
+    if_none_match: Annotated[str | None, Header(alias="If-None-Match")] = None,
+) -> dict | Response:
     """List conversations.
 
     An explicit ``q`` selects the retained owned destination picker. An explicit
     ``has_context_ref`` selects the retained resource-graph mode; neither owns
     the ``sort``/``direction`` view keys. Every unmarked request, with optional
-    ``scope`` and view keys, selects the finite primary index.
+    ``scope`` and view keys, selects the finite primary index, which carries a
+    strong ETag keyed by the ConversationIndex revision.
 
     Errors:
         E_INVALID_REQUEST (400): Invalid scope value, a view state outside the
@@ -69,19 +73,30 @@ def list_conversations(
         )
         return ok_page(conversations, page)
 
-    view, query = conversations_service.parse_conversation_index_query(
-        request.query_params.multi_items()
-    )
-    page = conversations_service.list_conversation_index(
+    query_items = request.query_params.multi_items()
+    view, query = conversations_service.parse_conversation_index_query(query_items)
+    result = collection_http_cache.read_collection_page(
         db,
         viewer_id=viewer.user_id,
-        limit=query.limit,
-        cursor=query.cursor,
-        collection_revision=query.collection_revision,
-        scope=query.parameters.get("scope"),
-        view=view,
+        family=CollectionFamily.ConversationIndex,
+        path=request.url.path,
+        query_items=query_items,
+        if_none_match=if_none_match,
+        load=lambda: conversations_service.list_conversation_index(
+            db,
+            viewer_id=viewer.user_id,
+            limit=query.limit,
+            cursor=query.cursor,
+            collection_revision=query.collection_revision,
+            scope=query.parameters.get("scope"),
+            view=view,
+        ),
+    )
+    return conditional_json_response(
+        etag=result.etag,
+        body=result.body,
+        cache_control=collection_http_cache.COLLECTION_CACHE_CONTROL,
     )
-    return ok(page, by_alias=True)
 
 
 class CreateConversationRequest(BaseModel):
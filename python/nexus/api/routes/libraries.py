@@ -20,7 +20,7 @@ from sqlalchemy.orm import Session
 from nexus.auth.middleware import Viewer, get_viewer
 from nexus.db.session import get_db, get_repeatable_read_db
 from nexus.errors import ApiErrorCode, InvalidRequestError, NotFoundError
-from nexus.responses import ok, ok_page
+from nexus.responses import conditional_json_response, ok, ok_page
 from nexus.schemas.library import (
     CreateLibraryInviteRequest,
     CreateLibraryRequest,
@@ -31,7 +31,13 @@ from nexus.schemas.library import (
     UpdateLibraryMemberRequest,
     UpdateLibraryRequest,
 )
-from nexus.services import library_entries, library_governance, library_invitations
+from nexus.services import (
+    collection_http_cache,
+    library_entries,
+    library_governance,
+    library_invitations,
+)
+from nexus.services.collection_revisions import CollectionFamily
 from nexus.services.resonance import service as resonance_service
 from nexus.services.sealed_handles import InvalidSealedHandle, unseal_user
 
@@ -113,23 +119,40 @@ def list_libraries(
     request: Request,
     viewer: Annotated[Viewer, Depends(get_viewer)],
     db: Annotated[Session, Depends(get_repeatable_read_db)],
-) -> dict:
+    if_none_match: Annotated[str | None, Header(alias="If-None-Match")] = None,
+) -> Response:
     """List all libraries the viewer is a member of, in the requested view.
 
+    The page carries a strong ETag keyed by the LibrariesIndex revision; a
+    current ``If-None-Match`` answers 304.
+
     Errors:
         E_INVALID_REQUEST (400): A view state outside the advertised inventory.
         E_INVALID_CURSOR (400): Cursor is malformed or outside its binding.
     """
-    view, query = library_governance.parse_libraries_index_query(request.query_params.multi_items())
-    page = library_governance.list_libraries(
+    query_items = request.query_params.multi_items()
+    view, query = library_governance.parse_libraries_index_query(query_items)
+    result = collection_http_cache.read_collection_page(
         db,
-        viewer.user_id,
-        view=view,
-        cursor=query.cursor,
-        collection_revision=query.collection_revision,
-        limit=query.limit,
+        viewer_id=viewer.user_id,
+        family=CollectionFamily.LibrariesIndex,
+        path=request.url.path,
+        query_items=query_items,
+        if_none_match=if_none_match,
+        load=lambda: library_governance.list_libraries(
+            db,
+            viewer.user_id,
+            view=view,
+            cursor=query.cursor,
+            collection_revision=query.collection_revision,
+            limit=query.limit,
+        ),
+    )
+    return conditional_json_response(
+        etag=result.etag,
+        body=result.body,
+        cache_control=collection_http_cache.COLLECTION_CACHE_CONTROL,
     )
-    return ok(page, by_alias=True)
 
 
 @router.get("/libraries/writable-destinations")
@@ -384,7 +407,8 @@ def list_library_entries(
     library_id: UUID,
     viewer: Annotated[Viewer, Depends(get_viewer)],
     db: Annotated[Session, Depends(get_repeatable_read_db)],
-) -> dict:
+    if_none_match: Annotated[str | None, Header(alias="If-None-Match")] = None,
+) -> Response:
     """List a library's entries under a view lens.
 
     Returns one mixed list of podcasts and media. Canonical order (sort omitted)
@@ -397,18 +421,34 @@ def list_library_entries(
     exact type; omission means all types. Podcast shows support only the complete
     all-items view. The whole query is parsed strictly (see
     ``library_entries.parse_entries_query``).
+
+    Pages carry a strong ETag keyed by the LibraryEntries revision, view and
+    cursor; a current ``If-None-Match`` answers 304 without hydrating entries.
     """
-    view, query = library_entries.parse_entries_query(request.query_params.multi_items())
-    page = library_entries.list_library_entries(
+    query_items = request.query_params.multi_items()
+    view, query = library_entries.parse_entries_query(query_items)
+    result = collection_http_cache.read_collection_page(
         db,
-        viewer.user_id,
-        library_id,
-        view=view,
-        limit=query.limit,
-        cursor=query.cursor,
-        collection_revision=query.collection_revision,
+        viewer_id=viewer.user_id,
+        family=CollectionFamily.LibraryEntries,
+        path=request.url.path,
+        query_items=query_items,
+        if_none_match=if_none_match,
+        load=lambda: library_entries.list_library_entries(
+            db,
+            viewer.user_id,
+            library_id,
+            view=view,
+            limit=query.limit,
+            cursor=query.cursor,
+            collection_revision=query.collection_revision,
+        ),
+    )
+    return conditional_json_response(
+        etag=result.etag,
+        body=result.body,
+        cache_control=collection_http_cache.COLLECTION_CACHE_CONTROL,
     )
-    return ok(page, by_alias=True)
 
 
 @router.get("/libraries/{library_id}/slate")
@@ -0,0 +1,27 @@
+"""Prometheus exposition for the API process (mounted only when METRICS_ENABLED).
+
+PUBLIC_PATHS member: scrapers authenticate with METRICS_TOKEN as a bearer
+token, never with a user session or the internal header.
+"""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Header
+from fastapi.responses import PlainTextResponse, Response
+from starlette.concurrency import run_in_threadpool
+
+from nexus.config import get_settings
+from nexus.metrics import PROMETHEUS_CONTENT_TYPE, metrics_token_matches, render_metrics
+
+router = APIRouter(tags=["ops"], include_in_schema=False)
+
+
+@router.get("/metrics")
+async def get_metrics(
+    authorization: Annotated[str | None, Header()] = None,
+) -> Response:
+    if not metrics_token_matches(authorization, get_settings().metrics_token):
+        return PlainTextResponse("unauthorized\n", status_code=401)
+    # Rendering may read queue depth from the database; keep it off the event loop.
+    body = await run_in_threadpool(render_metrics)
+    return Response(content=body, media_type=PROMETHEUS_CONTENT_TYPE)
@@ -8,13 +8,14 @@ so this router must be registered before the `media` router (see create_api_rout
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Body, Depends
+from fastapi import APIRouter, Body, Depends, Query, Request
 from fastapi.responses import JSONResponse, Response
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from nexus.auth.middleware import Viewer, get_viewer
 from nexus.db.session import get_db
-from nexus.responses import ok
+from nexus.responses import ok, success_response
 from nexus.schemas.media import (
     TranscriptRequestRequest,
 )
@@ -78,3 +79,15 @@ def request_media_transcript(
         status_code=202 if result.request_enqueued else 200,
         content=ok(result),
     )
+
+
+@router.post("/podcasts/transcription/deepgram/callback")
+async def receive_deepgram_callback(
+    request: Request,
+    db: Annotated[Session, Depends(get_db)],
+    token: Annotated[str | None, Query()] = None,
+) -> dict:
+    """Accept a Deepgram callback delivery (PUBLIC_PATHS member, shared-token auth)."""
+    body = await request.body()
+    out = await run_in_threadpool(transcription_service.record_deepgram_callback, db, body, token)
+    return success_response(out)
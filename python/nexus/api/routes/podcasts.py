@@ -10,7 +10,7 @@ from sqlalchemy.orm import Session
 from nexus.auth.middleware import Viewer, get_viewer
 from nexus.db.session import get_db, get_repeatable_read_db
 from nexus.errors import ApiErrorCode, InvalidRequestError
-from nexus.responses import ok
+from nexus.responses import conditional_json_response, ok
 from nexus.schemas.collection_page import parse_collection_query
 from nexus.schemas.podcast import (
     PodcastEpisodeFromDiscoveryRequest,
@@ -20,6 +20,8 @@ from nexus.schemas.podcast import (
     PodcastSubscribeRequest,
     PodcastSubscriptionSettingsPatchRequest,
 )
+from nexus.services import collection_http_cache
+from nexus.services.collection_revisions import CollectionFamily
 from nexus.services.podcasts import episode_acquisition as podcast_episode_acquisition_service
 from nexus.services.podcasts import episodes as podcast_episodes_service
 from nexus.services.podcasts import refresh as podcast_refresh_service
@@ -68,10 +70,12 @@ def list_subscriptions(
     request: Request,
     viewer: Annotated[Viewer, Depends(get_viewer)],
     db: Annotated[Session, Depends(get_repeatable_read_db)],
-) -> dict:
-    """List active podcast subscriptions for the viewer."""
+    if_none_match: Annotated[str | None, Header(alias="If-None-Match")] = None,
+) -> Response:
+    """List active podcast subscriptions for the viewer, ETag-keyed by revision."""
+    query_items = request.query_params.multi_items()
     parsed = parse_collection_query(
-        request.query_params.multi_items(),
+        query_items,
         domain_keys=frozenset({"sort", "filter", "library_id"}),
     )
     sort = parsed.parameters.get("sort", "recent_episode")
@@ -94,17 +98,29 @@ def list_subscriptions(
             ApiErrorCode.E_INVALID_REQUEST,
             "Invalid podcast library scope",
         ) from exc
-    page = podcast_subscriptions_query_service.list_subscriptions(
+    result = collection_http_cache.read_collection_page(
         db,
-        viewer.user_id,
-        limit=parsed.limit,
-        cursor=parsed.cursor,
-        collection_revision=parsed.collection_revision,
-        sort=sort,  # type: ignore[arg-type]
-        filter=filter_value,  # type: ignore[arg-type]
-        library_id=library_id,
+        viewer_id=viewer.user_id,
+        family=CollectionFamily.PodcastSubscriptions,
+        path=request.url.path,
+        query_items=query_items,
+        if_none_match=if_none_match,
+        load=lambda: podcast_subscriptions_query_service.list_subscriptions(
+            db,
+            viewer.user_id,
+            limit=parsed.limit,
+            cursor=parsed.cursor,
+            collection_revision=parsed.collection_revision,
+            sort=sort,  # type: ignore[arg-type]
+            filter=filter_value,  # type: ignore[arg-type]
+            library_id=library_id,
+        ),
+    )
+    return conditional_json_response(
+        etag=result.etag,
+        body=result.body,
+        cache_control=collection_http_cache.COLLECTION_CACHE_CONTROL,
     )
-    return ok(page, by_alias=True)
 
 
 @router.post("/podcasts/import/opml")
@@ -250,10 +266,12 @@ def list_podcast_episodes(
     request: Request,
     viewer: Annotated[Viewer, Depends(get_viewer)],
     db: Annotated[Session, Depends(get_repeatable_read_db)],
-) -> dict:
-    """List viewer-visible episodes for one podcast."""
+    if_none_match: Annotated[str | None, Header(alias="If-None-Match")] = None,
+) -> Response:
+    """List viewer-visible episodes for one podcast, ETag-keyed by revision."""
+    query_items = request.query_params.multi_items()
     parsed = parse_collection_query(
-        request.query_params.multi_items(),
+        query_items,
         domain_keys=frozenset({"state", "sort"}),
     )
     state = parsed.parameters.get("state", "all")
@@ -268,17 +286,29 @@ def list_podcast_episodes(
             ApiErrorCode.E_INVALID_REQUEST,
             "Invalid podcast episode sort option",
         )
-    page = podcast_episodes_service.list_podcast_episodes_for_viewer(
+    result = collection_http_cache.read_collection_page(
         db,
-        viewer.user_id,
-        podcast_id,
-        limit=parsed.limit,
-        cursor=parsed.cursor,
-        collection_revision=parsed.collection_revision,
-        state=state,  # type: ignore[arg-type]
-        sort=sort,  # type: ignore[arg-type]
+        viewer_id=viewer.user_id,
+        family=CollectionFamily.PodcastEpisodes,
+        path=request.url.path,
+        query_items=query_items,
+        if_none_match=if_none_match,
+        load=lambda: podcast_episodes_service.list_podcast_episodes_for_viewer(
+            db,
+            viewer.user_id,
+            podcast_id,
+            limit=parsed.limit,
+            cursor=parsed.cursor,
+            collection_revision=parsed.collection_revision,
+            state=state,  # type: ignore[arg-type]
+            sort=sort,  # type: ignore[arg-type]
+        ),
+    )
+    return conditional_json_response(
+        etag=result.etag,
+        body=result.body,
+        cache_control=collection_http_cache.COLLECTION_CACHE_CONTROL,
     )
-    return ok(page, by_alias=True)
 
 
 @router.post("/podcasts/{podcast_id}/episodes/mark-played")
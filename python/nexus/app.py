@@ -17,18 +17,21 @@ Order of registration:
 1. AuthMiddleware (innermost auth boundary)
 2. RequestDbSessionMiddleware (releases sessions before body transfer)
 3. StreamCORSMiddleware when configured (stream route CORS)
-4. RequestIDMiddleware (outermost request logging and X-Request-ID)
+4. ProfilingMiddleware when configured (sampling profiles)
+5. RequestIDMiddleware (outermost request logging and X-Request-ID)
 
 Actual execution order per request:
 1. RequestIDMiddleware (sets request_id, starts timer)
-2. StreamCORSMiddleware when configured (stream route CORS)
-3. RequestDbSessionMiddleware (tracks response-start DB release)
-4. AuthMiddleware (verifies auth, sets viewer)
-5. Route handler
-6. AuthMiddleware (returns response)
-7. RequestDbSessionMiddleware (releases request DB sessions before body transfer)
-8. StreamCORSMiddleware when configured (stream route CORS)
-9. RequestIDMiddleware (logs, sets response header)
+2. ProfilingMiddleware when configured (starts sampling)
+3. StreamCORSMiddleware when configured (stream route CORS)
+4. RequestDbSessionMiddleware (tracks response-start DB release)
+5. AuthMiddleware (verifies auth, sets viewer)
+6. Route handler
+7. AuthMiddleware (returns response)
+8. RequestDbSessionMiddleware (releases request DB sessions before body transfer)
+9. StreamCORSMiddleware when configured (stream route CORS)
+10. ProfilingMiddleware when configured (stops at response start, stores profile)
+11. RequestIDMiddleware (logs, sets response header)
 
 LLM client lifecycle:
 - httpx.AsyncClient is created at startup, stored in app.state, and shared by
@@ -64,6 +67,7 @@ from nexus.errors import ApiError, ApiErrorCode
 from nexus.jobs.registry import get_task_contract_digest
 from nexus.logging import get_logger
 from nexus.middleware.db_session import RequestDbSessionMiddleware
+from nexus.middleware.profiling import ProfilingMiddleware
 from nexus.middleware.request_id import RequestIDMiddleware
 from nexus.middleware.stream_cors import StreamCORSMiddleware
 from nexus.public_resource_security import (
@@ -389,6 +393,12 @@ def create_app(
                 stream_base_url=settings.effective_stream_base_url,
             )
 
+    # Sampling profiles for PROFILING_ROUTES and signed X-Nexus-Profile requests.
+    # Runs inside RequestIDMiddleware, which supplies the profile key.
+    if settings.profiling_routes or settings.profiling_signing_key:
+        app.add_middleware(ProfilingMiddleware)
+        logger.info("profiling_middleware_enabled")
+
     # Reader-state and reader-profile responses are never cacheable: the
     # cursor is revalidated event-driven and the profile is per-user private
     # state, so a cached snapshot would defeat revision arbitration or leak
@@ -44,6 +44,8 @@ PUBLIC_PATHS = {
     "/openapi.json",
     "/billing/stripe/webhook",
     "/ingest/email",
+    "/podcasts/transcription/deepgram/callback",
+    "/metrics",
 }
 EXTENSION_AUTH_PATHS = {
     "/auth/extension-sessions/current",
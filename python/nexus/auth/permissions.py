@@ -12,11 +12,13 @@ Query Semantics:
 - Membership role values: 'admin', 'member' (lowercase strings, not enums)
 - LibraryEntry rows with non-null media_id connect libraries and media
 
-Media Readability Rule (can_read_media / visible_media_ids_cte_sql):
+Media Readability Rule (can_read_media / visible_media_ids_rule_sql):
 - A media item is readable iff the viewer has a membership path or an incoming
   or creator grant path to that media (including an exact child-highlight
   grant), AND the viewer has no user_media_deletions tombstone for it, AND no
   media_teardown_intents row is armed for it.
+- visible_media_ids_cte_sql reads the rule's materialization,
+  viewer_visible_media, which database triggers maintain (migration 0221).
 - This is the sole authorization/global-readable relation. It is broader
   than "My Library": services/library_entries.py:library_media_ids_cte_sql()
   layers the personal-Default/non-default-library distinction on top of it.
@@ -175,8 +177,27 @@ def non_system_media_ref_exists_sql(media_expr: str, viewer_param: str = ":viewe
 def visible_media_ids_cte_sql() -> str:
     """Return SQL for the canonical visible-media CTE. Binds :viewer_id.
 
-    Sole authorization/global-readable relation: a viewer's membership or
-    incoming/creator grant path, minus tombstoned and armed-teardown media.
+    Sole authorization/global-readable relation, read from
+    ``viewer_visible_media``: the triggers of migration 0221 keep it equal to
+    :func:`visible_media_ids_rule_sql` on every membership, library entry, grant,
+    highlight anchor, tombstone and teardown change.
+    """
+    return """
+        SELECT vvm.media_id
+        FROM viewer_visible_media vvm
+        WHERE vvm.user_id = :viewer_id
+    """
+
+
+def visible_media_ids_rule_sql(viewer_param: str = ":viewer_id") -> str:
+    """The readability rule evaluated over ``media`` for ``viewer_param``.
+
+    A viewer's membership or incoming/creator grant path, minus tombstoned and
+    armed-teardown media. ``viewer_visible_media`` materializes it (the SQL
+    function ``viewer_media_visible`` is its per-pair form); reads go through
+    :func:`visible_media_ids_cte_sql`. Kept for the consistency rebuild, which
+    passes a column as ``viewer_param``, and for benchmarking against the
+    materialized set.
     """
     return f"""
         SELECT m.id AS media_id
@@ -187,15 +208,15 @@ def visible_media_ids_cte_sql() -> str:
                 FROM library_entries le
                 JOIN memberships membership
                   ON membership.library_id = le.library_id
-                WHERE membership.user_id = :viewer_id
+                WHERE membership.user_id = {viewer_param}
                   AND le.media_id = m.id
             )
-            OR {resource_grants.media_grant_path_exists_sql("m.id")}
+            OR {resource_grants.media_grant_path_exists_sql("m.id", viewer_param)}
           )
           AND NOT EXISTS (
               SELECT 1
               FROM user_media_deletions umd
-              WHERE umd.user_id = :viewer_id
+              WHERE umd.user_id = {viewer_param}
                 AND umd.media_id = m.id
           )
           AND NOT EXISTS (
@@ -36,6 +36,7 @@ INTERACTIVE_WORKER_JOB_KINDS: tuple[str, ...] = (
 )
 BACKGROUND_WORKER_JOB_KINDS: tuple[str, ...] = (
     "media_content_reindex_job",
+    "content_embedding_halfvec_backfill_job",
     "enrich_metadata",
     "media_unit_build",
     "note_reindex_job",
@@ -58,6 +59,7 @@ MAINTENANCE_JOB_KINDS: tuple[str, ...] = (
     "sync_gutenberg_catalog_job",
     "prune_background_jobs_job",
     "purge_expired_auth_handoff_codes",
+    "viewer_visible_media_rebuild_job",
 )
 ORACLE_RECONCILE_JOB_KINDS: tuple[str, ...] = (
     "ingest_media_source",
@@ -225,6 +227,11 @@ class Settings(BaseSettings):
         default="https://www.googleapis.com/youtube/v3",
         alias="YOUTUBE_DATA_BASE_URL",
     )
+    # Seconds an external Browse provider page (Brave, YouTube, Podcast Index)
+    # is reused across viewers; 0 disables the cache and request coalescing.
+    browse_provider_cache_ttl_seconds: int = Field(
+        default=60, alias="BROWSE_PROVIDER_CACHE_TTL_SECONDS"
+    )
     x_api_bearer_token: str | None = Field(default=None, alias="X_API_BEARER_TOKEN")
     x_api_base_url: str = Field(default="https://api.x.com/2", alias="X_API_BASE_URL")
     x_api_timeout_seconds: float = Field(default=10.0, alias="X_API_TIMEOUT_SECONDS")
@@ -252,6 +259,22 @@ class Settings(BaseSettings):
     podcast_transcription_timeout_seconds: float = Field(
         default=90.0, alias="PODCAST_TRANSCRIPTION_TIMEOUT_SECONDS"
     )
+    # Public URL of POST /podcasts/transcription/deepgram/callback. When set
+    # together with the secret, episode transcription is submitted for callback
+    # delivery and the worker yields its slot instead of waiting on the request.
+    deepgram_callback_url: str | None = Field(default=None, alias="DEEPGRAM_CALLBACK_URL")
+    deepgram_callback_secret: str | None = Field(
+        default=None,
+        alias="DEEPGRAM_CALLBACK_SECRET",
+        exclude=True,
+        repr=False,
+    )
+    podcast_transcription_poll_seconds: int = Field(
+        default=60, alias="PODCAST_TRANSCRIPTION_POLL_SECONDS"
+    )
+    podcast_transcription_callback_deadline_seconds: int = Field(
+        default=6 * 3600, alias="PODCAST_TRANSCRIPTION_CALLBACK_DEADLINE_SECONDS"
+    )
     podcast_refresh_due_schedule_seconds: int = Field(
         default=900, alias="PODCAST_REFRESH_DUE_SCHEDULE_SECONDS"
     )
@@ -330,12 +353,38 @@ class Settings(BaseSettings):
     worker_db_failure_backoff_max_seconds: float = Field(
         default=900.0, alias="WORKER_DB_FAILURE_BACKOFF_MAX_SECONDS"
     )
+    # Opt-in Prometheus exposition: GET /metrics on the API and on
+    # WORKER_METRICS_PORT for workers, both requiring METRICS_TOKEN as a bearer.
+    metrics_enabled: bool = Field(default=False, alias="METRICS_ENABLED")
+    metrics_token: str | None = Field(
+        default=None,
+        alias="METRICS_TOKEN",
+        exclude=True,
+        repr=False,
+    )
+    worker_metrics_port: int | None = Field(default=None, alias="WORKER_METRICS_PORT")
+    # Set on exactly one scraped process: it alone exports the shared queue depth.
+    metrics_queue_depth: bool = Field(default=False, alias="METRICS_QUEUE_DEPTH")
+    # Opt-in sampling profiles (nexus.profiling): comma-separated job kinds and
+    # route templates to always profile, plus a key for on-demand X-Nexus-Profile.
+    profiling_job_kinds: str | None = Field(default=None, alias="PROFILING_JOB_KINDS")
+    profiling_routes: str | None = Field(default=None, alias="PROFILING_ROUTES")
+    profiling_signing_key: str | None = Field(
+        default=None,
+        alias="PROFILING_SIGNING_KEY",
+        exclude=True,
+        repr=False,
+    )
+    profiling_sample_interval_ms: int = Field(default=10, alias="PROFILING_SAMPLE_INTERVAL_MS")
     sync_gutenberg_catalog_schedule_seconds: int = Field(
         default=0, alias="SYNC_GUTENBERG_CATALOG_SCHEDULE_SECONDS"
     )
     background_job_prune_schedule_seconds: int = Field(
         default=0, alias="BACKGROUND_JOB_PRUNE_SCHEDULE_SECONDS"
     )
+    viewer_visible_media_rebuild_schedule_seconds: int = Field(
+        default=0, alias="VIEWER_VISIBLE_MEDIA_REBUILD_SCHEDULE_SECONDS"
+    )
     background_job_prune_succeeded_after_days: int = Field(
         default=7, alias="BACKGROUND_JOB_PRUNE_SUCCEEDED_AFTER_DAYS"
     )
@@ -395,6 +444,10 @@ class Settings(BaseSettings):
         default=None, alias="NEXUS_FABLE_RETENTION_ACCEPTED_AT"
     )
 
+    # Directory holding the pre-seeded o200k_base encoding that prompt budgeting
+    # counts tokens with. Unset, prompts are counted by the character heuristic.
+    tiktoken_cache_dir: str | None = Field(default=None, alias="TIKTOKEN_CACHE_DIR")
+
     # Public web search provider settings.
     # Brave is the first production web-search provider. If no API key is
     # configured, required web-search turns fail closed with a typed tool error.
@@ -436,6 +489,23 @@ class Settings(BaseSettings):
         default=20.0,
         alias="TRANSCRIPT_EMBEDDING_TIMEOUT_SECONDS",
     )
+    # Per-query HNSW search settings for content-embedding ANN candidates (0217).
+    # Iterative scan needs pgvector >= 0.8; on older servers it is not set at all,
+    # since pgvector rejects hnsw.* names it does not define.
+    search_hnsw_ef_search: int = Field(default=100, alias="SEARCH_HNSW_EF_SEARCH")
+    search_hnsw_iterative_scan: Literal["off", "strict_order", "relaxed_order"] = Field(
+        default="relaxed_order", alias="SEARCH_HNSW_ITERATIVE_SCAN"
+    )
+    # Quantized candidate stage (0218): top ann_limit × rerank factor over the
+    # halfvec index, then exact cosine over the full vectors. Enable only once
+    # content_embedding_halfvec_backfill_job has filled every row; rows without a
+    # halfvec are invisible to this stage.
+    search_quantized_candidates: bool = Field(default=False, alias="SEARCH_QUANTIZED_CANDIDATES")
+    search_quantized_rerank_factor: int = Field(default=4, alias="SEARCH_QUANTIZED_RERANK_FACTOR")
+    # 0 (default) leaves content_embedding_halfvec_backfill_job unscheduled.
+    content_embedding_halfvec_backfill_schedule_seconds: int = Field(
+        default=0, alias="CONTENT_EMBEDDING_HALFVEC_BACKFILL_SCHEDULE_SECONDS"
+    )
 
     # Metadata enrichment settings
     metadata_enrichment_enabled: bool = Field(default=True, alias="METADATA_ENRICHMENT_ENABLED")
@@ -684,6 +754,32 @@ class Settings(BaseSettings):
             raise ValueError("PODCAST_REFRESH_DUE_LIMIT must be >= 1.")
         if self.podcast_transcription_timeout_seconds <= 0:
             raise ValueError("PODCAST_TRANSCRIPTION_TIMEOUT_SECONDS must be > 0.")
+        if bool(self.deepgram_callback_url) != bool(self.deepgram_callback_secret):
+            raise ValueError(
+                "DEEPGRAM_CALLBACK_URL and DEEPGRAM_CALLBACK_SECRET must be set together."
+            )
+        if self.podcast_transcription_poll_seconds < 1:
+            raise ValueError("PODCAST_TRANSCRIPTION_POLL_SECONDS must be >= 1.")
+        if (
+            self.podcast_transcription_callback_deadline_seconds
+            < self.podcast_transcription_poll_seconds
+        ):
+            raise ValueError(
+                "PODCAST_TRANSCRIPTION_CALLBACK_DEADLINE_SECONDS must be >= "
+                "PODCAST_TRANSCRIPTION_POLL_SECONDS."
+            )
+        if self.metrics_enabled and not self.metrics_token:
+            raise ValueError("METRICS_ENABLED requires METRICS_TOKEN.")
+        if self.worker_metrics_port is not None and not 1 <= self.worker_metrics_port <= 65_535:
+            raise ValueError("WORKER_METRICS_PORT must be between 1 and 65535.")
+        if not 1 <= self.profiling_sample_interval_ms <= 1000:
+            raise ValueError("PROFILING_SAMPLE_INTERVAL_MS must be between 1 and 1000.")
+        if not 1 <= self.search_hnsw_ef_search <= 1000:
+            raise ValueError("SEARCH_HNSW_EF_SEARCH must be between 1 and 1000.")
+        if not 1 <= self.search_quantized_rerank_factor <= 20:
+            raise ValueError("SEARCH_QUANTIZED_RERANK_FACTOR must be between 1 and 20.")
+        if self.content_embedding_halfvec_backfill_schedule_seconds < 0:
+            raise ValueError("CONTENT_EMBEDDING_HALFVEC_BACKFILL_SCHEDULE_SECONDS must be >= 0.")
         if self.youtube_transcript_timeout_seconds <= 0:
             raise ValueError("YOUTUBE_TRANSCRIPT_TIMEOUT_SECONDS must be > 0.")
         if self.youtube_transcript_proxy_retries_when_blocked < 0:
@@ -846,6 +942,14 @@ class Settings(BaseSettings):
             )
         if self.sync_gutenberg_catalog_schedule_seconds < 0:
             raise ValueError("SYNC_GUTENBERG_CATALOG_SCHEDULE_SECONDS must be >= 0.")
+        if self.tiktoken_cache_dir is not None and not (
+            os.path.isabs(self.tiktoken_cache_dir) and os.path.isdir(self.tiktoken_cache_dir)
+        ):
+            raise ValueError("TIKTOKEN_CACHE_DIR must be an absolute path to a directory.")
+        if self.browse_provider_cache_ttl_seconds < 0:
+            raise ValueError("BROWSE_PROVIDER_CACHE_TTL_SECONDS must be >= 0.")
+        if self.viewer_visible_media_rebuild_schedule_seconds < 0:
+            raise ValueError("VIEWER_VISIBLE_MEDIA_REBUILD_SCHEDULE_SECONDS must be >= 0.")
         if self.background_job_prune_schedule_seconds < 0:
             raise ValueError("BACKGROUND_JOB_PRUNE_SCHEDULE_SECONDS must be >= 0.")
         if self.atlas_project_schedule_seconds < 0:
@@ -0,0 +1,152 @@
+"""Restart-safe concurrent index builds for migrations.
+
+A killed ``CREATE INDEX CONCURRENTLY`` leaves an invalid relation behind, so a
+rerun drops an invalid exact match and builds again; an index with any other
+definition is refused rather than replaced. Errors carry the calling revision
+so a failed upgrade names its migration.
+
+The HNSW helpers serve 0217 (``embedding_vector``) and 0218
+(``embedding_halfvec``). Their build parameters come from
+``CONTENT_EMBEDDINGS_HNSW_M`` (default 16) and
+``CONTENT_EMBEDDINGS_HNSW_EF_CONSTRUCTION`` (default 64).
+"""
+
+from __future__ import annotations
+
+import os
+
+import sqlalchemy as sa
+from alembic.operations import Operations
+
+
+def hnsw_build_parameters(revision: str) -> tuple[int, int]:
+    """Validated ``(m, ef_construction)`` from the environment."""
+    m = _build_parameter(revision, "CONTENT_EMBEDDINGS_HNSW_M", 16, 2, 100)
+    ef_construction = _build_parameter(
+        revision, "CONTENT_EMBEDDINGS_HNSW_EF_CONSTRUCTION", 64, 4, 1000
+    )
+    if ef_construction < 2 * m:
+        raise RuntimeError(
+            f"{revision} CONTENT_EMBEDDINGS_HNSW_EF_CONSTRUCTION must be at least twice "
+            f"CONTENT_EMBEDDINGS_HNSW_M, got ef_construction={ef_construction}, m={m}"
+        )
+    return m, ef_construction
+
+
+def build_hnsw_index_concurrently(
+    op: Operations,
+    *,
+    revision: str,
+    index_name: str,
+    column: str,
+    opclass: str,
+    m: int,
+    ef_construction: int,
+) -> None:
+    """Build an HNSW index over ``content_embeddings.<column>``."""
+    build_index_concurrently(
+        op,
+        revision=revision,
+        table="content_embeddings",
+        index_name=index_name,
+        using=f"hnsw ({column} {opclass}) WITH (m = {m}, ef_construction = {ef_construction})",
+        expected_definition=(
+            f"CREATE INDEX {index_name} ON public.content_embeddings "
+            f"USING hnsw ({column} {opclass}) "
+            f"WITH (m='{m}', ef_construction='{ef_construction}')"
+        ),
+    )
+
+
+def build_index_concurrently(
+    op: Operations,
+    *,
+    revision: str,
+    table: str,
+    index_name: str,
+    using: str,
+    expected_definition: str,
+) -> None:
+    """Build ``index_name`` on ``table`` without blocking writes.
+
+    ``using`` is everything after ``USING`` in the create statement;
+    ``expected_definition`` is the same index as ``pg_get_indexdef`` spells it.
+    Returns once the index is valid.
+    """
+    bind = op.get_bind()
+    state = _index_state(bind, revision, index_name, expected_definition)
+    with op.get_context().autocommit_block():
+        if state == "exact_invalid":
+            op.drop_index(index_name, table_name=table, postgresql_concurrently=True)
+            _require_index_state(bind, revision, index_name, expected_definition, "absent")
+            state = "absent"
+        if state == "absent":
+            op.execute(f"CREATE INDEX CONCURRENTLY {index_name} ON {table} USING {using}")
+        _require_index_state(bind, revision, index_name, expected_definition, "exact_valid")
+
+
+def _build_parameter(revision: str, name: str, default: int, minimum: int, maximum: int) -> int:
+    raw = os.environ.get(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise RuntimeError(f"{revision} {name} must be an integer, got {raw!r}") from None
+    if not minimum <= value <= maximum:
+        raise RuntimeError(
+            f"{revision} {name} must be between {minimum} and {maximum}, got {value}"
+        )
+    return value
+
+
+def _index_row(bind: sa.engine.Connection, name: str) -> sa.RowMapping | None:
+    return (
+        bind.execute(
+            sa.text(
+                """
+                SELECT
+                    index_metadata.indisvalid AS is_valid,
+                    pg_get_indexdef(index_metadata.indexrelid) AS definition
+                FROM pg_class index_relation
+                JOIN pg_namespace index_namespace
+                  ON index_namespace.oid = index_relation.relnamespace
+                JOIN pg_index index_metadata
+                  ON index_metadata.indexrelid = index_relation.oid
+                WHERE index_namespace.nspname = 'public'
+                  AND index_relation.relname = :name
+                """
+            ),
+            {"name": name},
+        )
+        .mappings()
+        .one_or_none()
+    )
+
+
+def _index_state(
+    bind: sa.engine.Connection, revision: str, index_name: str, expected_definition: str
+) -> str:
+    row = _index_row(bind, index_name)
+    if row is None:
+        return "absent"
+    if row["definition"] != expected_definition:
+        raise RuntimeError(
+            f"{revision} index {index_name} has the wrong definition: {dict(row)!r}; "
+            "drop it or rerun with the parameters it was built with"
+        )
+    return "exact_valid" if row["is_valid"] else "exact_invalid"
+
+
+def _require_index_state(
+    bind: sa.engine.Connection,
+    revision: str,
+    index_name: str,
+    expected_definition: str,
+    expected: str,
+) -> None:
+    actual = _index_state(bind, revision, index_name, expected_definition)
+    if actual != expected:
+        raise RuntimeError(
+            f"{revision} index {index_name} expected state {expected!r}, found {actual!r}"
+        )
@@ -5,11 +5,25 @@ connection pooling for all database operations.
 """
 
 from functools import lru_cache
+from time import perf_counter
 
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
+from sqlalchemy.pool import ConnectionPoolEntry, QueuePool
 
 from nexus.config import get_settings
+from nexus.metrics import DB_POOL_CHECKOUT_WAIT_SECONDS
+
+
+class _CheckoutTimedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited for a connection."""
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT_SECONDS.observe(perf_counter() - started)
 
 
 def create_db_engine(database_url: str | None = None) -> Engine:
@@ -51,6 +65,7 @@ def create_db_engine(database_url: str | None = None) -> Engine:
 
     return create_engine(
         database_url,
+        poolclass=_CheckoutTimedQueuePool,
         pool_size=settings.database_pool_size,
         max_overflow=settings.database_max_overflow,
         pool_timeout=settings.database_pool_timeout_seconds,
@@ -13,19 +13,28 @@ exempt from the API's idle-in-transaction timeout.
 The raw connection is owned here, not by individual routes. This layer caps
 process-local listener count and logs open/close/rejection events so a stream
 surge is visible before ordinary request DB pools are exhausted.
+
+``SharedChannelListener`` is the other shape: one LISTEN connection per process
+and channel, held by a daemon thread and fanned out to subscribers by payload.
+Workers use it for signals many concurrent jobs wait on (each job runs on its
+own event loop), so waiting costs one idle connection per process, not one
+connection or one poll per job.
 """
 
 from __future__ import annotations
 
+import asyncio
 import threading
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass
-from time import monotonic
+from time import monotonic, sleep
 from typing import Protocol, cast
 from uuid import uuid4
 
 import psycopg
 from psycopg import sql
+from psycopg.rows import TupleRow
 
 from nexus.config import get_settings
 from nexus.errors import ApiError, ApiErrorCode
@@ -34,6 +43,8 @@ from nexus.logging import get_logger
 logger = get_logger(__name__)
 
 STREAM_LISTEN_MAX_CONNECTIONS = 64
+SHARED_LISTEN_RECONNECT_SECONDS = 1.0
+SHARED_LISTEN_WAIT_SECONDS = 30.0
 
 
 class StreamListenCapacityError(ApiError):
@@ -254,6 +265,10 @@ class PostgresListenManager:
 _listen_manager = PostgresListenManager()
 
 
+def get_stream_listen_stats() -> StreamListenStats:
+    return _listen_manager.stats
+
+
 async def _connect() -> _ListenConnection:
     # psycopg wants the bare libpq URL, not SQLAlchemy's postgresql+psycopg://.
     url = get_settings().database_url.replace("postgresql+psycopg://", "postgresql://", 1)
@@ -263,6 +278,144 @@ async def _connect() -> _ListenConnection:
     )
 
 
+class NotificationTick:
+    """One subscriber's "the target may have changed" flag.
+
+    The listener thread raises the flag on a matching NOTIFY and on every
+    (re)LISTEN, when notifications may have been missed; it starts raised so the
+    subscriber reads its row once. The row stays the source of truth: a raised
+    flag means "re-read", never "changed".
+    """
+
+    def __init__(self, target: str) -> None:
+        self.target = target
+        self._pending = threading.Event()
+        self._pending.set()
+        self._wakers: set[Callable[[], None]] = set()
+        self._lock = threading.Lock()
+
+    def consume(self) -> bool:
+        """Lower the flag and report whether it was raised."""
+        with self._lock:
+            if not self._pending.is_set():
+                return False
+            self._pending.clear()
+            return True
+
+    async def wait(self) -> None:
+        """Return once the flag is raised; callable from any event loop."""
+        loop = asyncio.get_running_loop()
+        woken = asyncio.Event()
+
+        def wake() -> None:
+            loop.call_soon_threadsafe(woken.set)
+
+        with self._lock:
+            if self._pending.is_set():
+                return
+            self._wakers.add(wake)
+        try:
+            await woken.wait()
+        finally:
+            with self._lock:
+                self._wakers.discard(wake)
+
+    def _raise(self) -> None:
+        with self._lock:
+            self._pending.set()
+            wakers = tuple(self._wakers)
+        for wake in wakers:
+            # The waiter's loop may already be closed; it no longer cares.
+            with suppress(RuntimeError):
+                wake()
+
+
+class SharedChannelListener:
+    """One process-wide LISTEN on ``channel``, fanned out by NOTIFY payload.
+
+    The daemon thread starts with the first subscription and then keeps its
+    autocommit connection for the life of the process; it blocks on the socket,
+    so idle subscribers cost no queries. A connection lost to a database error,
+    or to any other exception in the loop, is logged and re-opened, and every
+    re-LISTEN raises all ticks so subscribers re-read what they may have missed.
+    Until the LISTEN is back, each failed attempt raises them too, so an outage
+    degrades to a re-read per reconnect interval instead of a blind spot.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        *,
+        reconnect_seconds: float = SHARED_LISTEN_RECONNECT_SECONDS,
+        wait_seconds: float = SHARED_LISTEN_WAIT_SECONDS,
+    ) -> None:
+        self._channel = channel
+        self._reconnect_seconds = reconnect_seconds
+        self._wait_seconds = wait_seconds
+        self._subscribers: dict[str, set[NotificationTick]] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @contextmanager
+    def subscribe(self, target: str) -> Iterator[NotificationTick]:
+        tick = NotificationTick(target)
+        with self._lock:
+            self._subscribers.setdefault(target, set()).add(tick)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=f"listen-{self._channel}",
+                    daemon=True,
+                )
+                self._thread.start()
+        try:
+            yield tick
+        finally:
+            with self._lock:
+                ticks = self._subscribers.get(target)
+                if ticks is not None:
+                    ticks.discard(tick)
+                    if not ticks:
+                        del self._subscribers[target]
+
+    def _dispatch(self, target: str | None) -> None:
+        """Raise the ticks for ``target``, or every tick when ``target`` is None."""
+        with self._lock:
+            if target is None:
+                ticks = [tick for group in self._subscribers.values() for tick in group]
+            else:
+                ticks = list(self._subscribers.get(target, ()))
+        for tick in ticks:
+            tick._raise()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                with _connect_sync() as conn:
+                    conn.execute(sql.SQL("LISTEN {}").format(sql.Identifier(self._channel)))
+                    logger.info("shared_listen.open", channel=self._channel)
+                    self._dispatch(None)
+                    while True:
+                        for note in conn.notifies(timeout=self._wait_seconds):
+                            self._dispatch(note.payload)
+            except (psycopg.Error, OSError) as exc:
+                logger.warning("shared_listen.failed", channel=self._channel, error=str(exc))
+            except Exception:
+                # Nothing restarts this thread, so a bug in dispatch must not end
+                # every subscriber's cancel delivery for the life of the process.
+                logger.exception("shared_listen.crashed", channel=self._channel)
+            # justify-polling: while the LISTEN is down no NOTIFY arrives, so every
+            # failed (re)connect raises all ticks and subscribers re-read their row
+            # once per reconnect interval until the next LISTEN re-syncs them.
+            self._dispatch(None)
+            sleep(self._reconnect_seconds)
+
+
+def _connect_sync() -> psycopg.Connection[TupleRow]:
+    url = get_settings().database_url.replace("postgresql+psycopg://", "postgresql://", 1)
+    return psycopg.connect(url, autocommit=True)
+
+
 async def open_stream_listener(
     channel: str, target: str, idle_timeout_seconds: float
 ) -> PostgresStreamListener:
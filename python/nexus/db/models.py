@@ -27,7 +27,7 @@ from sqlalchemy import (
     UniqueConstraint,
     text,
 )
-from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TIMESTAMP, TSVECTOR
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.types import UserDefinedType
@@ -51,6 +51,18 @@ class PGVector(UserDefinedType):
         return f"vector({self.dimensions})"
 
 
+class PGHalfVec(UserDefinedType):
+    """PostgreSQL pgvector half-precision column type."""
+
+    cache_ok = True
+
+    def __init__(self, dimensions: int):
+        self.dimensions = dimensions
+
+    def get_col_spec(self, **_kw: object) -> str:
+        return f"halfvec({self.dimensions})"
+
+
 # =============================================================================
 # Enums
 # =============================================================================
@@ -1574,6 +1586,37 @@ class ProjectGutenbergCatalogEntry(Base):
     )
 
 
+class ProjectGutenbergSearchDocument(Base):
+    """Per-ebook Browse search document, rebuilt by the catalog sync."""
+
+    __tablename__ = "project_gutenberg_search_documents"
+
+    ebook_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("project_gutenberg_catalog.ebook_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    search_tsv: Mapped[str] = mapped_column(TSVECTOR, nullable=False)
+    contributors: Mapped[list[dict[str, object]]] = mapped_column(
+        JSONB,
+        nullable=False,
+        server_default=text("'[]'::jsonb"),
+    )
+    refreshed_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        server_default=text("now()"),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_project_gutenberg_search_documents_search_tsv",
+            "search_tsv",
+            postgresql_using="gin",
+        ),
+    )
+
+
 class Contributor(Base):
     """Canonical person, organization, group, or local creator identity.
 
@@ -1862,6 +1905,14 @@ class Fragment(Base):
     t_start_ms: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
     t_end_ms: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
     speaker_label: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Prefix sums over lower-idx fragments of the same media, refreshed by the
+    # fragment writers (media_document_metrics.refresh_fragment_document_offsets).
+    document_word_start: Mapped[int] = mapped_column(
+        BigInteger, server_default=text("0"), nullable=False
+    )
+    document_char_start: Mapped[int] = mapped_column(
+        BigInteger, server_default=text("0"), nullable=False
+    )
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True),
         server_default=text("now()"),
@@ -1870,6 +1921,10 @@ class Fragment(Base):
 
     __table_args__ = (
         UniqueConstraint("media_id", "idx", name="uq_fragments_media_idx"),
+        CheckConstraint(
+            "document_word_start >= 0 AND document_char_start >= 0",
+            name="ck_fragments_document_offsets_nonnegative",
+        ),
         CheckConstraint(
             "(t_start_ms IS NULL AND t_end_ms IS NULL) "
             "OR (t_start_ms IS NOT NULL AND t_end_ms IS NOT NULL)",
@@ -2963,6 +3018,12 @@ class PodcastListeningState(Base):
         TIMESTAMP(timezone=True),
         nullable=True,
     )
+    # Last full-path heartbeat that advanced the viewer's listening collection
+    # families. Steady heartbeats inside the coalescing window skip the bump.
+    collections_bumped_at: Mapped[datetime | None] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=True,
+    )
 
     __table_args__ = (
         CheckConstraint(
@@ -3038,6 +3099,55 @@ class ConsumptionActivitySpan(Base):
     )
 
 
+class ConsumptionActivityRollup(Base):
+    """Incremental 15-minute UTC slot totals over Consumption activity spans.
+
+    Every IANA offset is a whole number of quarter hours, so one slot always
+    falls inside exactly one local day and hour for any viewer time zone.
+    Active time is split across slots; word and media-position deltas are
+    attributed whole to the slot containing the span start. ``folded_through``
+    is the newest folded span's ``created_at``.
+    """
+
+    __tablename__ = "consumption_activity_rollups"
+
+    user_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("users.id", name="fk_consumption_activity_rollups_user"),
+        primary_key=True,
+    )
+    slot_start: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), primary_key=True)
+    media_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("media.id", name="fk_consumption_activity_rollups_media"),
+        primary_key=True,
+    )
+    modality: Mapped[str] = mapped_column(Text, primary_key=True)
+    device_id: Mapped[str] = mapped_column(Text, primary_key=True)
+    device_class: Mapped[str] = mapped_column(Text, primary_key=True)
+    active_ms: Mapped[Decimal] = mapped_column(Numeric, nullable=False)
+    forward_word_position: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    forward_media_position_ms: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    first_observed_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), nullable=False)
+    last_observed_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), nullable=False)
+    folded_through: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), nullable=False)
+
+    __table_args__ = (
+        CheckConstraint(
+            "slot_start = date_bin(interval '15 minutes', slot_start, "
+            "timestamptz '1970-01-01 00:00:00+00')",
+            name="ck_consumption_activity_rollups_slot_aligned",
+        ),
+        Index(
+            "ix_consumption_activity_rollups_user_device_slot",
+            "user_id",
+            "device_id",
+            "slot_start",
+        ),
+        Index("ix_consumption_activity_rollups_media", "media_id"),
+    )
+
+
 class ConsumptionCompletionFact(Base):
     """The first observed post-cutover Finished transition for one viewer/media."""
 
@@ -3134,6 +3244,17 @@ class PodcastTranscriptionJob(Base):
     attempts: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
     started_at: Mapped[datetime | None] = mapped_column(TIMESTAMP(timezone=True), nullable=True)
     completed_at: Mapped[datetime | None] = mapped_column(TIMESTAMP(timezone=True), nullable=True)
+    # Callback-delivered provider request for the current source attempt; the
+    # callback route fills provider_result and the resumed job consumes it.
+    provider_request_id: Mapped[str | None] = mapped_column(Text, nullable=True)
+    provider_diarize: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
+    provider_submitted_at: Mapped[datetime | None] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=True
+    )
+    provider_result: Mapped[dict[str, object] | None] = mapped_column(JSONB, nullable=True)
+    provider_result_received_at: Mapped[datetime | None] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True),
         server_default=text("now()"),
@@ -3150,6 +3271,21 @@ class PodcastTranscriptionJob(Base):
             "status IN ('pending', 'running', 'completed', 'failed')",
             name="ck_podcast_transcription_jobs_status",
         ),
+        CheckConstraint(
+            "(provider_request_id IS NULL AND provider_diarize IS NULL"
+            " AND provider_submitted_at IS NULL AND provider_result IS NULL"
+            " AND provider_result_received_at IS NULL)"
+            " OR (provider_request_id IS NOT NULL AND provider_diarize IS NOT NULL"
+            " AND provider_submitted_at IS NOT NULL"
+            " AND (provider_result IS NULL) = (provider_result_received_at IS NULL))",
+            name="ck_podcast_transcription_jobs_provider_request",
+        ),
+        Index(
+            "uq_podcast_transcription_jobs_provider_request_id",
+            "provider_request_id",
+            unique=True,
+            postgresql_where=text("provider_request_id IS NOT NULL"),
+        ),
         CheckConstraint(
             "attempts >= 0",
             name="ck_podcast_transcription_jobs_attempts_non_negative",
@@ -3464,6 +3600,8 @@ class ContentEmbedding(Base):
     embedding_model: Mapped[str] = mapped_column(Text, nullable=False)
     embedding_dimensions: Mapped[int] = mapped_column(Integer, nullable=False)
     embedding_vector: Mapped[list[float] | None] = mapped_column(PGVector(256), nullable=True)
+    # 16-bit shadow of embedding_vector for the quantized candidate stage (0218).
+    embedding_halfvec: Mapped[list[float] | None] = mapped_column(PGHalfVec(256), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True),
         server_default=text("now()"),
@@ -3514,6 +3652,35 @@ class MediaAtlasPosition(Base):
     )
 
 
+class MediaAtlasProjectionAxes(Base):
+    """The affine map of one user's last full atlas projection.
+
+    Mean embedding, the two principal components, and the fitted coordinate
+    bounds; newly indexed works are placed through it without moving placed
+    ones. Sole writer: services/atlas_projection.py.
+    """
+
+    __tablename__ = "media_atlas_projection_axes"
+
+    user_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    mean: Mapped[list[float]] = mapped_column(ARRAY(Float), nullable=False)
+    pc1: Mapped[list[float]] = mapped_column(ARRAY(Float), nullable=False)
+    pc2: Mapped[list[float]] = mapped_column(ARRAY(Float), nullable=False)
+    x_min: Mapped[float] = mapped_column(Float, nullable=False)
+    x_max: Mapped[float] = mapped_column(Float, nullable=False)
+    y_min: Mapped[float] = mapped_column(Float, nullable=False)
+    y_max: Mapped[float] = mapped_column(Float, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        server_default=text("now()"),
+        nullable=False,
+    )
+
+
 class ContentIndexState(Base):
     """Active evidence index pointer for a content owner."""
 
@@ -3531,6 +3698,10 @@ class ContentIndexState(Base):
     status_reason: Mapped[str | None] = mapped_column(Text, nullable=True)
     active_embedding_provider: Mapped[str | None] = mapped_column(Text, nullable=True)
     active_embedding_model: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Media owners only: ordered [chunk_idx, sha256(chunk_text)] pairs and the
+    # content fingerprint derived from them plus the active index pointer.
+    chunk_hashes: Mapped[list[list[object]] | None] = mapped_column(JSONB, nullable=True)
+    content_fingerprint: Mapped[str | None] = mapped_column(Text, nullable=True)
     updated_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True),
         server_default=text("now()"),
@@ -5918,6 +6089,25 @@ class UserMediaDeletion(Base):
     )
 
 
+class ViewerVisibleMedia(Base):
+    """(viewer, media) pairs the readability rule admits; trigger-maintained (0221)."""
+
+    __tablename__ = "viewer_visible_media"
+
+    user_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    media_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("media.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    __table_args__ = (Index("ix_viewer_visible_media_media_id", "media_id"),)
+
+
 # =============================================================================
 # EPUB
 # =============================================================================
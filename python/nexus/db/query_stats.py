@@ -0,0 +1,152 @@
+"""Per-request and per-job SQL statement accounting.
+
+``track_queries()`` opens a scope; every statement any engine executes while the
+scope is active adds to its ``QueryStats``: statement count, time spent in the
+cursor, and a count per statement fingerprint. Scopes nest and every active
+scope sees every statement, so a test budget around an API call also counts
+what the request middleware's own scope records.
+
+The listeners are attached to the ``Engine`` class, not one engine instance, so
+the application engine and the test fixture engine are both covered. Outside
+any scope they cost one ContextVar read per statement.
+
+A fingerprint that repeats within one scope is the N+1 signature: the same
+parameterized statement issued once per item of a loop. Bound parameters are
+already out of the SQL text; the fingerprint also folds inline literals and
+expanded ``IN`` lists so per-item variants collapse to one key.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from nexus.logging import get_logger
+
+logger = get_logger(__name__)
+
+# A fingerprint issued this many times in one scope is logged as a suspected N+1.
+REPEATED_STATEMENT_THRESHOLD = 10
+_FINGERPRINT_MAX_CHARS = 240
+_QUERY_STARTED_KEY = "nexus_query_started"
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<![:\w]):\w+|\?")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+_active_scopes: ContextVar[tuple[QueryStats, ...]] = ContextVar(
+    "nexus_query_stats_scopes", default=()
+)
+
+
+class QueryStats:
+    """Statements executed inside one ``track_queries()`` scope."""
+
+    def __init__(self) -> None:
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.fingerprints: Counter[str] = Counter()
+        # Sync routes and run_in_threadpool share the scope object across threads.
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, seconds: float) -> None:
+        key = fingerprint_statement(statement)
+        with self._lock:
+            self.statements += 1
+            self.db_seconds += seconds
+            self.fingerprints[key] += 1
+
+    def repeated_statements(
+        self, threshold: int = REPEATED_STATEMENT_THRESHOLD
+    ) -> list[tuple[str, int]]:
+        """Fingerprints issued at least ``threshold`` times, most repeated first."""
+        with self._lock:
+            return [
+                (key, count) for key, count in self.fingerprints.most_common() if count >= threshold
+            ]
+
+    def log_fields(self) -> dict[str, Any]:
+        with self._lock:
+            top = self.fingerprints.most_common(1)
+            return {
+                "db_statements": self.statements,
+                "db_ms": round(self.db_seconds * 1000, 2),
+                "db_max_repeats": top[0][1] if top else 0,
+            }
+
+
+def fingerprint_statement(statement: str) -> str:
+    """Normalize SQL so per-item variants of one statement share a key."""
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    normalized = _STRING_LITERAL.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _PLACEHOLDER_LIST.sub("(?)", normalized)
+    return normalized[:_FINGERPRINT_MAX_CHARS]
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count every statement executed in this context until the block exits."""
+    stats = QueryStats()
+    token = _active_scopes.set((*_active_scopes.get(), stats))
+    try:
+        yield stats
+    finally:
+        _active_scopes.reset(token)
+
+
+def report_repeated_statements(stats: QueryStats, **context: Any) -> None:
+    """Warn once per scope for each fingerprint over the N+1 threshold."""
+    for statement, count in stats.repeated_statements():
+        logger.warning("db_repeated_statement", statement=statement, count=count, **context)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    if _active_scopes.get():
+        conn.info.setdefault(_QUERY_STARTED_KEY, []).append(perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    scopes = _active_scopes.get()
+    started = conn.info.get(_QUERY_STARTED_KEY)
+    if not scopes or not started:
+        return
+    elapsed = perf_counter() - started.pop()
+    for stats in scopes:
+        stats.record(statement, elapsed)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context: Any) -> None:
+    connection = exception_context.connection
+    started = connection.info.get(_QUERY_STARTED_KEY) if connection is not None else None
+    if started:
+        started.pop()
@@ -1023,6 +1023,94 @@ def find_nonterminal_jobs_for_payload(
     return [_row_to_job(row) for row in rows]
 
 
+def nonterminal_job_payload_values(
+    db: Session,
+    *,
+    kind: str,
+    payload_key: str,
+    values: Sequence[str],
+) -> set[str]:
+    """Return the subset of ``values`` some not-yet-terminal ``kind`` job carries.
+
+    The batch form of :func:`find_nonterminal_jobs_for_payload` for one string
+    identity key: a sweep asks about a whole page of candidates (``storagePath``)
+    in one round-trip instead of one containment lookup per candidate.
+    """
+    if not values:
+        return set()
+    return set(
+        db.execute(
+            text(
+                """
+                SELECT DISTINCT payload ->> :payload_key
+                FROM background_jobs
+                WHERE kind = :kind
+                  AND status NOT IN ('succeeded', 'dead')
+                  AND payload ->> :payload_key = ANY(CAST(:values AS text[]))
+                """
+            ),
+            {"kind": kind, "payload_key": payload_key, "values": list(values)},
+        ).scalars()
+    )
+
+
+def wake_pending_jobs_for_payload(
+    db: Session,
+    *,
+    kind: str,
+    expected_payload_match: Mapping[str, Any],
+) -> int:
+    """Make unclaimed pending jobs of ``kind`` whose payload contains the match due now.
+
+    The doorway for an external completion signal (e.g. a provider callback)
+    to cut short a job's self-reschedule wait. Running, failed, and terminal
+    rows are untouched, and the retry budget is not affected. Returns the
+    number of rows woken.
+    """
+    woken = db.execute(
+        text(
+            """
+            UPDATE background_jobs
+            SET available_at = now(), updated_at = now()
+            WHERE kind = :kind
+              AND status = 'pending'
+              AND claimed_by IS NULL
+              AND available_at > now()
+              AND payload @> CAST(:expected_payload_match AS jsonb)
+            RETURNING id
+            """
+        ),
+        {
+            "kind": kind,
+            "expected_payload_match": json.dumps(dict(expected_payload_match)),
+        },
+    ).all()
+    if woken:
+        db.execute(text("SELECT pg_notify('nexus_background_jobs', :kind)"), {"kind": kind})
+    return len(woken)
+
+
+def count_pending_jobs_by_kind(db: Session) -> dict[tuple[str, str], int]:
+    """Count pending rows per kind, split into ``due`` now and ``scheduled`` later."""
+    rows = db.execute(
+        text(
+            """
+            SELECT kind,
+                   count(*) FILTER (WHERE available_at <= now()) AS due,
+                   count(*) FILTER (WHERE available_at > now()) AS scheduled
+            FROM background_jobs
+            WHERE status = 'pending'
+            GROUP BY kind
+            """
+        )
+    ).all()
+    counts: dict[tuple[str, str], int] = {}
+    for kind, due, scheduled in rows:
+        counts[(str(kind), "due")] = int(due)
+        counts[(str(kind), "scheduled")] = int(scheduled)
+    return counts
+
+
 def lock_jobs_for_payload(
     db: Session,
     *,
@@ -222,6 +222,20 @@ def _build_default_registry() -> dict[str, JobDefinition]:
                 else None
             ),
         ),
+        # Consistency check of the 0221 viewer_visible_media triggers: walks users
+        # in batches via self-reschedule and repairs drift. 0 leaves it unscheduled.
+        "viewer_visible_media_rebuild_job": JobDefinition(
+            kind="viewer_visible_media_rebuild_job",
+            handler=_run_viewer_visible_media_rebuild,
+            max_attempts=3,
+            retry_delays_seconds=(60, 300, 900),
+            lease_seconds=300,
+            periodic_interval_seconds=(
+                int(settings.viewer_visible_media_rebuild_schedule_seconds)
+                if settings.viewer_visible_media_rebuild_schedule_seconds > 0
+                else None
+            ),
+        ),
         "purge_expired_auth_handoff_codes": JobDefinition(
             kind="purge_expired_auth_handoff_codes",
             handler=_run_purge_expired_auth_handoff_codes,
@@ -279,6 +293,20 @@ def _build_default_registry() -> dict[str, JobDefinition]:
                 else None
             ),
         ),
+        # Fills the 0218 halfvec shadow for pre-existing embeddings; each run walks
+        # the table in batches via self-reschedule. 0 (default) leaves it unscheduled.
+        "content_embedding_halfvec_backfill_job": JobDefinition(
+            kind="content_embedding_halfvec_backfill_job",
+            handler=_run_content_embedding_halfvec_backfill,
+            max_attempts=3,
+            retry_delays_seconds=(60, 300, 900),
+            lease_seconds=300,
+            periodic_interval_seconds=(
+                int(settings.content_embedding_halfvec_backfill_schedule_seconds)
+                if settings.content_embedding_halfvec_backfill_schedule_seconds > 0
+                else None
+            ),
+        ),
         # Durable media teardown (spec §3.1). Dead rows are never pruned so a stuck
         # teardown stays operator-discoverable; requeue_dead_job is its repair path.
         # The dead-letter handler voids only the exact matching intent when the media
@@ -318,7 +346,7 @@ def _build_default_registry() -> dict[str, JobDefinition]:
 
 def _run_ingest_media_source(
     *, payload: Mapping[str, Any], context: JobExecutionContext
-) -> Mapping[str, Any] | None:
+) -> Mapping[str, Any] | RescheduleRequested | None:
     from nexus.tasks.ingest_media_source import ingest_media_source
 
     return ingest_media_source(
@@ -560,6 +588,24 @@ def _run_atlas_project(
     return atlas_project(payload=payload)
 
 
+def _run_content_embedding_halfvec_backfill(
+    *, payload: Mapping[str, Any], context: JobExecutionContext
+) -> Mapping[str, Any] | RescheduleRequested | None:
+    from nexus.tasks.content_embedding_halfvec_backfill import (
+        content_embedding_halfvec_backfill,
+    )
+
+    return content_embedding_halfvec_backfill(payload=payload, context=context)
+
+
+def _run_viewer_visible_media_rebuild(
+    *, payload: Mapping[str, Any], context: JobExecutionContext
+) -> Mapping[str, Any] | RescheduleRequested | None:
+    from nexus.tasks.viewer_visible_media_rebuild import viewer_visible_media_rebuild
+
+    return viewer_visible_media_rebuild(payload=payload, context=context)
+
+
 def _run_media_teardown(
     *, payload: Mapping[str, Any], context: JobExecutionContext
 ) -> Mapping[str, Any] | RescheduleRequested | None:
@@ -6,7 +6,8 @@ import math
 import threading
 import time
 from collections.abc import Callable, Mapping
-from datetime import datetime
+from contextlib import ExitStack
+from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
@@ -15,6 +16,7 @@ from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from nexus.db.query_stats import report_repeated_statements, track_queries
 from nexus.db.retries import retry_serializable
 from nexus.jobs.queue import (
     JobExecutionContext,
@@ -37,6 +39,8 @@ from nexus.jobs.registry import (
     periodic_slot_start,
 )
 from nexus.logging import get_logger
+from nexus.metrics import JOB_QUEUE_WAIT_SECONDS, JOB_RUN_SECONDS
+from nexus.profiling import job_profiling_enabled, profile_block
 
 logger = get_logger(__name__)
 
@@ -180,15 +184,26 @@ class JobWorker:
             lease_seconds=definition.lease_seconds,
         )
 
+        JOB_QUEUE_WAIT_SECONDS.observe(
+            max((datetime.now(UTC) - claimed.available_at).total_seconds(), 0.0), claimed.kind
+        )
+        run_started = time.monotonic()
         try:
             context = JobExecutionContext(
                 job_id=claimed.id,
                 worker_id=self.worker_id,
                 attempt_no=claimed.attempts,
             )
-            handler_result = definition.handler(payload=claimed.payload, context=context)
+            with ExitStack() as profiling:
+                if job_profiling_enabled(claimed.kind):
+                    profiling.enter_context(profile_block("jobs", str(claimed.id)))
+                with track_queries() as query_stats:
+                    handler_result = definition.handler(payload=claimed.payload, context=context)
+            run_seconds = time.monotonic() - run_started
+            report_repeated_statements(query_stats, job_id=str(claimed.id), kind=claimed.kind)
 
             if isinstance(handler_result, RescheduleRequested):
+                JOB_RUN_SECONDS.observe(run_seconds, claimed.kind, "rescheduled")
                 with self.session_factory() as db:
                     rescheduled = reschedule_running_job(
                         db,
@@ -206,6 +221,7 @@ class JobWorker:
                         job_id=str(claimed.id),
                         kind=claimed.kind,
                         available_at=handler_result.available_at.isoformat(),
+                        **query_stats.log_fields(),
                     )
                 else:
                     logger.warning(
@@ -219,6 +235,7 @@ class JobWorker:
             result_payload = _normalize_result_payload(handler_result)
             failed_result_statuses = set(definition.failed_result_statuses)
             if str(result_payload.get("status") or "") in failed_result_statuses:
+                JOB_RUN_SECONDS.observe(run_seconds, claimed.kind, "failed")
                 error_code = str(result_payload.get("error_code") or "E_WORKER_TASK_FAILED")
                 reason = str(result_payload.get("reason") or "task returned failed status")
                 with self.session_factory() as db:
@@ -251,9 +268,11 @@ class JobWorker:
                         kind=claimed.kind,
                         status=transition,
                         error_code=error_code,
+                        **query_stats.log_fields(),
                     )
                 return True
 
+            JOB_RUN_SECONDS.observe(run_seconds, claimed.kind, "completed")
             with self.session_factory() as db:
                 completed = complete_job(
                     db,
@@ -269,6 +288,7 @@ class JobWorker:
                     job_id=str(claimed.id),
                     kind=claimed.kind,
                     result_kind=result_payload.get("kind"),
+                    **query_stats.log_fields(),
                 )
             else:
                 logger.warning(
@@ -280,6 +300,7 @@ class JobWorker:
         # justify-ignore-error: worker task boundary records failure and applies
         # retry/dead-letter policy.
         except Exception as exc:
+            JOB_RUN_SECONDS.observe(time.monotonic() - run_started, claimed.kind, "error")
             logger.exception(
                 "worker_job_failed",
                 worker_id=self.worker_id,
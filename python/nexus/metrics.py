@@ -0,0 +1,343 @@
+"""Process-local Prometheus metrics for API and worker saturation signals.
+
+Hot paths record into fixed in-process instruments (a lock and a few integer
+adds per event); nothing leaves the process until a scrape renders the text
+exposition format. Exposure is opt-in via ``METRICS_ENABLED``: the API mounts
+``GET /metrics`` and each worker serves the same page on
+``WORKER_METRICS_PORT``, both behind ``METRICS_TOKEN`` as a bearer token.
+
+Gauges that describe shared state (DB pool occupancy, SSE listeners, queue
+depth per lane) are read at scrape time rather than maintained on every event.
+Queue depth is database-wide, so it comes from one designated process only.
+"""
+
+from __future__ import annotations
+
+import hmac
+import math
+import threading
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sequence
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from nexus.logging import get_logger
+
+logger = get_logger(__name__)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS_SECONDS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+JOB_BUCKETS_SECONDS = (0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0, 900.0, 3600.0)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+Sample = tuple[str, tuple[tuple[str, str], ...], float]
+
+
+class Counter:
+    """Monotonic counter keyed by a fixed label tuple."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def samples(self) -> list[Sample]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [
+            (f"{self.name}_total", tuple(zip(self.label_names, key, strict=True)), value)
+            for key, value in values
+        ]
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by a fixed label tuple."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Sequence[str] = (),
+        *,
+        buckets: Sequence[float] = LATENCY_BUCKETS_SECONDS,
+    ) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        # Per label key: one count per finite bucket plus +Inf, then the sum.
+        self._series: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        slot = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = ([0] * (len(self.buckets) + 1), [0.0])
+                self._series[label_values] = series
+            series[0][slot] += 1
+            series[1][0] += value
+
+    def samples(self) -> list[Sample]:
+        with self._lock:
+            snapshot = [
+                (key, list(counts), total[0]) for key, (counts, total) in self._series.items()
+            ]
+        samples: list[Sample] = []
+        for key, counts, total in sorted(snapshot):
+            labels = tuple(zip(self.label_names, key, strict=True))
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += count
+                samples.append(
+                    (f"{self.name}_bucket", (*labels, ("le", _format_value(bound))), cumulative)
+                )
+            samples.append((f"{self.name}_sum", labels, total))
+            samples.append((f"{self.name}_count", labels, cumulative))
+        return samples
+
+
+class Gauge:
+    """Gauge whose samples are read from ``collect`` at scrape time."""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Sequence[str],
+        collect: Callable[[], Iterable[tuple[tuple[str, ...], float]]],
+    ) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._collect = collect
+
+    def samples(self) -> list[Sample]:
+        return [
+            (self.name, tuple(zip(self.label_names, key, strict=True)), value)
+            for key, value in self._collect()
+        ]
+
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "nexus_http_request_duration_seconds",
+    "API request latency by route template.",
+    ("method", "route", "status"),
+)
+DB_POOL_CHECKOUT_WAIT_SECONDS = Histogram(
+    "nexus_db_pool_checkout_wait_seconds",
+    "Time spent waiting for a SQLAlchemy pool connection.",
+)
+JOB_QUEUE_WAIT_SECONDS = Histogram(
+    "nexus_job_queue_wait_seconds",
+    "Delay from a job becoming due to its handler starting.",
+    ("kind",),
+    buckets=JOB_BUCKETS_SECONDS,
+)
+JOB_RUN_SECONDS = Histogram(
+    "nexus_job_run_seconds",
+    "Job handler run time by outcome.",
+    ("kind", "outcome"),
+    buckets=JOB_BUCKETS_SECONDS,
+)
+EMBEDDING_CALL_SECONDS = Histogram(
+    "nexus_embedding_call_seconds",
+    "Embedding provider call latency per batch.",
+    ("model",),
+)
+EMBEDDING_BATCH_SIZE = Histogram(
+    "nexus_embedding_batch_size",
+    "Inputs per embedding provider call.",
+    ("model",),
+    buckets=BATCH_SIZE_BUCKETS,
+)
+RATE_LIMIT_DECISIONS = Counter(
+    "nexus_rate_limit_decisions",
+    "Rate limiter outcomes by check.",
+    ("check", "decision"),
+)
+
+
+def _db_pool_samples() -> list[tuple[tuple[str, ...], float]]:
+    from nexus.db.engine import get_engine
+
+    if get_engine.cache_info().currsize == 0:
+        return []
+    pool = get_engine().pool
+    read = {
+        "size": getattr(pool, "size", None),
+        "checked_out": getattr(pool, "checkedout", None),
+        "overflow": getattr(pool, "overflow", None),
+    }
+    return [((state,), float(reader())) for state, reader in read.items() if reader is not None]
+
+
+def _stream_listener_samples() -> list[tuple[tuple[str, ...], float]]:
+    from nexus.db.listen import get_stream_listen_stats
+
+    stats = get_stream_listen_stats()
+    return [(("active",), float(stats.active)), (("capacity",), float(stats.capacity))]
+
+
+def _queue_depth_samples() -> list[tuple[tuple[str, ...], float]]:
+    from nexus.config import BACKGROUND_WORKER_JOB_KINDS, INTERACTIVE_WORKER_JOB_KINDS
+    from nexus.db.session import get_session_factory
+    from nexus.jobs.queue import count_pending_jobs_by_kind
+
+    interactive = set(INTERACTIVE_WORKER_JOB_KINDS)
+    background = set(BACKGROUND_WORKER_JOB_KINDS)
+    try:
+        with get_session_factory()() as db:
+            counts = count_pending_jobs_by_kind(db)
+            db.rollback()
+    # justify-ignore-error: a scrape must still answer with the in-process
+    # series when the database is what is saturated.
+    except Exception as exc:
+        logger.warning("metrics_queue_depth_unavailable", error=str(exc))
+        return []
+    depth: dict[tuple[str, str], float] = {}
+    for (kind, state), count in counts.items():
+        if kind in interactive:
+            lane = "interactive"
+        elif kind in background:
+            lane = "background"
+        else:
+            lane = "maintenance"
+        depth[(lane, state)] = depth.get((lane, state), 0.0) + count
+    return sorted(depth.items())
+
+
+_INSTRUMENTS: tuple[Counter | Histogram | Gauge, ...] = (
+    HTTP_REQUEST_SECONDS,
+    DB_POOL_CHECKOUT_WAIT_SECONDS,
+    Gauge(
+        "nexus_db_pool_connections",
+        "SQLAlchemy pool occupancy.",
+        ("state",),
+        _db_pool_samples,
+    ),
+    JOB_QUEUE_WAIT_SECONDS,
+    JOB_RUN_SECONDS,
+    Gauge(
+        "nexus_stream_listeners",
+        "Process-local SSE LISTEN connections.",
+        ("state",),
+        _stream_listener_samples,
+    ),
+    EMBEDDING_CALL_SECONDS,
+    EMBEDDING_BATCH_SIZE,
+    RATE_LIMIT_DECISIONS,
+)
+
+
+# The queue is shared, so every process would read the same database-wide
+# counts; only the process with METRICS_QUEUE_DEPTH exports them, and summing the
+# series across scrape targets stays correct.
+JOB_QUEUE_DEPTH = Gauge(
+    "nexus_job_queue_depth",
+    "Pending background jobs per worker lane; due jobs are runnable now.",
+    ("lane", "state"),
+    _queue_depth_samples,
+)
+
+
+def render_metrics(instruments: Iterable[Counter | Histogram | Gauge] | None = None) -> str:
+    """Render every instrument in the Prometheus text exposition format.
+
+    By default these are this process's instruments, plus ``JOB_QUEUE_DEPTH``
+    when it is the process designated by ``METRICS_QUEUE_DEPTH``.
+    """
+    if instruments is None:
+        from nexus.config import get_settings
+
+        instruments = _INSTRUMENTS
+        if get_settings().metrics_queue_depth:
+            instruments = (*instruments, JOB_QUEUE_DEPTH)
+    lines: list[str] = []
+    for instrument in instruments:
+        lines.append(f"# HELP {instrument.name} {instrument.help_text}")
+        lines.append(f"# TYPE {instrument.name} {instrument.kind}")
+        for name, labels, value in instrument.samples():
+            if labels:
+                rendered = ",".join(f'{key}="{_escape_label(val)}"' for key, val in labels)
+                lines.append(f"{name}{{{rendered}}} {_format_value(value)}")
+            else:
+                lines.append(f"{name} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def metrics_token_matches(authorization: str | None, token: str | None) -> bool:
+    """Constant-time bearer check; an unset token never matches."""
+    if not token or not authorization:
+        return False
+    scheme, _, presented = authorization.partition(" ")
+    if scheme.lower() != "bearer":
+        return False
+    return hmac.compare_digest(presented.strip().encode(), token.encode())
+
+
+def start_metrics_server(*, port: int, token: str) -> ThreadingHTTPServer:
+    """Serve ``GET /metrics`` from a daemon thread for processes without an ASGI app."""
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802 - stdlib handler API
+            if self.path != "/metrics":
+                self._send(404, b"not found\n")
+            elif not metrics_token_matches(self.headers.get("authorization"), token):
+                self._send(401, b"unauthorized\n")
+            else:
+                self._send(200, render_metrics().encode())
+
+        def log_message(self, format: str, *args: object) -> None:
+            _ = format, args
+
+        def _send(self, status: int, body: bytes) -> None:
+            self.send_response(status)
+            self.send_header("content-type", PROMETHEUS_CONTENT_TYPE)
+            self.send_header("content-length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("0.0.0.0", port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    logger.info("metrics_server_started", port=server.server_address[1])
+    return server
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
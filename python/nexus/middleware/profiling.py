@@ -0,0 +1,70 @@
+"""ASGI middleware that samples selected requests (see nexus.profiling)."""
+
+from starlette.concurrency import run_in_threadpool
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from nexus.config import get_settings
+from nexus.profiling import (
+    PROFILE_HEADER,
+    SamplingProfiler,
+    profile_header_matches,
+    route_profiling_enabled,
+    store_profile,
+)
+
+
+class ProfilingMiddleware:
+    """Profile a request from dispatch until its response starts.
+
+    Runs inside RequestIDMiddleware so the profile is keyed by the request id.
+    Sampling stops at ``http.response.start``: streamed bodies (SSE) are not
+    profiled, and the upload happens after the response has been sent.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        request_id = (scope.get("state") or {}).get("request_id")
+        if scope["type"] != "http" or request_id is None or not _selected(scope, request_id):
+            await self.app(scope, receive, send)
+            return
+
+        profiler = SamplingProfiler(
+            interval_seconds=get_settings().profiling_sample_interval_ms / 1000
+        )
+        collapsed: str | None = None
+
+        async def stop_once() -> None:
+            nonlocal collapsed
+            if collapsed is None:
+                collapsed = await run_in_threadpool(profiler.stop)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                await stop_once()
+            await send(message)
+
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            await stop_once()
+            await run_in_threadpool(
+                store_profile, "requests", request_id, collapsed or "", samples=profiler.samples
+            )
+
+
+def _selected(scope: Scope, request_id: str) -> bool:
+    headers = dict(scope.get("headers") or ())
+    signed = headers.get(PROFILE_HEADER.lower().encode())
+    if signed is not None and profile_header_matches(signed.decode("latin-1"), request_id):
+        return True
+    if not get_settings().profiling_routes:
+        return False
+    for route in scope["app"].router.routes:
+        match, _ = route.matches(scope)
+        if match is Match.FULL:
+            return route_profiling_enabled(getattr(route, "path", ""))
+    return False
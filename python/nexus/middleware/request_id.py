@@ -5,7 +5,8 @@ This middleware:
 - Validates and normalizes incoming request IDs
 - Attaches the ID to request state for downstream use
 - Echoes the ID in response headers
-- Logs access information after response is produced
+- Logs access information after response is produced, with the request's
+  SQL statement count and DB time (see nexus.db.query_stats)
 
 Middleware Ordering (Critical):
 - Must be added LAST to run FIRST (FastAPI middleware runs in reverse order)
@@ -20,10 +21,15 @@ import uuid
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 
+from nexus.config import Environment, get_settings
+from nexus.db.query_stats import report_repeated_statements, track_queries
 from nexus.logging import clear_request_context, get_logger, set_request_context
+from nexus.metrics import HTTP_REQUEST_SECONDS
 from nexus.services.redact import safe_kv
 
 REQUEST_ID_HEADER = "X-Request-ID"
+# Debug header with the request's statement count; local and test only.
+DB_QUERIES_HEADER = "X-Nexus-DB-Queries"
 MAX_REQUEST_ID_LENGTH = 128
 
 # Regex for valid non-UUID request IDs
@@ -80,6 +86,12 @@ def normalize_request_id(value: str) -> str:
     return value
 
 
+def route_template(request: Request) -> str:
+    """The matched route's path template, so metric labels stay low-cardinality."""
+    route = request.scope.get("route")
+    return str(getattr(route, "path", None) or "unmatched")
+
+
 def generate_request_id() -> str:
     """Generate a new UUID v4 request ID."""
     return str(uuid.uuid4())
@@ -99,11 +111,16 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
     Args:
         app: The ASGI application.
         log_requests: If True, log access entries for each request.
+        expose_query_stats: If True, echo the statement count in
+            X-Nexus-DB-Queries. Defaults to on in local/test only.
     """
 
-    def __init__(self, app, log_requests: bool = True):
+    def __init__(self, app, log_requests: bool = True, expose_query_stats: bool | None = None):
         super().__init__(app)
         self.log_requests = log_requests
+        if expose_query_stats is None:
+            expose_query_stats = get_settings().nexus_env in (Environment.LOCAL, Environment.TEST)
+        self.expose_query_stats = expose_query_stats
 
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
         """Process request with request ID handling."""
@@ -126,43 +143,59 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
             method=request.method,
         )
 
-        try:
-            # Process request through the rest of the middleware stack
-            response = await call_next(request)
-
-            # Get user_id if auth middleware ran (set on request.state.viewer)
-            viewer = getattr(request.state, "viewer", None)
-            user_id = str(viewer.user_id) if viewer else None
-            if user_id:
-                set_request_context(request_id, user_id)
-
-            # Always echo request ID in response
-            response.headers[REQUEST_ID_HEADER] = request_id
-            duration_ms = (time.monotonic() - start_time) * 1000
-            downstream_timings = response.headers.getlist("Server-Timing")
-            api_timing = f"nexus_api;dur={duration_ms:.2f}"
-            response.headers["Server-Timing"] = (
-                ", ".join((api_timing, *downstream_timings)) if downstream_timings else api_timing
-            )
-
-            # Log access entry.
-            if self.log_requests:
-                logger.info(
-                    "http.request.completed",
-                    **safe_kv(
-                        status_code=response.status_code,
-                        duration_ms=round(duration_ms, 2),
-                    ),
+        with track_queries() as query_stats:
+            try:
+                # Process request through the rest of the middleware stack
+                response = await call_next(request)
+
+                # Get user_id if auth middleware ran (set on request.state.viewer)
+                viewer = getattr(request.state, "viewer", None)
+                user_id = str(viewer.user_id) if viewer else None
+                if user_id:
+                    set_request_context(request_id, user_id)
+
+                # Always echo request ID in response
+                response.headers[REQUEST_ID_HEADER] = request_id
+                if self.expose_query_stats:
+                    response.headers[DB_QUERIES_HEADER] = str(query_stats.statements)
+                duration_ms = (time.monotonic() - start_time) * 1000
+                HTTP_REQUEST_SECONDS.observe(
+                    duration_ms / 1000,
+                    request.method,
+                    route_template(request),
+                    str(response.status_code),
+                )
+                downstream_timings = response.headers.getlist("Server-Timing")
+                api_timing = f"nexus_api;dur={duration_ms:.2f}"
+                response.headers["Server-Timing"] = (
+                    ", ".join((api_timing, *downstream_timings))
+                    if downstream_timings
+                    else api_timing
                 )
 
-            return response
-
-        # justify-ignore-error: middleware observability boundary logs context
-        # and re-raises for the global unhandled-exception handler.
-        except Exception:
-            logger.exception("http.request.failed")
-            raise
+                # Log access entry.
+                if self.log_requests:
+                    logger.info(
+                        "http.request.completed",
+                        **safe_kv(
+                            status_code=response.status_code,
+                            duration_ms=round(duration_ms, 2),
+                            **query_stats.log_fields(),
+                        ),
+                    )
+                report_repeated_statements(query_stats, route=route_template(request))
+
+                return response
+
+            # justify-ignore-error: middleware observability boundary logs context
+            # and re-raises for the global unhandled-exception handler.
+            except Exception:
+                HTTP_REQUEST_SECONDS.observe(
+                    time.monotonic() - start_time, request.method, route_template(request), "500"
+                )
+                logger.exception("http.request.failed")
+                raise
 
-        finally:
-            # Clear context at end of request
-            clear_request_context()
+            finally:
+                # Clear context at end of request
+                clear_request_context()
@@ -0,0 +1,148 @@
+"""Opt-in sampling profiler for slow API routes and worker jobs.
+
+A daemon thread reads ``sys._current_frames()`` every
+``PROFILING_SAMPLE_INTERVAL_MS`` and counts the stacks it sees; the profiled
+code itself is not instrumented, so the cost is the sampler's own GIL slices.
+Profiles are written as collapsed stacks (``frame;frame;frame count`` lines,
+the input format of flamegraph.pl and speedscope) under
+``profiles/{jobs|requests}/{id}.collapsed``; the ``profile_captured`` log line
+carries that key as ``profile_path``.
+
+Selection is explicit: ``PROFILING_JOB_KINDS`` and ``PROFILING_ROUTES`` name job
+kinds and route templates to always profile, and a request carrying
+``X-Nexus-Profile: hex(HMAC-SHA256(PROFILING_SIGNING_KEY, X-Request-ID))`` is
+profiled on demand. A job samples only the worker thread; a request samples
+every thread (the endpoint may run on the event loop or in the threadpool), so
+each stack is rooted at its thread name and concurrent requests show up under
+their own threads.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import sys
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from types import FrameType
+from typing import Literal
+
+from nexus.config import get_settings
+from nexus.logging import get_logger
+from nexus.storage.client import StorageError, get_storage_client
+from nexus.storage.paths import build_profile_storage_path
+
+logger = get_logger(__name__)
+
+PROFILE_HEADER = "X-Nexus-Profile"
+PROFILE_CONTENT_TYPE = "text/plain; charset=utf-8"
+# Deep recursion is truncated from the root side; the leaf frames are the signal.
+_MAX_STACK_DEPTH = 128
+
+
+class SamplingProfiler:
+    """Count stacks of one thread (or of every thread) at a fixed interval."""
+
+    def __init__(self, *, interval_seconds: float, thread_id: int | None = None) -> None:
+        self.interval_seconds = interval_seconds
+        self.thread_id = thread_id
+        self.samples = 0
+        self._stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> str:
+        """Stop sampling and return the profile as collapsed stacks."""
+        self._stop.set()
+        self._thread.join()
+        return "".join(f"{stack} {count}\n" for stack, count in self._stacks.most_common())
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        while not self._stop.wait(self.interval_seconds):
+            frames = sys._current_frames()
+            if self.thread_id is not None:
+                frame = frames.get(self.thread_id)
+                if frame is not None:
+                    self._stacks[_collapse(frame)] += 1
+            else:
+                for thread_id, frame in frames.items():
+                    if thread_id == own_id:
+                        continue
+                    if thread_id not in names:
+                        names = {thread.ident: thread.name for thread in threading.enumerate()}
+                    root = names.get(thread_id, f"thread-{thread_id}")
+                    self._stacks[f"{root};{_collapse(frame)}"] += 1
+            self.samples += 1
+
+
+def _collapse(frame: FrameType | None) -> str:
+    parts: list[str] = []
+    while frame is not None and len(parts) < _MAX_STACK_DEPTH:
+        code = frame.f_code
+        module = frame.f_globals.get("__name__", code.co_filename)
+        parts.append(f"{module}:{code.co_qualname}")
+        frame = frame.f_back
+    parts.reverse()
+    return ";".join(parts)
+
+
+def job_profiling_enabled(kind: str) -> bool:
+    return kind in _csv(get_settings().profiling_job_kinds)
+
+
+def route_profiling_enabled(route: str) -> bool:
+    return route in _csv(get_settings().profiling_routes)
+
+
+def profile_header_matches(header: str | None, request_id: str) -> bool:
+    """Whether ``header`` is the HMAC of ``request_id`` under the signing key."""
+    key = get_settings().profiling_signing_key
+    if not key or not header:
+        return False
+    expected = hmac.new(key.encode(), request_id.encode(), hashlib.sha256).hexdigest()
+    return hmac.compare_digest(header.strip().lower(), expected)
+
+
+@contextmanager
+def profile_block(scope: Literal["jobs", "requests"], key: str) -> Iterator[None]:
+    """Sample the calling thread for the block and store the profile."""
+    profiler = SamplingProfiler(
+        interval_seconds=get_settings().profiling_sample_interval_ms / 1000,
+        thread_id=threading.get_ident(),
+    )
+    profiler.start()
+    try:
+        yield
+    finally:
+        store_profile(scope, key, profiler.stop(), samples=profiler.samples)
+
+
+def store_profile(
+    scope: Literal["jobs", "requests"], key: str, collapsed: str, *, samples: int
+) -> None:
+    try:
+        path = build_profile_storage_path(scope, key)
+    # justify-ignore-error: the profile is stored after the observed work, often
+    # while its own exception unwinds; an unstorable key must not replace it.
+    except ValueError as exc:
+        logger.warning("profile_key_rejected", profile_scope=scope, error=str(exc))
+        return
+    try:
+        get_storage_client().put_object(path, collapsed.encode(), PROFILE_CONTENT_TYPE)
+    # justify-ignore-error: profiling is diagnostic; a storage outage must not
+    # fail the job or request it observed.
+    except StorageError as exc:
+        logger.warning("profile_store_failed", profile_path=path, error=str(exc))
+        return
+    logger.info("profile_captured", profile_path=path, samples=samples)
+
+
+def _csv(value: str | None) -> frozenset[str]:
+    return frozenset(part.strip() for part in (value or "").split(",") if part.strip())
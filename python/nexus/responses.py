@@ -11,7 +11,7 @@ from collections.abc import Sequence
 from typing import Any
 
 from fastapi import Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 from sqlalchemy.exc import TimeoutError as SAQueuePoolTimeout
 from sqlalchemy.pool import QueuePool
@@ -58,6 +58,14 @@ def ok_page(
     }
 
 
+def conditional_json_response(*, etag: str, body: bytes | None, cache_control: str) -> Response:
+    """Answer a validator-backed read: 304 when ``body`` is None, else the encoded JSON."""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if body is None:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 def error_response(
     code: ApiErrorCode,
     message: str,
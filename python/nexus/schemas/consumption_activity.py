@@ -20,13 +20,13 @@ from nexus.schemas.presence import Absent, Presence
 
 _IN_CONFIG = ConfigDict(alias_generator=to_camel, populate_by_name=False, extra="forbid")
 _INT64_MAX = 9_223_372_036_854_775_807
-_MAX_ACTIVITY_SPAN_MS = 30_000
+MAX_ACTIVITY_SPAN_MS = 30_000
 
 ActivityModality = Literal["Reading", "Listening", "Viewing"]
 ActivityDeviceClass = Literal["Desktop", "Mobile"]
 _NonNegativeInt64 = Annotated[int, Field(ge=0, le=_INT64_MAX)]
 _Progress = Annotated[float, Field(ge=0, le=1)]
-_DurationMs = Annotated[int, Field(gt=0, le=_MAX_ACTIVITY_SPAN_MS)]
+_DurationMs = Annotated[int, Field(gt=0, le=MAX_ACTIVITY_SPAN_MS)]
 _COMPLETION_HANDLE_RE = re.compile(r"^ncc1\.[A-Za-z0-9_-]{22}\.[A-Za-z0-9_-]{22}$")
 _DEVICE_HANDLE_RE = re.compile(r"^ncd1\.[A-Za-z0-9_-]{22}$")
 
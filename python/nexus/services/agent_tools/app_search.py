@@ -231,6 +231,46 @@ def execute_app_search(
     forced_error: str | None = None,
 ) -> AppSearchRun:
     """Run app search for a chat turn and persist tool/retrieval metadata."""
+    run = run_app_search(
+        db,
+        viewer_id=viewer_id,
+        conversation_id=conversation_id,
+        user_message_id=user_message_id,
+        assistant_message_id=assistant_message_id,
+        scopes=scopes,
+        query=query,
+        kinds=kinds,
+        formats=formats,
+        authors=authors,
+        roles=roles,
+        tool_call_index=tool_call_index,
+        forced_error=forced_error,
+    )
+    persist_app_search_run(db, run)
+    return run
+
+
+def run_app_search(
+    db: Session,
+    *,
+    viewer_id: UUID,
+    conversation_id: UUID,
+    user_message_id: UUID,
+    assistant_message_id: UUID,
+    scopes: Sequence[str],
+    query: str,
+    kinds: Sequence[str] | None = None,
+    formats: Sequence[str] | None = None,
+    authors: Sequence[str] | None = None,
+    roles: Sequence[str] | None = None,
+    tool_call_index: int = 0,
+    forced_error: str | None = None,
+) -> AppSearchRun:
+    """Run app search for a chat turn without writing anything.
+
+    Only reads, so it may run on a session of its own; the caller persists the
+    returned run with ``persist_app_search_run``.
+    """
     kinds_filter = _non_empty_filter(kinds)
     formats_filter = _non_empty_filter(formats)
     authors_filter = _non_empty_filter(authors)
@@ -284,7 +324,7 @@ def execute_app_search(
             f'message="{_xml_attr(str(exc))}" />'
         )
         latency_ms = int((time.monotonic() - start) * 1000)
-        run = AppSearchRun(
+        return AppSearchRun(
             conversation_id=conversation_id,
             user_message_id=user_message_id,
             assistant_message_id=assistant_message_id,
@@ -302,8 +342,6 @@ def execute_app_search(
             empty_status=None,
             tool_call_index=tool_call_index,
         )
-        persist_app_search_run(db, run)
-        return run
 
     # Persisted on MessageRetrieval rows as a comma-joined URI list for
     # multiple scopes (e.g. "media:UUID-1,media:UUID-2"), the lone URI for
@@ -377,7 +415,7 @@ def execute_app_search(
         context_chars = 0
 
     latency_ms = int((time.monotonic() - start) * 1000)
-    run = AppSearchRun(
+    return AppSearchRun(
         conversation_id=conversation_id,
         user_message_id=user_message_id,
         assistant_message_id=assistant_message_id,
@@ -395,8 +433,6 @@ def execute_app_search(
         empty_status=empty_status,
         tool_call_index=tool_call_index,
     )
-    persist_app_search_run(db, run)
-    return run
 
 
 def _resolve_scope_uris(
@@ -4,12 +4,21 @@ Computes a persistent 2D position per work from its mean content embedding via
 pure-Python power-iteration PCA (no numpy — grand-atlas §D-2/G1), normalizes to
 [0, 1], runs one bounded repulsion pass, and upserts. Positions map to celestial
 coordinates at render time (§4.2).
+
+The PCA does its arithmetic in ``math.sumprod`` over row- and column-major copies
+of the mean embeddings, and repulsion bins points into a uniform grid. A full
+projection stores its axes (``media_atlas_projection_axes``); ``run_placement``
+projects newly indexed works through them without moving placed works.
 """
 
 from __future__ import annotations
 
 import math
+from bisect import bisect_right
 from collections import defaultdict
+from dataclasses import dataclass
+from itertools import islice
+from math import sumprod
 from uuid import UUID
 
 from sqlalchemy import text
@@ -26,12 +35,22 @@ logger = get_logger(__name__)
 # Batch the nightly re-projection only when the unpositioned backlog is
 # meaningful, so a single ingest does not churn the whole map (§S1.5).
 ATLAS_REPROJECT_TRIGGER_MIN_UNPOSITIONED = 20
+# ``atlas_project_job`` payload modes: re-fit the whole map, or place new works.
+ATLAS_PROJECT_MODE_FULL = "full"
+ATLAS_PROJECT_MODE_PLACE = "place"
 
 _EMBEDDING_DIMS = 256
 _PCA_ITERATIONS = 20
 # Fewer works than components requested makes PCA degenerate (§R-1): fall back to
 # an evenly-spaced ring, which the repulsion pass then leaves alone.
 _MIN_PCA_VECTORS = 3
+# The components are fitted on at most this many works, evenly strided; the
+# bounds still come from every work. At 256 dims the fit is O(sample × dims)
+# per iteration, so a large library costs one projection pass, not 40.
+_PCA_FIT_SAMPLE = 5000
+# Candidates one point is compared with in a repulsion pass. Bounds the pass on a
+# map whose points crowd into a few cells; pairs past the cap stay overlapping.
+_REPULSE_MAX_NEIGHBORS = 16
 
 
 # ---------- mean embeddings -------------------------------------------------
@@ -63,18 +82,29 @@ def _parse_pgvector_literal(raw: object) -> list[float]:
     return [float(token) for token in body.split(",")]
 
 
-def fetch_mean_embeddings(db: Session, user_id: UUID) -> list[tuple[UUID, list[float]]]:
+_UNPOSITIONED_SQL = """
+    AND NOT EXISTS (
+        SELECT 1 FROM media_atlas_positions p WHERE p.media_id = c.owner_id
+    )
+"""
+
+
+def fetch_mean_embeddings(
+    db: Session, user_id: UUID, *, unpositioned_only: bool = False
+) -> list[tuple[UUID, list[float]]]:
     """Return ``(media_id, mean_vector)`` for each visible work with embeddings.
 
     Uses the pgvector ``avg()`` aggregate (§D-1); falls back to Python averaging
     if the installed image lacks ``avg(vector)`` (§R-3). Scoped to the user's
     personal Default virtual relation (AC2) — a user with no Default library
-    yet has nothing to project.
+    yet has nothing to project. ``unpositioned_only`` limits it to works with
+    no atlas position yet.
     """
     default_library_id = governance.find_default_library_id(db, user_id)
     if default_library_id is None:
         return []
     params = {"viewer_id": user_id, "library_id": default_library_id}
+    unpositioned_sql = _UNPOSITIONED_SQL if unpositioned_only else ""
     try:
         rows = db.execute(
             text(
@@ -85,6 +115,7 @@ def fetch_mean_embeddings(db: Session, user_id: UUID) -> list[tuple[UUID, list[f
                 WHERE c.owner_kind = 'media'
                   AND c.owner_id IN ({_visible_media_sql()})
                   AND e.embedding_vector IS NOT NULL
+                  {unpositioned_sql}
                 GROUP BY c.owner_id
                 HAVING count(e.id) > 0
                 """
@@ -97,11 +128,11 @@ def fetch_mean_embeddings(db: Session, user_id: UUID) -> list[tuple[UUID, list[f
             raise
         logger.warning("atlas_avg_vector_unavailable_fallback_python", error=str(exc))
         db.rollback()
-        return _fetch_mean_embeddings_python(db, user_id, default_library_id)
+        return _fetch_mean_embeddings_python(db, user_id, default_library_id, unpositioned_sql)
 
 
 def _fetch_mean_embeddings_python(
-    db: Session, user_id: UUID, default_library_id: UUID
+    db: Session, user_id: UUID, default_library_id: UUID, unpositioned_sql: str
 ) -> list[tuple[UUID, list[float]]]:
     rows = db.execute(
         text(
@@ -112,6 +143,7 @@ def _fetch_mean_embeddings_python(
             WHERE c.owner_kind = 'media'
               AND c.owner_id IN ({_visible_media_sql()})
               AND e.embedding_vector IS NOT NULL
+              {unpositioned_sql}
             """
         ),
         {"viewer_id": user_id, "library_id": default_library_id},
@@ -135,24 +167,44 @@ def _fetch_mean_embeddings_python(
 # ---------- pure-Python PCA -------------------------------------------------
 
 
-def _dot(a: list[float], b: list[float]) -> float:
-    return math.fsum(x * y for x, y in zip(a, b, strict=False))
+@dataclass(frozen=True)
+class AtlasAxes:
+    """The affine map of one full projection: mean, two components, and bounds.
+
+    Stored per user so a later work is placed in the same frame
+    (``place_vectors``) without moving the works already on the map.
+    """
+
+    mean: tuple[float, ...]
+    pc1: tuple[float, ...]
+    pc2: tuple[float, ...]
+    x_min: float
+    x_max: float
+    y_min: float
+    y_max: float
 
 
 def _normalize(v: list[float]) -> list[float]:
-    norm = math.sqrt(_dot(v, v))
+    norm = math.sqrt(sumprod(v, v))
     if norm == 0.0:
         return v
     return [x / norm for x in v]
 
 
 def _power_iteration(
-    centered: list[list[float]],
+    rows: list[list[float]],
+    columns: list[tuple[float, ...]],
+    mean: list[float],
     seed: list[float],
     orthogonal_to: list[list[float]] | None = None,
 ) -> list[float]:
     """Dominant eigenvector of the covariance (X^T X) via power iteration.
 
+    ``rows`` and ``columns`` are the same uncentered matrix in both layouts, so
+    both halves of ``X^T (X v)`` are ``math.sumprod`` calls over contiguous
+    sequences (C loops, no per-element Python). Centering is folded in
+    algebraically: ``(x - m)·v = x·v - m·v``, and ``Σ p·(x - m) = Σ p·x - m Σ p``.
+
     ``orthogonal_to`` deflates the iterate against already-found components on
     every step (not just the seed): with a dominant eigenvalue (λ1 ≫ λ2),
     floating-point drift re-amplifies the first component, so component 2 needs
@@ -161,17 +213,17 @@ def _power_iteration(
     """
     v = _normalize(seed)
     for _ in range(_PCA_ITERATIONS):
-        # w = X^T (X v): project rows onto v, then accumulate back.
-        projections = [_dot(row, v) for row in centered]
-        w = [0.0] * len(v)
-        for row, p in zip(centered, projections, strict=False):
-            for i, value in enumerate(row):
-                w[i] += value * p
+        mean_v = sumprod(mean, v)
+        projections = [sumprod(row, v) - mean_v for row in rows]
+        projection_sum = math.fsum(projections)
+        w = [
+            sumprod(column, projections) - m * projection_sum
+            for column, m in zip(columns, mean, strict=True)
+        ]
         if orthogonal_to:
             for basis in orthogonal_to:
-                overlap = _dot(w, basis)
-                for i in range(len(w)):
-                    w[i] -= overlap * basis[i]
+                overlap = sumprod(w, basis)
+                w = [value - overlap * b for value, b in zip(w, basis, strict=True)]
         v = _normalize(w)
     return v
 
@@ -189,25 +241,26 @@ def _ring_layout(count: int) -> list[tuple[float, float]]:
     ]
 
 
-def pca_2d(vectors: list[list[float]]) -> list[tuple[float, float]]:
-    """Project N vectors to 2D via power-iteration PCA, normalized to [0, 1].
+def fit_pca_2d(vectors: list[list[float]]) -> AtlasAxes | None:
+    """Fit the 2D projection of N same-length vectors; None below 3 vectors.
 
-    Deterministic: component 1 seeds from the unit axis e0, component 2 from e1
-    made orthogonal to component 1. Fewer than 3 vectors → ring fallback.
+    Deterministic for a given input order: component 1 seeds from the unit axis
+    e0, component 2 from e1 made orthogonal to component 1, and the fit sample
+    is every ``ceil(N / _PCA_FIT_SAMPLE)``-th vector. The bounds are the min/max
+    of every vector's coordinates, so ``place_vectors`` maps the whole set onto
+    [0, 1].
     """
     n = len(vectors)
-    if n == 0:
-        return []
     if n < _MIN_PCA_VECTORS:
-        return _ring_layout(n)
-
-    dims = len(vectors[0])
-    mean = [math.fsum(vec[i] for vec in vectors) / n for i in range(dims)]
-    centered = [[vec[i] - mean[i] for i in range(dims)] for vec in vectors]
+        return None
+    sample = vectors[:: -(-n // _PCA_FIT_SAMPLE)]
+    dims = len(sample[0])
+    columns = list(zip(*sample, strict=True))
+    mean = [math.fsum(column) / len(sample) for column in columns]
 
     seed1 = [0.0] * dims
     seed1[0] = 1.0
-    pc1 = _power_iteration(centered, seed1)
+    pc1 = _power_iteration(sample, columns, mean, seed1)
 
     seed2 = [0.0] * dims
     seed2[1 if dims > 1 else 0] = 1.0
@@ -215,47 +268,126 @@ def pca_2d(vectors: list[list[float]]) -> list[tuple[float, float]]:
     # orthogonal complement; ``orthogonal_to`` then keeps it there on every
     # iteration so it converges to the second-largest variance direction rather
     # than re-amplifying pc1 (which would degenerate the map toward a diagonal).
-    dot_s2_pc1 = _dot(seed2, pc1)
-    seed2 = [seed2[i] - dot_s2_pc1 * pc1[i] for i in range(dims)]
-    pc2 = _power_iteration(centered, seed2, orthogonal_to=[pc1])
+    dot_s2_pc1 = sumprod(seed2, pc1)
+    seed2 = [s - dot_s2_pc1 * c for s, c in zip(seed2, pc1, strict=True)]
+    pc2 = _power_iteration(sample, columns, mean, seed2, orthogonal_to=[pc1])
+
+    mean_pc1 = sumprod(mean, pc1)
+    mean_pc2 = sumprod(mean, pc2)
+    xs = [sumprod(row, pc1) - mean_pc1 for row in vectors]
+    ys = [sumprod(row, pc2) - mean_pc2 for row in vectors]
+    return AtlasAxes(
+        mean=tuple(mean),
+        pc1=tuple(pc1),
+        pc2=tuple(pc2),
+        x_min=min(xs),
+        x_max=max(xs),
+        y_min=min(ys),
+        y_max=max(ys),
+    )
+
+
+def place_vectors(axes: AtlasAxes, vectors: list[list[float]]) -> list[tuple[float, float]]:
+    """Project vectors through stored axes into the fitted [0, 1] frame (clamped)."""
+    mean_pc1 = sumprod(axes.mean, axes.pc1)
+    mean_pc2 = sumprod(axes.mean, axes.pc2)
+    return [
+        (
+            _scale(sumprod(vec, axes.pc1) - mean_pc1, axes.x_min, axes.x_max),
+            _scale(sumprod(vec, axes.pc2) - mean_pc2, axes.y_min, axes.y_max),
+        )
+        for vec in vectors
+    ]
 
-    xs = [_dot(row, pc1) for row in centered]
-    ys = [_dot(row, pc2) for row in centered]
-    return list(zip(_min_max_normalize(xs), _min_max_normalize(ys), strict=False))
+
+def pca_2d(vectors: list[list[float]]) -> list[tuple[float, float]]:
+    """Project N vectors to 2D via power-iteration PCA, normalized to [0, 1].
+
+    Fewer than 3 vectors → ring fallback.
+    """
+    if not vectors:
+        return []
+    axes = fit_pca_2d(vectors)
+    if axes is None:
+        return _ring_layout(len(vectors))
+    return place_vectors(axes, vectors)
 
 
-def _min_max_normalize(values: list[float]) -> list[float]:
-    lo = min(values)
-    hi = max(values)
+def _scale(value: float, lo: float, hi: float) -> float:
     span = hi - lo
     if span == 0.0:
-        return [0.5 for _ in values]
-    return [min(1.0, max(0.0, (v - lo) / span)) for v in values]
+        return 0.5
+    return min(1.0, max(0.0, (value - lo) / span))
 
 
 # ---------- repulsion -------------------------------------------------------
 
 
 def repulse(
-    positions: list[tuple[float, float]], *, min_dist: float = 0.02
+    positions: list[tuple[float, float]],
+    *,
+    min_dist: float = 0.02,
+    fixed: list[tuple[float, float]] | None = None,
 ) -> list[tuple[float, float]]:
-    """One O(N²) pass pushing overlapping pairs apart along their connecting vector."""
+    """One pass pushing overlapping pairs apart along their connecting vector.
+
+    Pairs are found through a uniform grid, so each point is compared only with
+    the 3×3 cells around it. The repel distance is ``min_dist`` until the map
+    holds more than ``1 / min_dist²`` points (2,500 at the default) and then
+    shrinks to ``1 / sqrt(N)``, the mean spacing of N points on the unit square.
+    No map that crowded can keep every pair ``min_dist`` apart, and a fixed cell
+    would hold N·min_dist² points and make the pass quadratic. With the cell
+    following the spacing an evenly spread map averages one point per cell, and
+    no point examines more than ``_REPULSE_MAX_NEIGHBORS`` candidates, so the
+    pass is O(N) however the points cluster.
+
+    Cells are keyed on the starting positions; a point moved by an earlier shove
+    into a pair it was not binned near is left for the next projection, which
+    the single bounded pass accepts anyway.
+
+    ``fixed`` points repel but never move: a pair with one of them pushes the
+    movable point the full overlap instead of half of it.
+    """
     pts = [[x, y] for x, y in positions]
+    anchors = fixed or []
     n = len(pts)
+    if n + len(anchors) > 0:
+        min_dist = min(min_dist, 1.0 / math.sqrt(n + len(anchors)))
+    grid: dict[tuple[int, int], list[int]] = defaultdict(list)
+    for index, (x, y) in enumerate([*positions, *anchors]):
+        grid[(int(x // min_dist), int(y // min_dist))].append(index)
+
+    min_dist_sq = min_dist * min_dist
     for i in range(n):
-        for j in range(i + 1, n):
-            dx = pts[j][0] - pts[i][0]
-            dy = pts[j][1] - pts[i][1]
-            dist = math.hypot(dx, dy)
-            if dist >= min_dist:
+        cx, cy = int(positions[i][0] // min_dist), int(positions[i][1] // min_dist)
+        point = pts[i]
+        # Cells hold indices in ascending order: start each one after ``i``.
+        candidates = (
+            cell[k]
+            for ox in (-1, 0, 1)
+            for oy in (-1, 0, 1)
+            if (cell := grid.get((cx + ox, cy + oy)))
+            for k in range(bisect_right(cell, i), len(cell))
+        )
+        for j in islice(candidates, _REPULSE_MAX_NEIGHBORS):
+            other = pts[j] if j < n else anchors[j - n]
+            dx = other[0] - point[0]
+            dy = other[1] - point[1]
+            if dx * dx + dy * dy >= min_dist_sq:
                 continue
+            dist = math.hypot(dx, dy)
+            overlap = min_dist - dist
             if dist == 0.0:
-                # Coincident: nudge along a stable pseudo-random-ish axis.
-                dx, dy, dist = min_dist, 0.0, min_dist
-            shove = (min_dist - dist) / 2.0
+                # Coincident: separate along the x axis.
+                dx, dist = min_dist, min_dist
             ux, uy = dx / dist, dy / dist
-            pts[i][0] -= ux * shove
-            pts[i][1] -= uy * shove
+            if j >= n:
+                point[0] -= ux * overlap
+                point[1] -= uy * overlap
+                continue
+            shove = overlap / 2.0
+            point[0] -= ux * shove
+            point[1] -= uy * shove
             pts[j][0] += ux * shove
             pts[j][1] += uy * shove
     return [(min(1.0, max(0.0, x)), min(1.0, max(0.0, y))) for x, y in pts]
@@ -286,19 +418,144 @@ def upsert_positions(db: Session, positions: dict[UUID, tuple[float, float]]) ->
     return count
 
 
+def insert_new_positions(db: Session, positions: dict[UUID, tuple[float, float]]) -> int:
+    """INSERT positions for works that have none; never moves a placed work."""
+    count = 0
+    for media_id, (x, y) in positions.items():
+        result = db.execute(
+            text(
+                """
+                INSERT INTO media_atlas_positions (media_id, x, y)
+                VALUES (:media_id, :x, :y)
+                ON CONFLICT (media_id) DO NOTHING
+                """
+            ),
+            {"media_id": media_id, "x": float(x), "y": float(y)},
+        )
+        count += result.rowcount
+    return count
+
+
+def load_axes(db: Session, user_id: UUID) -> AtlasAxes | None:
+    row = db.execute(
+        text(
+            """
+            SELECT mean, pc1, pc2, x_min, x_max, y_min, y_max
+            FROM media_atlas_projection_axes
+            WHERE user_id = :user_id
+            """
+        ),
+        {"user_id": user_id},
+    ).one_or_none()
+    if row is None:
+        return None
+    return AtlasAxes(
+        mean=tuple(row.mean),
+        pc1=tuple(row.pc1),
+        pc2=tuple(row.pc2),
+        x_min=row.x_min,
+        x_max=row.x_max,
+        y_min=row.y_min,
+        y_max=row.y_max,
+    )
+
+
+def _store_axes(db: Session, user_id: UUID, axes: AtlasAxes) -> None:
+    db.execute(
+        text(
+            """
+            INSERT INTO media_atlas_projection_axes
+                (user_id, mean, pc1, pc2, x_min, x_max, y_min, y_max)
+            VALUES (:user_id, :mean, :pc1, :pc2, :x_min, :x_max, :y_min, :y_max)
+            ON CONFLICT (user_id) DO UPDATE SET
+                mean = EXCLUDED.mean,
+                pc1 = EXCLUDED.pc1,
+                pc2 = EXCLUDED.pc2,
+                x_min = EXCLUDED.x_min,
+                x_max = EXCLUDED.x_max,
+                y_min = EXCLUDED.y_min,
+                y_max = EXCLUDED.y_max,
+                computed_at = now()
+            """
+        ),
+        {
+            "user_id": user_id,
+            "mean": list(axes.mean),
+            "pc1": list(axes.pc1),
+            "pc2": list(axes.pc2),
+            "x_min": axes.x_min,
+            "x_max": axes.x_max,
+            "y_min": axes.y_min,
+            "y_max": axes.y_max,
+        },
+    )
+
+
+def _fetch_user_positions(db: Session, user_id: UUID) -> list[tuple[float, float]]:
+    default_library_id = governance.find_default_library_id(db, user_id)
+    if default_library_id is None:
+        return []
+    rows = db.execute(
+        text(
+            f"""
+            SELECT p.x, p.y
+            FROM media_atlas_positions p
+            WHERE p.media_id IN ({_visible_media_sql()})
+            """
+        ),
+        {"viewer_id": user_id, "library_id": default_library_id},
+    ).all()
+    return [(row.x, row.y) for row in rows]
+
+
 def run_projection(db: Session, user_id: UUID) -> dict:
-    """Fetch → PCA → repulse → upsert for one user. Flush-only; caller commits."""
+    """Fetch → PCA → repulse → upsert for one user. Flush-only; caller commits.
+
+    Stores the fitted axes so ``run_placement`` can add works to this frame.
+    """
     means = fetch_mean_embeddings(db, user_id)
     if not means:
         return {"positioned": 0, "skipped_no_embeddings": 0}
+    # GROUP BY output order is unspecified; the fit sample must not depend on it.
+    means.sort(key=lambda item: item[0])
     media_ids = [media_id for media_id, _ in means]
     vectors = [vec for _, vec in means]
-    projected = repulse(pca_2d(vectors))
-    positions = dict(zip(media_ids, projected, strict=False))
+    axes = fit_pca_2d(vectors)
+    if axes is None:
+        projected = _ring_layout(len(vectors))
+    else:
+        projected = place_vectors(axes, vectors)
+        _store_axes(db, user_id, axes)
+    positions = dict(zip(media_ids, repulse(projected), strict=False))
     written = upsert_positions(db, positions)
     return {"positioned": written, "skipped_no_embeddings": 0}
 
 
+def run_placement(db: Session, user_id: UUID) -> dict:
+    """Place only unpositioned works through the stored axes. Flush-only.
+
+    Existing positions are fixed repulsors and are never rewritten, so the map
+    does not shift when one work arrives (§D-4). Without stored axes, or when
+    the embedding width changed since the fit, this falls back to a full
+    ``run_projection``.
+    """
+    axes = load_axes(db, user_id)
+    if axes is None:
+        return run_projection(db, user_id)
+    means = fetch_mean_embeddings(db, user_id, unpositioned_only=True)
+    if not means:
+        return {"positioned": 0, "skipped_no_embeddings": 0}
+    if any(len(vec) != len(axes.mean) for _, vec in means):
+        return run_projection(db, user_id)
+    media_ids = [media_id for media_id, _ in means]
+    placed = place_vectors(axes, [vec for _, vec in means])
+    positions = dict(
+        zip(media_ids, repulse(placed, fixed=_fetch_user_positions(db, user_id)), strict=False)
+    )
+    written = insert_new_positions(db, positions)
+    return {"positioned": written, "skipped_no_embeddings": 0}
+
+
 def count_unpositioned(db: Session, user_id: UUID) -> int:
     """How many of the user's personal Default virtual media have no atlas
     position row yet. A user with no Default library yet has nothing
@@ -340,7 +597,9 @@ def list_projectable_user_ids(db: Session) -> list[UUID]:
 # ---------- enqueue ---------------------------------------------------------
 
 
-def _atlas_dedupe_key(user_id: UUID) -> str:
+def _atlas_dedupe_key(user_id: UUID, mode: str) -> str:
+    if mode == ATLAS_PROJECT_MODE_PLACE:
+        return f"atlas_place:{user_id}"
     return f"atlas_project:{user_id}"
 
 
@@ -348,17 +607,23 @@ def try_enqueue_atlas_project(db: Session, *, user_id: UUID, force: bool = False
     """Soft-enqueue one projection for ``user_id``; never breaks the host write.
 
     Rides the caller's transaction (flush-only) behind a SAVEPOINT so a queue
-    defect cannot fail an ingest/promote commit. When ``force`` is False, only
-    enqueues once the unpositioned backlog exceeds the trigger threshold (§S1.5),
-    so a single ingest does not re-project the whole map. Returns True only when
-    a new job row was inserted.
+    defect cannot fail an ingest/promote commit. When ``force`` is False and the
+    user already has stored axes, any unpositioned work enqueues a placement job,
+    which adds works without moving the map; without axes it only enqueues a
+    full projection once the unpositioned backlog exceeds the trigger threshold
+    (§S1.5), so a single ingest does not re-project the whole map. Returns True
+    only when a new job row was inserted.
     """
     try:
         with db.begin_nested():
+            mode = ATLAS_PROJECT_MODE_FULL
             if not force:
-                if count_unpositioned(db, user_id) <= ATLAS_REPROJECT_TRIGGER_MIN_UNPOSITIONED:
+                unpositioned = count_unpositioned(db, user_id)
+                if unpositioned > 0 and load_axes(db, user_id) is not None:
+                    mode = ATLAS_PROJECT_MODE_PLACE
+                elif unpositioned <= ATLAS_REPROJECT_TRIGGER_MIN_UNPOSITIONED:
                     return False
-            dedupe_key = _atlas_dedupe_key(user_id)
+            dedupe_key = _atlas_dedupe_key(user_id, mode)
             db.execute(
                 text(
                     "DELETE FROM background_jobs"
@@ -369,7 +634,7 @@ def try_enqueue_atlas_project(db: Session, *, user_id: UUID, force: bool = False
             _, inserted = enqueue_unique_job(
                 db,
                 kind="atlas_project_job",
-                payload={"user_id": str(user_id)},
+                payload={"user_id": str(user_id), "mode": mode},
                 dedupe_key=dedupe_key,
             )
         return inserted
@@ -0,0 +1,144 @@
+"""Process-local TTL cache and request coalescing for external Browse pages.
+
+Brave, YouTube, and Podcast Index pages are viewer-independent: a candidate is
+the provider item plus a sealed target, and the viewer-relative "already in
+Nexus" resolution is applied afterwards by ``service._resolve_owned``. So one
+page is cached per ``ProviderPageKey`` and shared by every viewer for
+``BROWSE_PROVIDER_CACHE_TTL_SECONDS``, and concurrent identical requests (a
+typeahead burst, two viewers searching the same term) share one provider call.
+
+The key holds provider-level inputs only: viewer-bound Browse cursors are
+decoded to the provider's page token before the lookup and re-encoded for the
+viewer after it. Failures are never cached; callers joined to a failing call
+see its exception. The in-flight call runs as its own task, so a caller that
+disconnects does not cancel it for the others.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from time import monotonic
+
+from nexus.schemas.browse import BrowseCandidate
+from nexus.services.browse.models import BrowseKind, BrowseQuery, BrowseSort, BrowseSource
+
+PROVIDER_PAGE_CACHE_MAX_ENTRIES = 2048
+
+type ProviderPage = tuple[list[BrowseCandidate], str | None]
+
+
+@dataclass(frozen=True, slots=True)
+class ProviderPageKey:
+    source: BrowseSource
+    query: str
+    kind: BrowseKind
+    sort: BrowseSort | None
+    limit: int
+    page_token: str | None
+
+
+def provider_page_key(query: BrowseQuery, *, page_token: str | None = None) -> ProviderPageKey:
+    """Key a provider page; the query text is whitespace-collapsed and casefolded."""
+    return ProviderPageKey(
+        source=query.source,
+        query=" ".join(query.query.split()).casefold(),
+        kind=query.kind,
+        sort=query.sort,
+        limit=query.limit,
+        page_token=page_token,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    items: tuple[BrowseCandidate, ...]
+    next_page_token: str | None
+    expires_at: float
+
+
+@dataclass(slots=True)
+class ProviderPageCacheStats:
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+
+
+class ProviderPageCache:
+    def __init__(
+        self,
+        *,
+        max_entries: int = PROVIDER_PAGE_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[ProviderPageKey, _Entry] = OrderedDict()
+        self._in_flight: dict[ProviderPageKey, asyncio.Task[ProviderPage]] = {}
+        self.stats = ProviderPageCacheStats()
+
+    async def fetch(
+        self,
+        key: ProviderPageKey,
+        load: Callable[[], Awaitable[ProviderPage]],
+        *,
+        ttl_seconds: float,
+    ) -> ProviderPage:
+        """Return the cached page for ``key``, joining or starting its load."""
+        if ttl_seconds <= 0:
+            return await load()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at > self._clock():
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return list(entry.items), entry.next_page_token
+            del self._entries[key]
+
+        loop = asyncio.get_running_loop()
+        task = self._in_flight.get(key)
+        if task is not None and task.get_loop() is loop:
+            self.stats.coalesced += 1
+        else:
+            self.stats.misses += 1
+            task = loop.create_task(self._load(key, load, ttl_seconds=ttl_seconds))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        items, next_page_token = await asyncio.shield(task)
+        return list(items), next_page_token
+
+    async def _load(
+        self,
+        key: ProviderPageKey,
+        load: Callable[[], Awaitable[ProviderPage]],
+        *,
+        ttl_seconds: float,
+    ) -> ProviderPage:
+        items, next_page_token = await load()
+        self._entries[key] = _Entry(
+            items=tuple(items),
+            next_page_token=next_page_token,
+            expires_at=self._clock() + ttl_seconds,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return items, next_page_token
+
+    def _forget(self, key: ProviderPageKey, task: asyncio.Task[ProviderPage]) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Every joined caller may have been cancelled; the outcome is still consumed.
+        if not task.cancelled():
+            task.exception()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.stats = ProviderPageCacheStats()
+
+
+provider_page_cache = ProviderPageCache()
@@ -21,7 +21,7 @@ _PREVIEW_EPISODES_FAMILY = "BrowsePreviewEpisodes"
 
 class BrowseSearchPlan(StrEnum):
     NexusMediaRankOffset = "NexusMediaRankOffset"
-    ProjectGutenbergRankOffset = "ProjectGutenbergRankOffset"
+    ProjectGutenbergRankKeyset = "ProjectGutenbergRankKeyset"
     YouTubeSearchPageToken = "YouTubeSearchPageToken"
 
 
@@ -31,7 +31,6 @@ class BrowsePreviewEpisodesPlan(StrEnum):
 
 _SEARCH_PLAN_KINDS = {
     BrowseSearchPlan.NexusMediaRankOffset: KeysetValueKind.Int,
-    BrowseSearchPlan.ProjectGutenbergRankOffset: KeysetValueKind.Int,
     BrowseSearchPlan.YouTubeSearchPageToken: KeysetValueKind.Text,
 }
 
@@ -102,6 +101,53 @@ def decode_search_cursor(
     return cast(str, value)
 
 
+def encode_gutenberg_search_cursor(
+    query: BrowseQuery,
+    *,
+    viewer_id: UUID,
+    provider_contract: str,
+    after_score: float,
+    after_download_count: int,
+    after_ebook_id: int,
+) -> str:
+    # The codec has no float kind; repr round-trips the rank exactly.
+    return encode_signed_keyset_cursor(
+        family=_SEARCH_FAMILY,
+        query=_search_digest(
+            query,
+            viewer_id=viewer_id,
+            provider_contract=provider_contract,
+            plan=BrowseSearchPlan.ProjectGutenbergRankKeyset,
+        ),
+        after=(
+            KeysetValue(KeysetValueKind.Text, repr(after_score)),
+            KeysetValue(KeysetValueKind.Int, after_download_count),
+            KeysetValue(KeysetValueKind.Int, after_ebook_id),
+        ),
+    )
+
+
+def decode_gutenberg_search_cursor(
+    cursor: str,
+    query: BrowseQuery,
+    *,
+    viewer_id: UUID,
+    provider_contract: str,
+) -> tuple[str, int, int]:
+    score, download_count, ebook_id = decode_signed_keyset_cursor(
+        cursor,
+        family=_SEARCH_FAMILY,
+        query=_search_digest(
+            query,
+            viewer_id=viewer_id,
+            provider_contract=provider_contract,
+            plan=BrowseSearchPlan.ProjectGutenbergRankKeyset,
+        ),
+        expected_kinds=(KeysetValueKind.Text, KeysetValueKind.Int, KeysetValueKind.Int),
+    )
+    return cast(str, score), cast(int, download_count), cast(int, ebook_id)
+
+
 def _preview_digest(
     *,
     viewer_id: UUID,
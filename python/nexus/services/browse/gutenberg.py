@@ -18,9 +18,8 @@ from nexus.schemas.browse import (
 from nexus.schemas.contributors import ContributorCreditOut
 from nexus.schemas.presence import absent, present
 from nexus.services.browse.cursor import (
-    BrowseSearchPlan,
-    decode_search_cursor,
-    encode_search_cursor,
+    decode_gutenberg_search_cursor,
+    encode_gutenberg_search_cursor,
 )
 from nexus.services.browse.models import (
     BrowseQuery,
@@ -51,87 +50,57 @@ def search(
     viewer_id: UUID,
     query: BrowseQuery,
 ) -> tuple[list[BrowseCandidate], str | None]:
-    offset = 0
+    after: tuple[str, int, int] | None = None
     if query.cursor is not None:
-        offset = int(
-            decode_search_cursor(
-                query.cursor,
-                query,
-                viewer_id=viewer_id,
-                provider_contract=_PROVIDER_CONTRACT,
-                plan=BrowseSearchPlan.ProjectGutenbergRankOffset,
-            )
+        after = decode_gutenberg_search_cursor(
+            query.cursor,
+            query,
+            viewer_id=viewer_id,
+            provider_contract=_PROVIDER_CONTRACT,
         )
+    # The search document is maintained by the catalog sync and by credit and
+    # contributor triggers (0220). Missing download counts sort last as -1 so
+    # the keyset compares plain integers.
     rows = (
         db.execute(
             text(
-                f"""
-                WITH credits AS (
-                    SELECT
-                        vcc.project_gutenberg_catalog_ebook_id AS ebook_id,
-                        jsonb_agg(
-                            jsonb_build_object(
-                                'contributor_handle', c.handle,
-                                'contributor_display_name', c.display_name,
-                                'href', '/authors/' || c.handle,
-                                'credited_name', vcc.credited_name,
-                                'role', vcc.role,
-                                'raw_role', vcc.raw_role,
-                                'ordinal', vcc.ordinal
-                            )
-                            ORDER BY vcc.ordinal
-                        ) AS contributors,
-                        string_agg(vcc.credited_name || ' ' || c.display_name, ' ') AS names
-                    FROM ({visible_credit_rows_sql()}) vcc
-                    JOIN contributors c ON c.id = vcc.contributor_id
-                    WHERE vcc.project_gutenberg_catalog_ebook_id IS NOT NULL
-                    GROUP BY vcc.project_gutenberg_catalog_ebook_id
-                ),
-                hits AS (
+                """
+                WITH hits AS (
                     SELECT
                         pg.ebook_id,
                         pg.title,
                         pg.subjects,
                         pg.bookshelves,
-                        pg.download_count,
-                        credits.contributors,
-                        ts_rank_cd(
-                            to_tsvector(
-                                'english',
-                                concat_ws(
-                                    ' ',
-                                    pg.title,
-                                    credits.names,
-                                    pg.subjects,
-                                    pg.bookshelves
-                                )
-                            ),
-                            websearch_to_tsquery('english', :query)
-                        ) AS score
-                    FROM project_gutenberg_catalog pg
-                    LEFT JOIN credits ON credits.ebook_id = pg.ebook_id
-                    WHERE to_tsvector(
-                        'english',
-                        concat_ws(
-                            ' ',
-                            pg.title,
-                            credits.names,
-                            pg.subjects,
-                            pg.bookshelves
-                        )
-                    ) @@ websearch_to_tsquery('english', :query)
+                        COALESCE(pg.download_count, -1) AS download_rank,
+                        d.contributors,
+                        ts_rank_cd(d.search_tsv, websearch_to_tsquery('english', :query))
+                            AS score
+                    FROM project_gutenberg_search_documents d
+                    JOIN project_gutenberg_catalog pg ON pg.ebook_id = d.ebook_id
+                    WHERE d.search_tsv @@ websearch_to_tsquery('english', :query)
                 )
                 SELECT *
                 FROM hits
-                ORDER BY score DESC, download_count DESC NULLS LAST, ebook_id ASC
-                OFFSET :offset
+                WHERE CAST(:after_score AS text) IS NULL
+                   OR score < CAST(:after_score AS real)
+                   OR (
+                        score = CAST(:after_score AS real)
+                        AND download_rank < :after_download_rank
+                   )
+                   OR (
+                        score = CAST(:after_score AS real)
+                        AND download_rank = :after_download_rank
+                        AND ebook_id > :after_ebook_id
+                   )
+                ORDER BY score DESC, download_rank DESC, ebook_id ASC
                 LIMIT :limit
                 """
             ),
             {
-                "viewer_id": viewer_id,
                 "query": query.query,
-                "offset": offset,
+                "after_score": None if after is None else after[0],
+                "after_download_rank": None if after is None else after[1],
+                "after_ebook_id": None if after is None else after[2],
                 "limit": query.limit + 1,
             },
         )
@@ -141,12 +110,14 @@ def search(
     items: list[BrowseCandidate] = [_candidate(_book(row)) for row in rows[: query.limit]]
     next_cursor = None
     if len(rows) > query.limit:
-        next_cursor = encode_search_cursor(
+        last = rows[query.limit - 1]
+        next_cursor = encode_gutenberg_search_cursor(
             query,
             viewer_id=viewer_id,
             provider_contract=_PROVIDER_CONTRACT,
-            plan=BrowseSearchPlan.ProjectGutenbergRankOffset,
-            after=offset + query.limit,
+            after_score=float(last["score"]),
+            after_download_count=int(last["download_rank"]),
+            after_ebook_id=int(last["ebook_id"]),
         )
     return items, next_cursor
 
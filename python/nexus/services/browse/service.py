@@ -12,6 +12,7 @@ from starlette.concurrency import run_in_threadpool
 from web_search_tool.types import WebSearchProvider
 
 from nexus.auth.permissions import visible_media_ids_cte_sql
+from nexus.config import get_settings
 from nexus.errors import ApiErrorCode, InvalidRequestError
 from nexus.schemas.browse import (
     BrowseCandidate,
@@ -34,6 +35,7 @@ from nexus.schemas.browse import (
 from nexus.schemas.contributors import ContributorCreditOut
 from nexus.schemas.presence import Presence, absent, present
 from nexus.services.browse import brave, gutenberg, nexus, podcast_index, youtube
+from nexus.services.browse.cache import provider_page_cache, provider_page_key
 from nexus.services.browse.models import (
     BraveWebArticleTarget,
     BrowsePreviewQuery,
@@ -63,6 +65,8 @@ async def search_browse(
     query: BrowseQuery,
     web_search_provider: WebSearchProvider | None,
 ) -> BrowsePage:
+    # External pages are cached before viewer-relative resolution; see browse.cache.
+    ttl_seconds = get_settings().browse_provider_cache_ttl_seconds
     match query.source:
         case BrowseSource.Nexus:
             items, next_cursor = await run_in_threadpool(
@@ -79,21 +83,32 @@ async def search_browse(
                 query=query,
             )
         case BrowseSource.Brave:
-            items, next_cursor = await brave.search(
-                web_search_provider,
-                query=query,
+            items, next_cursor = await provider_page_cache.fetch(
+                provider_page_key(query, page_token=query.cursor),
+                lambda: brave.search(web_search_provider, query=query),
+                ttl_seconds=ttl_seconds,
             )
         case BrowseSource.YouTube:
-            items, next_cursor = await run_in_threadpool(
-                youtube.search,
+            page_token = youtube.search_page_token(viewer_id=viewer_id, query=query)
+            items, next_page_token = await provider_page_cache.fetch(
+                provider_page_key(query, page_token=page_token),
+                lambda: run_in_threadpool(youtube.search_page, query, page_token=page_token),
+                ttl_seconds=ttl_seconds,
+            )
+            next_cursor = youtube.search_cursor(
                 viewer_id=viewer_id,
                 query=query,
+                page_token=next_page_token,
             )
         case BrowseSource.PodcastIndex:
-            items, next_cursor = await run_in_threadpool(
-                podcast_index.search,
-                viewer_id=viewer_id,
-                query=query,
+            items, next_cursor = await provider_page_cache.fetch(
+                provider_page_key(query, page_token=query.cursor),
+                lambda: run_in_threadpool(
+                    podcast_index.search,
+                    viewer_id=viewer_id,
+                    query=query,
+                ),
+                ttl_seconds=ttl_seconds,
             )
     items = await run_in_threadpool(
         _resolve_owned,
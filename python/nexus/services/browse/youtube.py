@@ -167,22 +167,39 @@ class YouTubeVideo:
     contributors: list[ContributorCreditOut]
 
 
-def search(
-    *,
-    viewer_id,
+def search_page_token(*, viewer_id, query: BrowseQuery) -> str | None:
+    """Decode the viewer's Browse cursor to the YouTube page token it carries."""
+    if query.cursor is None:
+        return None
+    return str(
+        decode_search_cursor(
+            query.cursor,
+            query,
+            viewer_id=viewer_id,
+            provider_contract=_PROVIDER_CONTRACT,
+            plan=BrowseSearchPlan.YouTubeSearchPageToken,
+        )
+    )
+
+
+def search_cursor(*, viewer_id, query: BrowseQuery, page_token: str | None) -> str | None:
+    if page_token is None:
+        return None
+    return encode_search_cursor(
+        query,
+        viewer_id=viewer_id,
+        provider_contract=_PROVIDER_CONTRACT,
+        plan=BrowseSearchPlan.YouTubeSearchPageToken,
+        after=page_token,
+    )
+
+
+def search_page(
     query: BrowseQuery,
+    *,
+    page_token: str | None,
 ) -> tuple[list[BrowseCandidate], str | None]:
-    page_token = None
-    if query.cursor is not None:
-        page_token = str(
-            decode_search_cursor(
-                query.cursor,
-                query,
-                viewer_id=viewer_id,
-                provider_contract=_PROVIDER_CONTRACT,
-                plan=BrowseSearchPlan.YouTubeSearchPageToken,
-            )
-        )
+    """One provider page and YouTube's next-page token; nothing here is viewer-bound."""
     settings = get_settings()
     if not settings.youtube_data_api_key:
         raise RuntimeError("YouTube Browse provider is not configured")
@@ -206,16 +223,7 @@ def search(
     except ValidationError as exc:
         raise RuntimeError("YouTube Browse response schema drift") from exc
     items: list[BrowseCandidate] = [_search_candidate(item) for item in response.items]
-    next_cursor = None
-    if response.next_page_token is not None:
-        next_cursor = encode_search_cursor(
-            query,
-            viewer_id=viewer_id,
-            provider_contract=_PROVIDER_CONTRACT,
-            plan=BrowseSearchPlan.YouTubeSearchPageToken,
-            after=response.next_page_token,
-        )
-    return items, next_cursor
+    return items, response.next_page_token
 
 
 def preview(video_ref: str) -> YouTubeVideo:
@@ -7,18 +7,24 @@ the chat run-state transitions (running, cancel-checks, terminal accounting).
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from typing import Any
 from uuid import UUID
 
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
+from nexus.db.listen import NotificationTick, SharedChannelListener
 from nexus.db.models import ChatRun
 from nexus.schemas.conversation import chat_run_event_payload_json
 from nexus.services import run_kit
 
 TERMINAL_RUN_STATUSES = run_kit.terminal_statuses(run_kit.RunStreamKind.ChatRun)
+# Notified with the run id by the 0222 trigger when cancel_requested_at is set.
+CHAT_RUN_CANCEL_CHANNEL = "chat_run_cancel"
+
+_cancel_listener = SharedChannelListener(CHAT_RUN_CANCEL_CHANNEL)
 
 
 def append_run_event(db: Session, run: ChatRun, event_type: str, payload: dict[str, Any]) -> None:
@@ -245,3 +251,28 @@ def is_cancel_requested(db: Session, run_id: UUID) -> bool:
         select(ChatRun.cancel_requested_at).where(ChatRun.id == run_id)
     ).scalar_one_or_none()
     return cancelled_at is not None
+
+
+class ChatRunCancelWatch:
+    """Cancel state of one executing run, re-read only when a NOTIFY says so."""
+
+    def __init__(self, run_id: UUID, tick: NotificationTick) -> None:
+        self._run_id = run_id
+        self._tick = tick
+        self._requested = False
+
+    def requested(self, db: Session) -> bool:
+        if not self._requested and self._tick.consume():
+            self._requested = is_cancel_requested(db, self._run_id)
+        return self._requested
+
+    async def wait(self, db: Session) -> None:
+        """Return once cancel has been requested."""
+        while not self.requested(db):
+            await self._tick.wait()
+
+
+@contextmanager
+def watch_chat_run_cancel(run_id: UUID) -> Iterator[ChatRunCancelWatch]:
+    with _cancel_listener.subscribe(str(run_id)) as tick:
+        yield ChatRunCancelWatch(run_id, tick)
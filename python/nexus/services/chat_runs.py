@@ -91,16 +91,20 @@ from nexus.schemas.conversation import (
 from nexus.services.agent_tools.app_search import (
     APP_SEARCH_TOOL_DEFINITION,
     APP_SEARCH_TOOL_NAME,
-    execute_app_search,
+    AppSearchRun,
+    persist_app_search_run,
+    run_app_search,
 )
 from nexus.services.agent_tools.inspect_resource import (
     INSPECT_RESOURCE_TOOL_DEFINITION,
     INSPECT_RESOURCE_TOOL_NAME,
+    InspectResourceResult,
     execute_inspect_resource,
 )
 from nexus.services.agent_tools.read_resource import (
     READ_RESOURCE_TOOL_DEFINITION,
     READ_RESOURCE_TOOL_NAME,
+    ReadResourceResult,
     execute_read_resource,
 )
 from nexus.services.agent_tools.web_search import (
@@ -131,9 +135,10 @@ from nexus.services.chat_run_citations import (
 )
 from nexus.services.chat_run_event_store import (
     TERMINAL_RUN_STATUSES,
+    ChatRunCancelWatch,
     ChatRunEventEmitter,
-    is_cancel_requested,
     mark_running,
+    watch_chat_run_cancel,
 )
 from nexus.services.chat_run_finalize import (
     MAX_ASSISTANT_CONTENT_LENGTH,
@@ -220,7 +225,9 @@ MAX_TOOL_ITERATIONS = 8
 CHAT_TEXT_FLUSH_INTERVAL_MS = 33
 CHAT_TEXT_FLUSH_MAX_CHARS = 512
 CHAT_TEXT_FLUSH_MAX_BYTES = 2048
-CHAT_CANCEL_POLL_INTERVAL_SECONDS = 0.25
+# Consecutive read-only tool calls of one turn run their reads this many at a
+# time, each on a session of its own; everything they persist stays in order.
+MAX_CONCURRENT_READ_TOOL_CALLS = 4
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
@@ -268,6 +275,8 @@ type ChatExecutionOutcome = (
     | SkippedChatExecution
 )
 
+type _ReadToolOutcome = AppSearchRun | ReadResourceResult | InspectResourceResult
+
 
 def _presence(value: str | None) -> owned_presence.Presence[str]:
     return (
@@ -732,16 +741,12 @@ def assert_chat_run_owner(db: Session, *, viewer_id: UUID, run_id: UUID) -> None
 
 
 async def _watch_chat_run_cancel(
-    db: Session, *, run_id: UUID, cancel_signal: asyncio.Event
+    db: Session, *, cancel_watch: ChatRunCancelWatch, cancel_signal: asyncio.Event
 ) -> None:
-    # justify-polling: cancel_requested_at is an UPDATE on the run row, while the
-    # existing SSE push channel only notifies appended event rows. This watcher is
-    # scoped to one active provider stream and exits as soon as the stream ends.
-    while not cancel_signal.is_set():
-        if is_cancel_requested(db, run_id):
-            cancel_signal.set()
-            return
-        await asyncio.sleep(CHAT_CANCEL_POLL_INTERVAL_SECONDS)
+    # Scoped to one active provider stream; the cancel NOTIFY wakes it, so it
+    # issues no queries while the run is not cancelled.
+    await cancel_watch.wait(db)
+    cancel_signal.set()
 
 
 def _latest_generation_support_id(db: Session, run_id: UUID) -> str | None:
@@ -785,13 +790,15 @@ async def execute_chat_run(
     )
     set_flow_id(str(run_id))
     try:
-        return await _execute_chat_run(
-            db,
-            run_id=run_id,
-            steps=steps,
-            session_factory=session_factory,
-            settings=settings,
-        )
+        with watch_chat_run_cancel(run_id) as cancel_watch:
+            return await _execute_chat_run(
+                db,
+                run_id=run_id,
+                steps=steps,
+                cancel_watch=cancel_watch,
+                session_factory=session_factory,
+                settings=settings,
+            )
     except Exception:
         db.rollback()
         logger.exception("chat_run.attempt_failed", run_id=str(run_id), job_id=str(job.id))
@@ -805,6 +812,7 @@ async def _execute_chat_run(
     *,
     run_id: UUID,
     steps: ChatStepRuntime,
+    cancel_watch: ChatRunCancelWatch,
     session_factory: sessionmaker[Session],
     settings: Settings,
 ) -> ChatExecutionOutcome:
@@ -842,7 +850,7 @@ async def _execute_chat_run(
     if run.status in TERMINAL_RUN_STATUSES:
         steps.clear()
         return SkippedChatExecution(reason="Terminal")
-    if is_cancel_requested(db, run.id):
+    if cancel_watch.requested(db):
         return _finalize_cancelled_execution(db, run=run, steps=steps)
 
     rate_limiter = get_rate_limiter()
@@ -901,7 +909,7 @@ async def _execute_chat_run(
         emitter = ChatRunEventEmitter(db, run, lease_fence=steps.lock_active_attempt)
 
         for turn_index in range(MAX_TOOL_ITERATIONS):
-            if is_cancel_requested(db, run.id):
+            if cancel_watch.requested(db):
                 return _finalize_cancelled_execution(
                     db,
                     run=run,
@@ -938,6 +946,7 @@ async def _execute_chat_run(
                         reasoning=reasoning,
                         intent=iter_intent,
                     ),
+                    cancel_watch=cancel_watch,
                     session_factory=session_factory,
                     settings=settings,
                     emitter=emitter,
@@ -966,6 +975,8 @@ async def _execute_chat_run(
                 break
 
             messages.append(assistant_message_from_turn(generation_result))
+            # Paths and indexes are fixed in call order before anything runs.
+            turn_tools: list[tuple[ToolCall, int, str, StepReplayState]] = []
             for tool_call in pending_tool_calls:
                 tool_call_index_next += 1
                 tool_path = f"turn/{turn_index}/tool/{tool_call_index_next}"
@@ -981,26 +992,51 @@ async def _execute_chat_run(
                     tool_state = steps.prepare(tool_path, tool_fingerprint)
                 else:
                     _assert_step_fingerprint(tool_state, tool_fingerprint)
+                turn_tools.append((tool_call, tool_call_index_next, tool_path, tool_state))
 
+            prefetched: dict[int, _ReadToolOutcome | None] = {}
+            for position, (tool_call, tool_call_index, tool_path, tool_state) in enumerate(
+                turn_tools
+            ):
                 if tool_state.dispatch_phase is Completed:
                     tool_result = decode_tool(tool_state)
                 else:
                     if tool_state.dispatch_phase is not Prepared:
                         raise AssertionError("tool step is not dispatchable")
+                    if _is_read_only_tool_step(tool_call, tool_state) and (
+                        tool_call_index not in prefetched
+                    ):
+                        # A write or web search ends the segment: reads after it
+                        # must observe it, so they are prefetched only once it ran.
+                        segment: list[tuple[ToolCall, int]] = []
+                        for later_call, later_index, _, later_state in turn_tools[position:]:
+                            if not _is_read_only_tool_step(later_call, later_state):
+                                break
+                            segment.append((later_call, later_index))
+                        if len(segment) > 1:
+                            # Fence before the reads: a run that lost its lease
+                            # must not start any of them.
+                            steps.lock_active_attempt()
+                            prefetched.update(
+                                await _prefetch_read_tool_calls(
+                                    session_factory, run=run, calls=segment
+                                )
+                            )
                     tool_result = await _execute_tool_step(
                         db,
                         run=run,
                         steps=steps,
                         path=tool_path,
                         tool_call=tool_call,
-                        tool_call_index=tool_call_index_next,
+                        tool_call_index=tool_call_index,
                         citation_n_next=citation_n_next,
                         emitter=emitter,
+                        prefetched=prefetched.pop(tool_call_index, None),
                     )
                 citation_n_next = tool_result.next_citation_ordinal
                 messages.append(tool_result_message(tool_result))
 
-                if is_cancel_requested(db, run.id):
+                if cancel_watch.requested(db):
                     return _finalize_cancelled_execution(
                         db,
                         run=run,
@@ -1016,7 +1052,7 @@ async def _execute_chat_run(
                 iterations=MAX_TOOL_ITERATIONS,
             )
 
-        if is_cancel_requested(db, run.id):
+        if cancel_watch.requested(db):
             return _finalize_cancelled_execution(
                 db,
                 run=run,
@@ -1089,6 +1125,7 @@ async def _dispatch_generation_step(
     steps: ChatStepRuntime,
     path: str,
     request: GenerationRequest,
+    cancel_watch: ChatRunCancelWatch,
     session_factory: sessionmaker[Session],
     settings: Settings,
     emitter: ChatRunEventEmitter,
@@ -1122,7 +1159,7 @@ async def _dispatch_generation_step(
 
     cancel_signal = asyncio.Event()
     cancel_watcher = asyncio.create_task(
-        _watch_chat_run_cancel(db, run_id=run.id, cancel_signal=cancel_signal)
+        _watch_chat_run_cancel(db, cancel_watch=cancel_watch, cancel_signal=cancel_signal)
     )
 
     def mark_dispatch_uncertain() -> None:
@@ -1352,24 +1389,27 @@ def _fold_generation_terminal(
     return _failed_chat_execution(db, run_id=run.id, error_code=result.error_code)
 
 
-async def _execute_tool_step(
+def _is_read_only_tool_step(tool_call: ToolCall, state: StepReplayState) -> bool:
+    """A dispatchable call whose replay policy marks it free of side effects."""
+    return (
+        state.dispatch_phase is Prepared
+        and tool_replay_policy(tool_call.name) is ReplayPolicy.ReDispatchable
+    )
+
+
+def _read_tool_call(
     db: Session,
     *,
-    run: ChatRun,
-    steps: ChatStepRuntime,
-    path: str,
+    viewer_id: UUID,
+    conversation_id: UUID,
+    user_message_id: UUID,
+    assistant_message_id: UUID,
     tool_call: ToolCall,
     tool_call_index: int,
-    citation_n_next: int,
-    emitter: ChatRunEventEmitter,
-) -> ToolStepResult:
-    if tool_call.name != WEB_SEARCH_TOOL_NAME or not isinstance(
-        steps.web_search_provider, owned_presence.Present
-    ):
-        steps.lock_active_attempt()
-
+) -> _ReadToolOutcome:
+    """Run the read phase of a read-only tool call; writes nothing."""
+    args = tool_call.arguments
     if tool_call.name == APP_SEARCH_TOOL_NAME:
-        args = tool_call.arguments
         scopes, forced_error = _app_search_scopes_from_tool_args(args)
         kinds, filter_error = _app_search_string_array_from_tool_args(args, "kinds")
         forced_error = forced_error or filter_error
@@ -1379,12 +1419,12 @@ async def _execute_tool_step(
         forced_error = forced_error or filter_error
         roles, filter_error = _app_search_string_array_from_tool_args(args, "roles")
         forced_error = forced_error or filter_error
-        run_result = execute_app_search(
+        return run_app_search(
             db,
-            viewer_id=run.owner_user_id,
-            conversation_id=run.conversation_id,
-            user_message_id=run.user_message_id,
-            assistant_message_id=run.assistant_message_id,
+            viewer_id=viewer_id,
+            conversation_id=conversation_id,
+            user_message_id=user_message_id,
+            assistant_message_id=assistant_message_id,
             scopes=scopes,
             query=str(args.get("query") or ""),
             kinds=kinds,
@@ -1394,6 +1434,112 @@ async def _execute_tool_step(
             tool_call_index=tool_call_index,
             forced_error=forced_error,
         )
+    uri = str(args.get("uri") or "")
+    if tool_call.name == READ_RESOURCE_TOOL_NAME:
+        return execute_read_resource(
+            db, viewer_id=viewer_id, conversation_id=conversation_id, uri=uri
+        )
+    if tool_call.name == INSPECT_RESOURCE_TOOL_NAME:
+        return execute_inspect_resource(
+            db, viewer_id=viewer_id, conversation_id=conversation_id, uri=uri
+        )
+    raise AssertionError(f"{tool_call.name} has no read-only phase")
+
+
+async def _prefetch_read_tool_calls(
+    session_factory: sessionmaker[Session],
+    *,
+    run: ChatRun,
+    calls: list[tuple[ToolCall, int]],
+) -> dict[int, _ReadToolOutcome | None]:
+    """Run the reads of a segment of read-only calls concurrently, keyed by index.
+
+    Each read gets its own session on a worker thread, bounded by
+    ``MAX_CONCURRENT_READ_TOOL_CALLS``. Nothing is persisted or emitted here:
+    the caller completes the steps one by one in call order, so tool rows,
+    citation ordinals, and stream events come out exactly as a sequential run.
+
+    A read that raises is logged and mapped to None, and the siblings keep
+    their outcomes. The caller then repeats that read inline when its step
+    comes up, so it succeeds or fails there exactly as in a sequential run,
+    after the steps before it have completed.
+    """
+    run_ids = {
+        "viewer_id": run.owner_user_id,
+        "conversation_id": run.conversation_id,
+        "user_message_id": run.user_message_id,
+        "assistant_message_id": run.assistant_message_id,
+    }
+    slots = asyncio.Semaphore(MAX_CONCURRENT_READ_TOOL_CALLS)
+
+    def read(tool_call: ToolCall, tool_call_index: int) -> _ReadToolOutcome:
+        with session_factory() as read_db:
+            return _read_tool_call(
+                read_db, tool_call=tool_call, tool_call_index=tool_call_index, **run_ids
+            )
+
+    async def bounded_read(tool_call: ToolCall, tool_call_index: int) -> _ReadToolOutcome:
+        async with slots:
+            return await asyncio.to_thread(read, tool_call, tool_call_index)
+
+    outcomes = await asyncio.gather(
+        *(bounded_read(tool_call, tool_call_index) for tool_call, tool_call_index in calls),
+        return_exceptions=True,
+    )
+    prefetched: dict[int, _ReadToolOutcome | None] = {}
+    for (tool_call, tool_call_index), outcome in zip(calls, outcomes, strict=True):
+        if not isinstance(outcome, BaseException):
+            prefetched[tool_call_index] = outcome
+            continue
+        if not isinstance(outcome, Exception):
+            raise outcome
+        logger.warning(
+            "chat_run.read_prefetch_failed",
+            run_id=str(run.id),
+            tool_name=tool_call.name,
+            tool_call_index=tool_call_index,
+            error=str(outcome),
+        )
+        prefetched[tool_call_index] = None
+    return prefetched
+
+
+async def _execute_tool_step(
+    db: Session,
+    *,
+    run: ChatRun,
+    steps: ChatStepRuntime,
+    path: str,
+    tool_call: ToolCall,
+    tool_call_index: int,
+    citation_n_next: int,
+    emitter: ChatRunEventEmitter,
+    prefetched: _ReadToolOutcome | None = None,
+) -> ToolStepResult:
+    if tool_call.name != WEB_SEARCH_TOOL_NAME or not isinstance(
+        steps.web_search_provider, owned_presence.Present
+    ):
+        steps.lock_active_attempt()
+
+    read_outcome = prefetched
+    if read_outcome is None and tool_call.name in {
+        APP_SEARCH_TOOL_NAME,
+        READ_RESOURCE_TOOL_NAME,
+        INSPECT_RESOURCE_TOOL_NAME,
+    }:
+        read_outcome = _read_tool_call(
+            db,
+            viewer_id=run.owner_user_id,
+            conversation_id=run.conversation_id,
+            user_message_id=run.user_message_id,
+            assistant_message_id=run.assistant_message_id,
+            tool_call=tool_call,
+            tool_call_index=tool_call_index,
+        )
+
+    if isinstance(read_outcome, AppSearchRun):
+        run_result = read_outcome
+        persist_app_search_run(db, run_result)
         if run_result.tool_call_id is None:
             raise AssertionError("app search did not persist its tool row")
         numbering = number_tool_citation_candidates(
@@ -1506,15 +1652,9 @@ async def _execute_tool_step(
             event=run_result.result_event,
         )
 
-    if tool_call.name in {READ_RESOURCE_TOOL_NAME, INSPECT_RESOURCE_TOOL_NAME}:
-        uri = str(tool_call.arguments.get("uri") or "")
-        if tool_call.name == READ_RESOURCE_TOOL_NAME:
-            read_result = execute_read_resource(
-                db,
-                viewer_id=run.owner_user_id,
-                conversation_id=run.conversation_id,
-                uri=uri,
-            )
+    if read_outcome is not None:
+        if isinstance(read_outcome, ReadResourceResult):
+            read_result = read_outcome
             tool_call_id = persist_tool_call_trace(
                 db,
                 run=run,
@@ -1539,12 +1679,7 @@ async def _execute_tool_step(
             output = read_result.tool_output(n=candidate_n)
             result = read_result
         else:
-            inspect_result = execute_inspect_resource(
-                db,
-                viewer_id=run.owner_user_id,
-                conversation_id=run.conversation_id,
-                uri=uri,
-            )
+            inspect_result = read_outcome
             tool_call_id = persist_tool_call_trace(
                 db,
                 run=run,
@@ -0,0 +1,181 @@
+"""Revision-keyed conditional reads for finite viewer collection pages.
+
+Every write that can change a finite collection advances the viewer's
+``CollectionFamily`` revision, so one page of a collection is fully determined
+by (viewer, family revision, route path, canonical query). That tuple is the
+strong ETag and the key of a small in-process page cache:
+
+- ``If-None-Match`` with a current validator costs one indexed revision read.
+- A repeat load at an unchanged revision serves the cached encoded envelope and
+  skips the family's hydration query.
+- Any bump changes the key; stale entries are never read again and age out of
+  the LRU.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+from urllib.parse import urlencode
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from nexus.schemas.collection_page import CollectionPage
+from nexus.services.collection_revisions import CollectionFamily, read_collection_revision
+
+PAGE_CACHE_MAX_ENTRIES = 512
+PAGE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+COLLECTION_CACHE_CONTROL = "private, no-cache"
+
+
+@dataclass(frozen=True, slots=True)
+class CollectionPageRead:
+    """Outcome of a conditional collection page read.
+
+    ``body`` is the encoded ``{"data": ...}`` envelope, or ``None`` when the
+    client's validator is still current and the answer is 304.
+    """
+
+    etag: str
+    body: bytes | None
+
+
+class CollectionPageCache:
+    """Thread-safe LRU of encoded collection pages with entry and byte limits."""
+
+    def __init__(
+        self,
+        max_entries: int = PAGE_CACHE_MAX_ENTRIES,
+        max_bytes: int = PAGE_CACHE_MAX_BYTES,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._pages: OrderedDict[str, bytes] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = Lock()
+
+    def get(self, etag: str) -> bytes | None:
+        with self._lock:
+            body = self._pages.get(etag)
+            if body is not None:
+                self._pages.move_to_end(etag)
+            return body
+
+    def put(self, etag: str, body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._pages.pop(etag, None)
+            if previous is not None:
+                self._total_bytes -= len(previous)
+            while self._pages and (
+                len(self._pages) >= self.max_entries
+                or self._total_bytes + len(body) > self.max_bytes
+            ):
+                _, evicted = self._pages.popitem(last=False)
+                self._total_bytes -= len(evicted)
+            self._pages[etag] = body
+            self._total_bytes += len(body)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pages.clear()
+            self._total_bytes = 0
+
+    @property
+    def size(self) -> int:
+        with self._lock:
+            return len(self._pages)
+
+
+_page_cache = CollectionPageCache()
+
+
+def get_page_cache() -> CollectionPageCache:
+    return _page_cache
+
+
+def collection_etag(
+    *,
+    viewer_id: UUID,
+    family: CollectionFamily,
+    revision: int,
+    path: str,
+    query_items: Iterable[tuple[str, str]],
+) -> str:
+    """Derive the strong validator for one page at one family revision.
+
+    Query items are sorted so parameter order does not split the cache; repeated
+    keys keep every value.
+    """
+    canonical_query = urlencode(sorted(query_items))
+    seed = "\x00".join((str(viewer_id), family.value, str(revision), path, canonical_query))
+    digest = hashlib.sha256(seed.encode()).hexdigest()[:32]
+    return f'"col-{revision}-{digest}"'
+
+
+def validator_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak If-None-Match comparison against one of our strong validators.
+
+    ``*`` is deliberately not honoured: it would answer 304 before the family's
+    own service has confirmed the viewer may see the collection at all.
+    """
+    if if_none_match is None:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip().removeprefix("W/")
+        if tag == etag:
+            return True
+    return False
+
+
+def read_collection_page(
+    db: Session,
+    *,
+    viewer_id: UUID,
+    family: CollectionFamily,
+    path: str,
+    query_items: Iterable[tuple[str, str]],
+    if_none_match: str | None,
+    load: Callable[[], CollectionPage[Any]],
+) -> CollectionPageRead:
+    """Answer one collection page read from its family revision when possible.
+
+    ``load`` is the family's own list service call; it keeps ownership of
+    authorization, cursor binding, and ``collectionRevision`` checks. It runs
+    only when neither the client's validator nor the page cache is current.
+    """
+    items = tuple(query_items)
+    revision = read_collection_revision(db, viewer_id=viewer_id, family=family)
+    etag = collection_etag(
+        viewer_id=viewer_id,
+        family=family,
+        revision=revision,
+        path=path,
+        query_items=items,
+    )
+    if validator_matches(if_none_match, etag):
+        return CollectionPageRead(etag=etag, body=None)
+
+    cached = _page_cache.get(etag)
+    if cached is not None:
+        return CollectionPageRead(etag=etag, body=cached)
+
+    page = load()
+    if page.collection_revision != revision:
+        etag = collection_etag(
+            viewer_id=viewer_id,
+            family=family,
+            revision=page.collection_revision,
+            path=path,
+            query_items=items,
+        )
+    body = b'{"data":' + page.model_dump_json(by_alias=True).encode() + b"}"
+    _page_cache.put(etag, body)
+    return CollectionPageRead(etag=etag, body=body)
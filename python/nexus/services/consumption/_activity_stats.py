@@ -24,6 +24,7 @@ from sqlalchemy.orm import Session
 from nexus.auth.permissions import visible_media_ids_cte_sql
 from nexus.config import get_settings
 from nexus.errors import InvalidRequestError
+from nexus.schemas.consumption_activity import MAX_ACTIVITY_SPAN_MS
 from nexus.services.consumption.handles import DeviceHandle, seal_device
 from nexus.services.contributor_credits import (
     current_contributor_rows_for_media_sql,
@@ -31,6 +32,9 @@ from nexus.services.contributor_credits import (
 )
 
 ACTIVITY_SESSION_GAP_MS = 1_800_000
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_ROLLUP_SLOT = timedelta(minutes=15)
+_ACTIVITY_SPAN_MAX = timedelta(milliseconds=MAX_ACTIVITY_SPAN_MS)
 
 
 def timeline_rows_sql(bucket: str) -> str:
@@ -114,40 +118,158 @@ def require_bucket_ceiling(
         raise InvalidRequestError(message="Consumption timeline exceeds 400 buckets")
 
 
-def activity_totals_sql() -> str:
+def activity_facts_sql(filters: str = "") -> str:
+    """Visible activity facts answered from slot rollups plus raw range edges.
+
+    Binds ``:viewer_id``, ``:start``, ``:end``, ``:core_start``, ``:core_end``
+    and ``:as_of_created_at``. Slots in ``[core_start, core_end)`` come from
+    ``consumption_activity_rollups``; only the sub-slot head and tail of the
+    range read ``consumption_activity_spans``, split by minute so local-day and
+    local-hour attribution matches the raw relation. Each span's forward
+    deltas come from exactly one side: the rollup slot holding its start, or a
+    per-span clipped share for spans starting outside the core. ``filters`` is
+    a fixed clause string over alias ``s`` from :func:`_filters`.
+
+    A rollup row folded after ``:as_of_created_at`` would leak later facts into
+    the snapshot, so such a slot is replayed from its spans created by then,
+    with the same split and attribution rule the fold uses.
+
+    Rows carry ``bucket_at`` (a slot or minute start), numeric ``active_ms``,
+    forward deltas and observed bounds. Delta-only edge rows have zero
+    ``active_ms`` and null bounds.
+    """
+    return f"""
+        WITH visible_media AS ({visible_media_ids_cte_sql()}),
+        core_slots AS (
+            SELECT s.*, m.title
+            FROM consumption_activity_rollups s
+            JOIN visible_media vm ON vm.media_id = s.media_id
+            JOIN media m ON m.id = s.media_id
+            WHERE s.user_id = :viewer_id
+              AND s.slot_start >= :core_start
+              AND s.slot_start < :core_end{filters}
+        ), core AS (
+            SELECT media_id, title, modality, device_id, device_class,
+                   slot_start AS bucket_at, active_ms,
+                   forward_word_position::numeric AS forward_word_position,
+                   forward_media_position_ms::numeric AS forward_media_position_ms,
+                   first_observed_at, last_observed_at
+            FROM core_slots
+            WHERE folded_through <= :as_of_created_at
+        ), core_replay AS (
+            SELECT r.media_id, r.title, r.modality, r.device_id, r.device_class,
+                   r.slot_start AS bucket_at,
+                   extract(epoch FROM
+                       LEAST(sp.ended_at, r.slot_start + interval '15 minutes')
+                       - GREATEST(sp.occurred_at, r.slot_start)
+                   ) * 1000 AS active_ms,
+                   CASE WHEN sp.occurred_at >= r.slot_start
+                        THEN greatest(0, coalesce(sp.word_end - sp.word_start, 0))
+                        ELSE 0 END::numeric AS forward_word_position,
+                   CASE WHEN sp.occurred_at >= r.slot_start
+                        THEN greatest(0, coalesce(
+                            sp.media_position_end_ms - sp.media_position_start_ms, 0
+                        ))
+                        ELSE 0 END::numeric AS forward_media_position_ms,
+                   GREATEST(sp.occurred_at, r.slot_start) AS first_observed_at,
+                   LEAST(sp.ended_at, r.slot_start + interval '15 minutes') AS last_observed_at
+            FROM core_slots r
+            CROSS JOIN LATERAL (
+                SELECT spans.*,
+                       spans.occurred_at + spans.duration_ms * interval '1 millisecond'
+                           AS ended_at
+                FROM consumption_activity_spans spans
+                WHERE spans.user_id = r.user_id
+                  AND spans.occurred_at > r.slot_start - interval '{MAX_ACTIVITY_SPAN_MS} milliseconds'
+                  AND spans.occurred_at < r.slot_start + interval '15 minutes'
+                  AND spans.media_id = r.media_id
+                  AND spans.modality = r.modality
+                  AND spans.device_id = r.device_id
+                  AND spans.device_class = r.device_class
+                  AND spans.created_at <= :as_of_created_at
+            ) sp
+            WHERE r.folded_through > :as_of_created_at
+              AND sp.ended_at > r.slot_start
+        ), edge AS (
+            SELECT s.*, m.title,
+                   s.occurred_at + s.duration_ms * interval '1 millisecond' AS ended_at
+            FROM consumption_activity_spans s
+            JOIN visible_media vm ON vm.media_id = s.media_id
+            JOIN media m ON m.id = s.media_id
+            WHERE s.user_id = :viewer_id
+              AND s.created_at <= :as_of_created_at
+              AND s.occurred_at < :end
+              AND s.occurred_at + s.duration_ms * interval '1 millisecond' > :start
+              AND (
+                s.occurred_at < :core_start
+                OR s.occurred_at + s.duration_ms * interval '1 millisecond' > :core_end
+              ){filters}
+        ), edge_pieces AS (
+            SELECT edge.media_id, edge.title, edge.modality, edge.device_id, edge.device_class,
+                   minute_start AS bucket_at,
+                   extract(epoch FROM
+                       least(portion.portion_end, minute_start + interval '1 minute')
+                       - greatest(portion.portion_start, minute_start)
+                   ) * 1000 AS active_ms,
+                   0::numeric AS forward_word_position,
+                   0::numeric AS forward_media_position_ms,
+                   greatest(portion.portion_start, minute_start) AS first_observed_at,
+                   least(portion.portion_end, minute_start + interval '1 minute')
+                       AS last_observed_at
+            FROM edge
+            CROSS JOIN LATERAL (
+                VALUES
+                    (GREATEST(edge.occurred_at, :start), LEAST(edge.ended_at, :core_start)),
+                    (GREATEST(edge.occurred_at, :core_end), LEAST(edge.ended_at, :end))
+            ) portion(portion_start, portion_end)
+            CROSS JOIN LATERAL generate_series(
+                date_trunc('minute', portion.portion_start),
+                date_trunc('minute', portion.portion_end - interval '1 microsecond'),
+                interval '1 minute'
+            ) minute_start
+            WHERE portion.portion_start < portion.portion_end
+        ), edge_deltas AS (
+            SELECT media_id, title, modality, device_id, device_class,
+                   GREATEST(occurred_at, :start) AS bucket_at,
+                   0::numeric AS active_ms,
+                   round(greatest(0, coalesce(word_end - word_start, 0))
+                       * extract(epoch FROM LEAST(ended_at, :end) - GREATEST(occurred_at, :start))
+                       / extract(epoch FROM ended_at - occurred_at)) AS forward_word_position,
+                   round(greatest(0, coalesce(media_position_end_ms - media_position_start_ms, 0))
+                       * extract(epoch FROM LEAST(ended_at, :end) - GREATEST(occurred_at, :start))
+                       / extract(epoch FROM ended_at - occurred_at)) AS forward_media_position_ms,
+                   NULL::timestamptz AS first_observed_at,
+                   NULL::timestamptz AS last_observed_at
+            FROM edge
+            WHERE occurred_at < :core_start OR occurred_at >= :core_end
+        )
+        SELECT * FROM core
+        UNION ALL SELECT * FROM core_replay
+        UNION ALL SELECT * FROM edge_pieces
+        UNION ALL SELECT * FROM edge_deltas
+    """
+
+
+def activity_totals_sql(filters: str = "") -> str:
     """One clipped factual total relation used by cards and day/hour rollups."""
     return f"""
-        WITH clipped AS ({visible_clipped_spans_sql()})
+        WITH facts AS ({activity_facts_sql(filters)})
         SELECT modality,
-               sum(extract(epoch FROM clipped_end - clipped_start) * 1000)::bigint AS active_ms,
-               sum(round(greatest(0, coalesce(word_end - word_start, 0))
-                   * extract(epoch FROM clipped_end - clipped_start)
-                   / extract(epoch FROM ended_at - occurred_at)))::bigint AS forward_word_position,
-               sum(round(greatest(0, coalesce(media_position_end_ms - media_position_start_ms, 0))
-                   * extract(epoch FROM clipped_end - clipped_start)
-                   / extract(epoch FROM ended_at - occurred_at)))::bigint AS forward_media_position_ms
-        FROM clipped GROUP BY modality
+               sum(active_ms)::bigint AS active_ms,
+               sum(forward_word_position)::bigint AS forward_word_position,
+               sum(forward_media_position_ms)::bigint AS forward_media_position_ms
+        FROM facts GROUP BY modality
     """
 
 
-def local_hours_sql() -> str:
+def local_hours_sql(filters: str = "") -> str:
     """Exactly 24 wall-clock rows; repeated fall-back hours intentionally fold."""
     return f"""
-        WITH clipped AS ({visible_clipped_spans_sql()}), pieces AS (
-            SELECT clipped.id,
-                   minute_start,
-                   least(clipped.clipped_end, minute_start + interval '1 minute') AS piece_end,
-                   greatest(clipped.clipped_start, minute_start) AS piece_start
-            FROM clipped
-            CROSS JOIN LATERAL generate_series(
-                date_trunc('minute', clipped.clipped_start),
-                date_trunc('minute', clipped.clipped_end - interval '1 microsecond'),
-                interval '1 minute'
-            ) minute_start
-        ), hourly AS (
-            SELECT extract(hour FROM minute_start AT TIME ZONE :time_zone)::int AS hour,
-                   sum(extract(epoch FROM piece_end - piece_start) * 1000)::bigint AS active_ms
-            FROM pieces
+        WITH facts AS ({activity_facts_sql(filters)}), hourly AS (
+            SELECT extract(hour FROM bucket_at AT TIME ZONE :time_zone)::int AS hour,
+                   sum(active_ms)::bigint AS active_ms
+            FROM facts
+            WHERE active_ms > 0
             GROUP BY hour
         ), hours AS (SELECT generate_series(0, 23) AS hour)
         SELECT hours.hour, coalesce(hourly.active_ms, 0)::bigint AS active_ms
@@ -156,35 +278,23 @@ def local_hours_sql() -> str:
     """
 
 
-def local_days_sql() -> str:
-    """Local calendar-day activity rows from the same clipped bucket facts."""
+def local_days_sql(filters: str = "") -> str:
+    """Local calendar-day activity rows from the same rolled-up facts."""
     return f"""
-        WITH clipped AS ({visible_clipped_spans_sql()}), pieces AS (
-            SELECT (minute_start AT TIME ZONE :time_zone)::date AS local_date,
-                   greatest(clipped.clipped_start, minute_start) AS piece_start,
-                   least(
-                       clipped.clipped_end,
-                       minute_start + interval '1 minute'
-                   ) AS piece_end
-            FROM clipped
-            CROSS JOIN LATERAL generate_series(
-                date_trunc('minute', clipped.clipped_start),
-                date_trunc('minute', clipped.clipped_end - interval '1 microsecond'),
-                interval '1 minute'
-            ) minute_start
-        )
-        SELECT local_date,
-               sum(extract(epoch FROM piece_end - piece_start) * 1000)::bigint AS active_ms
-        FROM pieces
+        WITH facts AS ({activity_facts_sql(filters)})
+        SELECT (bucket_at AT TIME ZONE :time_zone)::date AS local_date,
+               sum(active_ms)::bigint AS active_ms
+        FROM facts
+        WHERE active_ms > 0
         GROUP BY local_date
         ORDER BY local_date
     """
 
 
-def streaks_sql() -> str:
+def streaks_sql(filters: str = "") -> str:
     """Qualifying-day streaks; binds ``:is_live`` and ``:today_local``."""
     return f"""
-        WITH days AS ({local_days_sql()}), qualifying AS (
+        WITH days AS ({local_days_sql(filters)}), qualifying AS (
             SELECT local_date, local_date - row_number() OVER (ORDER BY local_date)::int AS island
             FROM days WHERE active_ms >= 300000
         ), runs AS (
@@ -201,6 +311,23 @@ def streaks_sql() -> str:
     """
 
 
+def rollup_core_bounds(start: datetime, end: datetime) -> tuple[datetime, datetime]:
+    """Slot-aligned ``[core_start, core_end)`` answered wholly by rollups.
+
+    ``core_end`` stays one maximum span duration before ``end`` so no span
+    starting inside the core can be clipped by the range end. An empty core
+    collapses to ``start`` and the whole range reads raw spans.
+    """
+    slot_us = _ROLLUP_SLOT // timedelta(microseconds=1)
+    start_us = (start - _EPOCH) // timedelta(microseconds=1)
+    end_us = (end - _ACTIVITY_SPAN_MAX - _EPOCH) // timedelta(microseconds=1)
+    core_start = _EPOCH + timedelta(microseconds=-(-start_us // slot_us) * slot_us)
+    core_end = _EPOCH + timedelta(microseconds=(end_us // slot_us) * slot_us)
+    if core_end <= core_start:
+        return start, start
+    return core_start, core_end
+
+
 @dataclass(frozen=True, slots=True)
 class ActivityQuery:
     start: datetime | None
@@ -552,32 +679,21 @@ def _media_activity_rows(
     db: Session, *, viewer_id: UUID, query: ActivityQuery, as_of: datetime
 ) -> list[dict[str, Any]]:
     """All currently visible media activity, deterministically ranked."""
-    start = query.start or datetime(1970, 1, 1, tzinfo=UTC)
     filters, filter_params = _filters(query)
-    relation = visible_clipped_spans_sql().replace(
-        "AND s.created_at <= :as_of_created_at", "AND s.created_at <= :as_of_created_at" + filters
-    )
     return [
         dict(row)
         for row in db.execute(
             text(f"""
-        WITH clipped AS ({relation}), ranked AS (
+        WITH facts AS ({activity_facts_sql(filters)}), ranked AS (
             SELECT media_id, min(title) AS title,
-                   sum(extract(epoch FROM clipped_end - clipped_start) * 1000)::bigint AS active_ms,
-                   sum(round(greatest(0, coalesce(word_end - word_start, 0))
-                       * extract(epoch FROM clipped_end - clipped_start)
-                       / extract(epoch FROM ended_at - occurred_at)))::bigint
-                       AS forward_word_position,
-                   sum(round(greatest(0, coalesce(media_position_end_ms - media_position_start_ms, 0))
-                       * extract(epoch FROM clipped_end - clipped_start)
-                       / extract(epoch FROM ended_at - occurred_at)))::bigint
-                       AS forward_media_position_ms,
-                   row_number() OVER (ORDER BY sum(extract(epoch FROM clipped_end - clipped_start) * 1000) DESC, media_id ASC) AS rank
-            FROM clipped GROUP BY media_id
+                   sum(active_ms)::bigint AS active_ms,
+                   sum(forward_word_position)::bigint AS forward_word_position,
+                   sum(forward_media_position_ms)::bigint AS forward_media_position_ms,
+                   row_number() OVER (ORDER BY sum(active_ms) DESC, media_id ASC) AS rank
+            FROM facts GROUP BY media_id
         ) SELECT * FROM ranked ORDER BY rank
     """),
-            {"viewer_id": viewer_id, "start": start, "end": query.end, "as_of_created_at": as_of}
-            | filter_params,
+            _activity_params(viewer_id=viewer_id, query=query, as_of=as_of) | filter_params,
         ).mappings()
     ]
 
@@ -594,31 +710,51 @@ def device_breakdown_rows(
     db: Session, *, viewer_id: UUID, query: ActivityQuery, as_of: datetime
 ) -> list[dict[str, Any]]:
     """Private device facts for a later sealed-handle projection."""
-    start = query.start or datetime(1970, 1, 1, tzinfo=UTC)
     filters, filter_params = _filters(query)
-    clipped = visible_clipped_spans_sql().replace(
-        "AND s.created_at <= :as_of_created_at", "AND s.created_at <= :as_of_created_at" + filters
-    )
     return [
         dict(row)
         for row in db.execute(
             text(f"""
-        WITH visible_media AS ({visible_media_ids_cte_sql()}), clipped AS ({clipped}), range_rows AS (
-            SELECT device_id, min(clipped_start) AS first_observed_at, max(clipped_end) AS last_observed_at,
-                   sum(extract(epoch FROM clipped_end - clipped_start) * 1000)::bigint AS active_ms,
+        WITH facts AS ({activity_facts_sql(filters)}), range_rows AS (
+            SELECT device_id, min(first_observed_at) AS first_observed_at,
+                   max(last_observed_at) AS last_observed_at,
+                   sum(active_ms)::bigint AS active_ms,
                    array_agg(DISTINCT device_class ORDER BY device_class) AS device_classes
-            FROM clipped GROUP BY device_id
+            FROM facts GROUP BY device_id
+        ), device_slots AS (
+            SELECT r.*
+            FROM consumption_activity_rollups r
+            WHERE r.user_id = :viewer_id
+              AND r.device_id IN (SELECT device_id FROM range_rows)
+              AND r.media_id IN ({visible_media_ids_cte_sql()})
         ), all_time AS (
-            SELECT s.device_id, min(s.occurred_at) AS first_seen_at
-            FROM consumption_activity_spans s JOIN visible_media vm ON vm.media_id = s.media_id
-            WHERE s.user_id = :viewer_id AND s.created_at <= :as_of_created_at
-            GROUP BY s.device_id
+            -- A device's first span starts in its earliest slot; slots folded
+            -- after the snapshot fall back to their spans created by then.
+            SELECT device_id, min(first_seen_at) AS first_seen_at
+            FROM (
+                SELECT device_id, first_observed_at AS first_seen_at
+                FROM device_slots
+                WHERE folded_through <= :as_of_created_at
+                UNION ALL
+                SELECT spans.device_id, spans.occurred_at
+                FROM device_slots r
+                JOIN consumption_activity_spans spans
+                  ON spans.user_id = r.user_id
+                 AND spans.occurred_at >= r.slot_start
+                 AND spans.occurred_at < r.slot_start + interval '15 minutes'
+                 AND spans.media_id = r.media_id
+                 AND spans.modality = r.modality
+                 AND spans.device_id = r.device_id
+                 AND spans.device_class = r.device_class
+                WHERE r.folded_through > :as_of_created_at
+                  AND spans.created_at <= :as_of_created_at
+            ) seen
+            GROUP BY device_id
         )
         SELECT range_rows.*, all_time.first_seen_at FROM range_rows JOIN all_time USING (device_id)
         ORDER BY range_rows.first_observed_at ASC, range_rows.device_id ASC
     """),
-            {"viewer_id": viewer_id, "start": start, "end": query.end, "as_of_created_at": as_of}
-            | filter_params,
+            _activity_params(viewer_id=viewer_id, query=query, as_of=as_of) | filter_params,
         ).mappings()
     ]
 
@@ -696,10 +832,14 @@ def _activity_params(
     query: ActivityQuery,
     as_of: datetime,
 ) -> dict[str, Any]:
+    start = query.start or _EPOCH
+    core_start, core_end = rollup_core_bounds(start, query.end)
     return {
         "viewer_id": viewer_id,
-        "start": query.start or datetime(1970, 1, 1, tzinfo=UTC),
+        "start": start,
         "end": query.end,
+        "core_start": core_start,
+        "core_end": core_end,
         "time_zone": query.time_zone,
         "as_of_created_at": as_of,
     }
@@ -708,12 +848,12 @@ def _activity_params(
 def activity_totals_rows(
     db: Session, *, viewer_id: UUID, query: ActivityQuery, as_of: datetime
 ) -> list[dict[str, Any]]:
-    sql, filters = _filtered_sql(activity_totals_sql(), query)
+    filters, filter_params = _filters(query)
     return [
         dict(row)
         for row in db.execute(
-            text(sql),
-            _activity_params(viewer_id=viewer_id, query=query, as_of=as_of) | filters,
+            text(activity_totals_sql(filters)),
+            _activity_params(viewer_id=viewer_id, query=query, as_of=as_of) | filter_params,
         ).mappings()
     ]
 
@@ -812,12 +952,12 @@ def timeline_rows(
 def local_hour_rows(
     db: Session, *, viewer_id: UUID, query: ActivityQuery, as_of: datetime
 ) -> list[dict[str, Any]]:
-    sql, filters = _filtered_sql(local_hours_sql(), query)
+    filters, filter_params = _filters(query)
     return [
         dict(row)
         for row in db.execute(
-            text(sql),
-            _activity_params(viewer_id=viewer_id, query=query, as_of=as_of) | filters,
+            text(local_hours_sql(filters)),
+            _activity_params(viewer_id=viewer_id, query=query, as_of=as_of) | filter_params,
         ).mappings()
     ]
 
@@ -825,12 +965,12 @@ def local_hour_rows(
 def local_day_rows(
     db: Session, *, viewer_id: UUID, query: ActivityQuery, as_of: datetime
 ) -> list[dict[str, Any]]:
-    sql, filters = _filtered_sql(local_days_sql(), query)
+    filters, filter_params = _filters(query)
     return [
         dict(row)
         for row in db.execute(
-            text(sql),
-            _activity_params(viewer_id=viewer_id, query=query, as_of=as_of) | filters,
+            text(local_days_sql(filters)),
+            _activity_params(viewer_id=viewer_id, query=query, as_of=as_of) | filter_params,
         ).mappings()
     ]
 
@@ -838,7 +978,7 @@ def local_day_rows(
 def streak_row(
     db: Session, *, viewer_id: UUID, query: ActivityQuery, as_of: datetime
 ) -> dict[str, int]:
-    sql, filters = _filtered_sql(streaks_sql(), query)
+    filters, filter_params = _filters(query)
     params = _activity_params(viewer_id=viewer_id, query=query, as_of=as_of)
     now = datetime.now(UTC)
     params.update(
@@ -847,7 +987,7 @@ def streak_row(
             "today_local": now.astimezone(ZoneInfo(query.time_zone)).date(),
         }
     )
-    row = db.execute(text(sql), params | filters).mappings().one()
+    row = db.execute(text(streaks_sql(filters)), params | filter_params).mappings().one()
     return {
         "streak": int(row["ending_streak"]),
         "longest_streak": int(row["longest_streak"]),
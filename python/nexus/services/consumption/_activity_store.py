@@ -103,6 +103,86 @@ def insert_activity_batch_in_txn(
         ),
         rows,
     )
+    upsert_activity_rollups_in_txn(db, span_ids=[row["id"] for row in rows])
+
+
+def upsert_activity_rollups_in_txn(db: Session, *, span_ids: list[UUID]) -> None:
+    """Fold newly inserted spans into their 15-minute slot rollups.
+
+    Active time is split at slot boundaries; word and media-position deltas are
+    attributed whole to the slot containing the span start so range reads can
+    reproduce per-span rounding exactly. ``folded_through`` keeps the latest
+    folded span's ``created_at`` so snapshot reads can tell a slot that changed
+    after their ``as_of``.
+    """
+    if not span_ids:
+        return
+    db.execute(
+        text(
+            """
+            INSERT INTO consumption_activity_rollups (
+                user_id, media_id, modality, device_id, device_class, slot_start,
+                active_ms, forward_word_position, forward_media_position_ms,
+                first_observed_at, last_observed_at, folded_through
+            )
+            SELECT s.user_id, s.media_id, s.modality, s.device_id, s.device_class,
+                   slot.slot_start,
+                   sum(extract(epoch FROM
+                       LEAST(s.ended_at, slot.slot_start + interval '15 minutes')
+                       - GREATEST(s.occurred_at, slot.slot_start)
+                   ) * 1000),
+                   sum(CASE WHEN slot.slot_start = s.start_slot
+                            THEN greatest(0, coalesce(s.word_end - s.word_start, 0))
+                            ELSE 0 END),
+                   sum(CASE WHEN slot.slot_start = s.start_slot
+                            THEN greatest(0, coalesce(
+                                s.media_position_end_ms - s.media_position_start_ms, 0
+                            ))
+                            ELSE 0 END),
+                   min(GREATEST(s.occurred_at, slot.slot_start)),
+                   max(LEAST(s.ended_at, slot.slot_start + interval '15 minutes')),
+                   max(s.created_at)
+            FROM (
+                SELECT spans.*,
+                       spans.occurred_at + spans.duration_ms * interval '1 millisecond'
+                           AS ended_at,
+                       date_bin(
+                           interval '15 minutes', spans.occurred_at,
+                           timestamptz '1970-01-01 00:00:00+00'
+                       ) AS start_slot
+                FROM consumption_activity_spans spans
+                WHERE spans.id = ANY(CAST(:span_ids AS uuid[]))
+            ) s
+            CROSS JOIN LATERAL generate_series(
+                s.start_slot,
+                date_bin(
+                    interval '15 minutes', s.ended_at - interval '1 microsecond',
+                    timestamptz '1970-01-01 00:00:00+00'
+                ),
+                interval '15 minutes'
+            ) slot(slot_start)
+            GROUP BY s.user_id, s.media_id, s.modality, s.device_id, s.device_class,
+                     slot.slot_start
+            ON CONFLICT (user_id, slot_start, media_id, modality, device_id, device_class)
+            DO UPDATE SET
+                active_ms = consumption_activity_rollups.active_ms + EXCLUDED.active_ms,
+                forward_word_position = consumption_activity_rollups.forward_word_position
+                    + EXCLUDED.forward_word_position,
+                forward_media_position_ms = consumption_activity_rollups.forward_media_position_ms
+                    + EXCLUDED.forward_media_position_ms,
+                first_observed_at = LEAST(
+                    consumption_activity_rollups.first_observed_at, EXCLUDED.first_observed_at
+                ),
+                last_observed_at = GREATEST(
+                    consumption_activity_rollups.last_observed_at, EXCLUDED.last_observed_at
+                ),
+                folded_through = GREATEST(
+                    consumption_activity_rollups.folded_through, EXCLUDED.folded_through
+                )
+            """
+        ),
+        {"span_ids": span_ids},
+    )
 
 
 def insert_completion_fact_in_txn(
@@ -162,6 +242,10 @@ def delete_completion_fact_in_txn(
 
 def delete_all_for_media_in_txn(db: Session, *, media_id: UUID) -> None:
     """Remove retained activity facts as part of explicit media teardown."""
+    db.execute(
+        text("DELETE FROM consumption_activity_rollups WHERE media_id = :media_id"),
+        {"media_id": media_id},
+    )
     db.execute(
         text("DELETE FROM consumption_activity_spans WHERE media_id = :media_id"),
         {"media_id": media_id},
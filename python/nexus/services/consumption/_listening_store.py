@@ -115,7 +115,10 @@ def record_heartbeat_in_txn(
     expected_reset_epoch: int,
 ) -> ListeningRow | None:
     """CAS the fencing tokens, then write position/duration/rate and advance the
-    write revision. An absent rate inserts NULL or preserves the current value."""
+    write revision. An absent rate inserts NULL or preserves the current value.
+
+    The caller bumps the listening collection families in the same transaction,
+    so the row's ``collections_bumped_at`` clock advances with it."""
     current = load_state(db, viewer_id=viewer_id, media_id=media_id)
     if current is None:
         # An absent row reads as revision 0 / epoch 0.
@@ -126,11 +129,12 @@ def record_heartbeat_in_txn(
                 """
                 INSERT INTO podcast_listening_states (
                     user_id, media_id, position_ms, duration_ms, playback_speed,
-                    is_completed, write_revision, reset_epoch, updated_at, last_engaged_at
+                    is_completed, write_revision, reset_epoch, updated_at, last_engaged_at,
+                    collections_bumped_at
                 )
                 VALUES (
                     :viewer_id, :media_id, :position_ms, :duration_ms, :playback_speed,
-                    false, 1, 0, now(), now()
+                    false, 1, 0, now(), now(), now()
                 )
                 """
             ),
@@ -174,7 +178,8 @@ def record_heartbeat_in_txn(
                     playback_speed = :playback_speed,
                     write_revision = :next_revision,
                     updated_at = now(),
-                    last_engaged_at = now()
+                    last_engaged_at = now(),
+                    collections_bumped_at = now()
                 WHERE user_id = :viewer_id AND media_id = :media_id
                 """
             ),
@@ -200,6 +205,96 @@ def record_heartbeat_in_txn(
     )
 
 
+_STEADY_HEARTBEAT_SQL = text(
+    """
+    UPDATE podcast_listening_states pls
+    SET position_ms = :position_ms,
+        duration_ms = CAST(:duration_ms AS integer),
+        playback_speed = CASE WHEN :rate_present
+                              THEN CAST(:playback_speed AS double precision)
+                              ELSE pls.playback_speed END,
+        write_revision = pls.write_revision + 1,
+        updated_at = now(),
+        last_engaged_at = now()
+    FROM (
+        SELECT (
+            SELECT pe.duration_seconds * 1000
+            FROM podcast_episodes pe
+            WHERE pe.media_id = :media_id
+        ) AS duration_ms
+    ) episode
+    WHERE pls.user_id = :viewer_id
+      AND pls.media_id = :media_id
+      AND pls.write_revision = :expected_write_revision
+      AND pls.reset_epoch = :expected_reset_epoch
+      AND pls.collections_bumped_at > now() - make_interval(secs => :bump_interval_seconds)
+      AND (
+        pls.is_completed
+        OR (
+            pls.position_ms > 0
+            AND :position_ms > 0
+            AND NOT coalesce(
+                pls.position_ms::double precision
+                    / nullif(coalesce(pls.duration_ms, episode.duration_ms), 0)
+                    >= :finished_progression,
+                false
+            )
+            AND NOT coalesce(
+                CAST(:position_ms AS double precision)
+                    / nullif(coalesce(CAST(:duration_ms AS integer), episode.duration_ms), 0)
+                    >= :finished_progression,
+                false
+            )
+        )
+      )
+    RETURNING pls.position_ms, pls.duration_ms, pls.playback_speed,
+              pls.write_revision, pls.reset_epoch, pls.is_completed
+    """
+)
+
+
+def record_steady_heartbeat_in_txn(
+    db: Session,
+    *,
+    viewer_id: UUID,
+    media_id: UUID,
+    position_ms: int,
+    duration_ms: int | None,
+    episode_playback_rate: Presence[float],
+    expected_write_revision: int,
+    expected_reset_epoch: int,
+    finished_progression: float,
+    bump_interval_seconds: int,
+) -> ListeningRow | None:
+    """One conditional CAS write for a heartbeat that cannot change read state.
+
+    Matches only an existing row whose fences equal the expected tokens, whose
+    listening-derived state is Finished by flag or InProgress both before and
+    after the write, and whose collections were bumped inside the coalescing
+    window. ``None`` means the caller must take the full serialized path, which
+    also owns every stale-revision outcome."""
+    row = (
+        db.execute(
+            _STEADY_HEARTBEAT_SQL,
+            {
+                "viewer_id": viewer_id,
+                "media_id": media_id,
+                "position_ms": position_ms,
+                "duration_ms": duration_ms,
+                "rate_present": isinstance(episode_playback_rate, Present),
+                "playback_speed": nullable_from_presence(episode_playback_rate),
+                "expected_write_revision": expected_write_revision,
+                "expected_reset_epoch": expected_reset_epoch,
+                "finished_progression": finished_progression,
+                "bump_interval_seconds": bump_interval_seconds,
+            },
+        )
+        .mappings()
+        .one_or_none()
+    )
+    return _row_from_mapping(row) if row is not None else None
+
+
 def install_preview_position_if_empty_in_txn(
     db: Session,
     *,
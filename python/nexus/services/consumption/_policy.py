@@ -6,6 +6,8 @@ from nexus.db.models import MediaKind
 from nexus.schemas.consumption_activity import ActivityModality
 
 FINISHED_PROGRESSION = 0.95
+# Steady listening heartbeats advance collection revisions at most this often.
+HEARTBEAT_COLLECTION_BUMP_INTERVAL_SECONDS = 60
 
 
 def completion_modality_for_kind(kind: str) -> ActivityModality:
@@ -26,7 +26,7 @@ from sqlalchemy.orm import Session
 from nexus.auth.permissions import can_read_media, visible_media_ids_cte_sql
 from nexus.db.errors import integrity_constraint_name
 from nexus.db.models import MediaKind
-from nexus.db.retries import retry_serializable
+from nexus.db.retries import retry_read_committed, retry_serializable
 from nexus.db.session import get_session_factory
 from nexus.errors import (
     ApiErrorCode,
@@ -1470,9 +1470,22 @@ def _validate_activity_batch(batch: ActivityBatchIn) -> None:
 def record_listening_heartbeat(
     viewer_id: UUID, media_id: UUID, heartbeat: ListeningHeartbeatIn
 ) -> ListeningHeartbeatResult:
-    """Fence and write position/duration/episode rate in one transaction."""
+    """Fence and write position/duration/episode rate in one transaction.
+
+    A steady heartbeat is one conditional CAS upsert under READ COMMITTED. Only
+    a read-state transition, a missing or stale row, or an expired collection
+    bump window takes the serialized path with the viewer lock, the visibility
+    check and the collection bumps.
+    """
     fresh = _fresh_session()
     try:
+        steady = retry_read_committed(
+            fresh,
+            "listening_heartbeat_steady",
+            partial(_record_steady_heartbeat_op, fresh, viewer_id, media_id, heartbeat),
+        )
+        if steady is not None:
+            return steady
         return retry_serializable(
             fresh,
             "listening_heartbeat",
@@ -1482,6 +1495,34 @@ def record_listening_heartbeat(
         fresh.close()
 
 
+def _record_steady_heartbeat_op(
+    db: Session, viewer_id: UUID, media_id: UUID, heartbeat: ListeningHeartbeatIn
+) -> ListeningHeartbeatResult | None:
+    # Visibility is re-proven by the full path at least once per bump window;
+    # this write touches only the viewer's own already-authorized row.
+    row = _listening_store.record_steady_heartbeat_in_txn(
+        db,
+        viewer_id=viewer_id,
+        media_id=media_id,
+        position_ms=heartbeat.position_ms,
+        duration_ms=nullable_from_presence(heartbeat.duration_ms),
+        episode_playback_rate=heartbeat.episode_playback_rate,
+        expected_write_revision=heartbeat.expected_write_revision,
+        expected_reset_epoch=heartbeat.expected_reset_epoch,
+        finished_progression=_policy.FINISHED_PROGRESSION,
+        bump_interval_seconds=_policy.HEARTBEAT_COLLECTION_BUMP_INTERVAL_SECONDS,
+    )
+    if row is None:
+        db.rollback()
+        return None
+    db.commit()
+    return ListeningHeartbeatResult(
+        listening_state=_projection.to_listening_state_out(row),
+        heartbeat_generation=heartbeat.heartbeat_generation,
+        heartbeat_sequence=heartbeat.heartbeat_sequence,
+    )
+
+
 def _record_heartbeat_op(
     db: Session, viewer_id: UUID, media_id: UUID, heartbeat: ListeningHeartbeatIn
 ) -> ListeningHeartbeatResult:
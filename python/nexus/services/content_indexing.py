@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 import math
 import re
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any, Literal, TypeGuard
@@ -215,6 +215,7 @@ def publish_content_index(
         embedding_provider=None,
         embedding_model=None,
         now=now,
+        chunk_hashes=[],
     )
 
     block_ids_by_idx: dict[int, UUID] = {}
@@ -284,6 +285,7 @@ def publish_content_index(
             embedding_provider=None,
             embedding_model=None,
             now=now,
+            chunk_hashes=[],
         )
         return ContentIndexResult(owner=plan.owner, status="no_text", chunk_count=0)
 
@@ -447,6 +449,7 @@ def publish_content_index(
                     embedding_model,
                     embedding_dimensions,
                     embedding_vector,
+                    embedding_halfvec,
                     created_at
                 )
                 VALUES (
@@ -455,6 +458,7 @@ def publish_content_index(
                     :embedding_model,
                     :embedding_dimensions,
                     CAST(:embedding_vector AS vector({plan.embedding_dimensions})),
+                    CAST(:embedding_vector AS halfvec({plan.embedding_dimensions})),
                     :now
                 )
                 """
@@ -477,6 +481,10 @@ def publish_content_index(
         embedding_provider=plan.embedding_provider,
         embedding_model=plan.embedding_model,
         now=now,
+        chunk_hashes=[
+            (chunk_idx, media_intelligence.chunk_text_hash(chunk.text))
+            for chunk_idx, chunk in enumerate(plan.chunks)
+        ],
     )
     # Single owner of the per-media unit trigger: every text-bearing media source
     # kind funnels through this ready branch, so the unit (re)build is enqueued
@@ -721,7 +729,7 @@ def rebuild_transcript_content_index(
     db: Session,
     *,
     media_id: UUID,
-    transcript_segments: Sequence[TranscriptSegmentInput],
+    transcript_segments: Iterable[TranscriptSegmentInput],
     reason: str,
 ) -> ContentIndexResult:
     return rebuild_content_index(
@@ -739,7 +747,7 @@ def rebuild_transcript_content_index(
 def build_transcript_indexable_blocks(
     *,
     media_id: UUID,
-    transcript_segments: Sequence[TranscriptSegmentInput],
+    transcript_segments: Iterable[TranscriptSegmentInput],
 ) -> list[IndexableBlock]:
     """Build an immutable transcript plan input without provider or DB work."""
     blocks: list[IndexableBlock] = []
@@ -950,6 +958,7 @@ def prepare_media_content_reindex(
         ),
         {"media_id": media_id, "revision": revision, "reason": reason},
     )
+    _store_content_fingerprint(db, owner=IndexOwner("media", media_id))
     return MediaContentReindexWork(
         media_id=media_id,
         revision=revision,
@@ -1024,6 +1033,7 @@ def publish_media_content_reindex(
             ),
             {"media_id": work.media_id, "revision": work.revision},
         )
+        _store_content_fingerprint(db, owner=plan.owner)
         return ContentIndexResult(result.owner, "ocr_required", 0)
     return result
 
@@ -1192,6 +1202,7 @@ def request_media_content_reindex(
         ),
         {"media_id": media_id, "revision": revision, "reason": reason},
     )
+    _store_content_fingerprint(db, owner=IndexOwner("media", media_id))
 
     from nexus.jobs.queue import (
         enqueue_job,
@@ -1457,6 +1468,7 @@ def deactivate_content_index(db: Session, *, owner: IndexOwner, reason: str) ->
         embedding_provider=None,
         embedding_model=None,
         now=now,
+        chunk_hashes=[],
     )
 
 
@@ -1572,7 +1584,13 @@ def _set_index_state(
     embedding_provider: str | None,
     embedding_model: str | None,
     now: datetime,
+    chunk_hashes: Sequence[tuple[int, str]] | None = None,
 ) -> None:
+    """Write the owner's state row and, for media, its persisted fingerprint.
+
+    ``chunk_hashes`` is the owner's new chunk set when this write follows a
+    materialization change; ``None`` keeps the stored set.
+    """
     if status != "ready":
         embedding_provider = None
         embedding_model = None
@@ -1606,6 +1624,7 @@ def _set_index_state(
                 "now": now,
             },
         )
+        _store_content_fingerprint(db, owner=owner, chunk_hashes=chunk_hashes)
         return
 
     db.execute(
@@ -1643,6 +1662,83 @@ def _set_index_state(
             "now": now,
         },
     )
+    _store_content_fingerprint(db, owner=owner, chunk_hashes=chunk_hashes)
+
+
+def _store_content_fingerprint(
+    db: Session,
+    *,
+    owner: IndexOwner,
+    chunk_hashes: Sequence[tuple[int, str]] | None = None,
+) -> None:
+    """Recompute a media owner's persisted content fingerprint after a state write.
+
+    Every writer of a media ``content_index_states`` row ends here, so readers
+    (``media_intelligence.current_content_fingerprints``) never hash chunk text.
+    A row with no stored chunk set yet derives it once from ``content_chunks``.
+    """
+    if owner.kind != "media":
+        return
+    state = (
+        db.execute(
+            text(
+                """
+                UPDATE content_index_states
+                SET chunk_hashes = COALESCE(
+                    CAST(:chunk_hashes AS jsonb),
+                    chunk_hashes,
+                    (
+                        SELECT COALESCE(
+                            jsonb_agg(
+                                jsonb_build_array(
+                                    c.chunk_idx,
+                                    encode(sha256(convert_to(c.chunk_text, 'UTF8')), 'hex')
+                                )
+                                ORDER BY c.chunk_idx
+                            ),
+                            '[]'::jsonb
+                        )
+                        FROM content_chunks c
+                        WHERE c.owner_kind = 'media' AND c.owner_id = :owner_id
+                    )
+                )
+                WHERE owner_kind = 'media' AND owner_id = :owner_id
+                RETURNING active_embedding_provider, active_embedding_model, updated_at,
+                          chunk_hashes
+                """
+            ),
+            {
+                "owner_id": owner.id,
+                "chunk_hashes": (
+                    json.dumps([list(pair) for pair in chunk_hashes])
+                    if chunk_hashes is not None
+                    else None
+                ),
+            },
+        )
+        .mappings()
+        .first()
+    )
+    if state is None:
+        return
+    db.execute(
+        text(
+            """
+            UPDATE content_index_states
+            SET content_fingerprint = :fingerprint
+            WHERE owner_kind = 'media' AND owner_id = :owner_id
+            """
+        ),
+        {
+            "owner_id": owner.id,
+            "fingerprint": media_intelligence.content_fingerprint_from_index(
+                provider=state["active_embedding_provider"],
+                model=state["active_embedding_model"],
+                index_generation=state["updated_at"],
+                chunk_hashes=state["chunk_hashes"],
+            ),
+        },
+    )
 
 
 def _validate_blocks(
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
+from threading import Lock
 from typing import Any, Literal, cast
 from uuid import UUID
 from xml.sax.saxutils import escape as xml_escape
@@ -42,9 +44,11 @@ from nexus.services.prompt_budget import (
     BudgetItem,
     BudgetSelection,
     PromptBlock,
+    TokenCounter,
     allocate_budget,
     build_prompt_budget,
     make_prompt_block,
+    token_counter_for,
 )
 from nexus.services.resource_graph.context import (
     admits_resource_for_conversation_read,
@@ -70,6 +74,56 @@ from nexus.services.search import get_search_result
 
 CACHE_POLICY_5M: Mapping[str, object] = {"type": "ephemeral", "ttl_seconds": 300}
 
+HISTORY_TURN_CACHE_MAX_CHARS = 32 * 1024 * 1024
+
+
+class _HistoryTurnCache:
+    """Process-wide LRU of rendered history turn text, keyed by message id.
+
+    Only ``complete`` messages are cached, and a complete message's content and
+    reader-selection snapshot never change again, so an entry can only go stale
+    by its row being deleted — which also removes it from every later history
+    path. Edits and branch switches select a different message id set and
+    simply miss.
+    """
+
+    def __init__(self, max_chars: int = HISTORY_TURN_CACHE_MAX_CHARS) -> None:
+        self.max_chars = max_chars
+        self._turns: OrderedDict[UUID, str] = OrderedDict()
+        self._total_chars = 0
+        self._lock = Lock()
+
+    def get_many(self, message_ids: Sequence[UUID]) -> dict[UUID, str]:
+        found: dict[UUID, str] = {}
+        with self._lock:
+            for message_id in message_ids:
+                content = self._turns.get(message_id)
+                if content is not None:
+                    self._turns.move_to_end(message_id)
+                    found[message_id] = content
+        return found
+
+    def put(self, message_id: UUID, content: str) -> None:
+        if len(content) > self.max_chars:
+            return
+        with self._lock:
+            previous = self._turns.pop(message_id, None)
+            if previous is not None:
+                self._total_chars -= len(previous)
+            while self._turns and self._total_chars + len(content) > self.max_chars:
+                _, evicted = self._turns.popitem(last=False)
+                self._total_chars -= len(evicted)
+            self._turns[message_id] = content
+            self._total_chars += len(content)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._turns.clear()
+            self._total_chars = 0
+
+
+_history_turn_cache = _HistoryTurnCache()
+
 
 @dataclass(frozen=True)
 class HistoryTurn:
@@ -154,6 +208,7 @@ def assemble_chat_context(
         path_message_ids=path_message_ids,
     )
 
+    token_counter = token_counter_for(profile.target)
     context_types: set[str] = set()
     system_block = make_prompt_block(
         block_id="system",
@@ -162,6 +217,7 @@ def assemble_chat_context(
         text=render_system_prompt_block(),
         cache_policy=CACHE_POLICY_5M,
         privacy_scope="global",
+        token_counter=token_counter,
     )
     mandatory_blocks: list[tuple[str, PromptBlock, Mapping[str, object]]] = []
 
@@ -188,6 +244,7 @@ def assemble_chat_context(
                     lane="attached_context",
                     text=render_subject_metadata_block(current_snapshot),
                     source_refs=[subject_source_ref],
+                    token_counter=token_counter,
                 ),
                 subject_source_ref,
             )
@@ -204,6 +261,7 @@ def assemble_chat_context(
                         {"type": "media", "id": str(current_snapshot.key.media_id)},
                         {"type": "highlight", "id": str(current_snapshot.key.highlight_id)},
                     ],
+                    token_counter=token_counter,
                 ),
                 {"hint": "reader_selection"},
             )
@@ -214,6 +272,7 @@ def assemble_chat_context(
             turn_context,
             viewer_id=run.owner_user_id,
             conversation_id=conversation.id,
+            token_counter=token_counter,
         )
         if subject_block is not None:
             mandatory_blocks.append(("subject", subject_block, subject_metadata))
@@ -234,6 +293,7 @@ def assemble_chat_context(
                     lane="attached_context",
                     text=_render_branch_anchor_block(user_message.branch_anchor),
                     source_refs=[branch_anchor_ref],
+                    token_counter=token_counter,
                 ),
                 branch_anchor_ref,
             )
@@ -245,6 +305,7 @@ def assemble_chat_context(
             conversation_id=conversation.id,
             viewer_id=run.owner_user_id,
             subject_uri=subject_uri,
+            token_counter=token_counter,
         )
     )
 
@@ -265,6 +326,7 @@ def assemble_chat_context(
         lane="current_user",
         text=user_message.content,
         source_refs=[{"type": "message", "id": str(user_message.id)}],
+        token_counter=token_counter,
     )
     max_context_tokens = contract.context_limit
     budget = build_prompt_budget(
@@ -312,6 +374,7 @@ def assemble_chat_context(
                 lane="recent_history",
                 text=turn.content,
                 source_refs=[{"type": "message", "id": str(message_id)}],
+                token_counter=token_counter,
             )
             for turn, message_id in zip(unit.turns, unit.message_ids, strict=True)
         )
@@ -483,6 +546,7 @@ def _build_subject_block(
     *,
     viewer_id: UUID,
     conversation_id: UUID,
+    token_counter: TokenCounter,
 ) -> tuple[PromptBlock | None, Mapping[str, object], str | None]:
     if turn_context is None or turn_context.subject_id is None:
         return None, {}, None
@@ -526,6 +590,7 @@ def _build_subject_block(
             lane="attached_context",
             text=_render_resource(resource, tag="subject"),
             source_refs=[metadata],
+            token_counter=token_counter,
         ),
         metadata,
         resource.uri,
@@ -538,6 +603,7 @@ def _build_resources_block(
     conversation_id: UUID,
     viewer_id: UUID,
     subject_uri: str | None = None,
+    token_counter: TokenCounter,
 ) -> tuple[
     PromptBlock | None,
     Mapping[str, object],
@@ -586,6 +652,7 @@ def _build_resources_block(
         text="\n".join(lines),
         source_refs=source_refs,
         cache_policy=None,
+        token_counter=token_counter,
     )
     uris = [ctx.target.uri for ctx in refs]
     return (
@@ -700,7 +767,12 @@ def load_recent_history_units(
     before_seq: int,
     path_message_ids: Sequence[UUID] | None = None,
 ) -> list[HistoryUnit]:
-    """Load completed recent history as pair-aware units in chronological order."""
+    """Load completed recent history as pair-aware units in chronological order.
+
+    The path is read as ids and roles only; rendered turn text comes from the
+    process-wide history turn cache, and only uncached messages have their
+    content and reader-selection snapshot fetched.
+    """
 
     filters = [
         "conversation_id = :conversation_id",
@@ -718,7 +790,7 @@ def load_recent_history_units(
     rows = db.execute(
         text(
             f"""
-            SELECT id, seq, role, content, reader_selection_snapshot
+            SELECT id, seq, role
             FROM messages
             WHERE {" AND ".join(filters)}
             ORDER BY seq ASC
@@ -726,6 +798,9 @@ def load_recent_history_units(
         ),
         params,
     ).fetchall()
+    contents = _load_history_turn_contents(db, [row[0] for row in rows])
+    # A message deleted between the two reads leaves the path entirely.
+    rows = [row for row in rows if row[0] in contents]
 
     units: list[HistoryUnit] = []
     index = 0
@@ -737,8 +812,8 @@ def load_recent_history_units(
                 HistoryUnit(
                     key=f"history_pair:{row[1]}:{next_row[1]}",
                     turns=(
-                        HistoryTurn(role="user", content=_history_user_content(row)),
-                        HistoryTurn(role="assistant", content=next_row[3]),
+                        HistoryTurn(role="user", content=contents[row[0]]),
+                        HistoryTurn(role="assistant", content=contents[next_row[0]]),
                     ),
                     message_ids=(row[0], next_row[0]),
                     first_seq=row[1],
@@ -747,12 +822,14 @@ def load_recent_history_units(
             )
             index += 2
             continue
-        content = _history_user_content(row) if row[2] == "user" else row[3]
         units.append(
             HistoryUnit(
                 key=f"history_single:{row[1]}",
                 turns=(
-                    HistoryTurn(role=cast(Literal["user", "assistant"], row[2]), content=content),
+                    HistoryTurn(
+                        role=cast(Literal["user", "assistant"], row[2]),
+                        content=contents[row[0]],
+                    ),
                 ),
                 message_ids=(row[0],),
                 first_seq=row[1],
@@ -763,16 +840,38 @@ def load_recent_history_units(
     return units
 
 
+def _load_history_turn_contents(db: Session, message_ids: Sequence[UUID]) -> dict[UUID, str]:
+    contents = _history_turn_cache.get_many(message_ids)
+    missing = [message_id for message_id in message_ids if message_id not in contents]
+    if not missing:
+        return contents
+    rows = db.execute(
+        text(
+            """
+            SELECT id, role, content, reader_selection_snapshot
+            FROM messages
+            WHERE id = ANY(:message_ids)
+            """
+        ),
+        {"message_ids": missing},
+    ).fetchall()
+    for row in rows:
+        content = _history_user_content(row) if row[1] == "user" else row[2]
+        _history_turn_cache.put(row[0], content)
+        contents[row[0]] = content
+    return contents
+
+
 def _history_user_content(row: Any) -> str:
     """A historical user turn, prefixed with its bounded
     `<historical_reader_selection>` block when the message carries a quote
     snapshot. The block applies only to the immediately following user text, and
     the whole unit stays one indivisible history turn for the budget."""
-    snapshot_raw = row[4]
+    snapshot_raw = row[3]
     if snapshot_raw is None:
-        return row[3]
+        return row[2]
     snapshot = decode_reader_selection_snapshot(snapshot_raw)
-    return f"{render_historical_reader_selection_prompt_block(snapshot)}\n\n{row[3]}"
+    return f"{render_historical_reader_selection_prompt_block(snapshot)}\n\n{row[2]}"
 
 
 def _load_tool_events(
@@ -792,10 +891,11 @@ def _load_tool_events(
         ),
         {"assistant_message_id": assistant_message_id},
     ).fetchall()
+    retrievals_by_call = _tool_retrieval_refs(db, [row[0] for row in rows])
     call_events: list[Mapping[str, object]] = []
     result_events: list[Mapping[str, object]] = []
     for row in rows:
-        retrievals = _tool_retrieval_refs(db, row[0])
+        retrievals = retrievals_by_call.get(row[0], [])
         selected = [retrieval for retrieval in retrievals if bool(retrieval.get("selected"))]
         call_events.append(
             {
@@ -825,27 +925,33 @@ def _load_tool_events(
     return call_events, result_events
 
 
-def _tool_retrieval_refs(db: Session, tool_call_id: UUID) -> list[Mapping[str, object]]:
+def _tool_retrieval_refs(
+    db: Session, tool_call_ids: Sequence[UUID]
+) -> dict[UUID, list[Mapping[str, object]]]:
+    if not tool_call_ids:
+        return {}
     rows = (
         db.execute(
             select(MessageRetrieval)
-            .where(MessageRetrieval.tool_call_id == tool_call_id)
-            .order_by(MessageRetrieval.ordinal.asc())
+            .where(MessageRetrieval.tool_call_id.in_(tool_call_ids))
+            .order_by(MessageRetrieval.tool_call_id, MessageRetrieval.ordinal.asc())
         )
         .scalars()
         .all()
     )
-    return [
-        {
-            "id": str(row.id),
-            "result_type": row.result_type,
-            "source_id": row.source_id,
-            "context_ref": row.context_ref,
-            "result_ref": row.result_ref,
-            "selected": row.selected,
-        }
-        for row in rows
-    ]
+    refs: dict[UUID, list[Mapping[str, object]]] = {}
+    for row in rows:
+        refs.setdefault(row.tool_call_id, []).append(
+            {
+                "id": str(row.id),
+                "result_type": row.result_type,
+                "source_id": row.source_id,
+                "context_ref": row.context_ref,
+                "result_ref": row.result_ref,
+                "selected": row.selected,
+            }
+        )
+    return refs
 
 
 def _selected_context_blocks(
@@ -870,12 +976,19 @@ def _dynamic_system_blocks(
     resources_block: PromptBlock | None,
     included_keys: set[str],
 ) -> tuple[PromptBlock, ...]:
+    """Order dynamic system blocks from most to least stable across turns.
+
+    The attached resources block only changes when the conversation's context
+    refs do, while subject, reader selection and branch anchor are per turn;
+    putting resources first keeps the longest byte-identical prompt prefix for
+    provider-side prefix caching.
+    """
     blocks: list[PromptBlock] = []
+    if resources_block is not None and "resources" in included_keys:
+        blocks.append(resources_block)
     for key, block, _metadata in mandatory_blocks:
         if key in included_keys:
             blocks.append(block)
-    if resources_block is not None and "resources" in included_keys:
-        blocks.append(resources_block)
     return tuple(blocks)
 
 
@@ -303,7 +303,9 @@ def contributor_credits_rollup_cte_sql(owner_column: Literal["media_id", "podcas
     id, source, or nested full contributor. ``contributor_search_text`` composes
     credited name + display name + every human alias; external keys never enter it
     (AC 24), so the media/podcast FTS blobs that embed it also carry no keys (a
-    deliberate, accepted ranking delta). Consumed by the search retrievers/service.
+    deliberate, accepted ranking delta). Consumed by the search retrievers/service;
+    the indexed match reads the same composition from the owner row's
+    ``contributor_search_tsv`` (``contributor_search_tsv`` SQL function, 0219).
     """
     return f"""
         SELECT
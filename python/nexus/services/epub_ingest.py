@@ -42,6 +42,7 @@ from nexus.errors import ApiErrorCode
 from nexus.services.canonicalize import generate_canonical_text_with_element_offsets
 from nexus.services.fragment_blocks import insert_fragment_blocks, parse_fragment_blocks
 from nexus.services.html_tree import parse_html_document, remove_element, unwrap_element
+from nexus.services.media_document_metrics import refresh_fragment_document_offsets
 from nexus.services.reader_apparatus import (
     attach_fragment_locators,
     collect_html_apparatus_targets,
@@ -49,6 +50,7 @@ from nexus.services.reader_apparatus import (
     replace_media_apparatus,
     source_fingerprint,
 )
+from nexus.services.text_quote import forget_normalized_media_sources
 from nexus.storage.client import StorageError
 from nexus.storage.paths import build_epub_attempt_asset_storage_path
 from nexus.tasks.storage_object_cleanup import reserve_storage_object_write
@@ -779,6 +781,7 @@ def publish_epub_extraction_plan(
         text("DELETE FROM fragments WHERE media_id = :media_id"),
         {"media_id": media_id},
     )
+    forget_normalized_media_sources(media_id)
 
     fragments: list[Fragment] = []
     for template, _chapter, _items, _edges in plan.fragment_specs:
@@ -792,6 +795,7 @@ def publish_epub_extraction_plan(
         fragments.append(fragment)
         db.add(fragment)
     db.flush()
+    refresh_fragment_document_offsets(db, media_id)
     for fragment in fragments:
         if 0 <= fragment.idx < len(plan.all_block_specs):
             insert_fragment_blocks(
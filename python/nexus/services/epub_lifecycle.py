@@ -30,6 +30,7 @@ from nexus.services.epub_ingest import (
 )
 from nexus.services.epub_metadata import build_epub_author_observation, persist_epub_metadata
 from nexus.services.media_author_observation_seam import attach_author_observation
+from nexus.services.text_quote import forget_normalized_media_sources
 from nexus.storage.client import get_storage_client
 
 logger = get_logger(__name__)
@@ -175,6 +176,7 @@ def delete_extraction_artifacts(db: Session, media_id: UUID) -> list[str]:
     # non-owning); the Highlight root survives and is resolved via LEFT JOIN
     # + quote re-resolution.
     db.execute(delete(Fragment).where(Fragment.media_id == media_id))
+    forget_normalized_media_sources(media_id)
     db.flush()
     return list(storage_paths)
 
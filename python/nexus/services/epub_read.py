@@ -185,7 +185,7 @@ def get_epub_navigation_for_viewer(
         db.execute(
             text(
                 """
-                SELECT id, idx, char_length(canonical_text) AS char_count
+                SELECT id, idx, canonical_text_char_count AS char_count
                 FROM fragments
                 WHERE media_id = :mid
                 ORDER BY idx ASC
@@ -361,34 +361,24 @@ def get_epub_section_for_viewer(
                        n.source,
                        n.ordinal,
                        LAG(n.location_id) OVER (ORDER BY n.ordinal) AS prev_section_id,
-                       LEAD(n.location_id) OVER (ORDER BY n.ordinal) AS next_section_id,
-                       f.id AS fragment_id,
-                       f.html_sanitized,
-                       f.canonical_text,
-                       f.canonical_text_word_count,
-                       COALESCE(
-                           (
-                               SELECT SUM(prior.canonical_text_word_count)
-                               FROM fragments prior
-                               WHERE prior.media_id = f.media_id
-                                 AND prior.idx < f.idx
-                           ),
-                           0
-                       ) AS document_word_start,
-                       f.created_at
+                       LEAD(n.location_id) OVER (ORDER BY n.ordinal) AS next_section_id
                 FROM epub_nav_locations n
-                JOIN fragments f
-                  ON f.media_id = n.media_id
-                 AND f.idx = n.fragment_idx
                 WHERE n.media_id = :mid
+                  AND EXISTS (
+                      SELECT 1 FROM fragments nf
+                      WHERE nf.media_id = n.media_id AND nf.idx = n.fragment_idx
+                  )
             )
-            SELECT location_id, label, fragment_id, fragment_idx, href_path,
-                   href_fragment, source_node_id, source, ordinal,
-                   prev_section_id, next_section_id,
-                   html_sanitized, canonical_text,
-                   canonical_text_word_count, document_word_start, created_at
-            FROM ordered_sections
-            WHERE location_id = :section_id
+            SELECT s.location_id, s.label, f.id, s.fragment_idx, s.href_path,
+                   s.href_fragment, s.source_node_id, s.source, s.ordinal,
+                   s.prev_section_id, s.next_section_id,
+                   f.html_sanitized, f.canonical_text,
+                   f.canonical_text_word_count, f.document_word_start, f.created_at
+            FROM ordered_sections s
+            JOIN fragments f
+              ON f.media_id = :mid
+             AND f.idx = s.fragment_idx
+            WHERE s.location_id = :section_id
         """),
         {"mid": media_id, "section_id": section_id},
     ).fetchone()
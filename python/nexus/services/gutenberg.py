@@ -10,7 +10,7 @@ from io import StringIO
 from typing import Any
 
 import httpx
-from sqlalchemy import delete, select
+from sqlalchemy import delete, select, text
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
@@ -142,13 +142,33 @@ def sync_project_gutenberg_catalog(
         ]
     )
 
+    with transaction(db):
+        refreshed = refresh_project_gutenberg_search_documents(db)
+
     return {
         "source_url": source_url,
         "row_count": len(rows),
         "synced_at": synced_at.isoformat(),
+        "search_documents_refreshed": refreshed,
     }
 
 
+def refresh_project_gutenberg_search_documents(db: Session) -> int:
+    """Rebuild the per-ebook Browse search documents from the catalog and credits.
+
+    One row per catalog ebook carries the tsvector over title, credited and
+    contributor names, subjects and bookshelves, plus the contributor JSON Browse
+    renders, so search is a GIN lookup instead of a catalog-wide aggregate.
+    Gutenberg credits are visible to every viewer, so the document is shared.
+    The document is defined by ``project_gutenberg_search_documents_refresh``
+    (0220), whose triggers already refresh an ebook when its credits change or a
+    credited contributor is renamed; this full pass picks up catalog changes.
+    Rows whose document is unchanged are not rewritten; removed ebooks go with
+    their catalog row (FK cascade). Returns the number of rows written.
+    """
+    return db.execute(text("SELECT project_gutenberg_search_documents_refresh(NULL)")).scalar_one()
+
+
 def download_project_gutenberg_catalog_feed(
     *,
     source_urls: tuple[str, ...] | None = None,
@@ -6,7 +6,7 @@ from uuid import UUID
 
 from sqlalchemy import delete, func, select, text, update
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager, selectinload
 from sqlalchemy.orm.exc import StaleDataError
 
 from nexus.auth.permissions import (
@@ -728,28 +728,34 @@ def _repair_missing_fragment_caches(db: Session, *, media_id: UUID, stale: list[
     text through the shared quote matchers recreates the cache values; ambiguous
     or unmatched quotes stay unresolved — returned with no locator, never
     painted at a wrong location (invariant 9). The media's fragments are fetched
-    and normalized once, then matched per quote.
+    and normalized once, and every stale quote is matched in one pass over them.
 
     Returns True when the caller must re-read: a cache row was repaired
     (committed — read paths otherwise roll back at session close) or a
     highlight vanished under a concurrent delete.
     """
     sources = text_quote.load_normalized_media_sources(db, media_id=media_id)
-    gone = False
+    # Concurrently deleted between the list read and this repair; the caller's
+    # re-read drops the highlight instead of crashing.
+    live = [
+        (highlight, highlight.fragment_anchor)
+        for highlight in stale
+        if highlight.fragment_anchor is not None
+    ]
+    gone = len(live) < len(stale)
+    matches = text_quote.match_quotes_in_sources(
+        sources,
+        [
+            text_quote.NormalizedQuote(
+                exact=normalize_quote_text(highlight.exact),
+                prefix=normalize_quote_text(highlight.prefix),
+                suffix=normalize_quote_text(highlight.suffix),
+            )
+            for highlight, _ in live
+        ],
+    )
     repaired = False
-    for highlight in stale:
-        anchor = highlight.fragment_anchor
-        if anchor is None:
-            # Concurrently deleted between the list read and this repair; the
-            # caller's re-read drops the highlight instead of crashing.
-            gone = True
-            continue
-        match = text_quote.match_quote_in_sources(
-            sources,
-            exact=normalize_quote_text(highlight.exact),
-            prefix=normalize_quote_text(highlight.prefix),
-            suffix=normalize_quote_text(highlight.suffix),
-        )
+    for (_, anchor), match in zip(live, matches, strict=True):
         if (
             match.status is not QuoteStatus.unique
             or match.fragment_id is None
@@ -805,6 +811,7 @@ def list_highlights_for_media(
         query = (
             db.query(Highlight)
             .join(HighlightPdfAnchor, Highlight.id == HighlightPdfAnchor.highlight_id)
+            .options(contains_eager(Highlight.pdf_anchor), selectinload(Highlight.pdf_quads))
             .filter(
                 HighlightPdfAnchor.media_id == media_id,
                 Highlight.anchor_kind == "pdf_page_geometry",
@@ -832,6 +839,7 @@ def list_highlights_for_media(
             db.query(Highlight, Fragment.id)
             .join(HighlightFragmentAnchor, Highlight.id == HighlightFragmentAnchor.highlight_id)
             .outerjoin(Fragment, Fragment.id == HighlightFragmentAnchor.fragment_id)
+            .options(contains_eager(Highlight.fragment_anchor))
             .filter(
                 Highlight.anchor_media_id == media_id,
                 Highlight.anchor_kind == "fragment_offsets",
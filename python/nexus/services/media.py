@@ -1195,14 +1195,7 @@ def list_fragments_for_viewer(
                 f.html_sanitized,
                 f.canonical_text,
                 f.canonical_text_word_count,
-                COALESCE(
-                    SUM(f.canonical_text_word_count) OVER (
-                        PARTITION BY f.media_id
-                        ORDER BY f.idx
-                        ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING
-                    ),
-                    0
-                ) AS document_word_start,
+                f.document_word_start,
                 f.t_start_ms,
                 f.t_end_ms,
                 f.speaker_label,
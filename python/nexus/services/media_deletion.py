@@ -55,6 +55,7 @@ from nexus.services.reader_apparatus import delete_media_apparatus
 from nexus.services.resource_graph import cleanup
 from nexus.services.resource_graph.refs import ResourceRef
 from nexus.services.source_attempt_artifacts import source_attempt_storage_paths
+from nexus.services.text_quote import forget_normalized_media_sources
 from nexus.storage.client import StorageError, get_storage_client
 
 if TYPE_CHECKING:
@@ -684,6 +685,7 @@ def delete_document_media_if_unreferenced(db: Session, media_id: UUID) -> list[s
     )
     db.execute(text("DELETE FROM media_file WHERE media_id = :media_id"), {"media_id": media_id})
     db.execute(text("DELETE FROM fragments WHERE media_id = :media_id"), {"media_id": media_id})
+    forget_normalized_media_sources(media_id)
     db.execute(
         text("DELETE FROM podcast_episodes WHERE media_id = :media_id"),
         {"media_id": media_id},
@@ -52,6 +52,43 @@ def canonical_word_boundary_ordinal(canonical_text: str, offset: int) -> int:
     return ordinal
 
 
+def refresh_fragment_document_offsets(db: Session, media_id: UUID) -> None:
+    """Recompute a media's stored cumulative fragment offsets in one pass.
+
+    ``fragments.document_word_start``/``document_char_start`` are prefix sums of
+    the generated per-fragment word and char counts over lower ``idx``. Every
+    writer that inserts more than one fragment for a media calls this once after
+    its inserts are flushed; a lone ``idx = 0`` fragment is already correct at
+    the column default. Only rows whose offsets moved are rewritten.
+    """
+    db.execute(
+        text(
+            """
+            UPDATE fragments f
+            SET document_word_start = o.document_word_start,
+                document_char_start = o.document_char_start
+            FROM (
+                SELECT
+                    id,
+                    COALESCE(SUM(canonical_text_word_count) OVER prior_fragments, 0)
+                        AS document_word_start,
+                    COALESCE(SUM(canonical_text_char_count) OVER prior_fragments, 0)
+                        AS document_char_start
+                FROM fragments
+                WHERE media_id = :media_id
+                WINDOW prior_fragments AS (
+                    ORDER BY idx ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING
+                )
+            ) o
+            WHERE f.id = o.id
+              AND (f.document_word_start, f.document_char_start)
+                  IS DISTINCT FROM (o.document_word_start, o.document_char_start)
+            """
+        ),
+        {"media_id": media_id},
+    )
+
+
 @dataclass(frozen=True)
 class MediaSummaryMetrics:
     word_count: int
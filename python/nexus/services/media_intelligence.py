@@ -29,7 +29,9 @@ from __future__ import annotations
 
 import hashlib
 import json
+from collections.abc import Sequence
 from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum
 from typing import Annotated, Any, Literal, assert_never, cast
 from uuid import UUID
@@ -442,7 +444,8 @@ def read_batch(db: Session, *, media_ids: list[UUID]) -> dict[UUID, MediaProject
 
     The set-based read model behind result-card and citation-chip enrichment:
     yields a ready :class:`MediaProjection` (``status='ready'``) only for media
-    whose ``ready`` head still matches the freshly recomputed content fingerprint,
+    whose ``ready`` head still matches the current content fingerprint (one
+    set-based read of the persisted fingerprints),
     applying the same staleness gate as :func:`get_current` so a
     re-ingested-but-not-yet-rebuilt unit is withheld. Keeps populating
     ``summary_md`` so the FE consumers that read it off search / citation DTOs do
@@ -465,11 +468,14 @@ def read_batch(db: Session, *, media_ids: list[UUID]) -> dict[UUID, MediaProject
         .mappings()
         .all()
     )
+    current = current_content_fingerprints(
+        db, media_ids=[UUID(str(row["media_id"])) for row in rows]
+    )
     projections: dict[UUID, MediaProjection] = {}
     for row in rows:
         media_id = UUID(str(row["media_id"]))
         fingerprint = str(row["content_fingerprint"])
-        if fingerprint == current_content_fingerprint(db, media_id=media_id):
+        if fingerprint == current[media_id]:
             projections[media_id] = MediaProjection(
                 media_id=media_id,
                 status="ready",
@@ -1306,9 +1312,88 @@ def current_content_fingerprint(db: Session, *, media_id: UUID) -> str:
     changes), which is the staleness signal for units and every Dossier that
     depends on the media. Works for not-ready media (an empty content index hashes
     to a stable value). Sole reader/definer of this fingerprint; callers (freshness
-    checks, publish fencing, aggregate dedup) MUST route through here rather than
-    reading the stored ``media_summaries.content_fingerprint`` column.
+    checks, publish fencing, aggregate dedup) MUST route through here (or
+    :func:`current_content_fingerprints`) rather than reading the stored
+    ``media_summaries.content_fingerprint`` column.
     """
+    return current_content_fingerprints(db, media_ids=[media_id])[media_id]
+
+
+def current_content_fingerprints(db: Session, *, media_ids: list[UUID]) -> dict[UUID, str]:
+    """Set-based :func:`current_content_fingerprint` for many media.
+
+    The content indexer persists each media's fingerprint on its
+    ``content_index_states`` row whenever the row or its chunk set changes, so
+    this is one indexed read. Rows written before fingerprints were persisted
+    derive it from their stored chunk hashes; a media with neither falls back to
+    hashing its chunk text.
+    """
+    if not media_ids:
+        return {}
+    rows = (
+        db.execute(
+            text(
+                """
+            SELECT owner_id, content_fingerprint,
+                   active_embedding_provider, active_embedding_model, updated_at,
+                   CASE WHEN content_fingerprint IS NULL THEN chunk_hashes END AS chunk_hashes
+            FROM content_index_states
+            WHERE owner_kind = 'media' AND owner_id = ANY(:media_ids)
+            """
+            ),
+            {"media_ids": media_ids},
+        )
+        .mappings()
+        .all()
+    )
+    fingerprints: dict[UUID, str] = {}
+    for row in rows:
+        media_id = UUID(str(row["owner_id"]))
+        if row["content_fingerprint"] is not None:
+            fingerprints[media_id] = str(row["content_fingerprint"])
+        elif row["chunk_hashes"] is not None:
+            fingerprints[media_id] = content_fingerprint_from_index(
+                provider=row["active_embedding_provider"],
+                model=row["active_embedding_model"],
+                index_generation=row["updated_at"],
+                chunk_hashes=row["chunk_hashes"],
+            )
+    for media_id in media_ids:
+        if media_id not in fingerprints:
+            fingerprints[media_id] = _hash_content_fingerprint(db, media_id=media_id)
+    return fingerprints
+
+
+def chunk_text_hash(chunk_text: str) -> str:
+    """The per-chunk content hash folded into the media content fingerprint."""
+    return hashlib.sha256(chunk_text.encode("utf-8")).hexdigest()
+
+
+def content_fingerprint_from_index(
+    *,
+    provider: str | None,
+    model: str | None,
+    index_generation: datetime | None,
+    chunk_hashes: Sequence[Sequence[object]],
+) -> str:
+    """Canonical fingerprint of one media's active index pointer and chunk set.
+
+    ``chunk_hashes`` is the ordered ``[chunk_idx, chunk_text_hash]`` list; the
+    content indexer stores it so writers recompute this without chunk text.
+    """
+    canonical = {
+        "active_embedding_provider": provider,
+        "active_embedding_model": model,
+        "active_index_generation": (
+            index_generation.isoformat() if index_generation is not None else None
+        ),
+        "chunks": [[int(str(idx)), str(digest)] for idx, digest in chunk_hashes],
+    }
+    serialized = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def _hash_content_fingerprint(db: Session, *, media_id: UUID) -> str:
     index_state = (
         db.execute(
             text(
@@ -1323,10 +1408,6 @@ def current_content_fingerprint(db: Session, *, media_id: UUID) -> str:
         .mappings()
         .first()
     )
-    provider = (index_state or {}).get("active_embedding_provider")
-    model = (index_state or {}).get("active_embedding_model")
-    index_generation = (index_state or {}).get("updated_at")
-
     chunk_rows = (
         db.execute(
             text(
@@ -1342,22 +1423,14 @@ def current_content_fingerprint(db: Session, *, media_id: UUID) -> str:
         .mappings()
         .all()
     )
-    canonical = {
-        "active_embedding_provider": provider,
-        "active_embedding_model": model,
-        "active_index_generation": (
-            index_generation.isoformat() if index_generation is not None else None
-        ),
-        "chunks": [
-            [
-                int(row["chunk_idx"]),
-                hashlib.sha256(str(row["chunk_text"]).encode("utf-8")).hexdigest(),
-            ]
-            for row in chunk_rows
+    return content_fingerprint_from_index(
+        provider=(index_state or {}).get("active_embedding_provider"),
+        model=(index_state or {}).get("active_embedding_model"),
+        index_generation=(index_state or {}).get("updated_at"),
+        chunk_hashes=[
+            (int(row["chunk_idx"]), chunk_text_hash(str(row["chunk_text"]))) for row in chunk_rows
         ],
-    }
-    serialized = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
-    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+    )
 
 
 def _load_candidates(db: Session, *, media_id: UUID) -> list[_Candidate]:
@@ -1219,10 +1219,17 @@ def run_source_attempt(
     fence = SourcePublicationFence.from_context(attempt_id=attempt_id, context=context)
     try:
 
-        def mark_running(_db: Session, attempt: MediaSourceAttempt) -> None:
+        def mark_running(phase_db: Session, attempt: MediaSourceAttempt) -> None:
+            # A podcast attempt that yielded to its transcription provider re-enters
+            # here at every poll; those polls continue the same run.
+            if not (
+                attempt.status == _ATTEMPT_RUNNING
+                and attempt.source_type == source_types.PODCAST_EPISODE_TRANSCRIPT
+                and _podcast_transcription_awaiting_provider(phase_db, media_id)
+            ):
+                attempt.run_count = int(attempt.run_count or 0) + 1
+                attempt.started_at = func.now()
             attempt.status = _ATTEMPT_RUNNING
-            attempt.run_count = int(attempt.run_count or 0) + 1
-            attempt.started_at = func.now()
             attempt.updated_at = func.now()
 
         run_source_publication_phase(
@@ -2986,6 +2993,22 @@ def _run_youtube_video(
     )
 
 
+def _podcast_transcription_awaiting_provider(db: Session, media_id: UUID) -> bool:
+    """Whether the episode's transcription was submitted and its worker yielded."""
+    return bool(
+        db.scalar(
+            text(
+                """
+                SELECT provider_request_id IS NOT NULL
+                FROM podcast_transcription_jobs
+                WHERE media_id = :media_id
+                """
+            ),
+            {"media_id": media_id},
+        )
+    )
+
+
 def _run_podcast_episode_transcript(
     session_factory: sessionmaker[Session],
     media_id: UUID,
@@ -3005,6 +3028,9 @@ def _run_podcast_episode_transcript(
                 ApiErrorCode.E_INVALID_KIND,
                 "Podcast transcript source attempts must target podcast episode media.",
             )
+        if _podcast_transcription_awaiting_provider(db, media_id):
+            # Resuming after a yield to the provider: extraction already began.
+            return
         begin_extraction(db, media)
         _bump_media_fact_collections(db)
 
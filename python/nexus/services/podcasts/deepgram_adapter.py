@@ -35,6 +35,13 @@ class TranscriptionResult:
     diagnostic_error_code: Literal["E_DIARIZATION_FAILED"] | None = None
 
 
+@dataclass(frozen=True)
+class DeepgramSubmission:
+    """A listen request Deepgram accepted for callback delivery."""
+
+    request_id: str
+
+
 class DeepgramClient:
     """Thin client for Deepgram listen transcription with diarization fallback."""
 
@@ -52,16 +59,8 @@ class DeepgramClient:
         self.timeout_seconds = timeout_seconds
 
     def transcribe(self, audio_url: str | None) -> TranscriptionResult:
-        normalized_audio_url = str(audio_url or "").strip()
-        if not normalized_audio_url:
-            return _transcription_failure_result(
-                ApiErrorCode.E_TRANSCRIPT_UNAVAILABLE.value,
-                "Transcript unavailable",
-            )
-
-        try:
-            validate_requested_url(normalized_audio_url)
-        except InvalidRequestError:
+        normalized_audio_url = _requestable_audio_url(audio_url)
+        if normalized_audio_url is None:
             return _transcription_failure_result(
                 ApiErrorCode.E_TRANSCRIPT_UNAVAILABLE.value,
                 "Transcript unavailable",
@@ -156,37 +155,81 @@ class DeepgramClient:
 
         return TranscriptionResult(status="completed", segments=segments)
 
+    def submit(
+        self, audio_url: str | None, *, diarize: bool, callback_url: str
+    ) -> DeepgramSubmission | TranscriptionResult:
+        """Queue a URL transcription and return at once with Deepgram's request id.
+
+        Deepgram POSTs the finished listen response to ``callback_url``; the
+        caller persists the request id and yields its worker slot until then.
+        An unusable audio URL is the same terminal failure as ``transcribe``.
+        """
+        normalized_audio_url = _requestable_audio_url(audio_url)
+        if normalized_audio_url is None:
+            return _transcription_failure_result(
+                ApiErrorCode.E_TRANSCRIPT_UNAVAILABLE.value,
+                "Transcript unavailable",
+            )
+
+        if not self.api_key:
+            raise RuntimeError("Transcription provider credentials are not configured")
+
+        response = httpx.post(
+            f"{self.base_url.rstrip('/')}{_DEEPGRAM_LISTEN_PATH}",
+            headers=self._url_request_headers(),
+            params={**self._url_listen_params(diarize=diarize), "callback": callback_url},
+            json={"url": normalized_audio_url},
+            timeout=self.timeout_seconds,
+        )
+        response.raise_for_status()
+        payload = response.json()
+        request_id = payload.get("request_id") if isinstance(payload, dict) else None
+        if not isinstance(request_id, str) or not request_id.strip():
+            raise ValueError("Deepgram callback submission did not return a request_id")
+        return DeepgramSubmission(request_id=request_id.strip())
+
     def _transcribe_with_deepgram(self, audio_url: str, *, diarize: bool) -> TranscriptionResult:
-        request_url = f"{self.base_url.rstrip('/')}{_DEEPGRAM_LISTEN_PATH}"
-        diarize_str = "true" if diarize else "false"
         response = httpx.post(
-            request_url,
-            headers={
-                "Authorization": f"Token {self.api_key}",
-                "Content-Type": "application/json",
-            },
-            params={
-                "model": self.model,
-                "diarize": diarize_str,
-                "utterances": "true",
-                "smart_format": "true",
-                "punctuate": "true",
-                "language": "en",
-            },
+            f"{self.base_url.rstrip('/')}{_DEEPGRAM_LISTEN_PATH}",
+            headers=self._url_request_headers(),
+            params=self._url_listen_params(diarize=diarize),
             json={"url": audio_url},
             timeout=self.timeout_seconds,
         )
         response.raise_for_status()
-        payload = response.json()
+        return result_from_listen_payload(response.json())
 
-        segments = _extract_deepgram_segments(payload)
-        if not segments:
-            return _transcription_failure_result(
-                ApiErrorCode.E_TRANSCRIPT_UNAVAILABLE.value,
-                "Transcript unavailable",
-            )
+    def _url_request_headers(self) -> dict[str, str]:
+        return {
+            "Authorization": f"Token {self.api_key}",
+            "Content-Type": "application/json",
+        }
 
-        return TranscriptionResult(status="completed", segments=segments)
+    def _url_listen_params(self, *, diarize: bool) -> dict[str, str]:
+        return {
+            "model": self.model,
+            "diarize": "true" if diarize else "false",
+            "utterances": "true",
+            "smart_format": "true",
+            "punctuate": "true",
+            "language": "en",
+        }
+
+
+def result_from_listen_payload(payload: Any) -> TranscriptionResult:
+    """Interpret one Deepgram listen response body, synchronous or delivered by callback.
+
+    A malformed body raises ``ValueError`` like the synchronous path; a body
+    without usable speech is the terminal ``E_TRANSCRIPT_UNAVAILABLE``.
+    """
+    segments = _extract_deepgram_segments(payload)
+    if not segments:
+        return _transcription_failure_result(
+            ApiErrorCode.E_TRANSCRIPT_UNAVAILABLE.value,
+            "Transcript unavailable",
+        )
+
+    return TranscriptionResult(status="completed", segments=segments)
 
 
 def get_deepgram_client() -> DeepgramClient:
@@ -199,6 +242,17 @@ def get_deepgram_client() -> DeepgramClient:
     )
 
 
+def _requestable_audio_url(audio_url: str | None) -> str | None:
+    normalized_audio_url = str(audio_url or "").strip()
+    if not normalized_audio_url:
+        return None
+    try:
+        validate_requested_url(normalized_audio_url)
+    except InvalidRequestError:
+        return None
+    return normalized_audio_url
+
+
 def _transcription_failure_result(
     error_code: TerminalTranscriptionErrorCode, error_message: str
 ) -> TranscriptionResult:
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import UTC, date, datetime
+import hmac
+import json
+from dataclasses import dataclass, replace
+from datetime import UTC, date, datetime, timedelta
 from typing import Any, Literal, cast
+from urllib.parse import urlencode
 from uuid import UUID
 
 from sqlalchemy import text
@@ -12,6 +15,7 @@ from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session, sessionmaker
 
 from nexus.coerce import coerce_positive_int
+from nexus.config import get_settings
 from nexus.db.errors import integrity_constraint_name
 from nexus.db.session import transaction
 from nexus.errors import (
@@ -21,7 +25,7 @@ from nexus.errors import (
     InvalidRequestError,
     NotFoundError,
 )
-from nexus.jobs.queue import enqueue_job
+from nexus.jobs.queue import enqueue_job, wake_pending_jobs_for_payload
 from nexus.logging import get_logger
 from nexus.schemas.media import (
     MediaProcessingStatus,
@@ -53,6 +57,7 @@ from nexus.services.source_publication import (
     SourcePublicationFence,
     run_source_publication_phase,
 )
+from nexus.services.text_quote import forget_normalized_media_sources
 from nexus.services.transcript_segments import normalize_transcript_segments
 from nexus.services.transcripts.current import (
     TranscriptRequestReason,
@@ -64,7 +69,10 @@ from nexus.services.transcripts.current import (
 from nexus.services.youtube_transcripts import fetch_youtube_transcript
 
 from .deepgram_adapter import (
+    DeepgramClient,
+    TranscriptionResult,
     get_deepgram_client,
+    result_from_listen_payload,
 )
 from .episodes import (
     episode_selection_fingerprint,
@@ -105,6 +113,14 @@ def _bump_all_episode_row_collections(db: Session) -> None:
     )
 
 
+class TranscriptionAwaitingProvider(Exception):
+    """The provider holds a queued transcription; the job should yield until ``available_at``."""
+
+    def __init__(self, available_at: datetime) -> None:
+        super().__init__("Podcast transcription is awaiting its provider callback")
+        self.available_at = available_at
+
+
 @dataclass(frozen=True)
 class TranscriptionRunResult:
     """Worker result for a single podcast transcription run."""
@@ -614,6 +630,11 @@ def request_media_transcript_for_viewer(
                     error_code = NULL,
                     started_at = NULL,
                     completed_at = NULL,
+                    provider_request_id = NULL,
+                    provider_diarize = NULL,
+                    provider_submitted_at = NULL,
+                    provider_result = NULL,
+                    provider_result_received_at = NULL,
                     updated_at = :updated_at
                 WHERE media_id = :media_id
                 """
@@ -1078,7 +1099,11 @@ def run_podcast_transcription_now(
                     media.language,
                     job.reserved_minutes,
                     job.requested_by_user_id,
-                    job.request_reason
+                    job.request_reason,
+                    job.provider_request_id,
+                    job.provider_diarize,
+                    job.provider_submitted_at,
+                    job.provider_result
                 FROM podcast_episodes episode
                 JOIN media ON media.id = episode.media_id
                 JOIN podcast_transcription_jobs job ON job.media_id = episode.media_id
@@ -1093,6 +1118,17 @@ def run_podcast_transcription_now(
     if sidecar is None:
         raise AssertionError("podcast source attempt is missing its domain job")
 
+    if sidecar[6] is not None:
+        return _resume_provider_transcription(
+            session_factory,
+            media_id=media_id,
+            request_reason=str(sidecar[5] or "episode_open"),
+            diarize=bool(sidecar[7]),
+            submitted_at=sidecar[8],
+            provider_result=sidecar[9],
+            publication_fence=publication_fence,
+        )
+
     rss_transcript_url = str(sidecar[0] or "").strip() or None
     reserved_minutes = int(sidecar[3] or 0)
     effective_requester = UUID(str(sidecar[4])) if sidecar[4] is not None else requested_by_user_id
@@ -1225,7 +1261,215 @@ def run_podcast_transcription_now(
         media_ids=(media_id,),
         mutate=publish_running_state,
     )
-    transcription_result = get_deepgram_client().transcribe(audio_url)
+    settings = get_settings()
+    client = get_deepgram_client()
+    if settings.deepgram_callback_url and settings.deepgram_callback_secret:
+        return _submit_provider_transcription(
+            session_factory,
+            client,
+            media_id=media_id,
+            request_reason=request_reason,
+            audio_url=audio_url,
+            diarize=True,
+            publication_fence=publication_fence,
+        )
+    return _publish_transcription_result(
+        session_factory,
+        media_id=media_id,
+        request_reason=request_reason,
+        transcription_result=client.transcribe(audio_url),
+        publication_fence=publication_fence,
+    )
+
+
+def _submit_provider_transcription(
+    session_factory: sessionmaker[Session],
+    client: DeepgramClient,
+    *,
+    media_id: UUID,
+    request_reason: str,
+    audio_url: str | None,
+    diarize: bool,
+    publication_fence: SourcePublicationFence,
+) -> TranscriptionRunResult:
+    """Queue callback delivery, record the request, and yield the worker slot."""
+    settings = get_settings()
+    callback_query = urlencode({"token": settings.deepgram_callback_secret})
+    submission = client.submit(
+        audio_url,
+        diarize=diarize,
+        callback_url=f"{settings.deepgram_callback_url}?{callback_query}",
+    )
+    if isinstance(submission, TranscriptionResult):
+        return _publish_transcription_result(
+            session_factory,
+            media_id=media_id,
+            request_reason=request_reason,
+            transcription_result=submission,
+            publication_fence=publication_fence,
+        )
+
+    now = datetime.now(UTC)
+
+    def record_provider_request(db: Session, _attempt: object) -> None:
+        result = db.execute(
+            text(
+                """
+                UPDATE podcast_transcription_jobs
+                SET provider_request_id = :provider_request_id,
+                    provider_diarize = :diarize,
+                    provider_submitted_at = :now,
+                    provider_result = NULL,
+                    provider_result_received_at = NULL,
+                    updated_at = :now
+                WHERE media_id = :media_id
+                """
+            ),
+            {
+                "media_id": media_id,
+                "provider_request_id": submission.request_id,
+                "diarize": diarize,
+                "now": now,
+            },
+        )
+        _assert_one_mutated_row(result, "podcast_transcription_jobs")
+
+    run_source_publication_phase(
+        session_factory=session_factory,
+        label="record_podcast_transcription_provider_request",
+        fence=publication_fence,
+        media_ids=(media_id,),
+        mutate=record_provider_request,
+    )
+    raise TranscriptionAwaitingProvider(
+        now + timedelta(seconds=settings.podcast_transcription_poll_seconds)
+    )
+
+
+def _resume_provider_transcription(
+    session_factory: sessionmaker[Session],
+    *,
+    media_id: UUID,
+    request_reason: str,
+    diarize: bool,
+    submitted_at: datetime,
+    provider_result: Any,
+    publication_fence: SourcePublicationFence,
+) -> TranscriptionRunResult:
+    """Continue a callback-delivered transcription after the worker yielded.
+
+    Until the callback lands the attempt keeps yielding, bounded by the callback
+    deadline. Past it the provider request is dropped before the timeout is
+    raised, so the job's retry submits afresh instead of timing out again. A
+    failed diarized result falls back to one non-diarized request, mirroring
+    the synchronous client; a completed one publishes exactly as the
+    synchronous path does.
+    """
+    settings = get_settings()
+    now = datetime.now(UTC)
+    if provider_result is None:
+        deadline = submitted_at + timedelta(
+            seconds=settings.podcast_transcription_callback_deadline_seconds
+        )
+        if now < deadline:
+            raise TranscriptionAwaitingProvider(
+                min(
+                    deadline,
+                    now + timedelta(seconds=settings.podcast_transcription_poll_seconds),
+                )
+            )
+
+        def drop_provider_request(db: Session, _attempt: object) -> None:
+            result = db.execute(
+                text(
+                    """
+                    UPDATE podcast_transcription_jobs
+                    SET provider_request_id = NULL,
+                        provider_diarize = NULL,
+                        provider_submitted_at = NULL,
+                        updated_at = :now
+                    WHERE media_id = :media_id
+                    """
+                ),
+                {"media_id": media_id, "now": now},
+            )
+            _assert_one_mutated_row(result, "podcast_transcription_jobs")
+
+        run_source_publication_phase(
+            session_factory=session_factory,
+            label="expire_podcast_transcription_provider_request",
+            fence=publication_fence,
+            media_ids=(media_id,),
+            mutate=drop_provider_request,
+        )
+        return _publish_transcription_result(
+            session_factory,
+            media_id=media_id,
+            request_reason=request_reason,
+            transcription_result=TranscriptionResult(
+                status="failed",
+                error_code=ApiErrorCode.E_TRANSCRIPTION_TIMEOUT.value,
+                error_message="Transcription timed out",
+            ),
+            publication_fence=publication_fence,
+        )
+
+    try:
+        transcription_result = result_from_listen_payload(provider_result)
+    except ValueError:
+        logger.warning("podcast_transcription_callback_malformed", media_id=str(media_id))
+        transcription_result = TranscriptionResult(
+            status="failed",
+            error_code=ApiErrorCode.E_TRANSCRIPTION_FAILED.value,
+            error_message="Transcription failed",
+        )
+    if transcription_result.status != "completed" and diarize:
+        return _submit_provider_transcription(
+            session_factory,
+            get_deepgram_client(),
+            media_id=media_id,
+            request_reason=request_reason,
+            audio_url=_read_episode_audio_url(session_factory, media_id=media_id),
+            diarize=False,
+            publication_fence=publication_fence,
+        )
+    if transcription_result.status == "completed" and not diarize:
+        transcription_result = replace(
+            transcription_result,
+            diagnostic_error_code=ApiErrorCode.E_DIARIZATION_FAILED.value,
+        )
+    return _publish_transcription_result(
+        session_factory,
+        media_id=media_id,
+        request_reason=request_reason,
+        transcription_result=transcription_result,
+        publication_fence=publication_fence,
+    )
+
+
+def _read_episode_audio_url(
+    session_factory: sessionmaker[Session], *, media_id: UUID
+) -> str | None:
+    db = session_factory()
+    try:
+        audio_url = db.scalar(
+            text("SELECT external_playback_url FROM media WHERE id = :media_id"),
+            {"media_id": media_id},
+        )
+        db.rollback()
+    finally:
+        db.close()
+    return str(audio_url or "").strip() or None
+
+
+def _publish_transcription_result(
+    session_factory: sessionmaker[Session],
+    *,
+    media_id: UUID,
+    request_reason: str,
+    transcription_result: TranscriptionResult,
+    publication_fence: SourcePublicationFence,
+) -> TranscriptionRunResult:
     transcription_status = transcription_result.status
     transcript_segments = normalize_transcript_segments(transcription_result.segments)
     transcription_error_code = transcription_result.error_code
@@ -1252,6 +1496,11 @@ def run_podcast_transcription_now(
                     SET status = 'completed',
                         error_code = :error_code,
                         completed_at = :now,
+                        provider_request_id = NULL,
+                        provider_diarize = NULL,
+                        provider_submitted_at = NULL,
+                        provider_result = NULL,
+                        provider_result_received_at = NULL,
                         updated_at = :now
                     WHERE media_id = :media_id
                     """
@@ -1298,6 +1547,70 @@ def run_podcast_transcription_now(
     )
 
 
+def record_deepgram_callback(db: Session, raw_body: bytes, token: str | None) -> dict[str, bool]:
+    """Store one Deepgram callback delivery and wake the yielded source attempt.
+
+    Deepgram retries non-2xx deliveries, so an unknown request id answers 404
+    and a repeat delivery answers ``processed: false``. The worker, not this
+    request, interprets and publishes the result.
+    """
+    secret = get_settings().deepgram_callback_secret
+    if not secret:
+        raise NotFoundError(ApiErrorCode.E_NOT_FOUND, "Not found")
+    if not token or not hmac.compare_digest(token.encode(), secret.encode()):
+        raise ApiError(ApiErrorCode.E_UNAUTHENTICATED, "Invalid transcription callback token")
+
+    try:
+        payload = json.loads(raw_body)
+    except ValueError as exc:
+        raise InvalidRequestError(
+            ApiErrorCode.E_INVALID_REQUEST, "Transcription callback body is not JSON"
+        ) from exc
+    metadata = payload.get("metadata") if isinstance(payload, dict) else None
+    request_id = metadata.get("request_id") if isinstance(metadata, dict) else None
+    if not isinstance(request_id, str) or not request_id.strip():
+        raise InvalidRequestError(
+            ApiErrorCode.E_INVALID_REQUEST, "Transcription callback is missing its request id"
+        )
+
+    media_id = db.scalar(
+        text(
+            """
+            UPDATE podcast_transcription_jobs
+            SET provider_result = CAST(:provider_result AS jsonb),
+                provider_result_received_at = now(),
+                updated_at = now()
+            WHERE provider_request_id = :provider_request_id
+              AND provider_result IS NULL
+            RETURNING media_id
+            """
+        ),
+        {"provider_request_id": request_id.strip(), "provider_result": json.dumps(payload)},
+    )
+    if media_id is None:
+        known = db.scalar(
+            text(
+                """
+                SELECT 1 FROM podcast_transcription_jobs
+                WHERE provider_request_id = :provider_request_id
+                """
+            ),
+            {"provider_request_id": request_id.strip()},
+        )
+        db.rollback()
+        if known is None:
+            raise NotFoundError(ApiErrorCode.E_NOT_FOUND, "Unknown transcription request")
+        return {"processed": False}
+
+    wake_pending_jobs_for_payload(
+        db,
+        kind="ingest_media_source",
+        expected_payload_match={"media_id": str(media_id)},
+    )
+    db.commit()
+    return {"processed": True}
+
+
 def _reset_podcast_transcription_job_for_source_attempt(
     db: Session,
     *,
@@ -1370,6 +1683,11 @@ def _reset_podcast_transcription_job_for_source_attempt(
                     error_code = NULL,
                     started_at = NULL,
                     completed_at = NULL,
+                    provider_request_id = NULL,
+                    provider_diarize = NULL,
+                    provider_submitted_at = NULL,
+                    provider_result = NULL,
+                    provider_result_received_at = NULL,
                     updated_at = :updated_at
                 WHERE media_id = :media_id
                 """
@@ -1393,6 +1711,7 @@ def _reset_media_transcript_state_for_source_attempt(
         {"media_id": media_id},
     )
     db.execute(text("DELETE FROM fragments WHERE media_id = :media_id"), {"media_id": media_id})
+    forget_normalized_media_sources(media_id)
     set_media_transcript_state(
         db,
         media_id=media_id,
@@ -2,13 +2,23 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-from collections.abc import Mapping, Sequence
+import hashlib
+import os
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass, field
+from functools import lru_cache
 from math import ceil
+from threading import Lock
 from typing import Literal
 
-from provider_runtime import ReasoningLevel
+import tiktoken
+from provider_runtime import ProviderTarget, ReasoningLevel
+
+from nexus.config import get_settings
+from nexus.logging import get_logger
+
+logger = get_logger(__name__)
 
 BudgetLane = Literal[
     "system",
@@ -163,12 +173,125 @@ def estimate_tokens(text: str) -> int:
 
     if not text:
         return 0
-    non_ascii = sum(1 for char in text if ord(char) > 127)
+    non_ascii = 0 if text.isascii() else len(text) - len(text.encode("ascii", "ignore"))
     char_estimate = ceil(len(text) / 3)
     word_estimate = len(text.split()) * 2
     return max(1, char_estimate, word_estimate, non_ascii)
 
 
+@dataclass(frozen=True)
+class TokenCounter:
+    """Offline prompt token counter for one provider family.
+
+    ``key`` namespaces the memo so two counters never share a cached count.
+    """
+
+    key: str
+    count: Callable[[str], int]
+
+
+HEURISTIC_TOKEN_COUNTER = TokenCounter(key="heuristic", count=estimate_tokens)
+
+# Local BPE encoding used for every provider. OpenAI models tokenize with it
+# directly; other providers' tokenizers run denser on the same text, so their
+# counts are scaled up. Every BPE count is still capped by the heuristic, which
+# keeps budgeting at least as permissive as before and never less safe than the
+# heuristic's own worst case.
+_BPE_ENCODING = "o200k_base"
+# tiktoken caches a downloaded encoding under the SHA-1 of its source URL.
+_BPE_ENCODING_URL = "https://openaipublic.blob.core.windows.net/encodings/o200k_base.tiktoken"
+_BPE_PROVIDER_MARGINS: Mapping[str, float] = {
+    "openai": 1.0,
+    "anthropic": 1.35,
+    "gemini": 1.25,
+    "moonshot": 1.25,
+}
+
+_TOKEN_MEMO_MAX_ENTRIES = 8192
+_token_memo: OrderedDict[tuple[str, bytes], int] = OrderedDict()
+_token_memo_lock = Lock()
+
+
+@lru_cache(maxsize=1)
+def _bpe_encode() -> Callable[[str], list[int]] | None:
+    """Load the local BPE encoding once; ``None`` falls back to the heuristic.
+
+    Only attempted when ``TIKTOKEN_CACHE_DIR`` holds the encoding file the
+    backend image pre-seeds, so a worker without it never reaches for the
+    network on the chat path.
+    """
+
+    cache_dir = get_settings().tiktoken_cache_dir
+    if cache_dir is None:
+        return None
+    encoding_file = os.path.join(cache_dir, hashlib.sha1(_BPE_ENCODING_URL.encode()).hexdigest())
+    if not os.path.isfile(encoding_file):
+        logger.warning("prompt_tokenizer_unavailable", reason="encoding_not_seeded")
+        return None
+    # tiktoken resolves its cache from the process environment, which a value
+    # read from the .env file never reaches.
+    os.environ["TIKTOKEN_CACHE_DIR"] = cache_dir
+    try:
+        encoding = tiktoken.get_encoding(_BPE_ENCODING)
+    except Exception as exc:
+        logger.warning(
+            "prompt_tokenizer_unavailable",
+            reason="encoding_load_failed",
+            error=type(exc).__name__,
+        )
+        return None
+    return lambda text: encoding.encode(text, disallowed_special=())
+
+
+def _bpe_counter(provider: str, margin: float, encode: Callable[[str], list[int]]) -> TokenCounter:
+    def count(text: str) -> int:
+        if not text:
+            return 0
+        return min(estimate_tokens(text), max(1, ceil(len(encode(text)) * margin)))
+
+    return TokenCounter(key=f"{_BPE_ENCODING}:{provider}", count=count)
+
+
+@lru_cache(maxsize=16)
+def _provider_token_counter(provider: str) -> TokenCounter:
+    margin = _BPE_PROVIDER_MARGINS.get(provider)
+    encode = _bpe_encode()
+    if margin is None or encode is None:
+        return HEURISTIC_TOKEN_COUNTER
+    return _bpe_counter(provider, margin, encode)
+
+
+def token_counter_for(target: ProviderTarget) -> TokenCounter:
+    """Resolve the offline token counter for a profile's runtime target."""
+
+    return _provider_token_counter(target.provider)
+
+
+def count_prompt_tokens(text: str, counter: TokenCounter = HEURISTIC_TOKEN_COUNTER) -> int:
+    """Count ``text`` with ``counter``, memoized by content hash.
+
+    History turns and attached documents recur verbatim across runs of one
+    conversation, so repeat counts are answered from a bounded LRU keyed by
+    (counter, BLAKE2b digest) rather than the text itself.
+    """
+
+    if not text:
+        return 0
+    key = (counter.key, hashlib.blake2b(text.encode(), digest_size=16).digest())
+    with _token_memo_lock:
+        cached = _token_memo.get(key)
+        if cached is not None:
+            _token_memo.move_to_end(key)
+            return cached
+    tokens = counter.count(text)
+    with _token_memo_lock:
+        _token_memo[key] = tokens
+        _token_memo.move_to_end(key)
+        while len(_token_memo) > _TOKEN_MEMO_MAX_ENTRIES:
+            _token_memo.popitem(last=False)
+    return tokens
+
+
 def make_prompt_block(
     *,
     block_id: str,
@@ -179,11 +302,12 @@ def make_prompt_block(
     cache_policy: Mapping[str, object] | None = None,
     privacy_scope: str = "conversation",
     required_provider_capability: str | None = None,
+    token_counter: TokenCounter = HEURISTIC_TOKEN_COUNTER,
 ) -> PromptBlock:
     """Create one structured prompt block."""
 
     refs = tuple(dict(ref) for ref in source_refs)
-    estimated_tokens = estimate_tokens(text)
+    estimated_tokens = count_prompt_tokens(text, token_counter)
     return PromptBlock(
         id=block_id,
         role=role,
@@ -13,6 +13,7 @@ from sqlalchemy.orm import Session, sessionmaker
 
 from nexus.errors import ApiError, ApiErrorCode
 from nexus.logging import get_logger
+from nexus.metrics import RATE_LIMIT_DECISIONS
 from nexus.services.billing import get_platform_token_usage
 from nexus.services.billing_entitlements import get_effective_entitlements
 from nexus.services.redact import safe_kv
@@ -99,11 +100,13 @@ class RateLimiter:
             db.commit()
 
         if count > self._rpm_limit:
+            RATE_LIMIT_DECISIONS.inc("rpm", "blocked")
             logger.warning("rate_limit.blocked", **safe_kv(limit_type="rpm"))
             raise ApiError(
                 ApiErrorCode.E_RATE_LIMITED,
                 f"Rate limit exceeded: {self._rpm_limit} requests per minute",
             )
+        RATE_LIMIT_DECISIONS.inc("rpm", "allowed")
 
     def check_concurrent_limit(self, user_id: UUID) -> None:
         """Check the current in-flight count without mutating it."""
@@ -135,11 +138,13 @@ class RateLimiter:
 
         current = int(row[0]) if row is not None else 0
         if current >= self._concurrent_limit:
+            RATE_LIMIT_DECISIONS.inc("concurrent", "blocked")
             logger.warning("rate_limit.blocked", **safe_kv(limit_type="concurrent"))
             raise ApiError(
                 ApiErrorCode.E_RATE_LIMITED,
                 f"Too many concurrent requests: {self._concurrent_limit} maximum",
             )
+        RATE_LIMIT_DECISIONS.inc("concurrent", "allowed")
 
     def acquire_inflight_slot(self, user_id: UUID) -> None:
         """Atomically check and increment one in-flight slot."""
@@ -160,6 +165,7 @@ class RateLimiter:
             current = self._ensure_inflight_row(db=db, user_id=user_id)
             if current >= self._concurrent_limit:
                 db.rollback()
+                RATE_LIMIT_DECISIONS.inc("inflight", "blocked")
                 logger.warning("rate_limit.blocked", **safe_kv(limit_type="concurrent"))
                 raise ApiError(
                     ApiErrorCode.E_RATE_LIMITED,
@@ -179,6 +185,7 @@ class RateLimiter:
                 },
             )
             db.commit()
+        RATE_LIMIT_DECISIONS.inc("inflight", "allowed")
 
     def release_inflight_slot(self, user_id: UUID) -> None:
         """Decrement one in-flight slot (clamped at zero)."""
@@ -242,11 +249,13 @@ class RateLimiter:
             )
 
         if monthly_usage["used"] + monthly_usage["reserved"] >= monthly_limit:
+            RATE_LIMIT_DECISIONS.inc("token_budget", "blocked")
             logger.warning("token_budget.exceeded", **safe_kv(key_mode="platform"))
             raise ApiError(
                 ApiErrorCode.E_TOKEN_BUDGET_EXCEEDED,
                 "Monthly AI token quota exceeded",
             )
+        RATE_LIMIT_DECISIONS.inc("token_budget", "allowed")
 
     def reserve_token_budget(
         self,
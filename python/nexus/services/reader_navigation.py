@@ -62,7 +62,7 @@ def get_media_navigation_for_viewer(
     fragment_rows = db.execute(
         text(
             """
-            SELECT id, idx, char_length(canonical_text)
+            SELECT id, idx, canonical_text_char_count
             FROM fragments
             WHERE media_id = :media_id
             ORDER BY idx ASC
@@ -19,7 +19,7 @@ from sqlalchemy.orm import Session
 from nexus.auth.permissions import visible_media_ids_cte_sql
 from nexus.services.search.query import SearchScope
 from nexus.services.search.scope import ScopeUnsupported, scope_filter_sql
-from nexus.services.search.sql import query_embedding_cte_sql
+from nexus.services.search.sql import apply_ann_search_settings
 from nexus.services.semantic_chunks import (
     to_pgvector_literal,
     transcript_embedding_dimensions,
@@ -64,44 +64,58 @@ def retrieve_content_chunk_candidates(
     if isinstance(scope_clause, ScopeUnsupported):
         return []
     scope_filter, scope_params = scope_clause
+    apply_ann_search_settings(db)
     rows = (
         db.execute(
             text(
                 f"""
                 WITH
                     visible_media AS ({visible_media_ids_cte_sql()}),
-                    {query_embedding_cte_sql(embedding_dims)}
-                SELECT
-                    cc.id AS content_chunk_id,
-                    cc.owner_kind,
-                    cc.owner_id,
-                    cc.chunk_text,
-                    cc.source_kind,
-                    cc.heading_path,
-                    cc.primary_evidence_span_id,
-                    COALESCE(m.title, 'Note') AS title,
-                    (1 - (ce.embedding_vector <=> qe.embedding)) AS semantic_score
-                FROM content_chunks cc
-                LEFT JOIN media m ON m.id = cc.owner_id AND cc.owner_kind = 'media'
-                JOIN content_index_states mcis ON mcis.owner_kind = cc.owner_kind
-                    AND mcis.owner_id = cc.owner_id
-                    AND mcis.status = 'ready'
-                JOIN content_embeddings ce ON ce.chunk_id = cc.id
-                    AND ce.embedding_provider = mcis.active_embedding_provider
-                    AND ce.embedding_model = mcis.active_embedding_model
-                    AND ce.embedding_dimensions = :embedding_dims
-                    AND ce.embedding_vector IS NOT NULL
-                JOIN query_embedding qe ON true
-                WHERE btrim(cc.chunk_text) <> ''
-                  AND mcis.active_embedding_provider = :query_embedding_provider
-                  AND mcis.active_embedding_model = :query_embedding_model
-                  AND (
-                    (cc.owner_kind = 'media' AND cc.owner_id IN (SELECT media_id FROM visible_media))
-                    OR (cc.owner_kind = 'note_block' AND cc.owner_id IN (
-                        SELECT id FROM note_blocks WHERE user_id = :viewer_id))
-                  )
-                  {scope_filter}
-                ORDER BY ce.embedding_vector <=> qe.embedding ASC, cc.id ASC
+                    nearest AS (
+                        SELECT
+                            cc.id AS content_chunk_id,
+                            cc.owner_kind,
+                            cc.owner_id,
+                            cc.chunk_text,
+                            cc.source_kind,
+                            cc.heading_path,
+                            cc.primary_evidence_span_id,
+                            COALESCE(m.title, 'Note') AS title,
+                            (1 - (ce.embedding_vector <=> CAST(
+                                :query_embedding AS vector({embedding_dims})
+                            ))) AS semantic_score
+                        FROM content_embeddings ce
+                        JOIN content_chunks cc ON cc.id = ce.chunk_id
+                        LEFT JOIN media m ON m.id = cc.owner_id AND cc.owner_kind = 'media'
+                        JOIN content_index_states mcis ON mcis.owner_kind = cc.owner_kind
+                            AND mcis.owner_id = cc.owner_id
+                            AND mcis.status = 'ready'
+                            AND ce.embedding_provider = mcis.active_embedding_provider
+                            AND ce.embedding_model = mcis.active_embedding_model
+                        WHERE ce.embedding_provider = :query_embedding_provider
+                          AND ce.embedding_model = :query_embedding_model
+                          AND ce.embedding_dimensions = :embedding_dims
+                          AND ce.embedding_vector IS NOT NULL
+                          AND btrim(cc.chunk_text) <> ''
+                          AND (
+                            (cc.owner_kind = 'media'
+                                AND cc.owner_id IN (SELECT media_id FROM visible_media))
+                            OR (cc.owner_kind = 'note_block' AND cc.owner_id IN (
+                                SELECT id FROM note_blocks WHERE user_id = :viewer_id))
+                          )
+                          {scope_filter}
+                        -- Distance alone keeps the HNSW index driving the scan (a
+                        -- second sort key would not); WITH TIES keeps every chunk
+                        -- tied at the cutoff so the chunk-id tiebreak below decides.
+                        ORDER BY ce.embedding_vector <=> CAST(
+                            :query_embedding AS vector({embedding_dims})
+                        )
+                        FETCH FIRST (:limit) ROWS WITH TIES
+                    )
+                -- Relaxed-order iterative scans may return near-ties out of order.
+                SELECT *
+                FROM nearest
+                ORDER BY semantic_score DESC, content_chunk_id ASC
                 LIMIT :limit
                 """
             ),
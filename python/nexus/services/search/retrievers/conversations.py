@@ -116,10 +116,7 @@ def _search_conversations(
             SELECT
                 c.id,
                 c.title,
-                ts_rank_cd(
-                    to_tsvector('english', COALESCE(c.title, '')),
-                    websearch_to_tsquery('english', :query)
-                ) AS score,
+                ts_rank_cd(c.title_tsv, websearch_to_tsquery('english', :query)) AS score,
                 ts_headline(
                     'english',
                     COALESCE(c.title, ''),
@@ -128,8 +125,7 @@ def _search_conversations(
                 ) AS snippet
             FROM conversations c
             JOIN visible_conversations vc ON vc.conversation_id = c.id
-            WHERE to_tsvector('english', COALESCE(c.title, ''))
-                  @@ websearch_to_tsquery('english', :query)
+            WHERE c.title_tsv @@ websearch_to_tsquery('english', :query)
               {scope_filter}
             ORDER BY score DESC, c.id ASC
             LIMIT :limit
@@ -175,10 +171,7 @@ def _search_conversation_artifacts(
             SELECT
                 a.subject_id AS conversation_id,
                 r.id AS revision_id,
-                ts_rank_cd(
-                    to_tsvector('english', COALESCE(r.content_text, '')),
-                    websearch_to_tsquery('english', :query)
-                ) AS score,
+                ts_rank_cd(r.content_text_tsv, websearch_to_tsquery('english', :query)) AS score,
                 ts_headline(
                     'english',
                     COALESCE(r.content_text, ''),
@@ -192,8 +185,7 @@ def _search_conversation_artifacts(
               AND a.audience_scheme = 'user'
               AND a.audience_id = c.owner_user_id::text
               AND c.owner_user_id = :viewer_id
-              AND to_tsvector('english', COALESCE(r.content_text, ''))
-                  @@ websearch_to_tsquery('english', :query)
+              AND r.content_text_tsv @@ websearch_to_tsquery('english', :query)
               {_artifact_scope_filter(scope_filter)}
             ORDER BY score DESC, r.id ASC
             LIMIT :limit
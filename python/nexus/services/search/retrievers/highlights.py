@@ -67,13 +67,7 @@ def _search_highlights(
                 f.t_end_ms,
                 hpa.page_number,
                 pdf_quads.quads,
-                ts_rank_cd(
-                    to_tsvector(
-                        'english',
-                        concat_ws(' ', h.exact, COALESCE(h.prefix, ''), COALESCE(h.suffix, ''))
-                    ),
-                    websearch_to_tsquery('english', :query)
-                ) AS score,
+                ts_rank_cd(h.search_tsv, websearch_to_tsquery('english', :query)) AS score,
                 ts_headline(
                     'english',
                     concat_ws(' ', h.exact, COALESCE(h.prefix, ''), COALESCE(h.suffix, '')),
@@ -103,10 +97,7 @@ def _search_highlights(
                 AND mcis.owner_id = h.anchor_media_id
                 AND mcis.status = 'ready'
             LEFT JOIN media_contributor_credits mcc ON mcc.media_id = m.id
-            WHERE to_tsvector(
-                    'english',
-                    concat_ws(' ', h.exact, COALESCE(h.prefix, ''), COALESCE(h.suffix, ''))
-                ) @@ websearch_to_tsquery('english', :query)
+            WHERE h.search_tsv @@ websearch_to_tsquery('english', :query)
               AND h.anchor_media_id IS NOT NULL
               AND (
                     (
@@ -34,6 +34,7 @@ from nexus.services.search.results import (
 )
 from nexus.services.search.scope import ScopeUnsupported, scope_filter_sql
 from nexus.services.search.sql import (
+    apply_ann_search_settings,
     contributor_credits_rollup_cte_sql,
     hybrid_content_chunk_tail_sql,
     query_embedding_cte_sql,
@@ -104,6 +105,7 @@ def _search_content_chunks(
     params.update(scope_params)
 
     if semantic_query_embedding is not None:
+        apply_ann_search_settings(db)
         leading_ctes = f"""visible_media AS ({visible_media_ids_cte_sql()}),
                 media_contributor_credits AS ({contributor_credits_rollup_cte_sql("media_id")}),
                 {query_embedding_cte_sql(embedding_dims)},
@@ -314,10 +316,7 @@ def _search_fragments(
                 m.title,
                 m.published_date,
                 mcc.contributor_credits,
-                ts_rank_cd(
-                    to_tsvector('english', f.canonical_text),
-                    websearch_to_tsquery('english', :query)
-                ) AS score,
+                ts_rank_cd(f.canonical_text_tsv, websearch_to_tsquery('english', :query)) AS score,
                 ts_headline(
                     'english',
                     f.canonical_text,
@@ -339,7 +338,7 @@ def _search_fragments(
                 AND mcis.owner_id = f.media_id
                 AND mcis.status = 'ready'
             LEFT JOIN media_contributor_credits mcc ON mcc.media_id = m.id
-            WHERE to_tsvector('english', f.canonical_text) @@ websearch_to_tsquery('english', :query)
+            WHERE f.canonical_text_tsv @@ websearch_to_tsquery('english', :query)
             {scope_filter}
             ORDER BY score DESC, f.idx ASC, f.id ASC
             LIMIT :limit
@@ -408,10 +407,7 @@ def _search_evidence_spans(
                 m.title,
                 m.published_date,
                 mcc.contributor_credits,
-                ts_rank_cd(
-                    to_tsvector('english', es.span_text),
-                    websearch_to_tsquery('english', :query)
-                ) AS score,
+                ts_rank_cd(es.span_text_tsv, websearch_to_tsquery('english', :query)) AS score,
                 ts_headline(
                     'english',
                     es.span_text,
@@ -425,8 +421,7 @@ def _search_evidence_spans(
                 AND mcis.owner_id = es.owner_id
                 AND mcis.status = 'ready'
             LEFT JOIN media_contributor_credits mcc ON mcc.media_id = m.id
-            WHERE to_tsvector('english', es.span_text)
-                  @@ websearch_to_tsquery('english', :query)
+            WHERE es.span_text_tsv @@ websearch_to_tsquery('english', :query)
               {scope_filter}
             ORDER BY score DESC, es.id ASC
             LIMIT :limit
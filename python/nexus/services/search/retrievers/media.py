@@ -22,6 +22,12 @@ from nexus.services.search.results import (
 from nexus.services.search.scope import ScopeUnsupported, scope_filter_sql
 from nexus.services.search.sql import contributor_credits_rollup_cte_sql
 
+# Stored title/description(/publisher) vectors plus the trigger-maintained
+# contributor vector (0219). The expressions match the GIN expression indexes
+# ix_media_search_document / ix_podcasts_search_document exactly.
+_MEDIA_SEARCH_TSV = "(m.search_tsv || m.contributor_search_tsv)"
+_PODCAST_SEARCH_TSV = "(p.search_tsv || p.contributor_search_tsv)"
+
 
 def _search_media(
     db: Session,
@@ -78,16 +84,7 @@ def _search_media(
             m.published_date,
             mcc.contributor_credits,
             CASE WHEN :has_query THEN ts_rank_cd(
-                to_tsvector(
-                    'english',
-                    concat_ws(
-                        ' ',
-                        m.title,
-                        COALESCE(m.description, ''),
-                        COALESCE(m.publisher, ''),
-                        COALESCE(mcc.contributor_search_text, '')
-                    )
-                ),
+                {_MEDIA_SEARCH_TSV},
                 websearch_to_tsquery('english', :query)
             ) ELSE 0.0 END AS score,
             CASE WHEN :has_query THEN ts_headline('english',
@@ -104,16 +101,8 @@ def _search_media(
         FROM media m
         JOIN visible_media vm ON vm.media_id = m.id
         LEFT JOIN media_contributor_credits mcc ON mcc.media_id = m.id
-        WHERE (:has_query IS FALSE OR to_tsvector(
-                'english',
-                concat_ws(
-                    ' ',
-                    m.title,
-                    COALESCE(m.description, ''),
-                    COALESCE(m.publisher, ''),
-                    COALESCE(mcc.contributor_search_text, '')
-                )
-            ) @@ websearch_to_tsquery('english', :query))
+        WHERE (:has_query IS FALSE
+            OR {_MEDIA_SEARCH_TSV} @@ websearch_to_tsquery('english', :query))
         {scope_filter}
         {content_kind_filter}
         {contributor_credit_filter}
@@ -182,15 +171,7 @@ def _search_podcasts(
             p.title,
             pcc.contributor_credits,
             CASE WHEN :has_query THEN ts_rank_cd(
-                to_tsvector(
-                    'english',
-                    concat_ws(
-                        ' ',
-                        p.title,
-                        COALESCE(p.description, ''),
-                        COALESCE(pcc.contributor_search_text, '')
-                    )
-                ),
+                {_PODCAST_SEARCH_TSV},
                 websearch_to_tsquery('english', :query)
             ) ELSE 0.0 END AS score,
             CASE WHEN :has_query THEN ts_headline(
@@ -207,15 +188,8 @@ def _search_podcasts(
         FROM podcasts p
         JOIN visible_podcasts vp ON vp.podcast_id = p.id
         LEFT JOIN podcast_contributor_credits pcc ON pcc.podcast_id = p.id
-        WHERE (:has_query IS FALSE OR to_tsvector(
-                'english',
-                concat_ws(
-                    ' ',
-                    p.title,
-                    COALESCE(p.description, ''),
-                    COALESCE(pcc.contributor_search_text, '')
-                )
-            ) @@ websearch_to_tsquery('english', :query))
+        WHERE (:has_query IS FALSE
+            OR {_PODCAST_SEARCH_TSV} @@ websearch_to_tsquery('english', :query))
         {scope_filter}
         {contributor_credit_filter}
         ORDER BY score DESC, p.id ASC
@@ -29,6 +29,7 @@ from nexus.services.search.results import (
 )
 from nexus.services.search.scope import ScopeUnsupported, scope_filter_sql
 from nexus.services.search.sql import (
+    apply_ann_search_settings,
     hybrid_content_chunk_tail_sql,
     query_embedding_cte_sql,
 )
@@ -197,6 +198,7 @@ def _search_note_chunks(
         )
     """
     if semantic_query_embedding is not None:
+        apply_ann_search_settings(db)
         embedding_model, query_embedding = semantic_query_embedding
         params["query_embedding"] = to_pgvector_literal(query_embedding)
         params["query_embedding_provider"] = transcript_embedding_provider_for_model(
@@ -52,10 +52,7 @@ def _search_reader_apparatus_items(
                             m.title,
                             m.published_date,
                             mcc.contributor_credits,
-                            to_tsvector(
-                                'english',
-                                concat_ws(' ', rai.label, rai.kind, rai.body_text)
-                            ) AS text_tsv
+                            rai.search_tsv AS text_tsv
                         FROM reader_apparatus_items rai
                         JOIN reader_apparatus_states ras ON ras.id = rai.state_id
                         JOIN media m ON m.id = rai.media_id
@@ -88,8 +88,11 @@ def _lexical_params(viewer_id: UUID, q: str, limit: int) -> dict[str, Any]:
     }
 
 
-def _tier_score_sql(title_sql: str, blob_sql: str) -> str:
-    """Exact/prefix/substring tiers on the title plus an FTS bonus over the blob."""
+def _tier_score_sql(title_sql: str, blob_sql: str, tsv_sql: str | None = None) -> str:
+    """Exact/prefix/substring tiers on the title plus an FTS bonus over the blob.
+
+    ``tsv_sql`` names a stored tsvector of the blob when the source has one.
+    """
     return f"""(
         CASE
             WHEN lower({title_sql}) = lower(:query) THEN 4.0
@@ -98,16 +101,17 @@ def _tier_score_sql(title_sql: str, blob_sql: str) -> str:
             ELSE 0.0
         END
         + ts_rank_cd(
-            to_tsvector('english', {blob_sql}),
+            {tsv_sql or f"to_tsvector('english', {blob_sql})"},
             websearch_to_tsquery('english', :query)
         ) * 2.0
     )"""
 
 
-def _lexical_match_sql(blob_sql: str) -> str:
+def _lexical_match_sql(blob_sql: str, tsv_sql: str | None = None) -> str:
     return f"""(
         {blob_sql} ILIKE :contains_pattern
-        OR to_tsvector('english', {blob_sql}) @@ websearch_to_tsquery('english', :query)
+        OR {tsv_sql or f"to_tsvector('english', {blob_sql})"}
+            @@ websearch_to_tsquery('english', :query)
     )"""
 
 
@@ -210,7 +214,7 @@ def retrieve_library_artifact_candidates(
                 a.subject_id AS library_id,
                 {_LIBRARY_DISPLAY_NAME_SQL} AS library_name,
                 r.content_text,
-                {_tier_score_sql(_LIBRARY_DISPLAY_NAME_SQL, "r.content_text")} AS score
+                {_tier_score_sql(_LIBRARY_DISPLAY_NAME_SQL, "r.content_text", "r.content_text_tsv")} AS score
             FROM artifacts a
             JOIN libraries l ON l.id = a.subject_id
             JOIN memberships mem ON mem.library_id = l.id AND mem.user_id = :viewer_id
@@ -218,7 +222,7 @@ def retrieve_library_artifact_candidates(
             WHERE a.subject_scheme = 'library'
               AND a.audience_scheme = 'library'
               AND a.audience_id = a.subject_id::text
-              AND {_lexical_match_sql("r.content_text")}
+              AND {_lexical_match_sql("r.content_text", "r.content_text_tsv")}
             ORDER BY score DESC, a.id ASC
             LIMIT :limit
             """
@@ -294,7 +298,7 @@ def reference_metadata_candidate_sql_parts(
             f"""
             (
                 SELECT 'artifact'::text AS result_type, a.id,
-                       {_tier_score_sql(_LIBRARY_DISPLAY_NAME_SQL, "r.content_text")} AS score,
+                       {_tier_score_sql(_LIBRARY_DISPLAY_NAME_SQL, "r.content_text", "r.content_text_tsv")} AS score,
                        jsonb_build_object(
                            'library_id', a.subject_id,
                            'library_name', {_LIBRARY_DISPLAY_NAME_SQL},
@@ -308,7 +312,7 @@ def reference_metadata_candidate_sql_parts(
                 WHERE a.subject_scheme = 'library'
                   AND a.audience_scheme = 'library'
                   AND a.audience_id = a.subject_id::text
-                  AND {_lexical_match_sql("r.content_text")}
+                  AND {_lexical_match_sql("r.content_text", "r.content_text_tsv")}
                 ORDER BY score DESC, a.id ASC
                 LIMIT :limit
             )
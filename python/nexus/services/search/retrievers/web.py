@@ -82,7 +82,8 @@ def _search_web_results(
                             mr.result_ref->>'display_url',
                             mr.result_ref->>'source_name',
                             mr.result_ref->>'snippet'
-                        ) AS search_text
+                        ) AS search_text,
+                        mr.search_tsv
                     FROM message_retrievals mr
                     JOIN message_tool_calls mtc ON mtc.id = mr.tool_call_id
                     JOIN visible_conversations vc ON vc.conversation_id = mtc.conversation_id
@@ -116,10 +117,7 @@ def _search_web_results(
                 locator,
                 selected,
                 raw_result_ref,
-                ts_rank_cd(
-                    to_tsvector('english', search_text),
-                    websearch_to_tsquery('english', :query)
-                ) AS score,
+                ts_rank_cd(search_tsv, websearch_to_tsquery('english', :query)) AS score,
                 ts_headline(
                     'english',
                     search_text,
@@ -127,8 +125,7 @@ def _search_web_results(
                     'MaxWords=50, MinWords=10, MaxFragments=1'
                 ) AS snippet
             FROM web_rows
-            WHERE to_tsvector('english', search_text)
-                  @@ websearch_to_tsquery('english', :query)
+            WHERE search_tsv @@ websearch_to_tsquery('english', :query)
               AND url IS NOT NULL
             ORDER BY score DESC, id ASC
             LIMIT :limit
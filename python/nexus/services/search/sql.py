@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from nexus.config import get_settings
+
 # Re-exported so the many search retrievers keep importing the credit rollup from
 # this shared-fragments module, while the sole raw ``contributor_credits`` read
 # lives in the canonical credit read owner (spec §3; S9 single-owner sweep).
@@ -33,6 +38,85 @@ def query_embedding_cte_sql(embedding_dims: int) -> str:
                 )"""
 
 
+def apply_ann_search_settings(db: Session) -> None:
+    """Set the HNSW search knobs for the rest of the current transaction.
+
+    Call before a query whose ANN candidates come from
+    ``ix_content_embeddings_vector_hnsw``. ``hnsw.ef_search`` trades recall for
+    latency; ``hnsw.iterative_scan`` lets a filtered scan keep walking the graph
+    until ``LIMIT`` rows pass the viewer and scope filters instead of returning
+    short. Both are transaction-local, so pooled connections are not affected.
+
+    pgvector rejects a ``hnsw.*`` name it does not define ("invalid
+    configuration parameter name"), so each knob is set only when the
+    installed extension has it: ``ef_search`` from 0.5.0, ``iterative_scan``
+    from 0.8.0.
+    """
+    version = _pgvector_version(db)
+    if version < (0, 5):
+        return
+    settings = get_settings()
+    params = {"ef_search": str(settings.search_hnsw_ef_search)}
+    assignments = ["set_config('hnsw.ef_search', :ef_search, true)"]
+    if version >= (0, 8):
+        params["iterative_scan"] = settings.search_hnsw_iterative_scan
+        assignments.append("set_config('hnsw.iterative_scan', :iterative_scan, true)")
+    db.execute(text(f"SELECT {', '.join(assignments)}"), params)
+
+
+_pgvector_versions: dict[object, tuple[int, ...]] = {}
+
+
+def _pgvector_version(db: Session) -> tuple[int, ...]:
+    """The installed pgvector version, read once per engine (``()`` when absent)."""
+    bind = db.get_bind()
+    engine = getattr(bind, "engine", bind)
+    version = _pgvector_versions.get(engine)
+    if version is None:
+        extversion = db.execute(
+            text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+        ).scalar_one_or_none()
+        version = tuple(int(part) for part in str(extversion or "").split(".") if part.isdigit())
+        _pgvector_versions[engine] = version
+    return version
+
+
+def _semantic_candidates_sql(embedding_dims: int) -> str:
+    """ANN candidate ids for the hybrid tail, optionally via the halfvec stage."""
+    eligible = f"""
+                    FROM content_embeddings ce
+                    WHERE ce.embedding_provider = :query_embedding_provider
+                      AND ce.embedding_model = :query_embedding_model
+                      AND ce.embedding_dimensions = {embedding_dims}
+                      AND EXISTS (
+                        SELECT 1
+                        FROM eligible_chunks ec
+                        WHERE ec.id = ce.chunk_id
+                          AND ec.active_embedding_provider = ce.embedding_provider
+                          AND ec.active_embedding_model = ce.embedding_model
+                      )"""
+    exact_distance = f"embedding_vector <=> CAST(:query_embedding AS vector({embedding_dims}))"
+    settings = get_settings()
+    if not settings.search_quantized_candidates:
+        return f"""
+                    SELECT ce.chunk_id AS id{eligible}
+                    ORDER BY ce.{exact_distance}
+                    FETCH FIRST (:ann_limit) ROWS WITH TIES"""
+    # Over-fetch on the 16-bit index, then keep the best by exact cosine.
+    return f"""
+                    SELECT quantized.id
+                    FROM (
+                        SELECT ce.chunk_id AS id, ce.embedding_vector{eligible}
+                        ORDER BY
+                            ce.embedding_halfvec
+                            <=> CAST(:query_embedding AS halfvec({embedding_dims}))
+                        FETCH FIRST (:ann_limit * {int(settings.search_quantized_rerank_factor)})
+                            ROWS WITH TIES
+                    ) quantized
+                    ORDER BY quantized.{exact_distance}, quantized.id ASC
+                    LIMIT :ann_limit"""
+
+
 def hybrid_content_chunk_tail_sql(
     *,
     leading_ctes: str,
@@ -59,6 +143,17 @@ def hybrid_content_chunk_tail_sql(
     columns, the `id` column to break ties on, and whether to apply the recency-decay term
     (True for documents, False for notes).
 
+    `semantic_candidates` scans `content_embeddings` ordered by distance to the bound
+    query vector alone, so the HNSW index drives it and `eligible_chunks` is applied as a
+    filter; callers run `apply_ann_search_settings` first. Candidate order is not part of
+    the contract (candidates are re-scored below), which is what permits relaxed-order
+    iterative scans. Candidates tied at the cutoff are all kept (`WITH TIES`; a chunk-id
+    sort key would stop the index from driving the scan), so the set does not depend on
+    which of equally distant chunks the scan reached first. With
+    `SEARCH_QUANTIZED_CANDIDATES` the scan runs over the halfvec index instead and
+    over-fetches, and the candidates kept are the best by exact cosine over the full
+    vectors, ties broken by chunk id.
+
     `leading_ctes`, `scored_passthrough_columns`, `final_select_columns`, and `order_by_id`
     are caller-owned fixed internal SQL literals (never user input), so interpolating them is
     safe — mirroring contributor_credits_rollup_cte_sql. `embedding_dims` is a fixed integer.
@@ -67,18 +162,7 @@ def hybrid_content_chunk_tail_sql(
     return f"""
             WITH
                 {leading_ctes},
-                semantic_candidates AS (
-                    SELECT ec.id
-                    FROM eligible_chunks ec
-                    JOIN content_embeddings ce ON ce.chunk_id = ec.id
-                        AND ce.embedding_provider = ec.active_embedding_provider
-                        AND ce.embedding_model = ec.active_embedding_model
-                        AND ce.embedding_dimensions = {embedding_dims}
-                    JOIN query_embedding qe ON true
-                    WHERE ec.active_embedding_provider = :query_embedding_provider
-                      AND ec.active_embedding_model = :query_embedding_model
-                    ORDER BY ce.embedding_vector <=> qe.embedding ASC, ec.id ASC
-                    LIMIT :ann_limit
+                semantic_candidates AS ({_semantic_candidates_sql(embedding_dims)}
                 ),
                 lexical_candidates AS (
                     SELECT ec.id
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import math
 import re
+import time
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
@@ -14,6 +15,7 @@ from provider_runtime import EmbeddingCall, Present, ProviderRuntime
 from nexus.config import get_settings
 from nexus.errors import ApiError, ApiErrorCode
 from nexus.logging import get_logger
+from nexus.metrics import EMBEDDING_BATCH_SIZE, EMBEDDING_CALL_SECONDS
 from nexus.services.llm_credentials import embedding_credential
 
 logger = get_logger(__name__)
@@ -311,7 +313,10 @@ async def _embed_with_openai_async(texts: list[str], *, dimensions: int) -> list
                 inputs=tuple(batch),
                 dimensions=Present(dimensions),
             )
+            started = time.monotonic()
             response = await runtime.embed(call, credential=credential)
+            EMBEDDING_CALL_SECONDS.observe(time.monotonic() - started, call.model)
+            EMBEDDING_BATCH_SIZE.observe(len(batch), call.model)
             vectors.extend(
                 _validate_embedding_vectors(
                     response.embeddings,
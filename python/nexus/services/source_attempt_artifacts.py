@@ -7,6 +7,13 @@ from typing import Any
 
 _DERIVED_ARTIFACT_PAYLOAD_KEYS = frozenset({"arxiv_source_package"})
 
+# What ``str.strip()`` removes, as a Postgres escape-string literal for ``btrim``.
+# Postgres has no ``\v`` escape (it reads as a literal ``v``), so every character
+# is spelled as a ``\uXXXX`` escape. U+3000 is the highest ``isspace`` code point.
+_STRIP_CHARS_SQL = "E'{}'".format(
+    "".join(f"\\u{code:04X}" for code in range(0x3001) if chr(code).isspace())
+)
+
 
 def source_attempt_storage_paths(source_payload: Mapping[str, Any] | None) -> list[str]:
     """Return storage objects owned or referenced by a source-attempt payload."""
@@ -23,6 +30,22 @@ def source_attempt_storage_paths(source_payload: Mapping[str, Any] | None) -> li
     return storage_paths
 
 
+def source_attempt_storage_paths_sql(payload_expr: str) -> str:
+    """Text-SQL twin of :func:`source_attempt_storage_paths`: a ``text[]`` of the
+    payload's storage paths (non-string and blank values are NULL elements)."""
+    values = [f"{payload_expr} -> 'storage_path'", f"{payload_expr} -> 'source_storage_path'"]
+    values.extend(
+        f"{payload_expr} -> '{key}' -> 'storage_path'"
+        for key in sorted(_DERIVED_ARTIFACT_PAYLOAD_KEYS)
+    )
+    elements = ", ".join(
+        f"CASE WHEN jsonb_typeof({value}) = 'string' "
+        f"THEN NULLIF(btrim({value} #>> '{{}}', {_STRIP_CHARS_SQL}), '') END"
+        for value in values
+    )
+    return f"ARRAY[{elements}]"
+
+
 def clone_source_payload_for_new_attempt(
     source_payload: Mapping[str, Any] | None,
 ) -> dict[str, Any]:
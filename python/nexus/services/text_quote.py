@@ -15,9 +15,15 @@ guesses a wrong anchor (amanuensis D-4).
 
 from __future__ import annotations
 
+import re
 import unicodedata
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
+from threading import Lock
 from uuid import UUID
 
 from sqlalchemy import select
@@ -117,38 +123,54 @@ def _find_all_occurrences(text: str, needle: str) -> list[int]:
 
 @dataclass(frozen=True, slots=True)
 class NormalizedText:
-    """Whitespace-collapsed NFC text with per-char raw spans.
-
-    ``spans[i]`` is the ``[start, end)`` codepoint span in the NFC source that
-    normalized char ``i`` came from (a collapsed whitespace run maps to one
-    U+0020). Owner texts (fragment canonical_text, media plain_text, note
-    body_text) are produced NFC, so NFC here is a no-op and raw spans index the
-    stored text directly.
+    """Whitespace-collapsed NFC text with a compact map back to raw offsets.
+
+    Every whitespace run becomes one U+0020, so normalized and raw offsets only
+    drift at runs longer than one char. ``collapse_at[k]`` is the normalized
+    index of the k-th such run and ``removed[k]`` the raw chars dropped through
+    it; ``raw_offset`` bisects these instead of keeping a span per char. Owner
+    texts (fragment canonical_text, media plain_text, note body_text) are
+    produced NFC, so NFC here is a no-op and raw offsets index the stored text
+    directly.
     """
 
     text: str
-    spans: tuple[tuple[int, int], ...]
+    collapse_at: array[int]
+    removed: array[int]
+
+    def raw_offset(self, index: int) -> int:
+        """Raw codepoint boundary for normalized boundary ``index``.
+
+        A collapsed run ends where its successor starts, so one lookup serves
+        both a hit's start and its exclusive end.
+        """
+        runs_before = bisect_left(self.collapse_at, index)
+        return index + (self.removed[runs_before - 1] if runs_before else 0)
+
+
+_WHITESPACE_RUN = re.compile(r"\s+")
 
 
 def normalize_for_match(text: str) -> NormalizedText:
     nfc = unicodedata.normalize("NFC", text)
-    chars: list[str] = []
-    spans: list[tuple[int, int]] = []
-    i = 0
-    length = len(nfc)
-    while i < length:
-        if nfc[i].isspace():
-            j = i
-            while j < length and nfc[j].isspace():
-                j += 1
-            chars.append(" ")
-            spans.append((i, j))
-            i = j
-        else:
-            chars.append(nfc[i])
-            spans.append((i, i + 1))
-            i += 1
-    return NormalizedText(text="".join(chars), spans=tuple(spans))
+    parts: list[str] = []
+    collapse_at = array("q")
+    removed = array("q")
+    dropped = 0
+    cursor = 0
+    for run in _WHITESPACE_RUN.finditer(nfc):
+        start, end = run.span()
+        parts.append(nfc[cursor:start])
+        parts.append(" ")
+        if end - start > 1:
+            collapse_at.append(start - dropped)
+            dropped += end - start - 1
+            removed.append(dropped)
+        cursor = end
+    if cursor == 0:
+        return NormalizedText(text=nfc, collapse_at=collapse_at, removed=removed)
+    parts.append(nfc[cursor:])
+    return NormalizedText(text="".join(parts), collapse_at=collapse_at, removed=removed)
 
 
 @dataclass(frozen=True, slots=True)
@@ -159,29 +181,41 @@ class QuoteCandidate:
     normalized_end: int
 
 
-def find_quote_candidates(
+def _context_matches(text: str, start: int, end: int, prefix: str, suffix: str) -> bool:
+    """Whether normalized context brackets ``text[start:end]``.
+
+    Normalized text never holds two adjacent spaces, so the trimmed seam is at
+    most one char each side; the comparison is done in place without copying
+    the text before or after the hit.
+    """
+    if prefix:
+        seam = start - 1 if start and text[start - 1] == " " else start
+        if not text.endswith(prefix, 0, seam):
+            return False
+    if suffix:
+        seam = end + 1 if end < len(text) and text[end] == " " else end
+        if not text.startswith(suffix, seam):
+            return False
+    return True
+
+
+def _candidates_at(
     normalized: NormalizedText,
+    positions: list[int],
     *,
     exact: str,
     prefix: str,
     suffix: str,
 ) -> list[QuoteCandidate]:
-    """Occurrences of a normalized quote, narrowed by normalized context.
-
-    ``exact``/``prefix``/``suffix`` must already be normalized (trimmed), so the
-    context comparison tolerates the single collapsed space at each seam.
-    """
     candidates: list[QuoteCandidate] = []
-    for start in _find_all_occurrences(normalized.text, exact):
+    for start in positions:
         end = start + len(exact)
-        if prefix and not normalized.text[:start].rstrip().endswith(prefix):
-            continue
-        if suffix and not normalized.text[end:].lstrip().startswith(suffix):
+        if not _context_matches(normalized.text, start, end, prefix, suffix):
             continue
         candidates.append(
             QuoteCandidate(
-                raw_start=normalized.spans[start][0],
-                raw_end=normalized.spans[end - 1][1],
+                raw_start=normalized.raw_offset(start),
+                raw_end=normalized.raw_offset(end),
                 normalized_start=start,
                 normalized_end=end,
             )
@@ -189,6 +223,27 @@ def find_quote_candidates(
     return candidates
 
 
+def find_quote_candidates(
+    normalized: NormalizedText,
+    *,
+    exact: str,
+    prefix: str,
+    suffix: str,
+) -> list[QuoteCandidate]:
+    """Occurrences of a normalized quote, narrowed by normalized context.
+
+    ``exact``/``prefix``/``suffix`` must already be normalized (trimmed), so the
+    context comparison tolerates the single collapsed space at each seam.
+    """
+    return _candidates_at(
+        normalized,
+        _find_all_occurrences(normalized.text, exact),
+        exact=exact,
+        prefix=prefix,
+        suffix=suffix,
+    )
+
+
 def context_window(normalized: NormalizedText, *, start: int, end: int) -> tuple[str, str]:
     """Nearest 64 normalized scalars each side, trimmed (shorter at boundaries)."""
     prefix = normalized.text[max(0, start - PREFIX_SUFFIX_WINDOW) : start].strip()
@@ -223,34 +278,155 @@ class NormalizedOwnerSource:
 
 # Request-scoped memo of one media's normalized fragment sources, keyed by
 # media_id. A read that resolves many quotes against the same owner threads one
-# of these so the O(fragments) fetch+normalize happens once, not per quote.
+# of these so even the fragment-set revision probe happens once, not per quote.
 MediaSourceCache = dict[UUID, list["NormalizedOwnerSource"]]
 
+# Rough in-memory budget for the process-wide cache, in normalized chars.
+NORMALIZED_SOURCE_CACHE_MAX_CHARS = 64 * 1024 * 1024
+
+FragmentSetRevision = tuple[UUID | None, UUID | None, int | None]
+
+
+def _sources_cost(sources: list[NormalizedOwnerSource]) -> int:
+    return sum(
+        len(source.normalized.text) + 16 * len(source.normalized.collapse_at) + 64
+        for source in sources
+    )
+
+
+class _NormalizedSourceCache:
+    """Process-wide LRU of normalized media sources, bounded by a char budget.
+
+    Keyed by (media_id, fragment-set revision). Fragments are immutable rows
+    and are only ever rewritten wholesale (delete + insert with fresh ids) or
+    appended, so the first and last fragment ids plus the last ``idx`` change
+    with every rewrite; a stale entry is never read again and ages out.
+    ``forget`` drops a media's entries early when this process rewrites it.
+    """
+
+    def __init__(self, max_chars: int = NORMALIZED_SOURCE_CACHE_MAX_CHARS) -> None:
+        self.max_chars = max_chars
+        self._entries: OrderedDict[
+            tuple[UUID, FragmentSetRevision], tuple[list[NormalizedOwnerSource], int]
+        ] = OrderedDict()
+        self._total_chars = 0
+        self._lock = Lock()
+
+    def get(
+        self, media_id: UUID, revision: FragmentSetRevision
+    ) -> list[NormalizedOwnerSource] | None:
+        key = (media_id, revision)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(
+        self,
+        media_id: UUID,
+        revision: FragmentSetRevision,
+        sources: list[NormalizedOwnerSource],
+    ) -> None:
+        cost = _sources_cost(sources)
+        if cost > self.max_chars:
+            return
+        key = (media_id, revision)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_chars -= previous[1]
+            while self._entries and self._total_chars + cost > self.max_chars:
+                _, (_, evicted_cost) = self._entries.popitem(last=False)
+                self._total_chars -= evicted_cost
+            self._entries[key] = (sources, cost)
+            self._total_chars += cost
+
+    def forget(self, media_id: UUID) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == media_id]:
+                self._total_chars -= self._entries.pop(key)[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_chars = 0
+
+
+_normalized_source_cache = _NormalizedSourceCache()
+
+
+def forget_normalized_media_sources(media_id: UUID) -> None:
+    """Drop this process's cached sources for a media whose fragments changed.
+
+    Correctness does not depend on this — the fragment-set revision already
+    moves — it only releases the stale entry's memory immediately.
+    """
+    _normalized_source_cache.forget(media_id)
+
+
+def _fragment_set_revision(db: Session, media_id: UUID) -> FragmentSetRevision:
+    """First/last fragment identity in one round trip of ``(media_id, idx)`` probes."""
+    in_media = Fragment.media_id == media_id
+    first_id = select(Fragment.id).where(in_media).order_by(Fragment.idx).limit(1)
+    last = (
+        select(Fragment.id, Fragment.idx).where(in_media).order_by(Fragment.idx.desc()).limit(1)
+    ).subquery()
+    row = db.execute(
+        select(
+            first_id.scalar_subquery(),
+            select(last.c.id).scalar_subquery(),
+            select(last.c.idx).scalar_subquery(),
+        )
+    ).one()
+    return (row[0], row[1], row[2])
+
 
 def load_normalized_media_sources(
     db: Session, *, media_id: UUID, cache: MediaSourceCache | None = None
 ) -> list[NormalizedOwnerSource]:
     """Fetch and normalize a media's fragments once for repeated quote matching.
 
-    When ``cache`` is supplied the fetch+normalize is memoized by ``media_id``,
-    so a caller resolving many quotes against the same owner (e.g. a reader
-    connections page of same-media passage anchors) reloads the document once.
+    Normalized sources are shared across requests through a process-wide LRU
+    keyed by the media's fragment-set revision, so a hot document costs two
+    index probes instead of a full fetch+normalize. When ``cache`` is supplied
+    the result is also memoized by ``media_id`` for the rest of the request.
+    The returned list is shared and must not be mutated.
     """
     if cache is not None and media_id in cache:
         return cache[media_id]
-    rows = db.execute(
-        select(Fragment.id, Fragment.canonical_text, Fragment.t_start_ms, Fragment.t_end_ms)
-        .where(Fragment.media_id == media_id)
-        .order_by(Fragment.idx)
-    ).all()
-    sources = [
-        NormalizedOwnerSource(row[0], row[2], row[3], normalize_for_match(row[1])) for row in rows
-    ]
+    revision = _fragment_set_revision(db, media_id)
+    sources = _normalized_source_cache.get(media_id, revision)
+    if sources is None:
+        rows = db.execute(
+            select(Fragment.id, Fragment.canonical_text, Fragment.t_start_ms, Fragment.t_end_ms)
+            .where(Fragment.media_id == media_id)
+            .order_by(Fragment.idx)
+        ).all()
+        sources = [
+            NormalizedOwnerSource(row[0], row[2], row[3], normalize_for_match(row[1]))
+            for row in rows
+        ]
+        # Only cache what the probe described: a rewrite committed between the
+        # two reads would otherwise be stored under the old revision.
+        loaded_ends = (sources[0].fragment_id, sources[-1].fragment_id) if sources else (None, None)
+        if loaded_ends == revision[:2]:
+            _normalized_source_cache.put(media_id, revision, sources)
     if cache is not None:
         cache[media_id] = sources
     return sources
 
 
+@dataclass(frozen=True, slots=True)
+class NormalizedQuote:
+    """A quote selector already in normalized (trimmed) form."""
+
+    exact: str
+    prefix: str = ""
+    suffix: str = ""
+
+
 def match_quote_in_sources(
     sources: list[NormalizedOwnerSource],
     *,
@@ -260,20 +436,74 @@ def match_quote_in_sources(
 ) -> OwnerQuoteMatch:
     """Match one normalized quote against pre-normalized owner sources.
 
-    The pure-matching half of ``resolve_owner_quote``: callers resolving many
-    quotes against the same owner (highlight cache repair) load the sources once
-    and call this per quote instead of re-fetching the whole document each time.
+    The pure-matching half of ``resolve_owner_quote``; see
+    ``match_quotes_in_sources`` for many quotes against one owner.
     """
-    if not exact:
-        return OwnerQuoteMatch(QuoteStatus.empty_exact, None, None, None, "", "", None, None)
+    return match_quotes_in_sources(sources, [NormalizedQuote(exact, prefix, suffix)])[0]
 
-    hits: list[tuple[NormalizedOwnerSource, QuoteCandidate]] = []
-    for source in sources:
-        for candidate in find_quote_candidates(
-            source.normalized, exact=exact, prefix=prefix, suffix=suffix
-        ):
-            hits.append((source, candidate))
 
+def match_quotes_in_sources(
+    sources: list[NormalizedOwnerSource],
+    quotes: Sequence[NormalizedQuote],
+) -> list[OwnerQuoteMatch]:
+    """Match many normalized quotes against pre-normalized owner sources.
+
+    The sources are joined once into one haystack and each distinct ``exact``
+    is scanned once across all of them, so a book of thousands of fragments
+    costs one C-speed ``str.find`` pass per distinct quote instead of one per
+    fragment. Occurrences are mapped back to their source by bisecting the
+    source starts and narrowed per quote by context; quotes sharing a passage
+    (the same sentence highlighted with different context, or re-resolved
+    repeatedly by cache repair) share the scan. Results are positional with
+    ``quotes``.
+    """
+    hits: list[list[tuple[NormalizedOwnerSource, QuoteCandidate]]] = [[] for _ in quotes]
+    by_exact: dict[str, list[int]] = {}
+    for index, quote in enumerate(quotes):
+        if quote.exact:
+            by_exact.setdefault(quote.exact, []).append(index)
+    if not by_exact or not sources:
+        return [_owner_match(quote, []) for quote in quotes]
+
+    # Normalized text holds no newline (every whitespace run is one U+0020), so
+    # no normalized exact can match across the separator.
+    source_starts: list[int] = []
+    offset = 0
+    for source in sources:
+        source_starts.append(offset)
+        offset += len(source.normalized.text) + 1
+    haystack = "\n".join(source.normalized.text for source in sources)
+
+    for exact, indexes in by_exact.items():
+        positions_by_source: dict[int, list[int]] = {}
+        for position in _find_all_occurrences(haystack, exact):
+            source_index = bisect_right(source_starts, position) - 1
+            positions_by_source.setdefault(source_index, []).append(
+                position - source_starts[source_index]
+            )
+        for source_index, positions in positions_by_source.items():
+            source = sources[source_index]
+            for index in indexes:
+                quote = quotes[index]
+                if len(hits[index]) > 1:
+                    continue
+                for candidate in _candidates_at(
+                    source.normalized,
+                    positions,
+                    exact=exact,
+                    prefix=quote.prefix,
+                    suffix=quote.suffix,
+                ):
+                    hits[index].append((source, candidate))
+
+    return [_owner_match(quote, quote_hits) for quote, quote_hits in zip(quotes, hits, strict=True)]
+
+
+def _owner_match(
+    quote: NormalizedQuote, hits: list[tuple[NormalizedOwnerSource, QuoteCandidate]]
+) -> OwnerQuoteMatch:
+    if not quote.exact:
+        return OwnerQuoteMatch(QuoteStatus.empty_exact, None, None, None, "", "", None, None)
     if len(hits) > 1:
         return OwnerQuoteMatch(QuoteStatus.ambiguous, None, None, None, "", "", None, None)
     if not hits:
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import html
-from collections.abc import Sequence
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, replace
 from datetime import datetime
+from itertools import batched
 from typing import Any
 from uuid import UUID
 
@@ -13,8 +14,13 @@ from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from nexus.coerce import coerce_non_negative_int
+from nexus.services.media_document_metrics import refresh_fragment_document_offsets
 from nexus.text import normalize_whitespace
 
+# Rows per unnest INSERT: a three-hour episode publishes in a handful of
+# statements while each bind stays a modest array.
+TRANSCRIPT_INSERT_BATCH_SIZE = 1000
+
 
 @dataclass(frozen=True)
 class TranscriptSegmentInput:
@@ -37,14 +43,36 @@ def canonicalize_transcript_segment_text(raw_value: Any) -> str:
 
 
 def normalize_transcript_segments(raw_segments: Any) -> Sequence[TranscriptSegmentInput]:
-    """Normalize and sort transcript segments with deterministic ordering."""
+    """Normalize and sort transcript segments with deterministic ordering.
+
+    Order is (t_start_ms, provider position). Providers emit chronological
+    segments, so the common case is one streaming pass that assigns
+    ``segment_idx`` as it goes; the first out-of-order start time falls back to
+    a stable sort of everything accepted.
+    """
     if not isinstance(raw_segments, list):
         return []
 
-    # (segment, original_idx) pairs: original_idx is a throwaway tie-break key for
-    # the stable sort below; it is not part of the persisted contract.
-    accepted: list[tuple[TranscriptSegmentInput, int]] = []
-    for original_idx, segment in enumerate(raw_segments):
+    accepted = _accepted_transcript_segments(raw_segments)
+    ordered: list[TranscriptSegmentInput] = []
+    for segment in accepted:
+        if ordered and segment.t_start_ms < ordered[-1].t_start_ms:
+            ordered.append(segment)
+            ordered.extend(accepted)
+            # sort() is stable, so equal start times keep provider order.
+            ordered.sort(key=lambda candidate: candidate.t_start_ms)
+            return [
+                replace(candidate, segment_idx=position)
+                for position, candidate in enumerate(ordered)
+            ]
+        ordered.append(segment)
+    return ordered
+
+
+def _accepted_transcript_segments(raw_segments: list[Any]) -> Iterator[TranscriptSegmentInput]:
+    """Yield valid segments in provider order, indexed by acceptance position."""
+    accepted_count = 0
+    for segment in raw_segments:
         if not isinstance(segment, dict):
             continue
 
@@ -64,43 +92,29 @@ def normalize_transcript_segments(raw_segments: Any) -> Sequence[TranscriptSegme
         if speaker_label == "":
             speaker_label = None
 
-        accepted.append(
-            (
-                TranscriptSegmentInput(
-                    segment_idx=0,  # assigned after sorting from final position
-                    t_start_ms=t_start_ms,
-                    t_end_ms=t_end_ms,
-                    canonical_text=text_value,
-                    speaker_label=speaker_label,
-                ),
-                original_idx,
-            )
+        yield TranscriptSegmentInput(
+            segment_idx=accepted_count,
+            t_start_ms=t_start_ms,
+            t_end_ms=t_end_ms,
+            canonical_text=text_value,
+            speaker_label=speaker_label,
         )
-
-    accepted.sort(key=lambda pair: (pair[0].t_start_ms, pair[1]))
-    return [
-        TranscriptSegmentInput(
-            segment_idx=position,
-            t_start_ms=segment.t_start_ms,
-            t_end_ms=segment.t_end_ms,
-            canonical_text=segment.canonical_text,
-            speaker_label=segment.speaker_label,
-        )
-        for position, (segment, _original_idx) in enumerate(accepted)
-    ]
+        accepted_count += 1
 
 
 def insert_transcript_fragments(
     db: Session,
     media_id: UUID,
-    transcript_segments: Sequence[TranscriptSegmentInput],
+    transcript_segments: Iterable[TranscriptSegmentInput],
     *,
     now: datetime,
 ) -> None:
-    """Persist transcript segments as ordered fragments."""
-    for idx, segment in enumerate(transcript_segments):
-        canonical_text = segment.canonical_text
-        html_sanitized = f"<p>{html.escape(canonical_text)}</p>"
+    """Persist transcript segments as ordered fragments with document offsets.
+
+    Rows go in as column arrays through ``unnest``, one statement per
+    ``TRANSCRIPT_INSERT_BATCH_SIZE`` segments instead of one per segment.
+    """
+    for idx_start, batch in _batches(transcript_segments):
         db.execute(
             text(
                 """
@@ -114,26 +128,86 @@ def insert_transcript_fragments(
                     speaker_label,
                     created_at
                 )
-                VALUES (
+                SELECT
                     :media_id,
-                    :idx,
-                    :canonical_text,
-                    :html_sanitized,
-                    :t_start_ms,
-                    :t_end_ms,
-                    :speaker_label,
+                    seg.idx,
+                    seg.canonical_text,
+                    seg.html_sanitized,
+                    seg.t_start_ms,
+                    seg.t_end_ms,
+                    seg.speaker_label,
                     :created_at
+                FROM unnest(
+                    CAST(:idxs AS integer[]),
+                    CAST(:canonical_texts AS text[]),
+                    CAST(:html_sanitized AS text[]),
+                    CAST(:t_start_ms AS integer[]),
+                    CAST(:t_end_ms AS integer[]),
+                    CAST(:speaker_labels AS text[])
+                ) AS seg(idx, canonical_text, html_sanitized, t_start_ms, t_end_ms, speaker_label)
+                """
+            ),
+            {
+                "media_id": media_id,
+                "idxs": list(range(idx_start, idx_start + len(batch))),
+                "canonical_texts": [segment.canonical_text for segment in batch],
+                "html_sanitized": [
+                    f"<p>{html.escape(segment.canonical_text)}</p>" for segment in batch
+                ],
+                "t_start_ms": [segment.t_start_ms for segment in batch],
+                "t_end_ms": [segment.t_end_ms for segment in batch],
+                "speaker_labels": [segment.speaker_label for segment in batch],
+                "created_at": now,
+            },
+        )
+    refresh_fragment_document_offsets(db, media_id)
+
+
+def insert_podcast_transcript_segments(
+    db: Session,
+    media_id: UUID,
+    transcript_segments: Iterable[TranscriptSegmentInput],
+    *,
+    now: datetime,
+) -> None:
+    """Persist the timed segment rows that mirror transcript fragments, in batches."""
+    for idx_start, batch in _batches(transcript_segments):
+        db.execute(
+            text(
+                """
+                INSERT INTO podcast_transcript_segments (
+                    media_id, segment_idx, canonical_text,
+                    t_start_ms, t_end_ms, speaker_label, created_at
                 )
+                SELECT
+                    :media_id, seg.segment_idx, seg.canonical_text,
+                    seg.t_start_ms, seg.t_end_ms, seg.speaker_label, :created_at
+                FROM unnest(
+                    CAST(:segment_idxs AS integer[]),
+                    CAST(:canonical_texts AS text[]),
+                    CAST(:t_start_ms AS integer[]),
+                    CAST(:t_end_ms AS integer[]),
+                    CAST(:speaker_labels AS text[])
+                ) AS seg(segment_idx, canonical_text, t_start_ms, t_end_ms, speaker_label)
                 """
             ),
             {
                 "media_id": media_id,
-                "idx": idx,
-                "canonical_text": canonical_text,
-                "html_sanitized": html_sanitized,
-                "t_start_ms": segment.t_start_ms,
-                "t_end_ms": segment.t_end_ms,
-                "speaker_label": segment.speaker_label,
+                "segment_idxs": list(range(idx_start, idx_start + len(batch))),
+                "canonical_texts": [segment.canonical_text for segment in batch],
+                "t_start_ms": [segment.t_start_ms for segment in batch],
+                "t_end_ms": [segment.t_end_ms for segment in batch],
+                "speaker_labels": [segment.speaker_label for segment in batch],
                 "created_at": now,
             },
         )
+
+
+def _batches(
+    transcript_segments: Iterable[TranscriptSegmentInput],
+) -> Iterator[tuple[int, tuple[TranscriptSegmentInput, ...]]]:
+    """Yield (first position, segments) chunks; positions number rows 0..n-1."""
+    idx_start = 0
+    for batch in batched(transcript_segments, TRANSCRIPT_INSERT_BATCH_SIZE):
+        yield idx_start, batch
+        idx_start += len(batch)
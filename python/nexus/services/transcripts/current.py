@@ -20,8 +20,10 @@ from nexus.errors import ApiErrorCode, NotFoundError
 from nexus.jobs.queue import enqueue_job
 from nexus.services.content_indexing import IndexOwner, deactivate_content_index
 from nexus.services.media_processing_state import mark_ready_for_reading_by_id
+from nexus.services.text_quote import forget_normalized_media_sources
 from nexus.services.transcript_segments import (
     TranscriptSegmentInput,
+    insert_podcast_transcript_segments,
     insert_transcript_fragments,
 )
 
@@ -130,6 +132,7 @@ def _publish_current_transcript_artifacts(
         {"media_id": media_id},
     )
     db.execute(text("DELETE FROM fragments WHERE media_id = :media_id"), {"media_id": media_id})
+    forget_normalized_media_sources(media_id)
 
     insert_transcript_fragments(
         db,
@@ -137,30 +140,12 @@ def _publish_current_transcript_artifacts(
         transcript_segments,
         now=now,
     )
-    for segment_idx, segment in enumerate(transcript_segments):
-        db.execute(
-            text(
-                """
-                INSERT INTO podcast_transcript_segments (
-                    media_id, segment_idx, canonical_text,
-                    t_start_ms, t_end_ms, speaker_label, created_at
-                )
-                VALUES (
-                    :media_id, :segment_idx, :canonical_text,
-                    :t_start_ms, :t_end_ms, :speaker_label, :created_at
-                )
-                """
-            ),
-            {
-                "media_id": media_id,
-                "segment_idx": segment_idx,
-                "canonical_text": segment.canonical_text,
-                "t_start_ms": segment.t_start_ms,
-                "t_end_ms": segment.t_end_ms,
-                "speaker_label": segment.speaker_label,
-                "created_at": now,
-            },
-        )
+    insert_podcast_transcript_segments(
+        db,
+        media_id,
+        transcript_segments,
+        now=now,
+    )
 
     deactivate_content_index(
         db, owner=IndexOwner("media", media_id), reason="transcript_replacement"
@@ -12,6 +12,7 @@ from nexus.services.content_indexing import IndexOwner, delete_content_index
 from nexus.services.document_embeds import (
     prepare_document_embed_artifacts_for_fragment_replacement,
 )
+from nexus.services.text_quote import forget_normalized_media_sources
 
 
 def delete_web_article_artifacts(
@@ -45,6 +46,7 @@ def delete_web_article_artifacts(
     # non-owning); the Highlight root survives and is resolved via LEFT JOIN
     # + quote re-resolution.
     db.execute(delete(Fragment).where(Fragment.media_id == media_id))
+    forget_normalized_media_sources(media_id)
     # Deliberately NOT credits/author memos: every caller of this helper is a
     # LIVE-media refresh/re-ingest (web re-ingest, source requeue, browser
     # re-capture, X thread/post refresh). Refresh keeps the prior author list
@@ -36,6 +36,7 @@ from nexus.services.document_embeds import (
 )
 from nexus.services.fragment_blocks import FragmentBlockSpec, insert_fragment_blocks
 from nexus.services.media_author_observation_seam import attach_author_observation
+from nexus.services.media_document_metrics import refresh_fragment_document_offsets
 from nexus.services.media_processing_state import mark_ready_for_reading
 from nexus.services.provider_events import record_external_provider_event
 from nexus.services.reader_apparatus import (
@@ -430,6 +431,7 @@ def _refresh_x_author_thread_media_for_viewer(
             for prepared_fragment in prepared_fragments:
                 db.add(prepared_fragment.fragment)
             db.flush()
+            refresh_fragment_document_offsets(db, media.id)
             for prepared_fragment in prepared_fragments:
                 insert_fragment_blocks(
                     db,
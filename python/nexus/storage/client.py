@@ -1,7 +1,7 @@
 """Cloudflare R2 storage client."""
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from typing import BinaryIO
@@ -126,6 +126,14 @@ class StorageClientBase(ABC):
         """Delete an object path."""
         ...
 
+    def delete_objects(self, paths: Sequence[str]) -> None:
+        """Delete many object paths; missing paths are not an error.
+
+        The default deletes one path at a time; clients with a batch API override it.
+        """
+        for path in paths:
+            self.delete_object(path)
+
     @abstractmethod
     def list_objects(
         self,
@@ -137,6 +145,10 @@ class StorageClientBase(ABC):
         ...
 
 
+# S3 DeleteObjects accepts at most 1000 keys per request.
+_DELETE_OBJECTS_BATCH_SIZE = 1000
+
+
 class StorageError(Exception):
     """Storage operation error."""
 
@@ -341,6 +353,24 @@ class StorageClient(StorageClientBase):
         except (BotoCoreError, ClientError) as exc:
             raise StorageError(f"Failed to delete object {path}") from exc
 
+    def delete_objects(self, paths: Sequence[str]) -> None:
+        for start in range(0, len(paths), _DELETE_OBJECTS_BATCH_SIZE):
+            batch = paths[start : start + _DELETE_OBJECTS_BATCH_SIZE]
+            try:
+                response = self._client.delete_objects(
+                    Bucket=self._bucket,
+                    Delete={"Objects": [{"Key": path} for path in batch], "Quiet": True},
+                )
+            except (BotoCoreError, ClientError) as exc:
+                raise StorageError(f"Failed to delete {len(batch)} objects") from exc
+            errors = response.get("Errors") or []
+            if errors:
+                first = errors[0]
+                raise StorageError(
+                    f"Failed to delete {len(errors)} of {len(batch)} objects; "
+                    f"first {first.get('Key')}: {first.get('Code')}"
+                )
+
     def list_objects(
         self,
         prefix: str,
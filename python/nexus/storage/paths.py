@@ -10,6 +10,7 @@ Path Invariants:
     - Upload staging: uploads/media/{media_id}/original.{ext}
     - EPUB asset: media/{media_id}/assets/{asset_key}
     - Oracle plate: oracle/plates/{slug}.{ext}
+    - Sampling profile: profiles/{jobs|requests}/{job_id|request_id}.collapsed
 
 Rules:
     - No leading slash
@@ -135,3 +136,17 @@ def build_oracle_plate_storage_path(slug: str, ext: str) -> str:
     if ext not in set(PLATE_CONTENT_TYPE_TO_EXT.values()):
         raise ValueError("oracle plate ext must be jpg|png|webp")
     return f"oracle/plates/{slug}.{ext}"
+
+
+def build_profile_storage_path(scope: str, key: str) -> str:
+    """Build the path for one sampling profile, keyed by job id or request id.
+
+    Keys use the request-id alphabet, so any id the request middleware accepts
+    (including a leading ``.``, ``_`` or ``-``) names a profile; the fixed
+    ``.collapsed`` suffix keeps every key a single path segment.
+    """
+    if scope not in ("jobs", "requests"):
+        raise ValueError("profile scope must be jobs|requests")
+    if not re.fullmatch(r"[A-Za-z0-9._-]{1,128}", key):
+        raise ValueError("profile key must be a job id or request id")
+    return f"profiles/{scope}/{key}.collapsed"
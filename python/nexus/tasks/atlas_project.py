@@ -1,7 +1,8 @@
 """Worker task: grand atlas projection.
 
 Two enqueue shapes flow into the one job kind:
-- on-demand (``payload["user_id"]``): project one user's corpus.
+- on-demand (``payload["user_id"]``): project one user's corpus, or with
+  ``payload["mode"] == "place"`` only place their unpositioned works.
 - periodic sweep (no user_id): project every user with library entries.
 No LLM — pure computation, a simple synchronous session pattern.
 """
@@ -15,7 +16,9 @@ from uuid import UUID
 from nexus.db.session import get_session_factory
 from nexus.logging import get_logger
 from nexus.services.atlas_projection import (
+    ATLAS_PROJECT_MODE_PLACE,
     list_projectable_user_ids,
+    run_placement,
     run_projection,
 )
 
@@ -31,10 +34,11 @@ def atlas_project(*, payload: Mapping[str, Any]) -> dict:
         with factory() as db:
             user_ids = list_projectable_user_ids(db)
 
+    place = raw_user_id is not None and payload.get("mode") == ATLAS_PROJECT_MODE_PLACE
     positioned = 0
     for user_id in user_ids:
         with factory() as db:
-            result = run_projection(db, user_id)
+            result = run_placement(db, user_id) if place else run_projection(db, user_id)
             db.commit()
         positioned += int(result["positioned"])
 
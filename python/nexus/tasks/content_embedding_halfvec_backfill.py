@@ -0,0 +1,100 @@
+"""Worker task: fill ``content_embeddings.embedding_halfvec`` for existing rows.
+
+New embeddings are written with both columns (content_indexing); this walks the
+rows that predate 0218 in id order, one batch per invocation, and reschedules
+itself with the id cursor in the payload. ``SKIP LOCKED`` keeps it off rows a
+reindex is rewriting, which the cursor then moves past, so a short batch only
+ends the pass: the job completes once no unfilled row remains, and otherwise
+starts another pass from the first id after ``_RESCAN_DELAY``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import text
+
+from nexus.db.session import get_session_factory
+from nexus.jobs.queue import JobExecutionContext, RescheduleRequested, get_job
+from nexus.logging import get_logger
+
+logger = get_logger(__name__)
+
+CONTENT_EMBEDDING_HALFVEC_BACKFILL_JOB_KIND = "content_embedding_halfvec_backfill_job"
+
+_BATCH_SIZE = 2000
+_RESCAN_DELAY = timedelta(seconds=60)
+
+
+def content_embedding_halfvec_backfill(
+    *, payload: Mapping[str, Any], context: JobExecutionContext
+) -> Mapping[str, Any] | RescheduleRequested | None:
+    session_factory = get_session_factory()
+    with session_factory() as db:
+        job = get_job(db, context.job_id)
+        if job is None:
+            # justify-defect: the worker just claimed this row; it cannot be gone.
+            raise RuntimeError("content_embedding_halfvec_backfill job row vanished after claim")
+        after_id = job.payload.get("afterId")
+        updated_ids = list(
+            db.execute(
+                text(
+                    """
+                    WITH batch AS (
+                        SELECT id
+                        FROM content_embeddings
+                        WHERE embedding_halfvec IS NULL
+                          AND embedding_vector IS NOT NULL
+                          AND (CAST(:after_id AS uuid) IS NULL OR id > CAST(:after_id AS uuid))
+                        ORDER BY id
+                        LIMIT :batch_size
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    UPDATE content_embeddings ce
+                    SET embedding_halfvec = CAST(ce.embedding_vector AS halfvec)
+                    FROM batch
+                    WHERE ce.id = batch.id
+                    RETURNING ce.id
+                    """
+                ),
+                {"after_id": after_id, "batch_size": _BATCH_SIZE},
+            ).scalars()
+        )
+        db.commit()
+        if len(updated_ids) == _BATCH_SIZE:
+            return RescheduleRequested(
+                available_at=datetime.now(UTC),
+                payload={**job.payload, "afterId": str(max(updated_ids))},
+            )
+        remaining = db.execute(
+            text(
+                """
+                SELECT EXISTS (
+                    SELECT 1
+                    FROM content_embeddings
+                    WHERE embedding_halfvec IS NULL
+                      AND embedding_vector IS NOT NULL
+                )
+                """
+            )
+        ).scalar_one()
+
+    if remaining:
+        # Rows locked during the pass were skipped behind the cursor.
+        logger.info(
+            "content_embedding_halfvec_backfill_rescan",
+            updated=len(updated_ids),
+            worker_id=context.worker_id,
+        )
+        return RescheduleRequested(
+            available_at=datetime.now(UTC) + _RESCAN_DELAY,
+            payload={key: value for key, value in job.payload.items() if key != "afterId"},
+        )
+    logger.info(
+        "content_embedding_halfvec_backfill_completed",
+        updated=len(updated_ids),
+        worker_id=context.worker_id,
+    )
+    return {"disposition": "BackfillComplete", "updated": len(updated_ids)}
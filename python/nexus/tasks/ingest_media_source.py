@@ -3,9 +3,10 @@
 from uuid import UUID
 
 from nexus.db.session import get_session_factory
-from nexus.jobs.queue import JobExecutionContext
+from nexus.jobs.queue import JobExecutionContext, RescheduleRequested
 from nexus.logging import get_logger
 from nexus.services.media_source_ingest import run_source_attempt
+from nexus.services.podcasts.transcription import TranscriptionAwaitingProvider
 
 logger = get_logger(__name__)
 
@@ -17,18 +18,30 @@ def ingest_media_source(
     request_id: str | None = None,
     *,
     context: JobExecutionContext,
-) -> dict[str, object]:
+) -> dict[str, object] | RescheduleRequested:
     media_uuid = UUID(media_id)
     attempt_uuid = UUID(attempt_id)
     actor_uuid = UUID(actor_user_id)
-    result = run_source_attempt(
-        session_factory=get_session_factory(),
-        media_id=media_uuid,
-        attempt_id=attempt_uuid,
-        actor_user_id=actor_uuid,
-        request_id=request_id,
-        context=context,
-    )
+    try:
+        result = run_source_attempt(
+            session_factory=get_session_factory(),
+            media_id=media_uuid,
+            attempt_id=attempt_uuid,
+            actor_user_id=actor_uuid,
+            request_id=request_id,
+            context=context,
+        )
+    except TranscriptionAwaitingProvider as exc:
+        # The provider holds the transcription; its callback wakes this job
+        # early, otherwise it re-checks at the poll cadence.
+        logger.info(
+            "ingest_media_source_awaiting_provider",
+            media_id=media_id,
+            attempt_id=attempt_id,
+            available_at=exc.available_at.isoformat(),
+            request_id=request_id,
+        )
+        return RescheduleRequested(available_at=exc.available_at)
     logger.info(
         "ingest_media_source_completed",
         media_id=media_id,
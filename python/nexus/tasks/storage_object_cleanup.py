@@ -22,7 +22,7 @@ promoted with the pre-claim CAS :func:`nexus.jobs.queue.update_unclaimed_job`.
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID
@@ -39,11 +39,15 @@ from nexus.jobs.queue import (
     enqueue_job,
     find_nonterminal_jobs_for_payload,
     get_job,
+    nonterminal_job_payload_values,
     update_running_job_payload,
     update_unclaimed_job,
 )
 from nexus.logging import get_logger
-from nexus.services.source_attempt_artifacts import source_attempt_storage_paths
+from nexus.services.source_attempt_artifacts import (
+    source_attempt_storage_paths,
+    source_attempt_storage_paths_sql,
+)
 from nexus.storage.client import StorageClientBase, get_storage_client
 
 logger = get_logger(__name__)
@@ -114,6 +118,58 @@ def path_has_live_db_owner(db: Session, storage_path: str) -> bool:
     return False
 
 
+def paths_with_live_db_owner(db: Session, storage_paths: Sequence[str]) -> set[str]:
+    """The subset of ``storage_paths`` a committed DB row still owns, in one query.
+
+    Set-based form of :func:`path_has_live_db_owner` over the same surfaces; the
+    source-attempt check reads only the attempts of the media each path names.
+    """
+    if not storage_paths:
+        return set()
+    media_ids = [_media_id_from_storage_path(path) for path in storage_paths]
+    return set(
+        db.execute(
+            text(
+                f"""
+                SELECT listed.path
+                FROM unnest(CAST(:paths AS text[]), CAST(:media_ids AS uuid[]))
+                    AS listed(path, media_id)
+                WHERE EXISTS (
+                        SELECT 1 FROM media_file mf WHERE mf.storage_path = listed.path
+                      )
+                   OR EXISTS (
+                        SELECT 1 FROM epub_resources er WHERE er.storage_path = listed.path
+                      )
+                   OR EXISTS (
+                        SELECT 1
+                        FROM media_source_attempts msa
+                        WHERE msa.media_id = listed.media_id
+                          AND listed.path = ANY(
+                              {source_attempt_storage_paths_sql("msa.source_payload")}
+                          )
+                      )
+                """
+            ),
+            {
+                "paths": list(storage_paths),
+                "media_ids": [
+                    None if media_id is None else str(media_id) for media_id in media_ids
+                ],
+            },
+        ).scalars()
+    )
+
+
+def paths_with_armed_writers(db: Session, storage_paths: Sequence[str]) -> set[str]:
+    """The subset of ``storage_paths`` with a nonterminal cleanup reservation."""
+    return nonterminal_job_payload_values(
+        db,
+        kind=STORAGE_OBJECT_CLEANUP_JOB_KIND,
+        payload_key="storagePath",
+        values=storage_paths,
+    )
+
+
 def _armed_writers_for_path(db: Session, storage_path: str) -> list:
     return find_nonterminal_jobs_for_payload(
         db,
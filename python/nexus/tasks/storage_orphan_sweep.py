@@ -5,7 +5,8 @@ objects whose write completed after a signed-URL expiry or an earlier delete. It
 durably pages the ``media/`` prefix via ``list_objects``, ignoring objects modified
 within ``storage_orphan_sweep_min_age_seconds`` (a write completing after one pass
 gets a fresh modified time and is caught by a later pass), and deletes only paths
-with no live DB owner and no Armed cleanup writer.
+with no live DB owner and no Armed cleanup writer. Ownership and writers are
+resolved for the whole page at once and the orphans go out in one batch delete.
 
 Recurrence + seeding: this uses the registry's periodic mechanism
 (``periodic_interval_seconds``) rather than the spec's self-chained successor. See
@@ -34,8 +35,8 @@ from nexus.jobs.queue import JobExecutionContext, RescheduleRequested, get_job
 from nexus.logging import get_logger
 from nexus.storage.client import get_storage_client
 from nexus.tasks.storage_object_cleanup import (
-    _armed_writers_for_path,
-    path_has_live_db_owner,
+    paths_with_armed_writers,
+    paths_with_live_db_owner,
 )
 
 logger = get_logger(__name__)
@@ -74,22 +75,21 @@ def storage_orphan_sweep(
         page = client.list_objects(_MEDIA_PREFIX, continuation_token=continuation_token)
 
         now = _now_utc(db)
-        deleted = 0
-        scanned = 0
+        scanned = len(page.objects)
+        candidates: list[str] = []
         for entry in page.objects:
-            scanned += 1
             last_modified = entry.last_modified
             if last_modified.tzinfo is None:
                 last_modified = last_modified.replace(tzinfo=UTC)
-            if now - last_modified < min_age:
-                continue
-            if path_has_live_db_owner(db, entry.path):
-                continue
-            if _armed_writers_for_path(db, entry.path):
-                continue
-            # No live owner and no Armed writer: an orphan. Delete idempotently.
-            client.delete_object(entry.path)
-            deleted += 1
+            if now - last_modified >= min_age:
+                candidates.append(entry.path)
+        # Ownership and Armed writers for the whole page, one query each.
+        owned = paths_with_live_db_owner(db, candidates)
+        armed = paths_with_armed_writers(db, [path for path in candidates if path not in owned])
+        # No live owner and no Armed writer: orphans. Delete idempotently.
+        orphans = [path for path in candidates if path not in owned and path not in armed]
+        client.delete_objects(orphans)
+        deleted = len(orphans)
 
         if deleted:
             logger.info(
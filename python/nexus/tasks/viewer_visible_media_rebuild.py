@@ -0,0 +1,140 @@
+"""Worker task: check ``viewer_visible_media`` against the readability rule.
+
+The 0221 triggers keep the table current; this is the consistency check behind
+them. Each invocation takes one batch of users in id order, diffs their rows
+against ``visible_media_ids_rule_sql`` evaluated for each of them, so drift is
+measured against the rule itself rather than another copy of it, and repairs
+every mismatch through ``viewer_visible_media_repair``, which holds the
+triggers' advisory locks and re-evaluates the pair with the rule function, so a
+repair never races a concurrent membership, grant, or teardown change. It
+reschedules itself with the user cursor until a short batch ends the walk.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import text
+
+from nexus.auth.permissions import visible_media_ids_rule_sql
+from nexus.db.session import get_session_factory
+from nexus.jobs.queue import JobExecutionContext, RescheduleRequested, get_job
+from nexus.logging import get_logger
+
+logger = get_logger(__name__)
+
+VIEWER_VISIBLE_MEDIA_REBUILD_JOB_KIND = "viewer_visible_media_rebuild_job"
+
+# Each user costs one evaluation of the rule over media.
+_USER_BATCH_SIZE = 50
+
+_MISMATCHES_SQL = f"""
+    WITH batch_users AS (
+        SELECT u.id AS user_id
+        FROM users u
+        WHERE CAST(:after_id AS uuid) IS NULL OR u.id > CAST(:after_id AS uuid)
+        ORDER BY u.id
+        LIMIT :batch_size
+    ),
+    expected AS (
+        SELECT bu.user_id, rule.media_id
+        FROM batch_users bu
+        CROSS JOIN LATERAL ({visible_media_ids_rule_sql("bu.user_id")}) rule
+    ),
+    actual AS (
+        SELECT vvm.user_id, vvm.media_id
+        FROM batch_users bu
+        JOIN viewer_visible_media vvm ON vvm.user_id = bu.user_id
+    ),
+    mismatches AS (
+        (SELECT user_id, media_id, 'missing' AS drift FROM expected
+         EXCEPT
+         SELECT user_id, media_id, 'missing' FROM actual)
+        UNION ALL
+        (SELECT user_id, media_id, 'extra' AS drift FROM actual
+         EXCEPT
+         SELECT user_id, media_id, 'extra' FROM expected)
+    )
+    SELECT
+        (SELECT count(*) FROM batch_users) AS batch_count,
+        (SELECT max(user_id::text) FROM batch_users) AS last_user_id,
+        COALESCE(
+            (
+                SELECT jsonb_agg(
+                    jsonb_build_object(
+                        'user_id', user_id, 'media_id', media_id, 'drift', drift
+                    )
+                )
+                FROM mismatches
+            ),
+            '[]'::jsonb
+        ) AS mismatches
+"""
+
+
+def viewer_visible_media_rebuild(
+    *, payload: Mapping[str, Any], context: JobExecutionContext
+) -> Mapping[str, Any] | RescheduleRequested | None:
+    session_factory = get_session_factory()
+    with session_factory() as db:
+        job = get_job(db, context.job_id)
+        if job is None:
+            # justify-defect: the worker just claimed this row; it cannot be gone.
+            raise RuntimeError("viewer_visible_media_rebuild job row vanished after claim")
+        job_payload = dict(job.payload)
+        after_id = job_payload.get("afterUserId")
+        row = (
+            db.execute(
+                text(_MISMATCHES_SQL),
+                {"after_id": after_id, "batch_size": _USER_BATCH_SIZE},
+            )
+            .mappings()
+            .one()
+        )
+        db.rollback()
+        # One transaction per pair: each repair holds the trigger locks only briefly.
+        mismatches = list(row["mismatches"])
+        for mismatch in mismatches:
+            db.execute(
+                text(
+                    "SELECT viewer_visible_media_repair(CAST(:user_id AS uuid), "
+                    "CAST(:media_id AS uuid))"
+                ),
+                {"user_id": mismatch["user_id"], "media_id": mismatch["media_id"]},
+            )
+            db.commit()
+
+    missing = sum(1 for mismatch in mismatches if mismatch["drift"] == "missing")
+    if mismatches:
+        logger.warning(
+            "viewer_visible_media_drift_repaired",
+            missing=missing,
+            extra=len(mismatches) - missing,
+            sample=mismatches[:10],
+            worker_id=context.worker_id,
+        )
+    checked = int(job_payload.get("checkedUsers", 0)) + int(row["batch_count"])
+    repaired = int(job_payload.get("repairedPairs", 0)) + len(mismatches)
+    if row["batch_count"] < _USER_BATCH_SIZE:
+        logger.info(
+            "viewer_visible_media_rebuild_completed",
+            checked_users=checked,
+            repaired_pairs=repaired,
+            worker_id=context.worker_id,
+        )
+        return {
+            "disposition": "RebuildComplete",
+            "checkedUsers": checked,
+            "repairedPairs": repaired,
+        }
+    return RescheduleRequested(
+        available_at=datetime.now(UTC),
+        payload={
+            **job_payload,
+            "afterUserId": row["last_user_id"],
+            "checkedUsers": checked,
+            "repairedPairs": repaired,
+        },
+    )
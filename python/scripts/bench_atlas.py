@@ -0,0 +1,83 @@
+"""In-memory benchmark for the grand atlas projection.
+
+Times the pieces of ``services.atlas_projection`` on synthetic mean embeddings
+(seeded Gaussian clusters, 256 dims like ``content_embeddings``) at each
+``--sizes`` entry: ``fit`` (power-iteration PCA), ``project`` (the fitted set
+through the axes), ``repulse`` (grid repulsion of the full map), and ``place``
+(``--new`` unseen works through the stored axes, repelled by the placed map —
+the incremental path). No database: it measures the arithmetic the job does
+after ``fetch_mean_embeddings``.
+
+Usage:
+    python scripts/bench_atlas.py --sizes 1000,10000,50000 --report atlas.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from collections.abc import Callable
+
+from nexus.services.atlas_projection import fit_pca_2d, place_vectors, repulse
+
+DIMS = 256
+CLUSTERS = 24
+
+
+def _vectors(count: int, *, seed: int) -> list[list[float]]:
+    rng = random.Random(seed)
+    centers = [[rng.gauss(0.0, 1.0) for _ in range(DIMS)] for _ in range(CLUSTERS)]
+    return [
+        [value + rng.gauss(0.0, 0.3) for value in centers[rng.randrange(CLUSTERS)]]
+        for _ in range(count)
+    ]
+
+
+def _timed[T](fn: Callable[[], T]) -> tuple[T, float]:
+    start = time.perf_counter()
+    result = fn()
+    return result, round((time.perf_counter() - start) * 1000, 1)
+
+
+def bench(size: int, new: int) -> dict[str, float | int]:
+    vectors = _vectors(size + new, seed=size)
+    fitted, incoming = vectors[:size], vectors[size:]
+    axes, fit_ms = _timed(lambda: fit_pca_2d(fitted))
+    if axes is None:
+        raise SystemExit(f"size {size} is below the PCA minimum")
+    projected, project_ms = _timed(lambda: place_vectors(axes, fitted))
+    placed_map, repulse_ms = _timed(lambda: repulse(projected))
+    _, place_ms = _timed(lambda: repulse(place_vectors(axes, incoming), fixed=placed_map))
+    return {
+        "size": size,
+        "new": new,
+        "fit_ms": fit_ms,
+        "project_ms": project_ms,
+        "repulse_ms": repulse_ms,
+        "place_ms": place_ms,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,50000")
+    parser.add_argument("--new", type=int, default=50, help="works placed incrementally")
+    parser.add_argument("--report", help="write the rows as JSON to this path")
+    args = parser.parse_args()
+
+    rows = [bench(int(size), args.new) for size in args.sizes.split(",")]
+    print(f"{'size':>7} {'fit ms':>9} {'project ms':>11} {'repulse ms':>11} {'place ms':>9}")
+    for row in rows:
+        print(
+            f"{row['size']:>7} {row['fit_ms']:>9} {row['project_ms']:>11}"
+            f" {row['repulse_ms']:>11} {row['place_ms']:>9}"
+        )
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as handle:
+            json.dump(rows, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
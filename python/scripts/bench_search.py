@@ -0,0 +1,735 @@
+"""Synthetic-corpus benchmark for hybrid search.
+
+Two subcommands against the database in DATABASE_URL (local/test only):
+
+``generate`` builds a synthetic corpus through the real write doorways: users with
+a default and a second library, web articles whose fragments are content-indexed
+by ``rebuild_fragment_content_index``, highlights with notes, standalone notes,
+and conversations. Text is drawn from a seeded Zipf vocabulary so common and rare
+terms behave like natural language for full-text search. Content chunks come out
+at roughly one per fragment, so ``users × media × fragments`` sets the scale
+(10 × 100 × 10 is 10k chunks; 1000 × 1000 × 10 is 10M). ``--jobs`` fans users
+out over processes.
+
+``run`` replays a fixed query mix through ``search.service.search`` and
+``search.batch.search_scopes`` and reports p50/p95/p99 per query class and per
+internal result type (each retriever is timed separately), then EXPLAIN
+(ANALYZE, BUFFERS) for the slowest captured statement of each result type.
+
+``recall`` compares the HNSW candidate scan against an exact scan (index scans
+disabled) for a sample of query vectors per user: recall@k and p50/p95/p99 for
+every ``--ef-search`` × ``--iterative-scan`` combination, so the recall/latency
+trade of ``SEARCH_HNSW_EF_SEARCH`` can be read off one table.
+
+``visibility`` measures the visible-media relation for readers of shared
+libraries: each of ``--readers`` extra users joins every generated user's shelf
+(about half of each user's media), so ``users × media-per-user / 2`` media are
+visible through shared memberships (200 × 100 gives 10k). It times the
+materialized ``viewer_visible_media`` lookup against the rule evaluated over
+``media``, both as a full count and as a recent-media page, and checks that the
+two return the same set.
+
+All subcommands replace the embedding provider with deterministic unit vectors
+keyed by text hash: no network, and the ANN path sees realistic random vectors.
+
+Usage:
+    python scripts/bench_search.py generate --label bench1 --users 10 --media-per-user 100
+    python scripts/bench_search.py run --label bench1 --repeat 20 --report bench1.json
+    python scripts/bench_search.py recall --label bench1 --ef-search 20,40,100,200 --k 50
+    python scripts/bench_search.py generate --label vis200 --users 200 --media-per-user 100 \
+        --fragments-per-media 1 --highlights-per-media 0 --notes-per-user 0 \
+        --conversations-per-user 0 --jobs 0
+    python scripts/bench_search.py visibility --label vis200 --users 200 --readers 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from typing import Any
+from unittest import mock
+from uuid import NAMESPACE_URL, UUID, uuid5
+
+from sqlalchemy import event, text
+
+from nexus.auth.permissions import visible_media_ids_cte_sql, visible_media_ids_rule_sql
+from nexus.config import get_settings
+from nexus.db.engine import get_engine
+from nexus.db.models import (
+    Conversation,
+    Fragment,
+    Library,
+    Media,
+    MediaKind,
+    Membership,
+    Message,
+    ProcessingStatus,
+)
+from nexus.db.session import create_session_factory
+from nexus.services import library_entries, note_bodies, semantic_chunks
+from nexus.services.bootstrap import ensure_user_and_default_library
+from nexus.services.content_indexing import rebuild_fragment_content_index
+from nexus.services.highlights import create_fragment_highlight_in_txn
+from nexus.services.note_indexing import rebuild_note_content_index
+from nexus.services.notes import set_highlight_note_body_pm_json_in_current_transaction
+from nexus.services.resource_graph.context import add_context_ref_without_commit
+from nexus.services.resource_graph.refs import ResourceRef
+from nexus.services.search import candidates
+from nexus.services.search import sql as search_sql
+from nexus.services.search.batch import search_scopes
+from nexus.services.search.content_chunk_candidates import retrieve_content_chunk_candidates
+from nexus.services.search.query import SearchQuery, SearchScope
+from nexus.services.search.service import search
+
+VOCABULARY_SIZE = 5000
+PERCENTILES = (50, 95, 99)
+_SYLLABLES = ("ka", "lo", "mi", "ren", "sa", "tor", "vel", "qu", "dan", "ith", "or", "ze", "pha")
+
+
+def _bench_id(label: str, name: str) -> UUID:
+    return uuid5(NAMESPACE_URL, f"bench:search:{label}:{name}")
+
+
+def _vocabulary(seed: int) -> list[str]:
+    rng = random.Random(seed)
+    words: set[str] = set()
+    while len(words) < VOCABULARY_SIZE:
+        words.add("".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words, key=lambda word: (hashlib.sha256(word.encode()).digest(), word))
+
+
+class _Prose:
+    """Zipf-distributed pseudo-words: rank 0 is the most frequent term."""
+
+    def __init__(self, vocabulary: list[str], rng: random.Random) -> None:
+        self.vocabulary = vocabulary
+        self.rng = rng
+        self._weights = [1.0 / (rank + 1) for rank in range(len(vocabulary))]
+
+    def words(self, count: int) -> str:
+        return " ".join(self.rng.choices(self.vocabulary, weights=self._weights, k=count))
+
+
+def _stub_embeddings(texts: list[str], *, dimensions: int) -> list[list[float]]:
+    vectors = []
+    for value in texts:
+        rng = random.Random(hashlib.sha256(value.encode()).digest())
+        vector = [rng.gauss(0.0, 1.0) for _ in range(dimensions)]
+        norm = math.sqrt(sum(component * component for component in vector)) or 1.0
+        vectors.append([component / norm for component in vector])
+    return vectors
+
+
+@contextmanager
+def _stubbed_embedding_provider() -> Iterator[None]:
+    with mock.patch.object(semantic_chunks, "_embed_with_openai", _stub_embeddings):
+        yield
+
+
+# =============================================================================
+# generate
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class CorpusShape:
+    label: str
+    seed: int
+    media_per_user: int
+    fragments_per_media: int
+    words_per_fragment: int
+    highlights_per_media: int
+    notes_per_user: int
+    conversations_per_user: int
+    messages_per_conversation: int
+
+
+def _generate_user(shape: CorpusShape, user_idx: int) -> int:
+    """Write one user's corpus; returns the number of fragments indexed."""
+    rng = random.Random(f"{shape.seed}:{user_idx}")
+    prose = _Prose(_vocabulary(shape.seed), rng)
+    user_id = _bench_id(shape.label, f"user:{user_idx}")
+    fragments_indexed = 0
+    with _stubbed_embedding_provider(), create_session_factory()() as db:
+        default_library_id = ensure_user_and_default_library(
+            db, user_id, f"bench-{shape.label}-{user_idx}@example.invalid"
+        )
+        shelf_id = _bench_id(shape.label, f"library:{user_idx}")
+        db.add(Library(id=shelf_id, owner_user_id=user_id, name="Bench shelf", is_default=False))
+        db.flush()
+        db.add(Membership(library_id=shelf_id, user_id=user_id, role="admin"))
+        db.commit()
+
+        media_ids: list[UUID] = []
+        for media_idx in range(shape.media_per_user):
+            media_id = _bench_id(shape.label, f"media:{user_idx}:{media_idx}")
+            media_ids.append(media_id)
+            db.add(
+                Media(
+                    id=media_id,
+                    kind=MediaKind.web_article.value,
+                    title=prose.words(rng.randint(3, 8)),
+                    requested_url=f"https://bench.invalid/{shape.label}/{user_idx}/{media_idx}",
+                    processing_status=ProcessingStatus.ready_for_reading,
+                    created_by_user_id=user_id,
+                    language="en",
+                )
+            )
+            db.flush()
+            fragments = []
+            for fragment_idx in range(shape.fragments_per_media):
+                body = prose.words(shape.words_per_fragment)
+                fragment = Fragment(
+                    id=_bench_id(shape.label, f"fragment:{user_idx}:{media_idx}:{fragment_idx}"),
+                    media_id=media_id,
+                    idx=fragment_idx,
+                    canonical_text=body,
+                    html_sanitized=f"<p>{body}</p>",
+                )
+                db.add(fragment)
+                fragments.append(fragment)
+            db.flush()
+            library_entries.ensure_entry(
+                db, default_library_id, library_entries.media_target(media_id)
+            )
+            if media_idx % 2 == 0:
+                library_entries.ensure_entry(db, shelf_id, library_entries.media_target(media_id))
+            rebuild_fragment_content_index(
+                db,
+                media_id=media_id,
+                source_kind="web_article",
+                fragments=fragments,
+                reason="bench_generate",
+            )
+            fragments_indexed += len(fragments)
+
+            for highlight_idx in range(shape.highlights_per_media):
+                fragment = fragments[highlight_idx % len(fragments)]
+                end_offset = min(len(fragment.canonical_text), rng.randint(20, 120))
+                highlight_id = _bench_id(
+                    shape.label, f"highlight:{user_idx}:{media_idx}:{highlight_idx}"
+                )
+                create_fragment_highlight_in_txn(
+                    db,
+                    viewer_id=user_id,
+                    highlight_id=highlight_id,
+                    fragment_id=fragment.id,
+                    start_offset=0,
+                    end_offset=end_offset,
+                    color="yellow",
+                )
+                note_id = _bench_id(shape.label, f"highlight-note:{highlight_id}")
+                set_highlight_note_body_pm_json_in_current_transaction(
+                    db,
+                    user_id,
+                    highlight_id=highlight_id,
+                    block_id=note_id,
+                    body_pm_json=note_bodies.pm_doc_from_text(prose.words(rng.randint(8, 40))),
+                    client_mutation_id=f"bench:{note_id}",
+                )
+                rebuild_note_content_index(db, note_block_id=note_id, reason="bench_generate")
+            db.commit()
+
+        for note_idx in range(shape.notes_per_user):
+            note_id = _bench_id(shape.label, f"note:{user_idx}:{note_idx}")
+            note_bodies.upsert_note_body(
+                db,
+                viewer_id=user_id,
+                block_id=note_id,
+                body_pm_json=note_bodies.pm_doc_from_text(prose.words(rng.randint(10, 80))),
+            )
+            rebuild_note_content_index(db, note_block_id=note_id, reason="bench_generate")
+        db.commit()
+
+        for conversation_idx in range(shape.conversations_per_user):
+            conversation_id = _bench_id(shape.label, f"conversation:{user_idx}:{conversation_idx}")
+            db.add(
+                Conversation(
+                    id=conversation_id,
+                    owner_user_id=user_id,
+                    title=prose.words(4),
+                    sharing="private",
+                    next_seq=shape.messages_per_conversation + 1,
+                )
+            )
+            db.flush()
+            parent_id = None
+            for seq in range(1, shape.messages_per_conversation + 1):
+                message_id = _bench_id(shape.label, f"message:{conversation_id}:{seq}")
+                db.add(
+                    Message(
+                        id=message_id,
+                        conversation_id=conversation_id,
+                        seq=seq,
+                        role="user" if seq % 2 else "assistant",
+                        content=prose.words(rng.randint(10, 120)),
+                        status="complete",
+                        parent_message_id=parent_id,
+                    )
+                )
+                db.flush()
+                parent_id = message_id
+            db.flush()
+            if media_ids:
+                # Conversation-scoped search reads the conversation's context edges.
+                add_context_ref_without_commit(
+                    db,
+                    viewer_id=user_id,
+                    conversation_id=conversation_id,
+                    target=ResourceRef(scheme="media", id=rng.choice(media_ids)),
+                    origin="user",
+                )
+        db.commit()
+    return fragments_indexed
+
+
+def generate(shape: CorpusShape, *, users: int, jobs: int) -> int:
+    # Bootstrap is serializable and contends across processes; run it up front
+    # so each worker only finds its user.
+    with create_session_factory()() as db:
+        for user_idx in range(users):
+            ensure_user_and_default_library(
+                db,
+                _bench_id(shape.label, f"user:{user_idx}"),
+                f"bench-{shape.label}-{user_idx}@example.invalid",
+            )
+    get_engine().dispose()  # forked workers must not inherit pooled connections
+    started = time.monotonic()
+    fragments = 0
+    with ExitStack() as stack:
+        # One job writes in-process: no forked copies of an open engine.
+        mapper = map if jobs <= 1 else stack.enter_context(ProcessPoolExecutor(jobs)).map
+        for done, count in enumerate(mapper(_generate_user, [shape] * users, range(users)), 1):
+            fragments += count
+            elapsed = time.monotonic() - started
+            print(
+                f"users {done}/{users} fragments {fragments} "
+                f"({fragments / max(elapsed, 1e-9):.0f} fragments/s)",
+                flush=True,
+            )
+    with create_session_factory()() as db:
+        chunks = db.execute(
+            text(
+                """
+                SELECT count(*)
+                FROM content_chunks cc
+                JOIN media m ON cc.owner_kind = 'media' AND m.id = cc.owner_id
+                WHERE m.requested_url LIKE :prefix
+                """
+            ),
+            {"prefix": f"https://bench.invalid/{shape.label}/%"},
+        ).scalar_one()
+    print(f"corpus {shape.label}: {users} users, {chunks} media content chunks")
+    return 0
+
+
+# =============================================================================
+# run
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class QueryCase:
+    name: str
+    query: SearchQuery
+    scopes: tuple[SearchScope, ...] = ()
+
+
+def _query_mix(vocabulary: list[str], shelf_id: UUID, media_id: UUID) -> list[QueryCase]:
+    common, mid, rare = vocabulary[3], vocabulary[200], vocabulary[4000]
+    phrase = " ".join(vocabulary[10:14])
+    return [
+        QueryCase("all_common_term", SearchQuery(text=common)),
+        QueryCase("all_rare_term", SearchQuery(text=rare)),
+        QueryCase("all_two_terms", SearchQuery(text=f"{common} {mid}")),
+        QueryCase("all_phrase", SearchQuery(text=phrase)),
+        QueryCase("documents", SearchQuery(text=mid, requested_kinds=frozenset({"documents"}))),
+        QueryCase("notes", SearchQuery(text=mid, requested_kinds=frozenset({"notes"}))),
+        QueryCase("highlights", SearchQuery(text=mid, requested_kinds=frozenset({"highlights"}))),
+        QueryCase(
+            "conversations", SearchQuery(text=mid, requested_kinds=frozenset({"conversations"}))
+        ),
+        QueryCase("library_scope", SearchQuery(text=mid, scope=SearchScope("library", shelf_id))),
+        QueryCase("media_scope", SearchQuery(text=common, scope=SearchScope("media", media_id))),
+        QueryCase(
+            "search_scopes",
+            SearchQuery(text=f"{mid} {rare}"),
+            scopes=(SearchScope("library", shelf_id), SearchScope("media", media_id)),
+        ),
+    ]
+
+
+class _StatementCapture:
+    """Attribute each executed statement and its duration to the active result type."""
+
+    def __init__(self) -> None:
+        self.result_type: str | None = None
+        self.slowest: dict[str, tuple[float, str, Any]] = {}
+        self._started: list[float] = []
+
+    def before(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        self._started.append(time.perf_counter())
+
+    def after(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        elapsed = time.perf_counter() - self._started.pop()
+        if self.result_type is None or not statement.lstrip().upper().startswith(
+            ("SELECT", "WITH")
+        ):
+            return
+        current = self.slowest.get(self.result_type)
+        if current is None or elapsed > current[0]:
+            self.slowest[self.result_type] = (elapsed, statement, parameters)
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    out = {}
+    for percentile in PERCENTILES:
+        rank = max(0, math.ceil(percentile / 100 * len(ordered)) - 1)
+        out[f"p{percentile}_ms"] = round(ordered[rank] * 1000, 2)
+    out["n"] = len(ordered)
+    return out
+
+
+def run(label: str, *, seed: int, users: int, repeat: int, warmup: int, report: str | None) -> int:
+    vocabulary = _vocabulary(seed)
+    case_samples: dict[str, list[float]] = defaultdict(list)
+    type_samples: dict[str, list[float]] = defaultdict(list)
+    capture = _StatementCapture()
+    original_search_type = candidates._search_type
+
+    def timed_search_type(db, viewer_id, q, has_query, result_type, *args, **kwargs):
+        capture.result_type = result_type
+        started = time.perf_counter()
+        try:
+            return original_search_type(db, viewer_id, q, has_query, result_type, *args, **kwargs)
+        finally:
+            type_samples[result_type].append(time.perf_counter() - started)
+            capture.result_type = None
+
+    engine = get_engine()
+    with (
+        _stubbed_embedding_provider(),
+        mock.patch.object(candidates, "_search_type", timed_search_type),
+        create_session_factory(engine)() as db,
+    ):
+        event.listen(engine, "before_cursor_execute", capture.before)
+        event.listen(engine, "after_cursor_execute", capture.after)
+        try:
+            for iteration in range(warmup + repeat):
+                user_idx = iteration % users
+                viewer_id = _bench_id(label, f"user:{user_idx}")
+                cases = _query_mix(
+                    vocabulary,
+                    _bench_id(label, f"library:{user_idx}"),
+                    _bench_id(label, f"media:{user_idx}:0"),
+                )
+                if iteration == warmup:
+                    type_samples.clear()
+                    capture.slowest.clear()
+                for case in cases:
+                    started = time.perf_counter()
+                    if case.scopes:
+                        search_scopes(db, viewer_id, case.query, case.scopes)
+                    else:
+                        search(db, viewer_id, case.query)
+                    if iteration >= warmup:
+                        case_samples[case.name].append(time.perf_counter() - started)
+                    db.rollback()
+        finally:
+            event.remove(engine, "before_cursor_execute", capture.before)
+            event.remove(engine, "after_cursor_execute", capture.after)
+
+        plans: dict[str, list[str]] = {}
+        for result_type, (_, statement, parameters) in sorted(capture.slowest.items()):
+            rows = db.connection().exec_driver_sql(
+                f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters
+            )
+            plans[result_type] = [row[0] for row in rows]
+            db.rollback()
+
+    results = {
+        "label": label,
+        "by_query": {name: _percentiles(samples) for name, samples in sorted(case_samples.items())},
+        "by_result_type": {
+            name: _percentiles(samples) for name, samples in sorted(type_samples.items())
+        },
+        "explain": plans,
+    }
+    _print_table("query", results["by_query"])
+    _print_table("result type", results["by_result_type"])
+    for result_type, plan in plans.items():
+        print(f"\n-- EXPLAIN slowest {result_type} statement\n" + "\n".join(plan))
+    if report:
+        with open(report, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2)
+    return 0
+
+
+# =============================================================================
+# recall
+# =============================================================================
+
+
+def _chunk_ids(db, viewer_id: UUID, query_embedding: tuple[str, list[float]], k: int) -> list:
+    rows = retrieve_content_chunk_candidates(
+        db,
+        viewer_id=viewer_id,
+        query_embedding=query_embedding,
+        scope=SearchScope("all"),
+        limit=k,
+    )
+    return [row.content_chunk_id for row in rows]
+
+
+def recall(
+    label: str,
+    *,
+    seed: int,
+    users: int,
+    queries: int,
+    k: int,
+    ef_search: list[int],
+    iterative_scan: list[str],
+    report: str | None,
+) -> int:
+    vocabulary = _vocabulary(seed)
+    rng = random.Random(seed)
+    texts = [" ".join(rng.sample(vocabulary[:1000], 3)) for _ in range(queries)]
+    settings = get_settings()
+    exact: dict[tuple[int, int], list] = {}
+    exact_samples: list[float] = []
+    recalls: dict[str, list[float]] = defaultdict(list)
+    samples: dict[str, list[float]] = defaultdict(list)
+
+    with _stubbed_embedding_provider(), create_session_factory(get_engine())() as db:
+        embeddings = [semantic_chunks.build_text_embedding(value) for value in texts]
+        for user_idx in range(users):
+            viewer_id = _bench_id(label, f"user:{user_idx}")
+            for query_idx, embedding in enumerate(embeddings):
+                # Ground truth: no index scans, so the ORDER BY is a full sort.
+                db.execute(text("SELECT set_config('enable_indexscan', 'off', true)"))
+                started = time.perf_counter()
+                exact[(user_idx, query_idx)] = _chunk_ids(db, viewer_id, embedding, k)
+                exact_samples.append(time.perf_counter() - started)
+                db.rollback()
+
+        for mode in iterative_scan:
+            for ef in ef_search:
+                name = f"ef_search={ef} iterative_scan={mode}"
+                tuned = settings.model_copy(
+                    update={"search_hnsw_ef_search": ef, "search_hnsw_iterative_scan": mode}
+                )
+                with mock.patch.object(search_sql, "get_settings", lambda tuned=tuned: tuned):
+                    for (user_idx, query_idx), truth in exact.items():
+                        viewer_id = _bench_id(label, f"user:{user_idx}")
+                        started = time.perf_counter()
+                        found = _chunk_ids(db, viewer_id, embeddings[query_idx], k)
+                        samples[name].append(time.perf_counter() - started)
+                        db.rollback()
+                        if truth:
+                            recalls[name].append(len(set(found) & set(truth)) / len(truth))
+
+    rows = {"exact": {**_percentiles(exact_samples), "recall": 1.0}}
+    for name, latencies in samples.items():
+        measured = recalls[name]
+        mean_recall = sum(measured) / len(measured) if measured else 0.0
+        rows[name] = {**_percentiles(latencies), "recall": round(mean_recall, 4)}
+    print(f"\nrecall@{k} over {len(exact)} (user, query) pairs")
+    print(f"{'configuration':<44} {'recall':>8} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10}")
+    for name, stats in rows.items():
+        print(
+            f"{name:<44} {stats['recall']:>8} {stats['p50_ms']:>10} "
+            f"{stats['p95_ms']:>10} {stats['p99_ms']:>10}"
+        )
+    if report:
+        with open(report, "w", encoding="utf-8") as handle:
+            json.dump({"label": label, "k": k, "recall": rows}, handle, indent=2)
+    return 0
+
+
+# =============================================================================
+# visibility
+# =============================================================================
+
+
+def _visibility_statements() -> dict[str, str]:
+    statements = {}
+    for name, relation in (
+        ("materialized", visible_media_ids_cte_sql()),
+        ("rule", visible_media_ids_rule_sql()),
+    ):
+        statements[f"{name} count"] = f"SELECT count(*) FROM ({relation}) visible"
+        statements[f"{name} page"] = f"""
+            SELECT m.id
+            FROM media m
+            WHERE m.id IN ({relation})
+            ORDER BY m.created_at DESC, m.id DESC
+            LIMIT 50
+        """
+    return statements
+
+
+def visibility(label: str, *, users: int, readers: int, repeat: int, report: str | None) -> int:
+    statements = _visibility_statements()
+    samples: dict[str, list[float]] = defaultdict(list)
+    visible_counts: dict[str, int] = {}
+    with create_session_factory(get_engine())() as db:
+        for reader_idx in range(readers):
+            reader_id = _bench_id(label, f"reader:{reader_idx}")
+            ensure_user_and_default_library(
+                db, reader_id, f"bench-{label}-reader-{reader_idx}@example.invalid"
+            )
+            for user_idx in range(users):
+                db.execute(
+                    text(
+                        """
+                        INSERT INTO memberships (library_id, user_id, role)
+                        SELECT l.id, :reader_id, 'member'
+                        FROM libraries l
+                        WHERE l.id = :library_id
+                        ON CONFLICT DO NOTHING
+                        """
+                    ),
+                    {
+                        "reader_id": reader_id,
+                        "library_id": _bench_id(label, f"library:{user_idx}"),
+                    },
+                )
+            db.commit()
+
+        for reader_idx in range(readers):
+            reader_id = _bench_id(label, f"reader:{reader_idx}")
+            params = {"viewer_id": reader_id}
+            materialized = set(db.execute(text(visible_media_ids_cte_sql()), params).scalars())
+            rule = set(db.execute(text(visible_media_ids_rule_sql()), params).scalars())
+            if materialized != rule:
+                print(
+                    f"ERROR: reader {reader_idx} materialized set differs from the rule "
+                    f"({len(materialized - rule)} extra, {len(rule - materialized)} missing)"
+                )
+                return 1
+            visible_counts[str(reader_id)] = len(rule)
+            for _ in range(repeat):
+                for name, statement in statements.items():
+                    started = time.perf_counter()
+                    db.execute(text(statement), params).all()
+                    samples[name].append(time.perf_counter() - started)
+            db.rollback()
+
+    counts = sorted(visible_counts.values())
+    print(f"{readers} readers, visible media per reader {counts[0]}..{counts[-1]}")
+    rows = {name: _percentiles(latencies) for name, latencies in samples.items()}
+    _print_table("visible media", rows)
+    if report:
+        with open(report, "w", encoding="utf-8") as handle:
+            json.dump(
+                {"label": label, "visible": visible_counts, "latency": rows},
+                handle,
+                indent=2,
+            )
+    return 0
+
+
+def _print_table(title: str, rows: dict[str, dict[str, float]]) -> None:
+    print(f"\n{title:<28} {'n':>6} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10}")
+    for name, stats in rows.items():
+        print(
+            f"{name:<28} {stats['n']:>6} {stats['p50_ms']:>10} "
+            f"{stats['p95_ms']:>10} {stats['p99_ms']:>10}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    nexus_env = os.getenv("NEXUS_ENV", "local")
+    if nexus_env not in ("local", "test"):
+        print(f"ERROR: bench_search.py refuses to run in NEXUS_ENV={nexus_env}")
+        return 1
+
+    parser = argparse.ArgumentParser()
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    for name in ("generate", "run", "recall", "visibility"):
+        sub = subcommands.add_parser(name)
+        sub.add_argument("--label", required=True)
+        sub.add_argument("--seed", type=int, default=7)
+        sub.add_argument("--users", type=int, default=10)
+    gen = subcommands.choices["generate"]
+    gen.add_argument("--media-per-user", type=int, default=100)
+    gen.add_argument("--fragments-per-media", type=int, default=10)
+    gen.add_argument("--words-per-fragment", type=int, default=120)
+    gen.add_argument("--highlights-per-media", type=int, default=1)
+    gen.add_argument("--notes-per-user", type=int, default=20)
+    gen.add_argument("--conversations-per-user", type=int, default=5)
+    gen.add_argument("--messages-per-conversation", type=int, default=6)
+    gen.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    bench = subcommands.choices["run"]
+    bench.add_argument("--repeat", type=int, default=20)
+    bench.add_argument("--warmup", type=int, default=2)
+    bench.add_argument("--report")
+    recall_parser = subcommands.choices["recall"]
+    recall_parser.add_argument("--queries", type=int, default=20)
+    recall_parser.add_argument("--k", type=int, default=50)
+    recall_parser.add_argument("--ef-search", default="20,40,100,200")
+    recall_parser.add_argument("--iterative-scan", default="off,relaxed_order")
+    recall_parser.add_argument("--report")
+    visibility_parser = subcommands.choices["visibility"]
+    visibility_parser.add_argument("--readers", type=int, default=5)
+    visibility_parser.add_argument("--repeat", type=int, default=20)
+    visibility_parser.add_argument("--report")
+    args = parser.parse_args(argv)
+
+    if args.command == "generate":
+        shape = CorpusShape(
+            label=args.label,
+            seed=args.seed,
+            media_per_user=args.media_per_user,
+            fragments_per_media=args.fragments_per_media,
+            words_per_fragment=args.words_per_fragment,
+            highlights_per_media=args.highlights_per_media,
+            notes_per_user=args.notes_per_user,
+            conversations_per_user=args.conversations_per_user,
+            messages_per_conversation=args.messages_per_conversation,
+        )
+        return generate(shape, users=args.users, jobs=args.jobs)
+    if args.command == "recall":
+        return recall(
+            args.label,
+            seed=args.seed,
+            users=args.users,
+            queries=args.queries,
+            k=args.k,
+            ef_search=[int(value) for value in args.ef_search.split(",")],
+            iterative_scan=[value.strip() for value in args.iterative_scan.split(",")],
+            report=args.report,
+        )
+    if args.command == "visibility":
+        return visibility(
+            args.label,
+            users=args.users,
+            readers=args.readers,
+            repeat=args.repeat,
+            report=args.report,
+        )
+    return run(
+        args.label,
+        seed=args.seed,
+        users=args.users,
+        repeat=args.repeat,
+        warmup=args.warmup,
+        report=args.report,
+    )
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
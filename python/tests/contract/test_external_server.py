@@ -4,8 +4,11 @@ import asyncio
 import hashlib
 import http.client
 import json
+import queue
+import threading
 import wave
 from collections.abc import AsyncIterator
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from io import BytesIO
 from pathlib import Path
 from typing import Any
@@ -39,6 +42,7 @@ from provider_runtime import openai as openai_codec
 from provider_runtime.transport import SseEvent
 
 from tests.testkit.external_server import (
+    DEEPGRAM_API_KEY,
     NASA_AUDIO_PATH,
     NASA_FEED_URL,
     NASA_TRANSCRIPT_URL,
@@ -630,3 +634,60 @@ def test_unknown_paths_and_prompts_fail_closed() -> None:
         )
         assert status == 422
         assert json.loads(body) == {"error": {"code": "unknown_chat_prompt"}}
+
+
+def test_deepgram_listen_protocol_delivers_queued_result_to_callback() -> None:
+    delivered: queue.Queue[tuple[str, dict[str, Any]]] = queue.Queue()
+
+    class CallbackHandler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:  # noqa: N802 - stdlib handler API
+            body = self.rfile.read(int(self.headers["content-length"]))
+            delivered.put((self.path, json.loads(body)))
+            self.send_response(204)
+            self.end_headers()
+
+        def log_message(self, format: str, *args: object) -> None:
+            _ = format, args
+
+    receiver = HTTPServer(("127.0.0.1", 0), CallbackHandler)
+    receiver_thread = threading.Thread(target=receiver.serve_forever, daemon=True)
+    receiver_thread.start()
+    callback_url = f"http://127.0.0.1:{receiver.server_address[1]}/callback?token=t"
+    params = {
+        "model": "nova-3",
+        "diarize": "true",
+        "utterances": "true",
+        "smart_format": "true",
+        "punctuate": "true",
+        "language": "en",
+    }
+    headers = {"Authorization": f"Token {DEEPGRAM_API_KEY}", "Content-Type": "application/json"}
+    try:
+        with running_external_protocol_server(fixture_root=_FIXTURES) as address:
+            audio_url = f"http://{address[0]}:{address[1]}{NASA_AUDIO_PATH}"
+            body = json.dumps({"url": audio_url}).encode()
+            status, _, sync_body = _request(
+                address, "POST", f"/v1/listen?{urlencode(params)}", headers=headers, body=body
+            )
+            assert status == 200, f"listen fixture rejected its canonical request: {sync_body!r}"
+            status, _, queued_body = _request(
+                address,
+                "POST",
+                f"/v1/listen?{urlencode({**params, 'callback': callback_url})}",
+                headers=headers,
+                body=body,
+            )
+            assert status == 200, f"listen fixture rejected a callback request: {queued_body!r}"
+            path, payload = delivered.get(timeout=5)
+    finally:
+        receiver.shutdown()
+        receiver.server_close()
+
+    request_id = json.loads(queued_body)["request_id"]
+    assert path == "/callback?token=t", f"callback lost its query token: {path!r}"
+    assert payload["metadata"]["request_id"] == request_id, (
+        f"callback did not carry the submitted request id: {payload['metadata']!r}"
+    )
+    assert payload["results"] == json.loads(sync_body)["results"], (
+        "callback delivery diverged from the synchronous listen result"
+    )
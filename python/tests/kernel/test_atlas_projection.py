@@ -0,0 +1,40 @@
+"""Priority proof: placement through stored axes agrees with the full projection."""
+
+from __future__ import annotations
+
+import math
+import random
+
+from nexus.services.atlas_projection import fit_pca_2d, pca_2d, place_vectors, repulse
+
+
+def _clustered_vectors(count: int, dims: int, seed: int) -> list[list[float]]:
+    rng = random.Random(seed)
+    centers = [[rng.gauss(0.0, 1.0) for _ in range(dims)] for _ in range(4)]
+    return [
+        [value + rng.gauss(0.0, 0.1) for value in centers[index % len(centers)]]
+        for index in range(count)
+    ]
+
+
+def test_placing_a_fitted_vector_reproduces_its_full_projection_position() -> None:
+    vectors = _clustered_vectors(60, 16, seed=7)
+    axes = fit_pca_2d(vectors[:50])
+    assert axes is not None
+    assert abs(math.fsum(a * b for a, b in zip(axes.pc1, axes.pc2, strict=True))) < 1e-9
+
+    full = pca_2d(vectors[:50])
+    assert place_vectors(axes, vectors[:50]) == full
+    assert min(x for x, _ in full) == 0.0 and max(x for x, _ in full) == 1.0
+
+    for x, y in place_vectors(axes, vectors[50:]):
+        assert 0.0 <= x <= 1.0 and 0.0 <= y <= 1.0
+
+
+def test_grid_repulsion_separates_neighbors_and_never_moves_fixed_points() -> None:
+    fixed = [(0.5, 0.5), (0.9, 0.9)]
+    moved = repulse([(0.505, 0.5), (0.1, 0.1), (0.1, 0.1)], min_dist=0.02, fixed=fixed)
+
+    assert math.hypot(moved[0][0] - 0.5, moved[0][1] - 0.5) >= 0.02 - 1e-12
+    assert math.hypot(moved[1][0] - moved[2][0], moved[1][1] - moved[2][1]) >= 0.02 - 1e-12
+    assert repulse([(0.2, 0.2), (0.8, 0.8)]) == [(0.2, 0.2), (0.8, 0.8)]
@@ -0,0 +1,100 @@
+"""Priority proof: identical Browse provider requests share one call and one cached page."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import cast
+
+import pytest
+
+from nexus.schemas.browse import BrowseCandidate
+from nexus.services.browse.cache import ProviderPage, ProviderPageCache, provider_page_key
+from nexus.services.browse.models import BrowseKind, BrowseQuery, BrowseSource
+
+
+class _StubProvider:
+    """Counts provider calls; each call parks until the test releases it."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.release = asyncio.Event()
+        self.fail = False
+
+    async def search(self, query: BrowseQuery) -> ProviderPage:
+        self.calls.append(query.query)
+        await self.release.wait()
+        if self.fail:
+            raise RuntimeError("provider down")
+        return cast(list[BrowseCandidate], [f"{query.query}-{len(self.calls)}"]), None
+
+
+def _query(text: str) -> BrowseQuery:
+    return BrowseQuery(
+        query=text,
+        kind=BrowseKind.Video,
+        source=BrowseSource.YouTube,
+        sort=None,
+        limit=10,
+        cursor=None,
+    )
+
+
+def test_concurrent_and_repeated_queries_hit_the_provider_once_per_ttl() -> None:
+    now = [0.0]
+    cache = ProviderPageCache(clock=lambda: now[0])
+    provider = _StubProvider()
+
+    async def browse(text: str) -> ProviderPage:
+        query = _query(text)
+        return await cache.fetch(
+            provider_page_key(query), lambda: provider.search(query), ttl_seconds=60
+        )
+
+    async def scenario() -> None:
+        burst = [asyncio.create_task(browse(text)) for text in ("Lo-fi", "lo-fi ", " LO-FI")]
+        await asyncio.sleep(0)
+        provider.release.set()
+        pages = await asyncio.gather(*burst)
+        assert pages == [(["Lo-fi-1"], None)] * 3
+        assert provider.calls == ["Lo-fi"]
+
+        for _ in range(5):
+            assert await browse("lo-fi") == (["Lo-fi-1"], None)
+        assert len(provider.calls) == 1
+
+        now[0] = 61.0
+        assert await browse("lo-fi") == (["lo-fi-2"], None)
+        assert len(provider.calls) == 2
+
+        provider.fail = True
+        with pytest.raises(RuntimeError, match="provider down"):
+            await browse("jazz")
+        provider.fail = False
+        assert await browse("jazz") == (["jazz-4"], None), "a failure must not be cached"
+
+    asyncio.run(scenario())
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.coalesced) == (5, 4, 2)
+
+
+def test_a_cancelled_caller_does_not_cancel_the_shared_provider_call() -> None:
+    cache = ProviderPageCache()
+    provider = _StubProvider()
+    query = _query("field recordings")
+
+    async def scenario() -> None:
+        def browse() -> asyncio.Task[ProviderPage]:
+            return asyncio.create_task(
+                cache.fetch(
+                    provider_page_key(query), lambda: provider.search(query), ttl_seconds=60
+                )
+            )
+
+        leaver, stayer = browse(), browse()
+        await asyncio.sleep(0)
+        leaver.cancel()
+        provider.release.set()
+        assert await stayer == (["field recordings-1"], None)
+        assert leaver.cancelled()
+
+    asyncio.run(scenario())
+    assert provider.calls == ["field recordings"]
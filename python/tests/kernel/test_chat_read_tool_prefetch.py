@@ -0,0 +1,116 @@
+"""Priority proof: prefetched reads are bounded, keyed by call, and fall back inline.
+
+The read tools are stubbed so the proof needs no provider or database: it
+requires every read of a segment to run on its own session, at most
+``MAX_CONCURRENT_READ_TOOL_CALLS`` at a time, with each outcome keyed by its call
+index. A read that raises maps to None without costing its siblings their
+outcomes, and a step with no prefetched outcome runs its read inline.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from contextlib import nullcontext
+from types import SimpleNamespace
+from typing import Any, cast
+from uuid import uuid4
+
+import pytest
+from provider_runtime import ToolCall
+from sqlalchemy.orm import Session, sessionmaker
+
+from nexus.services import chat_runs
+from nexus.services.agent_tools.read_resource import READ_RESOURCE_TOOL_NAME
+
+
+def _run() -> Any:
+    return SimpleNamespace(
+        id=uuid4(),
+        owner_user_id=uuid4(),
+        conversation_id=uuid4(),
+        user_message_id=uuid4(),
+        assistant_message_id=uuid4(),
+    )
+
+
+def _read_call(call_id: str) -> ToolCall:
+    return ToolCall(id=call_id, name=READ_RESOURCE_TOOL_NAME, arguments={"uri": call_id})
+
+
+def test_prefetch_bounds_concurrency_keys_by_index_and_isolates_a_failure(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+    sessions: list[object] = []
+
+    def stub_read(db: object, *, tool_call: ToolCall, tool_call_index: int, **_ids: Any) -> Any:
+        nonlocal in_flight, peak
+        with lock:
+            sessions.append(db)
+            in_flight += 1
+            peak = max(peak, in_flight)
+        try:
+            time.sleep(0.05)
+            if tool_call.id == "read-3":
+                raise RuntimeError("injected read failure")
+            return f"outcome of {tool_call.id} at {tool_call_index}"
+        finally:
+            with lock:
+                in_flight -= 1
+
+    monkeypatch.setattr(chat_runs, "_read_tool_call", stub_read)
+    session_factory = cast(sessionmaker[Session], lambda: nullcontext(object()))
+    # Indexes out of order and beyond the bound: results follow the calls.
+    calls = [(_read_call(f"read-{n}"), index) for n, index in enumerate((7, 2, 9, 4, 11, 5))]
+
+    prefetched = asyncio.run(
+        chat_runs._prefetch_read_tool_calls(session_factory, run=_run(), calls=calls)
+    )
+
+    assert prefetched == {
+        7: "outcome of read-0 at 7",
+        2: "outcome of read-1 at 2",
+        9: "outcome of read-2 at 9",
+        4: None,
+        11: "outcome of read-4 at 11",
+        5: "outcome of read-5 at 5",
+    }
+    assert peak == chat_runs.MAX_CONCURRENT_READ_TOOL_CALLS
+    assert len({id(db) for db in sessions}) == len(calls), "each read needs its own session"
+
+
+def test_a_step_without_a_prefetched_outcome_reads_inline(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    inline_db = object()
+    reads: list[tuple[object, int]] = []
+
+    class _InlineRead(Exception):
+        pass
+
+    def stub_read(db: object, *, tool_call: ToolCall, tool_call_index: int, **_ids: Any) -> Any:
+        reads.append((db, tool_call_index))
+        raise _InlineRead
+
+    monkeypatch.setattr(chat_runs, "_read_tool_call", stub_read)
+    steps = SimpleNamespace(lock_active_attempt=lambda: None, web_search_provider=None)
+
+    with pytest.raises(_InlineRead):
+        asyncio.run(
+            chat_runs._execute_tool_step(
+                cast(Session, inline_db),
+                run=_run(),
+                steps=cast(Any, steps),
+                path="tool/4",
+                tool_call=_read_call("read-3"),
+                tool_call_index=4,
+                citation_n_next=0,
+                emitter=cast(Any, None),
+                prefetched=None,
+            )
+        )
+    assert reads == [(inline_db, 4)], "a failed prefetch must be repeated on the run's session"
@@ -0,0 +1,80 @@
+"""Collection page validators: one strong ETag per (viewer, family revision,
+route, canonical query), and a bounded LRU keyed by it.
+
+The oracle is the revision contract: any write that can change a finite
+collection bumps its family revision, so the validator must move with the
+revision and with every input that selects a different page, and must not move
+with incidental query parameter order.
+"""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from nexus.services.collection_http_cache import (
+    CollectionPageCache,
+    collection_etag,
+    validator_matches,
+)
+from nexus.services.collection_revisions import CollectionFamily
+
+_VIEWER = UUID(int=7)
+_PATH = "/libraries/00000000-0000-0000-0000-000000000001/entries"
+
+
+def _etag(**overrides: object) -> str:
+    arguments: dict[str, object] = {
+        "viewer_id": _VIEWER,
+        "family": CollectionFamily.LibraryEntries,
+        "revision": 4,
+        "path": _PATH,
+        "query_items": [("limit", "50"), ("sort", "title")],
+    }
+    arguments.update(overrides)
+    return collection_etag(**arguments)  # type: ignore[arg-type]
+
+
+def test_validator_ignores_parameter_order_but_tracks_every_page_input() -> None:
+    baseline = _etag()
+
+    assert _etag(query_items=[("sort", "title"), ("limit", "50")]) == baseline
+    variants = {
+        _etag(revision=5),
+        _etag(viewer_id=UUID(int=8)),
+        _etag(family=CollectionFamily.PodcastEpisodes),
+        _etag(path=_PATH.replace("1/entries", "2/entries")),
+        _etag(query_items=[("limit", "50"), ("sort", "added")]),
+        _etag(query_items=[("limit", "50"), ("sort", "title"), ("cursor", "c")]),
+    }
+    assert baseline not in variants
+    assert len(variants) == 6
+    assert baseline.startswith('"') and baseline.endswith('"')
+
+
+def test_if_none_match_accepts_lists_and_weak_prefix_but_not_wildcard() -> None:
+    etag = _etag()
+
+    assert validator_matches(etag, etag)
+    assert validator_matches(f'"stale", W/{etag}', etag)
+    assert not validator_matches(None, etag)
+    assert not validator_matches("*", etag)
+    assert not validator_matches(_etag(revision=5), etag)
+
+
+def test_page_cache_evicts_least_recently_used_within_entry_and_byte_limits() -> None:
+    cache = CollectionPageCache(max_entries=2, max_bytes=10)
+    cache.put("a", b"1111")
+    cache.put("b", b"2222")
+    assert cache.get("a") == b"1111"
+
+    cache.put("c", b"3333")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1111"
+
+    cache.put("d", b"44444444")
+    assert cache.size == 1
+    assert cache.get("d") == b"44444444"
+
+    cache.put("huge", b"x" * 11)
+    assert cache.get("huge") is None
+    assert cache.get("d") == b"44444444"
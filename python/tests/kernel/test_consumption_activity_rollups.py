@@ -0,0 +1,50 @@
+"""Rollup core bounds: the slot-aligned interior a stats read answers from
+``consumption_activity_rollups`` instead of raw spans.
+
+The oracle is the rollup attribution rule: a slot row may only stand in for
+raw spans when no span it summarizes can be clipped by the requested range.
+That requires a quarter-hour aligned core that starts at or after ``start``
+and ends at least one maximum span duration before ``end``.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from nexus.schemas.consumption_activity import MAX_ACTIVITY_SPAN_MS
+from nexus.services.consumption._activity_stats import rollup_core_bounds
+
+_SLOT = timedelta(minutes=15)
+_SPAN = timedelta(milliseconds=MAX_ACTIVITY_SPAN_MS)
+
+
+def _aligned(value: datetime) -> bool:
+    return (value - datetime(1970, 1, 1, tzinfo=UTC)) % _SLOT == timedelta(0)
+
+
+def test_core_is_slot_aligned_and_leaves_room_for_a_maximum_span_before_the_end() -> None:
+    start = datetime(2026, 3, 8, 6, 7, 12, 345, tzinfo=UTC)
+    end = datetime(2026, 3, 9, 0, 0, 10, tzinfo=UTC)
+
+    core_start, core_end = rollup_core_bounds(start, end)
+
+    assert (core_start, core_end) == (
+        datetime(2026, 3, 8, 6, 15, tzinfo=UTC),
+        datetime(2026, 3, 8, 23, 45, tzinfo=UTC),
+    )
+    assert _aligned(core_start) and _aligned(core_end)
+    assert start <= core_start < core_end <= end - _SPAN
+
+
+def test_aligned_range_keeps_its_own_start_as_the_core_start() -> None:
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    end = datetime(2026, 1, 2, tzinfo=UTC)
+
+    assert rollup_core_bounds(start, end) == (start, end - _SLOT)
+
+
+def test_range_too_short_for_a_whole_slot_collapses_to_an_empty_core_at_start() -> None:
+    start = datetime(2026, 1, 1, 3, 7, tzinfo=UTC)
+
+    for length in (timedelta(minutes=1), _SLOT, timedelta(minutes=20)):
+        assert rollup_core_bounds(start, start + length) == (start, start)
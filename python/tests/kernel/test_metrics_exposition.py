@@ -0,0 +1,42 @@
+"""Metrics exposition: histograms render cumulative buckets and scrapes need the token.
+
+The oracle is the Prometheus text format: ``_bucket`` counts are cumulative
+and end at ``+Inf``, which equals ``_count``; label values are escaped.
+"""
+
+from __future__ import annotations
+
+from nexus.metrics import Counter, Histogram, metrics_token_matches, render_metrics
+
+
+def test_histogram_buckets_are_cumulative_and_labels_are_escaped() -> None:
+    histogram = Histogram("t_latency_seconds", "Test latency.", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, '/a"b')
+    counter = Counter("t_events", "Test events.", ("decision",))
+    counter.inc("allowed")
+    counter.inc("allowed", amount=2)
+
+    lines = render_metrics([histogram, counter]).splitlines()
+
+    assert lines == [
+        "# HELP t_latency_seconds Test latency.",
+        "# TYPE t_latency_seconds histogram",
+        't_latency_seconds_bucket{route="/a\\"b",le="0.1"} 2',
+        't_latency_seconds_bucket{route="/a\\"b",le="1"} 3',
+        't_latency_seconds_bucket{route="/a\\"b",le="+Inf"} 4',
+        't_latency_seconds_sum{route="/a\\"b"} 3.65',
+        't_latency_seconds_count{route="/a\\"b"} 4',
+        "# HELP t_events Test events.",
+        "# TYPE t_events counter",
+        't_events_total{decision="allowed"} 3',
+    ]
+
+
+def test_token_check_requires_a_configured_bearer_token() -> None:
+    assert metrics_token_matches("Bearer s3cret", "s3cret")
+    assert metrics_token_matches("bearer s3cret", "s3cret")
+    assert not metrics_token_matches("Bearer wrong", "s3cret")
+    assert not metrics_token_matches("Basic s3cret", "s3cret")
+    assert not metrics_token_matches(None, "s3cret")
+    assert not metrics_token_matches("Bearer ", None)
@@ -0,0 +1,113 @@
+"""Prompt token counting: provider counters may only tighten the heuristic,
+and memoized counts are per counter.
+
+The oracle is the previous character-by-character heuristic: budgeting with a
+tokenizer-backed counter must never count a block above it, so mandatory
+context that fit before still fits.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from math import ceil
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from provider_runtime import ProviderTarget
+
+from nexus.services import prompt_budget
+from nexus.services.prompt_budget import (
+    HEURISTIC_TOKEN_COUNTER,
+    TokenCounter,
+    _bpe_counter,
+    count_prompt_tokens,
+    estimate_tokens,
+    token_counter_for,
+)
+
+
+def _reference_estimate(text: str) -> int:
+    if not text:
+        return 0
+    non_ascii = sum(1 for char in text if ord(char) > 127)
+    return max(1, ceil(len(text) / 3), len(text.split()) * 2, non_ascii)
+
+
+def test_heuristic_matches_the_per_character_reference() -> None:
+    for text in ("", "a", "plain ascii words here", "naïve café — 東京 タワー", "日本語" * 40):
+        assert estimate_tokens(text) == _reference_estimate(text)
+
+
+def test_bpe_counter_scales_by_margin_and_never_exceeds_the_heuristic() -> None:
+    def one_token_per_four_chars(text: str) -> list[int]:
+        return [0] * ceil(len(text) / 4)
+
+    counter = _bpe_counter("anthropic", 1.35, one_token_per_four_chars)
+    prose = "The quick brown fox jumps over the lazy dog. " * 20
+    assert counter.count(prose) == ceil(ceil(len(prose) / 4) * 1.35)
+    assert counter.count(prose) <= estimate_tokens(prose)
+
+    dense = "x" * 600
+    saturated = _bpe_counter("anthropic", 10.0, one_token_per_four_chars)
+    assert saturated.count(dense) == estimate_tokens(dense)
+
+
+def test_memo_is_namespaced_by_counter_and_answers_repeats_without_recounting() -> None:
+    calls: list[str] = []
+
+    def counting(text: str) -> int:
+        calls.append(text)
+        return 7
+
+    text = "history turn that recurs on every run of this conversation"
+    counter = TokenCounter(key="test-memo", count=counting)
+    assert count_prompt_tokens(text, counter) == 7
+    assert count_prompt_tokens(text, counter) == 7
+    assert calls == [text]
+    assert count_prompt_tokens(text, HEURISTIC_TOKEN_COUNTER) == estimate_tokens(text)
+
+
+class _FourCharEncoding:
+    def encode(self, text: str, *, disallowed_special: tuple[str, ...]) -> list[int]:
+        return [0] * ceil(len(text) / 4)
+
+
+def test_configured_seeded_encoding_directory_selects_the_bpe_counter(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    target = ProviderTarget(provider="openai", model="gpt-5.6-luna")
+    loaded: list[str] = []
+
+    def get_encoding(name: str) -> _FourCharEncoding:
+        loaded.append(os.environ["TIKTOKEN_CACHE_DIR"])
+        return _FourCharEncoding()
+
+    monkeypatch.setattr(prompt_budget.tiktoken, "get_encoding", get_encoding)
+    monkeypatch.delenv("TIKTOKEN_CACHE_DIR", raising=False)
+    settings = SimpleNamespace(tiktoken_cache_dir=str(tmp_path))
+    monkeypatch.setattr(prompt_budget, "get_settings", lambda: settings)
+
+    def resolve() -> TokenCounter:
+        prompt_budget._bpe_encode.cache_clear()
+        prompt_budget._provider_token_counter.cache_clear()
+        return token_counter_for(target)
+
+    try:
+        assert resolve() is HEURISTIC_TOKEN_COUNTER, "an unseeded directory must not load"
+        assert loaded == []
+
+        encoding_name = hashlib.sha1(prompt_budget._BPE_ENCODING_URL.encode()).hexdigest()
+        (tmp_path / encoding_name).write_bytes(b"seeded")
+        counter = resolve()
+        assert counter.key == "o200k_base:openai"
+        assert loaded == [str(tmp_path)]
+        prose = "The quick brown fox jumps over the lazy dog. " * 20
+        assert counter.count(prose) == ceil(len(prose) / 4)
+
+        settings.tiktoken_cache_dir = None
+        assert resolve() is HEURISTIC_TOKEN_COUNTER
+    finally:
+        prompt_budget._bpe_encode.cache_clear()
+        prompt_budget._provider_token_counter.cache_clear()
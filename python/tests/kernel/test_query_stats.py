@@ -0,0 +1,49 @@
+"""SQL statement accounting: per-item variants share a fingerprint and scopes nest.
+
+The oracle is the statements a loop actually sends through an engine: an N+1
+loop over distinct ids must surface as one fingerprint repeated N times, in
+every active scope, and the test budget helper must reject it.
+"""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from nexus.db.query_stats import fingerprint_statement, track_queries
+from tests.testkit.query_budget import assert_query_budget
+
+
+def test_loop_queries_share_one_fingerprint_in_every_active_scope() -> None:
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        conn.execute(text("CREATE TABLE item (id INTEGER PRIMARY KEY)"))
+        with track_queries() as outer:
+            with track_queries() as inner:
+                for item_id in range(12):
+                    conn.execute(text("SELECT id FROM item WHERE id = :id"), {"id": item_id})
+                    conn.execute(text(f"SELECT id FROM item WHERE id IN ({item_id}, 99)"))
+            conn.execute(text("SELECT 1"))
+        conn.execute(text("SELECT 2"))
+
+    assert inner.statements == 24
+    assert outer.statements == 25
+    assert inner.repeated_statements() == [
+        ("SELECT id FROM item WHERE id = ?", 12),
+        ("SELECT id FROM item WHERE id IN (?)", 12),
+    ]
+    assert inner.log_fields()["db_max_repeats"] == 12
+
+    with pytest.raises(AssertionError, match="issued 12 times"):
+        with assert_query_budget(30, max_repeats=3), engine.connect() as conn:
+            for item_id in range(12):
+                conn.execute(text("SELECT :id"), {"id": item_id})
+
+
+def test_fingerprint_folds_literals_and_keeps_casts() -> None:
+    assert (
+        fingerprint_statement(
+            "SELECT  x::uuid FROM t\n WHERE a = %(a_1)s AND b IN (%(b_1)s, %(b_2)s) AND c = 'it''s'"
+        )
+        == "SELECT x::uuid FROM t WHERE a = ? AND b IN (?) AND c = ?"
+    )
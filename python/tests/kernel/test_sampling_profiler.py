@@ -0,0 +1,79 @@
+"""Sampling profiler: a busy function dominates the collapsed stacks.
+
+The oracle is where the profiled thread actually spent its time: a CPU loop
+nested under a known caller must appear as ``caller;busy`` leaf frames in
+collapsed-stack lines whose counts sum to the number of stacks sampled.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from nexus import profiling
+from nexus.profiling import SamplingProfiler, store_profile
+from nexus.storage.paths import build_profile_storage_path
+
+
+def _busy(deadline: float) -> int:
+    total = 0
+    while time.monotonic() < deadline:
+        total += 1
+    return total
+
+
+def _caller() -> int:
+    return _busy(time.monotonic() + 0.2)
+
+
+def test_collapsed_stacks_attribute_samples_to_the_busy_leaf() -> None:
+    profiler = SamplingProfiler(interval_seconds=0.005, thread_id=threading.get_ident())
+    profiler.start()
+    _caller()
+    collapsed = profiler.stop()
+
+    counts = {
+        line.rsplit(" ", 1)[0]: int(line.rsplit(" ", 1)[1]) for line in collapsed.splitlines()
+    }
+    assert sum(counts.values()) == profiler.samples > 0
+    busy = sum(
+        count
+        for stack, count in counts.items()
+        if stack.endswith(f"{__name__}:_caller;{__name__}:_busy")
+    )
+    assert busy >= profiler.samples // 2
+
+
+def test_profile_paths_are_keyed_by_job_or_request_id() -> None:
+    assert build_profile_storage_path("jobs", "0b7e-id") == "profiles/jobs/0b7e-id.collapsed"
+    for scope, key in (("media", "abc"), ("requests", "../x"), ("requests", "")):
+        with pytest.raises(ValueError):
+            build_profile_storage_path(scope, key)
+
+
+class _RecordingStorage:
+    def __init__(self) -> None:
+        self.paths: list[str] = []
+
+    def put_object(self, path: str, data: bytes, content_type: str) -> None:
+        self.paths.append(path)
+
+
+def test_every_accepted_request_id_stores_and_a_bad_key_never_raises(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Request ids may lead with ``.``, ``_`` or ``-``; storing must never fail the request."""
+    storage = _RecordingStorage()
+    monkeypatch.setattr(profiling, "get_storage_client", lambda: storage)
+
+    for request_id in ("-req", "_req", ".req"):
+        store_profile("requests", request_id, "a;b 1", samples=1)
+    store_profile("requests", "not/a/request-id", "a;b 1", samples=1)
+
+    assert storage.paths == [
+        "profiles/requests/-req.collapsed",
+        "profiles/requests/_req.collapsed",
+        "profiles/requests/.req.collapsed",
+    ]
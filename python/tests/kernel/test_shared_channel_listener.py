@@ -0,0 +1,74 @@
+"""Priority proof: a notification tick wakes waiters on any loop and is never lost.
+
+The shared listener behind the ticks also outlives an unexpected error in its
+loop: nothing else would restart its thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from nexus.db import listen
+from nexus.db.listen import NotificationTick
+
+
+def test_notification_tick_starts_raised_and_wakes_a_waiter_from_another_thread() -> None:
+    tick = NotificationTick("run-1")
+    assert tick.consume(), "a new subscriber must read its row once"
+    assert not tick.consume()
+
+    async def wait_for_listener_thread() -> None:
+        raiser = threading.Timer(0.05, tick._raise)
+        raiser.start()
+        try:
+            await asyncio.wait_for(tick.wait(), timeout=5)
+        finally:
+            raiser.join()
+
+    asyncio.run(wait_for_listener_thread())
+    assert tick.consume()
+
+    # A raise that lands before the wait is kept, not dropped.
+    tick._raise()
+    asyncio.run(asyncio.wait_for(tick.wait(), timeout=5))
+    assert tick.consume()
+
+
+def test_shared_listener_survives_an_unexpected_error_in_its_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    connects: list[int] = []
+    reconnected = threading.Event()
+
+    class _Connection:
+        def __enter__(self) -> _Connection:
+            return self
+
+        def __exit__(self, *exc_info: object) -> None:
+            return None
+
+        def execute(self, *_args: object) -> None:
+            if len(connects) == 1:
+                raise ValueError("a bug outside psycopg")
+
+        def notifies(self, *, timeout: float) -> Iterator[object]:
+            reconnected.set()
+            time.sleep(timeout)
+            return iter(())
+
+    def connect() -> _Connection:
+        connects.append(len(connects))
+        return _Connection()
+
+    monkeypatch.setattr(listen, "_connect_sync", connect)
+    listener = listen.SharedChannelListener(
+        "listener-proof", reconnect_seconds=0.01, wait_seconds=0.01
+    )
+    with listener.subscribe("run-1"):
+        assert reconnected.wait(timeout=5), "the LISTEN thread died with the error"
+    assert len(connects) >= 2
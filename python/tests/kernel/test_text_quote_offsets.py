@@ -0,0 +1,146 @@
+"""Normalized quote matching: compact offset maps and the batch matcher agree
+with the per-char reference.
+
+The oracle is the previous normalizer, which recorded one raw span per
+normalized char; every hit must map back to the same raw offsets, and a batch
+of quotes must resolve exactly as each quote does alone. The process-wide
+source cache is keyed by fragment-set revision and bounded by its char budget.
+"""
+
+from __future__ import annotations
+
+import random
+import unicodedata
+from uuid import UUID
+
+from nexus.services.text_quote import (
+    NormalizedOwnerSource,
+    NormalizedQuote,
+    QuoteStatus,
+    _NormalizedSourceCache,
+    find_quote_candidates,
+    match_quote_in_sources,
+    match_quotes_in_sources,
+    normalize_for_match,
+)
+
+
+def _reference_normalize(text: str) -> tuple[str, list[tuple[int, int]]]:
+    nfc = unicodedata.normalize("NFC", text)
+    chars: list[str] = []
+    spans: list[tuple[int, int]] = []
+    i = 0
+    while i < len(nfc):
+        j = i + 1
+        if nfc[i].isspace():
+            while j < len(nfc) and nfc[j].isspace():
+                j += 1
+        chars.append(" " if nfc[i].isspace() else nfc[i])
+        spans.append((i, j))
+        i = j
+    return "".join(chars), spans
+
+
+def test_offset_map_matches_per_char_spans_for_every_boundary() -> None:
+    rng = random.Random(32)
+    alphabet = ["a", "b", "é", "東", " ", "  ", "\n\t", " ", "\r\n  "]
+    for _ in range(300):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        expected_text, spans = _reference_normalize(text)
+        normalized = normalize_for_match(text)
+        assert normalized.text == expected_text
+        for index, (raw_start, raw_end) in enumerate(spans):
+            assert normalized.raw_offset(index) == raw_start
+            assert normalized.raw_offset(index + 1) == raw_end
+
+
+def test_context_narrowing_tolerates_one_collapsed_seam() -> None:
+    normalized = normalize_for_match("alpha \n\n beta gamma.  beta delta")
+    hits = find_quote_candidates(normalized, exact="beta", prefix="alpha", suffix="gamma.")
+    assert [(hit.raw_start, hit.raw_end) for hit in hits] == [(9, 13)]
+    assert find_quote_candidates(normalized, exact="beta", prefix="alph", suffix="") == []
+    assert len(find_quote_candidates(normalized, exact="beta", prefix="", suffix="")) == 2
+
+
+def test_batch_matches_resolve_like_single_quotes() -> None:
+    sources = [
+        NormalizedOwnerSource(UUID(int=1), None, None, normalize_for_match("the cat sat. the dog")),
+        NormalizedOwnerSource(UUID(int=2), 0, 10, normalize_for_match("the  cat ran")),
+    ]
+    quotes = [
+        NormalizedQuote("cat"),
+        NormalizedQuote("cat", suffix="ran"),
+        NormalizedQuote("the dog", prefix="sat."),
+        NormalizedQuote("missing"),
+        NormalizedQuote(""),
+    ]
+    batch = match_quotes_in_sources(sources, quotes)
+    singles = [
+        match_quote_in_sources(sources, exact=q.exact, prefix=q.prefix, suffix=q.suffix)
+        for q in quotes
+    ]
+    assert batch == singles
+    assert [match.status for match in batch] == [
+        QuoteStatus.ambiguous,
+        QuoteStatus.unique,
+        QuoteStatus.unique,
+        QuoteStatus.no_match,
+        QuoteStatus.empty_exact,
+    ]
+    assert (batch[1].fragment_id, batch[1].raw_start, batch[1].raw_end) == (UUID(int=2), 5, 8)
+
+
+def test_joined_scan_matches_a_per_source_scan_and_never_crosses_a_seam() -> None:
+    rng = random.Random(320)
+    words = ["ab", "ba", "a", "b", "ab ba", "\n"]
+    for _ in range(100):
+        sources = [
+            NormalizedOwnerSource(
+                UUID(int=index),
+                None,
+                None,
+                normalize_for_match(" ".join(rng.choice(words) for _ in range(rng.randint(0, 6)))),
+            )
+            for index in range(rng.randint(1, 5))
+        ]
+        quotes = [NormalizedQuote(rng.choice(["a", "ab", "ab ba", "b a", "ba ab"]))]
+        [match] = match_quotes_in_sources(sources, quotes)
+        per_source = [
+            (source.fragment_id, hit.raw_start, hit.raw_end)
+            for source in sources
+            for hit in find_quote_candidates(
+                source.normalized, exact=quotes[0].exact, prefix="", suffix=""
+            )
+        ]
+        if len(per_source) == 1:
+            assert (match.fragment_id, match.raw_start, match.raw_end) == per_source[0]
+        else:
+            assert match.status == (
+                QuoteStatus.no_match if not per_source else QuoteStatus.ambiguous
+            )
+
+    seam = [
+        NormalizedOwnerSource(UUID(int=1), None, None, normalize_for_match("the end")),
+        NormalizedOwnerSource(UUID(int=2), None, None, normalize_for_match("begins here")),
+    ]
+    assert match_quote_in_sources(seam, exact="end begins").status == QuoteStatus.no_match
+
+
+def test_source_cache_is_revision_keyed_and_char_bounded() -> None:
+    media_id = UUID(int=9)
+    old_revision = (UUID(int=1), UUID(int=2), 1)
+    new_revision = (UUID(int=3), UUID(int=4), 1)
+    sources = [NormalizedOwnerSource(UUID(int=1), None, None, normalize_for_match("x" * 100))]
+    cache = _NormalizedSourceCache(max_chars=400)
+
+    cache.put(media_id, old_revision, sources)
+    assert cache.get(media_id, old_revision) is sources
+    assert cache.get(media_id, new_revision) is None
+
+    cache.put(media_id, new_revision, sources)
+    cache.put(UUID(int=10), old_revision, sources)
+    assert cache.get(media_id, old_revision) is None, "oldest entry is evicted past the budget"
+
+    cache.forget(media_id)
+    assert cache.get(media_id, new_revision) is None
+    assert cache.get(UUID(int=10), old_revision) is sources
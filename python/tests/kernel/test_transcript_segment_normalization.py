@@ -0,0 +1,62 @@
+"""Transcript segment normalization: single-pass ordering matches the sort.
+
+The oracle is the previous implementation: accept valid segments, stable-sort
+by (t_start_ms, provider position), then number them. The streaming pass must
+agree for chronological input and for input that turns out of order late.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from nexus.services.transcript_segments import (
+    TranscriptSegmentInput,
+    canonicalize_transcript_segment_text,
+    normalize_transcript_segments,
+)
+
+
+def _reference(raw_segments: list[Any]) -> list[TranscriptSegmentInput]:
+    accepted = []
+    for original_idx, segment in enumerate(raw_segments):
+        if not isinstance(segment, dict):
+            continue
+        text_value = canonicalize_transcript_segment_text(segment.get("text"))
+        start, end = segment.get("t_start_ms"), segment.get("t_end_ms")
+        if not text_value or not isinstance(start, int) or not isinstance(end, int):
+            continue
+        if start < 0 or start >= end:
+            continue
+        accepted.append((start, original_idx, end, text_value, segment.get("speaker_label")))
+    accepted.sort(key=lambda row: (row[0], row[1]))
+    return [
+        TranscriptSegmentInput(
+            segment_idx=position,
+            t_start_ms=start,
+            t_end_ms=end,
+            canonical_text=text_value,
+            speaker_label=speaker,
+        )
+        for position, (start, _original, end, text_value, speaker) in enumerate(accepted)
+    ]
+
+
+def _segment(start: int, end: int, text: str, speaker: str | None = None) -> dict[str, Any]:
+    return {"t_start_ms": start, "t_end_ms": end, "text": text, "speaker_label": speaker}
+
+
+def test_chronological_and_late_out_of_order_input_match_the_sorted_reference() -> None:
+    chronological = [
+        _segment(0, 900, "  opening   line ", "0"),
+        "not a segment",
+        _segment(900, 900, "zero length"),
+        _segment(900, 1800, "second", "1"),
+        _segment(900, 1200, "same start keeps provider order"),
+        _segment(1800, 2400, ""),
+        _segment(2400, 3000, "last"),
+    ]
+    late_inversion = [*chronological, _segment(1000, 1100, "correction"), _segment(50, 80, "cue")]
+
+    for raw in (chronological, late_inversion, [], [_segment(5, 9, "only")]):
+        assert list(normalize_transcript_segments(raw)) == _reference(raw)
+    assert normalize_transcript_segments({"segments": chronological}) == []
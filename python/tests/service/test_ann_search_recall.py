@@ -0,0 +1,149 @@
+"""Priority proof: filtered ANN candidates keep recall against exact search.
+
+Most of the indexed chunks belong to another reader, so the visibility filter
+discards most HNSW neighbours. With a small ``ef_search`` only the iterative
+scan keeps the top-k full; the exact answer comes from the same query with
+index scans disabled.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import random
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from nexus.config import get_settings
+from nexus.db.models import Fragment
+from nexus.services import semantic_chunks
+from nexus.services.bootstrap import ensure_user_and_default_library
+from nexus.services.content_indexing import rebuild_fragment_content_index
+from nexus.services.search.content_chunk_candidates import retrieve_content_chunk_candidates
+from nexus.services.search.query import SearchScope
+from nexus.services.semantic_chunks import build_text_embedding
+from tests.testkit.auth import UserRecord
+from tests.testkit.llm_tool_scenarios import create_readable_media
+
+_K = 5
+
+
+def _hashed_unit_vectors(texts: list[str], *, dimensions: int) -> list[list[float]]:
+    vectors = []
+    for value in texts:
+        rng = random.Random(hashlib.sha256(value.encode()).digest())
+        vector = [rng.gauss(0.0, 1.0) for _ in range(dimensions)]
+        norm = math.sqrt(sum(component * component for component in vector)) or 1.0
+        vectors.append([component / norm for component in vector])
+    return vectors
+
+
+def _indexed_media(db: Session, user_id: UUID, library_id: UUID, body: str) -> None:
+    media_id = create_readable_media(
+        db, user_id=user_id, default_library_id=library_id, title=body, canonical_text=body
+    )
+    rebuild_fragment_content_index(
+        db,
+        media_id=media_id,
+        source_kind="web_article",
+        fragments=list(db.scalars(select(Fragment).where(Fragment.media_id == media_id))),
+        reason="ann_recall_proof",
+    )
+
+
+def _candidate_ids(db: Session, viewer_id: UUID, query: str) -> list[UUID]:
+    # The planner would sort this small table; make it walk the HNSW index.
+    db.execute(text("SELECT set_config('enable_sort', 'off', true)"))
+    return [
+        candidate.content_chunk_id
+        for candidate in retrieve_content_chunk_candidates(
+            db,
+            viewer_id=viewer_id,
+            query_embedding=build_text_embedding(query),
+            scope=SearchScope("all"),
+            limit=_K,
+        )
+    ]
+
+
+def test_filtered_ann_candidates_match_exact_search(
+    db_session: Session,
+    test_user: UserRecord,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(semantic_chunks, "_embed_with_openai", _hashed_unit_vectors)
+    settings = get_settings()
+    monkeypatch.setattr(settings, "search_hnsw_ef_search", _K)
+    monkeypatch.setattr(settings, "search_hnsw_iterative_scan", "relaxed_order")
+
+    stranger_id = uuid4()
+    stranger_library_id = ensure_user_and_default_library(
+        db_session, stranger_id, f"{stranger_id}@example.invalid"
+    )
+    for index in range(60):
+        _indexed_media(db_session, stranger_id, stranger_library_id, f"Hidden passage {index}")
+    for index in range(8):
+        _indexed_media(
+            db_session, test_user.id, test_user.default_library_id, f"Visible passage {index}"
+        )
+
+    queries = [f"Reader question {index}" for index in range(6)]
+    hits = 0
+    for query in queries:
+        with db_session.begin_nested() as exact_scope:
+            db_session.execute(text("SELECT set_config('enable_indexscan', 'off', true)"))
+            exact = _candidate_ids(db_session, test_user.id, query)
+            exact_scope.rollback()
+        with db_session.begin_nested() as ann_scope:
+            approximate = _candidate_ids(db_session, test_user.id, query)
+            assert (
+                db_session.execute(
+                    text("SELECT current_setting('hnsw.iterative_scan', true)")
+                ).scalar_one()
+                == "relaxed_order"
+            ), "the installed pgvector supports iterative scans"
+            ann_scope.rollback()
+        assert len(exact) == _K
+        assert len(approximate) == _K, "the filter starved the ANN candidate list"
+        hits += len(set(exact) & set(approximate))
+
+    assert hits / (_K * len(queries)) >= 0.9
+
+
+def test_equally_distant_candidates_are_cut_by_chunk_id(
+    db_session: Session,
+    test_user: UserRecord,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(semantic_chunks, "_embed_with_openai", _hashed_unit_vectors)
+    settings = get_settings()
+    monkeypatch.setattr(settings, "search_hnsw_ef_search", _K)
+    monkeypatch.setattr(settings, "search_hnsw_iterative_scan", "relaxed_order")
+
+    # The same passage in more media than the limit: every chunk is the same
+    # distance from any query, so only the tiebreak decides which are kept.
+    for _ in range(_K + 3):
+        _indexed_media(db_session, test_user.id, test_user.default_library_id, "Repeated passage")
+    tied = sorted(
+        db_session.execute(
+            text(
+                """
+                SELECT cc.id
+                FROM content_chunks cc
+                JOIN library_entries le ON le.media_id = cc.owner_id
+                WHERE cc.owner_kind = 'media'
+                  AND le.library_id = :library_id
+                """
+            ),
+            {"library_id": test_user.default_library_id},
+        ).scalars()
+    )
+    assert len(tied) == _K + 3
+
+    with db_session.begin_nested() as ann_scope:
+        approximate = _candidate_ids(db_session, test_user.id, "Reader question")
+        ann_scope.rollback()
+    assert approximate == tied[:_K]
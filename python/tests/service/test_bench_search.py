@@ -0,0 +1,103 @@
+"""Smoke proof: every bench_search subcommand runs end to end on a tiny corpus.
+
+The corpus is committed under a fresh label, so it never collides with another
+run's rows in the disposable test database.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+SCRIPT = Path(__file__).parents[2] / "scripts" / "bench_search.py"
+
+
+def _bench_module() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("nexus_bench_search", SCRIPT)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_every_subcommand_runs_on_a_tiny_corpus(
+    engine: Engine, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    bench = _bench_module()
+    label = f"smoke-{uuid4().hex[:12]}"
+    common = ["--label", label, "--users", "2"]
+
+    assert (
+        bench.main(
+            [
+                "generate",
+                *common,
+                "--media-per-user",
+                "2",
+                "--fragments-per-media",
+                "2",
+                "--words-per-fragment",
+                "30",
+                "--notes-per-user",
+                "1",
+                "--conversations-per-user",
+                "1",
+                "--messages-per-conversation",
+                "2",
+                "--jobs",
+                "1",
+            ]
+        )
+        == 0
+    )
+    with engine.connect() as connection:
+        context_edges = connection.execute(
+            text(
+                """
+                SELECT count(*)
+                FROM resource_edges e
+                JOIN conversations c ON c.id = e.source_id
+                WHERE e.source_scheme = 'conversation'
+                  AND e.target_scheme = 'media'
+                  AND e.kind = 'context'
+                  AND c.owner_user_id = ANY(:user_ids)
+                """
+            ),
+            {"user_ids": [bench._bench_id(label, f"user:{idx}") for idx in range(2)]},
+        ).scalar_one()
+    assert context_edges == 2, "each conversation must carry its media context edge"
+
+    report = tmp_path / "run.json"
+    assert (
+        bench.main(["run", *common, "--repeat", "1", "--warmup", "0", "--report", str(report)]) == 0
+    )
+    assert report.exists()
+    assert (
+        bench.main(
+            [
+                "recall",
+                *common,
+                "--queries",
+                "2",
+                "--k",
+                "5",
+                "--ef-search",
+                "20",
+                "--iterative-scan",
+                "off",
+            ]
+        )
+        == 0
+    )
+    capsys.readouterr()
+    assert bench.main(["visibility", *common, "--readers", "1", "--repeat", "1"]) == 0
+    # Each reader joins both shelves, and each shelf holds half of a user's media.
+    assert "1 readers, visible media per reader 2..2" in capsys.readouterr().out
@@ -0,0 +1,295 @@
+"""Priority proof: concurrent read tools publish exactly what a sequential run does.
+
+A turn's consecutive read-only calls are read concurrently ahead of time, and
+the steps are then completed one by one in call order. The proof runs one turn
+of read, read, write, read three ways: with prefetch disabled, with prefetch,
+and with a prefetched read that raises. Each must produce the same tool rows,
+citation ordinals and stream events, and the read after the write must see it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+from provider_runtime import (
+    Absent,
+    CallMeta,
+    PossiblyBillable,
+    Present,
+    ResponsePayload,
+    Succeeded,
+    TerminalEvent,
+    TextContent,
+    TextDelta,
+    ToolCall,
+    ToolCallDone,
+)
+from provider_runtime.testing import ScriptedRuntime
+from sqlalchemy import Engine, text
+from sqlalchemy.orm import Session
+
+from nexus.config import get_settings
+from nexus.db.models import ChatRun
+from nexus.db.session import create_session_factory
+from nexus.jobs.queue import JobExecutionContext, claim_job
+from nexus.schemas.notes import CreatePageRequest
+from nexus.services import chat_runs, notes
+from nexus.services.agent_tools.read_resource import READ_RESOURCE_TOOL_NAME
+from nexus.services.agent_tools.writes import JOT_NOTE_TOOL_NAME
+from nexus.services.bootstrap import ensure_user_and_default_library
+from nexus.services.llm_execution import ProductionExecutionRuntime
+from nexus.services.llm_profiles import profile as profile_lookup
+from nexus.services.rate_limit import RateLimiter, get_rate_limiter, set_rate_limiter
+from nexus.services.resource_graph.context import add_context_ref_without_commit
+from nexus.services.resource_graph.refs import ResourceRef
+from tests.testkit.chat import create_entitled_chat
+from tests.testkit.llm_tool_scenarios import create_readable_media
+
+_PROFILE = profile_lookup("balanced")
+assert _PROFILE is not None
+_WORKER_ID = "read-prefetch-proof-worker"
+
+
+def _succeeded(content: TextContent) -> Succeeded:
+    return Succeeded(
+        meta=CallMeta(
+            provider=_PROFILE.target.provider,
+            model=_PROFILE.target.model,
+            provider_request_id=Present(f"req-{uuid4()}"),
+            upstream_provider=Absent(),
+            usage=Absent(),
+            attempt_trace=(),
+            billability=PossiblyBillable(),
+        ),
+        response=ResponsePayload(content=content, continuation=Absent()),
+    )
+
+
+def _turn_calls(
+    *, first_media_id: UUID, second_media_id: UUID, page_id: UUID, marker: str
+) -> tuple[ToolCall, ...]:
+    return (
+        ToolCall(
+            id="call-read-1",
+            name=READ_RESOURCE_TOOL_NAME,
+            arguments={"uri": f"media:{first_media_id}"},
+        ),
+        ToolCall(
+            id="call-read-2",
+            name=READ_RESOURCE_TOOL_NAME,
+            arguments={"uri": f"media:{second_media_id}"},
+        ),
+        ToolCall(
+            id="call-jot",
+            name=JOT_NOTE_TOOL_NAME,
+            arguments={"markdown": marker, "page_uri": f"page:{page_id}"},
+        ),
+        ToolCall(
+            id="call-read-3",
+            name=READ_RESOURCE_TOOL_NAME,
+            arguments={"uri": f"media:{first_media_id}"},
+        ),
+    )
+
+
+def _run_turn(engine: Engine, monkeypatch: pytest.MonkeyPatch, mode: str) -> dict[str, Any]:
+    marker = f"Prefetch proof note {uuid4()}"
+    with Session(engine, expire_on_commit=False) as db:
+        chat = create_entitled_chat(db, content="Read both, jot a note, then read again.")
+        default_library_id = ensure_user_and_default_library(db, chat.user_id)
+        media_ids = tuple(
+            create_readable_media(
+                db,
+                user_id=chat.user_id,
+                default_library_id=default_library_id,
+                title=title,
+                canonical_text=body,
+            )
+            for title, body in (
+                ("Tide tables", "High water comes twice a day along the estuary."),
+                ("Salt marsh", "Cordgrass holds the mud against the winter storms."),
+            )
+        )
+        for media_id in media_ids:
+            add_context_ref_without_commit(
+                db,
+                viewer_id=chat.user_id,
+                conversation_id=chat.conversation_id,
+                target=ResourceRef(scheme="media", id=media_id),
+                origin="user",
+            )
+        page_id = uuid4()
+        notes.create_page(db, chat.user_id, CreatePageRequest(page_id=page_id, title="Field notes"))
+        db.commit()
+        claimed = claim_job(
+            db,
+            job_id=chat.job_id,
+            worker_id=_WORKER_ID,
+            lease_seconds=300,
+            allowed_kinds=("chat_run",),
+        )
+        assert claimed is not None
+        db.commit()
+
+    calls = _turn_calls(
+        first_media_id=media_ids[0], second_media_id=media_ids[1], page_id=page_id, marker=marker
+    )
+    runtime = ScriptedRuntime(
+        stream_scripts=(
+            (
+                *(ToolCallDone(tool_call=call) for call in calls),
+                TerminalEvent(outcome=_succeeded(TextContent(text="", tool_calls=calls))),
+            ),
+            (
+                TextDelta(text="Both read; note jotted."),
+                TerminalEvent(
+                    outcome=_succeeded(TextContent(text="Both read; note jotted.", tool_calls=()))
+                ),
+            ),
+        )
+    )
+
+    # Per read: the notes carrying the marker that its session could see, and
+    # whether it ran on the event loop's thread (inline) or a worker (prefetch).
+    observed: dict[int, tuple[int, bool]] = {}
+    failed: list[int] = []
+    read_tool_call = chat_runs._read_tool_call
+
+    def spy_read(db: Session, **kwargs: Any) -> Any:
+        tool_call_index = kwargs["tool_call_index"]
+        inline = threading.current_thread() is threading.main_thread()
+        if mode == "prefetch_fails" and not inline and kwargs["tool_call"].id == "call-read-2":
+            failed.append(tool_call_index)
+            raise RuntimeError("injected prefetch failure")
+        outcome = read_tool_call(db, **kwargs)
+        notes_seen = db.execute(
+            text("SELECT count(*) FROM note_blocks WHERE body_text LIKE :pattern"),
+            {"pattern": f"%{marker}%"},
+        ).scalar_one()
+        observed[tool_call_index] = (notes_seen, inline)
+        return outcome
+
+    monkeypatch.setattr(chat_runs, "_read_tool_call", spy_read)
+    if mode == "sequential":
+
+        async def no_prefetch(*_args: Any, **_kwargs: Any) -> dict[int, Any]:
+            return {}
+
+        monkeypatch.setattr(chat_runs, "_prefetch_read_tool_calls", no_prefetch)
+
+    session_factory = create_session_factory(engine)
+    previous_limiter = get_rate_limiter()
+    set_rate_limiter(RateLimiter(session_factory=session_factory))
+    try:
+        with Session(engine, expire_on_commit=False) as db:
+            outcome = asyncio.run(
+                chat_runs.execute_chat_run(
+                    db,
+                    run_id=chat.run_id,
+                    job=claimed,
+                    execution_context=JobExecutionContext(
+                        job_id=claimed.id, worker_id=_WORKER_ID, attempt_no=claimed.attempts
+                    ),
+                    session_factory=session_factory,
+                    runtime=ProductionExecutionRuntime(runtime),
+                    settings=get_settings().model_copy(
+                        update={"openai_api_key": "sk-test-openai-key"}
+                    ),
+                )
+            )
+    finally:
+        set_rate_limiter(previous_limiter)
+    assert isinstance(outcome, chat_runs.PublishedChatExecution)
+
+    with Session(engine) as db:
+        run = db.get(ChatRun, chat.run_id)
+        assert run is not None and run.status == "complete"
+        tool_rows = db.execute(
+            text(
+                """
+                SELECT tool_call_index, tool_name, status
+                FROM message_tool_calls
+                WHERE assistant_message_id = :message_id
+                ORDER BY tool_call_index
+                """
+            ),
+            {"message_id": run.assistant_message_id},
+        ).all()
+        ordinals = db.execute(
+            text(
+                """
+                SELECT mtc.tool_call_index, mr.citation_candidate_ordinal
+                FROM message_retrievals mr
+                JOIN message_tool_calls mtc ON mtc.id = mr.tool_call_id
+                WHERE mtc.assistant_message_id = :message_id
+                ORDER BY mr.citation_candidate_ordinal
+                """
+            ),
+            {"message_id": run.assistant_message_id},
+        ).all()
+        events = db.execute(
+            text(
+                """
+                SELECT event_type, payload->>'tool_call_index', payload->>'tool_name',
+                       payload->>'status'
+                FROM chat_run_events
+                WHERE run_id = :run_id AND event_type = 'tool_result'
+                ORDER BY seq
+                """
+            ),
+            {"run_id": chat.run_id},
+        ).all()
+    first_index = tool_rows[0][0]
+    return {
+        "tool_rows": [(index - first_index, name, status) for index, name, status in tool_rows],
+        "ordinals": [
+            (index - first_index, ordinal - ordinals[0][1]) for index, ordinal in ordinals
+        ],
+        "events": [
+            (event_type, int(index) - first_index, name, status)
+            for event_type, index, name, status in events
+        ],
+        "notes_seen": {index - first_index: seen for index, (seen, _) in observed.items()},
+        "inline": {index - first_index: inline for index, (_, inline) in observed.items()},
+        "failed": [index - first_index for index in failed],
+    }
+
+
+@pytest.mark.parametrize("mode", ["sequential", "concurrent", "prefetch_fails"])
+def test_prefetched_reads_publish_the_sequential_rows_ordinals_and_events(
+    engine: Engine,
+    monkeypatch: pytest.MonkeyPatch,
+    mode: str,
+) -> None:
+    observed = _run_turn(engine, monkeypatch, mode)
+
+    assert observed["tool_rows"] == [
+        (0, READ_RESOURCE_TOOL_NAME, "complete"),
+        (1, READ_RESOURCE_TOOL_NAME, "complete"),
+        (2, JOT_NOTE_TOOL_NAME, "complete"),
+        (3, READ_RESOURCE_TOOL_NAME, "complete"),
+    ]
+    assert observed["ordinals"] == [(0, 0), (1, 1), (3, 2)], (
+        "citation ordinals must follow call order, not read completion order"
+    )
+    assert observed["events"] == [
+        ("tool_result", 0, READ_RESOURCE_TOOL_NAME, "complete"),
+        ("tool_result", 1, READ_RESOURCE_TOOL_NAME, "complete"),
+        ("tool_result", 2, JOT_NOTE_TOOL_NAME, "complete"),
+        ("tool_result", 3, READ_RESOURCE_TOOL_NAME, "complete"),
+    ]
+    assert observed["notes_seen"] == {0: 0, 1: 0, 3: 1}, "a read after a write must see the write"
+
+    if mode == "sequential":
+        assert observed["inline"] == {0: True, 1: True, 3: True}
+    elif mode == "concurrent":
+        assert observed["inline"] == {0: False, 1: False, 3: True}
+    else:
+        # The failed prefetch is repeated inline at its turn; its sibling's
+        # prefetched outcome is kept.
+        assert observed["failed"] == [1]
+        assert observed["inline"] == {0: False, 1: True, 3: True}
@@ -0,0 +1,167 @@
+"""Priority proof: a chat-run cancel reaches the executor through the shared LISTEN.
+
+The executor no longer polls ``cancel_requested_at``; the 0222 trigger notifies
+the run id and one LISTEN per process wakes the watching run. The proofs cancel
+through the owner API and require the provider-stream watcher to fire for that
+run only, and require a cancel made while the LISTEN connection is down to be
+observed during the outage, with notifications resuming once it reconnects.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import Counter
+from uuid import UUID
+
+import psycopg
+import pytest
+from psycopg.rows import TupleRow
+from sqlalchemy import Engine, text
+from sqlalchemy.orm import Session
+
+from nexus.db import listen
+from nexus.services import chat_run_event_store
+from nexus.services.chat_run_event_store import (
+    CHAT_RUN_CANCEL_CHANNEL,
+    ChatRunCancelWatch,
+    watch_chat_run_cancel,
+)
+from nexus.services.chat_runs import _watch_chat_run_cancel, cancel_chat_run
+from tests.testkit.chat import create_entitled_chat
+
+_LISTEN_QUERY = f'LISTEN "{CHAT_RUN_CANCEL_CHANNEL}"'
+
+
+def _listener_pids(engine: Engine) -> set[int]:
+    with engine.connect() as conn:
+        return set(
+            conn.execute(
+                text("SELECT pid FROM pg_stat_activity WHERE query = :query"),
+                {"query": _LISTEN_QUERY},
+            ).scalars()
+        )
+
+
+async def _new_listener(engine: Engine, known: set[int]) -> int:
+    """The pid of a LISTEN connection not in ``known``, once its re-sync has landed."""
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        new = _listener_pids(engine) - known
+        if new:
+            # The listener raises every tick right after its LISTEN; let that
+            # land so later subscribers are raised only by their own NOTIFY.
+            await asyncio.sleep(0.2)
+            return new.pop()
+        await asyncio.sleep(0.05)
+    raise AssertionError(f"no new {_LISTEN_QUERY} connection within 10s")
+
+
+def _cancel(engine: Engine, *, user_id: UUID, run_id: UUID) -> None:
+    with Session(engine) as db:
+        cancel_chat_run(db, viewer_id=user_id, run_id=run_id)
+
+
+def test_owner_cancel_wakes_only_that_runs_stream_watcher(
+    engine: Engine,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    with Session(engine) as db:
+        cancelled = create_entitled_chat(db, content="Stop this one.")
+        bystander = create_entitled_chat(db, content="Keep this one going.")
+    reads: Counter[UUID] = Counter()
+    is_cancel_requested = chat_run_event_store.is_cancel_requested
+
+    def counting_read(db: Session, run_id: UUID) -> bool:
+        reads[run_id] += 1
+        return is_cancel_requested(db, run_id)
+
+    monkeypatch.setattr(chat_run_event_store, "is_cancel_requested", counting_read)
+    # A fresh process-wide listener, so its LISTEN connection is the new one.
+    monkeypatch.setattr(
+        chat_run_event_store,
+        "_cancel_listener",
+        listen.SharedChannelListener(CHAT_RUN_CANCEL_CHANNEL),
+    )
+    known = _listener_pids(engine)
+
+    async def cancel_one_of_two() -> None:
+        with (
+            Session(engine) as db,
+            watch_chat_run_cancel(cancelled.run_id) as cancel_watch,
+        ):
+            await _new_listener(engine, known)
+            with watch_chat_run_cancel(bystander.run_id) as bystander_watch:
+                # A new subscriber reads its row once.
+                assert not cancel_watch.requested(db)
+                assert not bystander_watch.requested(db)
+                bystander_reads = reads[bystander.run_id]
+
+                cancel_signal = asyncio.Event()
+                watcher = asyncio.create_task(
+                    _watch_chat_run_cancel(
+                        db, cancel_watch=cancel_watch, cancel_signal=cancel_signal
+                    )
+                )
+                _cancel(engine, user_id=cancelled.user_id, run_id=cancelled.run_id)
+                await asyncio.wait_for(watcher, timeout=10)
+
+                assert cancel_signal.is_set(), "the stream watcher never saw the cancel"
+                assert not bystander_watch.requested(db)
+                assert reads[bystander.run_id] == bystander_reads, (
+                    "a cancel NOTIFY for one run made another run re-read its row"
+                )
+
+    asyncio.run(cancel_one_of_two())
+
+
+def test_a_cancel_during_a_listen_outage_is_observed_and_notifies_resume(
+    engine: Engine,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    with Session(engine) as db:
+        during_outage = create_entitled_chat(db, content="Cancelled while the LISTEN is down.")
+        after_reconnect = create_entitled_chat(db, content="Cancelled after it is back.")
+    down = threading.Event()
+    connect_sync = listen._connect_sync
+
+    def flaky_connect() -> psycopg.Connection[TupleRow]:
+        if down.is_set():
+            raise psycopg.OperationalError("LISTEN connection refused for the proof")
+        return connect_sync()
+
+    monkeypatch.setattr(listen, "_connect_sync", flaky_connect)
+    # A listener of its own, so the proof cannot disturb the process-wide one.
+    listener = listen.SharedChannelListener(CHAT_RUN_CANCEL_CHANNEL, reconnect_seconds=0.1)
+    known = _listener_pids(engine)
+
+    async def cancel_across_an_outage() -> None:
+        with (
+            Session(engine) as db,
+            listener.subscribe(str(during_outage.run_id)) as outage_tick,
+        ):
+            outage_watch = ChatRunCancelWatch(during_outage.run_id, outage_tick)
+            pid = await _new_listener(engine, known)
+            assert not outage_watch.requested(db)
+
+            down.set()
+            with engine.connect() as conn:
+                conn.execute(text("SELECT pg_terminate_backend(:pid)"), {"pid": pid})
+            _cancel(engine, user_id=during_outage.user_id, run_id=during_outage.run_id)
+            await asyncio.wait_for(outage_watch.wait(db), timeout=10)
+            assert not _listener_pids(engine) - known, (
+                "the cancel must be observed while the LISTEN is still down"
+            )
+
+            down.clear()
+            await _new_listener(engine, known)
+            with listener.subscribe(str(after_reconnect.run_id)) as reconnect_tick:
+                reconnect_watch = ChatRunCancelWatch(after_reconnect.run_id, reconnect_tick)
+                assert not reconnect_watch.requested(db)
+                _cancel(engine, user_id=after_reconnect.user_id, run_id=after_reconnect.run_id)
+                # Only the NOTIFY can raise this tick now that the LISTEN is back.
+                await asyncio.wait_for(reconnect_tick.wait(), timeout=10)
+                assert reconnect_watch.requested(db)
+
+    asyncio.run(cancel_across_an_outage())
@@ -0,0 +1,64 @@
+"""Priority proof: collection list routes answer If-None-Match from the revision.
+
+Through the real FastAPI stack, a current validator must get a bodiless 304
+carrying the same ETag, and a write that bumps the family revision must turn
+the old validator into a 200 with the new page and a new ETag.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from nexus.services.collection_http_cache import COLLECTION_CACHE_CONTROL
+
+
+def _create_library(client: TestClient) -> str:
+    library_id = str(uuid4())
+    response = client.post("/libraries", json={"library_id": library_id, "name": "Tide tables"})
+    assert response.status_code == 201, response.text
+    return library_id
+
+
+def _create_conversation(client: TestClient) -> str:
+    response = client.post("/conversations")
+    assert response.status_code == 201, response.text
+    return str(response.json()["data"]["id"])
+
+
+@pytest.mark.parametrize(
+    ("path", "bump"),
+    [("/libraries", _create_library), ("/conversations", _create_conversation)],
+)
+def test_a_current_validator_gets_304_until_the_revision_moves(
+    authenticated_client: TestClient,
+    path: str,
+    bump: Callable[[TestClient], str],
+) -> None:
+    first = authenticated_client.get(path)
+    assert first.status_code == 200, first.text
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == COLLECTION_CACHE_CONTROL
+
+    revalidated = authenticated_client.get(path, headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+
+    created_id = bump(authenticated_client)
+
+    changed = authenticated_client.get(path, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    page = changed.json()["data"]
+    assert page["collectionRevision"] > first.json()["data"]["collectionRevision"]
+    assert created_id in {str(row["id"]) for row in page["items"]}
+    assert (
+        authenticated_client.get(
+            path, headers={"If-None-Match": changed.headers["etag"]}
+        ).status_code
+        == 304
+    )
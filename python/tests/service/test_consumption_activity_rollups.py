@@ -0,0 +1,150 @@
+"""Priority proof: rollup-backed activity stats answer the same snapshot as raw spans."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID, uuid4
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from nexus.db.models import Media, MediaKind, ProcessingStatus
+from nexus.services.consumption._activity_stats import (
+    ActivityQuery,
+    activity_totals_rows,
+    activity_totals_sql,
+    device_breakdown_rows,
+    local_hours_sql,
+    rollup_core_bounds,
+)
+from nexus.services.consumption._activity_store import upsert_activity_rollups_in_txn
+from nexus.services.library_entries import ensure_entry, media_target
+from tests.testkit.auth import UserRecord
+
+_DAY = datetime(2026, 3, 1, tzinfo=UTC)
+_FOLDED = datetime(2026, 3, 2, 12, tzinfo=UTC)
+_AS_OF = _FOLDED + timedelta(minutes=1)
+_LATE = _FOLDED + timedelta(minutes=5)
+
+
+def _span(
+    db: Session,
+    *,
+    viewer_id: UUID,
+    media_id: UUID,
+    device_id: str,
+    occurred_at: datetime,
+    words: tuple[int, int],
+    created_at: datetime,
+) -> None:
+    span_id = uuid4()
+    db.execute(
+        text(
+            """
+            INSERT INTO consumption_activity_spans (
+                id, user_id, media_id, modality, device_id, device_class, occurred_at,
+                duration_ms, word_start, word_end, created_at
+            ) VALUES (
+                :id, :user_id, :media_id, 'Reading', :device_id, 'Desktop', :occurred_at,
+                20000, :word_start, :word_end, :created_at
+            )
+            """
+        ),
+        {
+            "id": span_id,
+            "user_id": viewer_id,
+            "media_id": media_id,
+            "device_id": device_id,
+            "occurred_at": occurred_at,
+            "word_start": words[0],
+            "word_end": words[1],
+            "created_at": created_at,
+        },
+    )
+    upsert_activity_rollups_in_txn(db, span_ids=[span_id])
+
+
+def _raw_params(viewer_id: UUID, query: ActivityQuery) -> dict[str, Any]:
+    assert query.start is not None
+    return {
+        "viewer_id": viewer_id,
+        "start": query.start,
+        "end": query.end,
+        "core_start": query.start,
+        "core_end": query.start,
+        "time_zone": query.time_zone,
+        "as_of_created_at": _AS_OF,
+    }
+
+
+def test_rollup_reads_match_raw_spans_when_facts_arrive_after_as_of(
+    db_session: Session,
+    test_user: UserRecord,
+) -> None:
+    """A slot folded after ``as_of`` is replayed, never read with the later spans in it."""
+    media_id = uuid4()
+    db_session.add(
+        Media(
+            id=media_id,
+            kind=MediaKind.web_article.value,
+            title="Rollup snapshot",
+            requested_url=f"https://rollups.invalid/{media_id}",
+            processing_status=ProcessingStatus.ready_for_reading,
+            created_by_user_id=test_user.id,
+        )
+    )
+    db_session.flush()
+    ensure_entry(db_session, test_user.default_library_id, media_target(media_id))
+
+    at = _DAY.replace(hour=10)
+    for occurred_at, words, created_at, device_id in (
+        (at + timedelta(minutes=3), (0, 50), _FOLDED, "desk"),
+        (at + timedelta(minutes=14, seconds=50), (50, 60), _FOLDED, "desk"),
+        (at + timedelta(minutes=5), (60, 90), _LATE, "desk"),
+        (at - timedelta(hours=2), (90, 95), _LATE, "desk"),
+        (at + timedelta(minutes=6), (0, 40), _LATE, "phone"),
+    ):
+        _span(
+            db_session,
+            viewer_id=test_user.id,
+            media_id=media_id,
+            device_id=device_id,
+            occurred_at=occurred_at,
+            words=words,
+            created_at=created_at,
+        )
+
+    query = ActivityQuery(start=_DAY, end=_DAY + timedelta(days=1), time_zone="Asia/Kolkata")
+    core_start, core_end = rollup_core_bounds(_DAY, query.end)
+    assert core_start <= at < core_end, "the late slots must sit inside the rollup core"
+
+    rolled = activity_totals_rows(db_session, viewer_id=test_user.id, query=query, as_of=_AS_OF)
+    raw = [
+        dict(row)
+        for row in db_session.execute(
+            text(activity_totals_sql()), _raw_params(test_user.id, query)
+        ).mappings()
+    ]
+    expected = [
+        {
+            "modality": "Reading",
+            "active_ms": 40000,
+            "forward_word_position": 60,
+            "forward_media_position_ms": 0,
+        }
+    ]
+    assert raw == expected, "spans created after as_of must not count"
+    assert rolled == raw
+
+    hours = db_session.execute(
+        text(local_hours_sql()),
+        {**_raw_params(test_user.id, query), "core_start": core_start, "core_end": core_end},
+    ).all()
+    raw_hours = db_session.execute(text(local_hours_sql()), _raw_params(test_user.id, query)).all()
+    assert hours == raw_hours
+
+    devices = device_breakdown_rows(db_session, viewer_id=test_user.id, query=query, as_of=_AS_OF)
+    assert [(row["device_id"], row["first_seen_at"]) for row in devices] == [
+        ("desk", at + timedelta(minutes=3))
+    ]
@@ -0,0 +1,94 @@
+"""Priority proof: the halfvec backfill re-scans rows its cursor moved past.
+
+``SKIP LOCKED`` lets the id cursor pass a row another transaction holds. The
+proof parks an unfilled row behind the cursor, which is where such a row ends
+up, and requires the pass to restart from the first id instead of completing.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from nexus.db.models import Fragment
+from nexus.jobs.queue import JobExecutionContext, RescheduleRequested, enqueue_job
+from nexus.services.content_indexing import rebuild_fragment_content_index
+from nexus.tasks import content_embedding_halfvec_backfill as backfill
+from tests.testkit.auth import UserRecord
+from tests.testkit.llm_tool_scenarios import create_readable_media
+
+_LAST_ID = "ffffffff-ffff-ffff-ffff-ffffffffffff"
+
+
+def test_rows_behind_the_cursor_are_filled_by_a_second_pass(
+    db_session: Session,
+    test_user: UserRecord,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        backfill,
+        "get_session_factory",
+        lambda: sessionmaker(
+            bind=db_session.get_bind(),
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        ),
+    )
+    media_id = create_readable_media(
+        db_session,
+        user_id=test_user.id,
+        default_library_id=test_user.default_library_id,
+        title="Halfvec backfill",
+        canonical_text="Tides turn twice a day along the estuary.",
+    )
+    rebuild_fragment_content_index(
+        db_session,
+        media_id=media_id,
+        source_kind="web_article",
+        fragments=list(db_session.scalars(select(Fragment).where(Fragment.media_id == media_id))),
+        reason="halfvec_backfill_proof",
+    )
+    unfilled = """
+        SELECT count(*)
+        FROM content_embeddings ce
+        JOIN content_chunks cc ON cc.id = ce.chunk_id
+        WHERE cc.owner_id = :media_id AND ce.embedding_halfvec IS NULL
+    """
+    db_session.execute(
+        text(
+            """
+            UPDATE content_embeddings ce
+            SET embedding_halfvec = NULL
+            FROM content_chunks cc
+            WHERE cc.id = ce.chunk_id AND cc.owner_id = :media_id
+            """
+        ),
+        {"media_id": media_id},
+    )
+    assert db_session.execute(text(unfilled), {"media_id": media_id}).scalar_one() > 0
+    job = enqueue_job(
+        db_session,
+        kind=backfill.CONTENT_EMBEDDING_HALFVEC_BACKFILL_JOB_KIND,
+        payload={"afterId": _LAST_ID},
+    )
+    db_session.flush()
+    context = JobExecutionContext(job_id=job.id, worker_id="halfvec-backfill-proof", attempt_no=1)
+
+    rescan = backfill.content_embedding_halfvec_backfill(payload=job.payload, context=context)
+
+    assert isinstance(rescan, RescheduleRequested), "a short pass completed with rows unfilled"
+    assert "afterId" not in rescan.payload
+    assert rescan.available_at > datetime.now(UTC)
+
+    db_session.execute(
+        text("UPDATE background_jobs SET payload = CAST(:payload AS jsonb) WHERE id = :job_id"),
+        {"payload": "{}", "job_id": job.id},
+    )
+    done = backfill.content_embedding_halfvec_backfill(payload={}, context=context)
+
+    assert not isinstance(done, RescheduleRequested)
+    assert done is not None and done["disposition"] == "BackfillComplete"
+    assert db_session.execute(text(unfilled), {"media_id": media_id}).scalar_one() == 0
@@ -0,0 +1,131 @@
+"""Priority proof: every index-state writer persists the recomputed content fingerprint."""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from nexus.db.models import Fragment
+from nexus.jobs.queue import JobExecutionContext, claim_job
+from nexus.jobs.registry import get_default_registry
+from nexus.services.content_indexing import (
+    MEDIA_CONTENT_REINDEX_JOB_KIND,
+    IndexOwner,
+    deactivate_content_index,
+    mark_content_index_failed,
+    mark_content_index_pending,
+    plan_content_index,
+    prepare_media_content_reindex,
+    publish_media_content_reindex,
+    rebuild_fragment_content_index,
+    request_media_content_reindex,
+)
+from nexus.services.media_intelligence import _hash_content_fingerprint
+from tests.testkit.auth import UserRecord
+from tests.testkit.llm_tool_scenarios import create_readable_media
+
+
+def _assert_fingerprint_current(db: Session, media_id: UUID, writer: str) -> str:
+    stored = db.execute(
+        text(
+            """
+            SELECT content_fingerprint
+            FROM content_index_states
+            WHERE owner_kind = 'media' AND owner_id = :media_id
+            """
+        ),
+        {"media_id": media_id},
+    ).scalar_one()
+    assert stored == _hash_content_fingerprint(db, media_id=media_id), (
+        f"{writer} left a stale content fingerprint"
+    )
+    return stored
+
+
+def _rebuild(db: Session, media_id: UUID) -> None:
+    fragments = list(db.scalars(select(Fragment).where(Fragment.media_id == media_id)))
+    rebuild_fragment_content_index(
+        db,
+        media_id=media_id,
+        source_kind="web_article",
+        fragments=fragments,
+        reason="fingerprint_proof",
+    )
+
+
+def test_stored_fingerprint_matches_recompute_after_every_writer(
+    db_session: Session,
+    test_user: UserRecord,
+) -> None:
+    media_id = create_readable_media(
+        db_session,
+        user_id=test_user.id,
+        default_library_id=test_user.default_library_id,
+        title="Fingerprint proof",
+        canonical_text="Attention is the scarcest resource a reader has.",
+    )
+    owner = IndexOwner("media", media_id)
+
+    _rebuild(db_session, media_id)
+    ready = _assert_fingerprint_current(db_session, media_id, "publish_content_index")
+
+    mark_content_index_pending(db_session, owner=owner, reason="fingerprint_proof")
+    _assert_fingerprint_current(db_session, media_id, "mark_content_index_pending")
+    mark_content_index_failed(
+        db_session, owner=owner, failure_code="E_PROOF", failure_message="synthetic failure"
+    )
+    _assert_fingerprint_current(db_session, media_id, "mark_content_index_failed")
+
+    intent = request_media_content_reindex(
+        db_session, media_id=media_id, reason="operator_repair", request_id=None
+    )
+    _assert_fingerprint_current(db_session, media_id, "request_media_content_reindex")
+    db_session.commit()
+
+    lease_seconds = get_default_registry()[MEDIA_CONTENT_REINDEX_JOB_KIND].lease_seconds
+    job = claim_job(
+        db_session,
+        job_id=intent.background_job_id,
+        worker_id="fingerprint-proof",
+        lease_seconds=lease_seconds,
+        allowed_kinds=(MEDIA_CONTENT_REINDEX_JOB_KIND,),
+    )
+    assert job is not None
+    context = JobExecutionContext(
+        job_id=job.id, worker_id="fingerprint-proof", attempt_no=job.attempts
+    )
+    work = prepare_media_content_reindex(
+        db_session,
+        media_id=media_id,
+        revision=intent.revision,
+        reason="operator_repair",
+        context=context,
+        lease_seconds=lease_seconds,
+    )
+    assert work is not None
+    _assert_fingerprint_current(db_session, media_id, "prepare_media_content_reindex")
+
+    result = publish_media_content_reindex(
+        db_session,
+        work=work,
+        plan=plan_content_index(
+            owner=owner, source_kind=work.source_kind, blocks=list(work.blocks)
+        ),
+        context=context,
+        lease_seconds=lease_seconds,
+    )
+    assert result is not None
+    _assert_fingerprint_current(db_session, media_id, "publish_media_content_reindex")
+
+    deactivate_content_index(db_session, owner=owner, reason="fingerprint_proof")
+    _assert_fingerprint_current(db_session, media_id, "deactivate_content_index")
+
+    db_session.execute(
+        text("UPDATE fragments SET canonical_text = :text WHERE media_id = :media_id"),
+        {"text": "Habits decide what a reader notices first.", "media_id": media_id},
+    )
+    db_session.expire_all()
+    _rebuild(db_session, media_id)
+    assert _assert_fingerprint_current(db_session, media_id, "rebuild after edit") != ready
@@ -7,7 +7,7 @@ from uuid import uuid4
 from sqlalchemy import Engine, select
 from sqlalchemy.orm import Session
 
-from nexus.db.models import Media, MediaFile, MediaKind, ProcessingStatus
+from nexus.db.models import Media, MediaFile, MediaKind, MediaSourceAttempt, ProcessingStatus
 from nexus.services.bootstrap import ensure_user_and_default_library
 from nexus.services.media_deletion import (
     delete_document_media_if_unreferenced,
@@ -17,6 +17,8 @@ from nexus.storage.client import get_storage_client
 from nexus.storage.paths import build_storage_path
 from nexus.tasks.storage_object_cleanup import (
     finalize_storage_object_write,
+    path_has_live_db_owner,
+    paths_with_live_db_owner,
     reserve_storage_object_write,
 )
 
@@ -100,3 +102,107 @@ def test_owned_object_write_and_document_delete_converge_across_postgres_and_min
     assert storage.head_object(storage_path) is None, (
         "document deletion left an object without a live database owner"
     )
+
+
+def test_page_ownership_matches_per_path_checks_and_batch_delete_removes_only_orphans(
+    engine: Engine,
+) -> None:
+    """The orphan sweep's page query agrees with the per-path owner check."""
+    user_id = uuid4()
+    media_id = uuid4()
+    file_path = build_storage_path(media_id, "pdf")
+    attempt_path = f"media/{media_id}/arxiv/source.tar.gz"
+    # Postgres before 16 reads E'\v' as a literal "v": neither trim may eat a
+    # trailing "v", and the SQL trim must strip whatever str.strip() strips.
+    trailing_v_path = f"media/{media_id}/exports/annotations.csv"
+    vertical_tab_path = f"media/{media_id}/arxiv/figures.tar"
+    no_break_space_path = f"media/{media_id}/arxiv/tables.tar"
+    orphan_path = f"media/{media_id}/orphaned.bin"
+    foreign_path = f"media/{uuid4()}/arxiv/source.tar.gz"
+    storage = get_storage_client()
+
+    with Session(engine) as db:
+        ensure_user_and_default_library(db, user_id, f"orphan-page-{user_id}@example.invalid")
+        db.add(
+            Media(
+                id=media_id,
+                kind=MediaKind.pdf.value,
+                title="Orphan page ownership",
+                processing_status=ProcessingStatus.ready_for_reading,
+                created_by_user_id=user_id,
+            )
+        )
+        db.flush()
+        db.add_all(
+            [
+                MediaFile(
+                    media_id=media_id,
+                    storage_path=file_path,
+                    content_type="application/pdf",
+                    size_bytes=3,
+                ),
+                MediaSourceAttempt(
+                    id=uuid4(),
+                    media_id=media_id,
+                    created_by_user_id=user_id,
+                    source_type="uploaded_pdf_file",
+                    attempt_no=1,
+                    status="succeeded",
+                    intent_key=f"orphan-page-proof:{media_id}",
+                    # The foreign path is named here but belongs to another media id.
+                    source_payload={
+                        "arxiv_source_package": {"storage_path": f" {attempt_path} "},
+                        "source_storage_path": foreign_path,
+                    },
+                ),
+                MediaSourceAttempt(
+                    id=uuid4(),
+                    media_id=media_id,
+                    created_by_user_id=user_id,
+                    source_type="uploaded_pdf_file",
+                    attempt_no=2,
+                    status="succeeded",
+                    intent_key=f"orphan-page-proof:{media_id}:2",
+                    source_payload={
+                        "storage_path": trailing_v_path,
+                        "source_storage_path": f"\v{vertical_tab_path}\v",
+                        "arxiv_source_package": {
+                            "storage_path": f"\u00a0{no_break_space_path}\u00a0"
+                        },
+                    },
+                ),
+            ]
+        )
+        db.commit()
+
+        paths = [
+            file_path,
+            attempt_path,
+            trailing_v_path,
+            vertical_tab_path,
+            no_break_space_path,
+            orphan_path,
+            foreign_path,
+        ]
+        owned = paths_with_live_db_owner(db, paths)
+        per_path = {path for path in paths if path_has_live_db_owner(db, path)}
+
+    assert (
+        owned
+        == per_path
+        == {
+            file_path,
+            attempt_path,
+            trailing_v_path,
+            vertical_tab_path,
+            no_break_space_path,
+        }
+    ), f"page ownership {owned!r} diverged from per-path ownership {per_path!r}"
+
+    for path in paths:
+        storage.put_object(path, b"pdf", "application/octet-stream")
+    storage.delete_objects([path for path in paths if path not in owned])
+
+    survivors = {path for path in paths if storage.head_object(path) is not None}
+    assert survivors == owned, f"batch delete left {survivors - owned!r} or removed owned paths"
+    storage.delete_objects(sorted(owned))
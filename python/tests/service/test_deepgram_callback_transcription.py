@@ -0,0 +1,358 @@
+"""Priority proof: a callback-delivered transcription yields, wakes, falls back, and expires.
+
+The source attempt runs through ``run_source_attempt`` against sessions joined
+to the test transaction; the provider is a recording stand-in that queues
+every submission for callback delivery. Polls continue one run, so
+``run_count`` never moves while the attempt waits on its provider.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from nexus.config import get_settings
+from nexus.db.models import (
+    MediaSourceAttempt,
+    Podcast,
+    PodcastEpisode,
+    PodcastTranscriptionJob,
+)
+from nexus.errors import ApiError, ApiErrorCode
+from nexus.jobs.queue import (
+    JobExecutionContext,
+    claim_job,
+    enqueue_job,
+    reschedule_running_job,
+)
+from nexus.services.media_source_ingest import run_source_attempt
+from nexus.services.podcasts import transcription
+from nexus.services.podcasts.deepgram_adapter import DeepgramSubmission
+from nexus.services.podcasts.ingest import sync_subscription_ingest
+from nexus.services.podcasts.provider import PODCAST_PROVIDER
+from nexus.services.podcasts.transcription import TranscriptionAwaitingProvider
+from nexus.services.transcripts.current import ensure_media_transcript_state_row
+from tests.testkit.auth import UserRecord
+
+_SECRET = "deepgram-callback-proof-secret"
+_CALLBACK_PATH = "/podcasts/transcription/deepgram/callback"
+_WORKER = "deepgram-callback-proof"
+
+
+class _QueuedDeepgram:
+    """Accepts every submission for callback delivery and records its diarize flag."""
+
+    def __init__(self) -> None:
+        self.submissions: list[bool] = []
+
+    def submit(
+        self, audio_url: str | None, *, diarize: bool, callback_url: str
+    ) -> DeepgramSubmission:
+        assert audio_url and callback_url.endswith(f"?token={_SECRET}")
+        self.submissions.append(diarize)
+        return DeepgramSubmission(request_id=f"dg-proof-{len(self.submissions)}")
+
+
+@dataclass(frozen=True)
+class _AwaitingEpisode:
+    media_id: UUID
+    attempt_id: UUID
+    job_id: UUID
+    actor_user_id: UUID
+
+
+@pytest.fixture
+def deepgram(monkeypatch: pytest.MonkeyPatch) -> _QueuedDeepgram:
+    settings = get_settings()
+    monkeypatch.setattr(
+        settings, "deepgram_callback_url", f"https://nexus.example.invalid{_CALLBACK_PATH}"
+    )
+    monkeypatch.setattr(settings, "deepgram_callback_secret", _SECRET)
+    client = _QueuedDeepgram()
+    monkeypatch.setattr(transcription, "get_deepgram_client", lambda: client)
+    return client
+
+
+@pytest.fixture
+def sessions(db_session: Session) -> sessionmaker[Session]:
+    return sessionmaker(
+        bind=db_session.get_bind(),
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+
+def _awaiting_episode(
+    db: Session,
+    user: UserRecord,
+    *,
+    diarize: bool,
+    submitted_at: datetime,
+    provider_result: dict[str, object] | None = None,
+) -> _AwaitingEpisode:
+    """One podcast attempt that already submitted ``dg-proof-0`` and yielded once."""
+    podcast_id = uuid4()
+    feed_url = f"https://feeds.example.invalid/{podcast_id}.xml"
+    db.add(
+        Podcast(
+            id=podcast_id,
+            provider=PODCAST_PROVIDER,
+            provider_podcast_id=f"deepgram-callback-proof-{podcast_id}",
+            title="Deepgram callback proof",
+            feed_url=feed_url,
+        )
+    )
+    db.flush()
+    now = datetime.now(UTC)
+    sync_subscription_ingest(
+        db=db,
+        viewer_id=user.id,
+        podcast_id=podcast_id,
+        feed_url=feed_url,
+        selected_episodes=[
+            {
+                "podcast_index_episode_ref": f"deepgram-proof-{podcast_id}",
+                "guid": f"deepgram-proof-{podcast_id}",
+                "title": "Callback episode",
+                "audio_url": f"https://media.example.invalid/{podcast_id}.mp3",
+                "published_at": now - timedelta(days=1),
+                "duration_seconds": 120,
+            }
+        ],
+        now=now,
+    )
+    media_id = db.scalars(
+        select(PodcastEpisode.media_id).where(PodcastEpisode.podcast_id == podcast_id)
+    ).one()
+    db.execute(
+        text("UPDATE media SET processing_status = 'extracting' WHERE id = :media_id"),
+        {"media_id": media_id},
+    )
+    ensure_media_transcript_state_row(db, media_id=media_id, now=now, request_reason="episode_open")
+    job_row = PodcastTranscriptionJob(
+        media_id=media_id,
+        requested_by_user_id=user.id,
+        request_reason="episode_open",
+        status="running",
+        provider_request_id="dg-proof-0",
+        provider_diarize=diarize,
+        provider_submitted_at=submitted_at,
+    )
+    if provider_result is not None:
+        # An unset JSONB attribute stays SQL NULL; None would store JSON null.
+        job_row.provider_result = provider_result
+        job_row.provider_result_received_at = now
+    db.add(job_row)
+    attempt_id = uuid4()
+    job = enqueue_job(
+        db,
+        kind="ingest_media_source",
+        payload={
+            "media_id": str(media_id),
+            "attempt_id": str(attempt_id),
+            "actor_user_id": str(user.id),
+            "request_id": None,
+        },
+    )
+    db.add(
+        MediaSourceAttempt(
+            id=attempt_id,
+            media_id=media_id,
+            created_by_user_id=user.id,
+            source_type="podcast_episode_transcript",
+            attempt_no=1,
+            run_count=1,
+            status="running",
+            intent_key=f"deepgram-callback-proof:{media_id}",
+            source_payload={"request_reason": "episode_open"},
+            job_id=job.id,
+        )
+    )
+    db.commit()
+    return _AwaitingEpisode(media_id, attempt_id, job.id, user.id)
+
+
+def _poll(
+    db: Session, sessions: sessionmaker[Session], episode: _AwaitingEpisode
+) -> dict[str, object]:
+    """Claim the ingest job and run one worker pass over the attempt."""
+    job = claim_job(db, job_id=episode.job_id, worker_id=_WORKER, lease_seconds=300)
+    assert job is not None, "the ingest job was not due"
+    db.commit()
+    context = JobExecutionContext(job_id=job.id, worker_id=_WORKER, attempt_no=job.attempts)
+    return run_source_attempt(
+        session_factory=sessions,
+        media_id=episode.media_id,
+        attempt_id=episode.attempt_id,
+        actor_user_id=episode.actor_user_id,
+        request_id=None,
+        context=context,
+    )
+
+
+def _provider_state(db: Session, episode: _AwaitingEpisode) -> tuple[object, ...]:
+    db.expire_all()
+    return tuple(
+        db.execute(
+            text(
+                """
+                SELECT job.provider_request_id, job.provider_diarize,
+                       job.provider_result IS NOT NULL, job.status, attempt.run_count,
+                       attempt.status
+                FROM podcast_transcription_jobs job
+                JOIN media_source_attempts attempt ON attempt.media_id = job.media_id
+                WHERE job.media_id = :media_id
+                """
+            ),
+            {"media_id": episode.media_id},
+        ).one()
+    )
+
+
+def _listen_payload(request_id: str) -> dict[str, object]:
+    return {
+        "metadata": {"request_id": request_id, "duration": 12.0, "channels": 1},
+        "results": {
+            "channels": [{"alternatives": [{"transcript": "Welcome back. Today, tides."}]}],
+            "utterances": [
+                {"start": 0.0, "end": 6.0, "transcript": "Welcome back.", "speaker": 0},
+                {"start": 6.0, "end": 12.0, "transcript": "Today, tides.", "speaker": 1},
+            ],
+        },
+    }
+
+
+def test_callback_wakes_the_yielded_attempt_and_polls_do_not_count_as_runs(
+    db_session: Session,
+    sessions: sessionmaker[Session],
+    test_user: UserRecord,
+    anonymous_client: TestClient,
+    deepgram: _QueuedDeepgram,
+) -> None:
+    episode = _awaiting_episode(db_session, test_user, diarize=True, submitted_at=datetime.now(UTC))
+
+    with pytest.raises(TranscriptionAwaitingProvider) as waiting:
+        _poll(db_session, sessions, episode)
+    assert _provider_state(db_session, episode) == (
+        "dg-proof-0",
+        True,
+        False,
+        "running",
+        1,
+        "running",
+    ), "a poll before the callback must neither resubmit nor count as a run"
+    context = JobExecutionContext(job_id=episode.job_id, worker_id=_WORKER, attempt_no=1)
+    assert reschedule_running_job(
+        db_session,
+        job_id=context.job_id,
+        worker_id=context.worker_id,
+        attempt_no=context.attempt_no,
+        available_at=waiting.value.available_at,
+    )
+    db_session.commit()
+
+    body = json.dumps(_listen_payload("dg-proof-0"))
+    forged = anonymous_client.post(f"{_CALLBACK_PATH}?token=not-the-secret", content=body)
+    assert forged.status_code == 401, forged.text
+    unknown = anonymous_client.post(
+        f"{_CALLBACK_PATH}?token={_SECRET}", content=json.dumps(_listen_payload("dg-elsewhere"))
+    )
+    assert unknown.status_code == 404, unknown.text
+    assert _provider_state(db_session, episode)[2] is False, "a rejected delivery was stored"
+
+    delivered = anonymous_client.post(f"{_CALLBACK_PATH}?token={_SECRET}", content=body)
+    assert delivered.status_code == 200, delivered.text
+    assert delivered.json()["data"] == {"processed": True}
+    redelivered = anonymous_client.post(f"{_CALLBACK_PATH}?token={_SECRET}", content=body)
+    assert redelivered.json()["data"] == {"processed": False}
+    assert db_session.execute(
+        text("SELECT available_at <= now() FROM background_jobs WHERE id = :job_id"),
+        {"job_id": episode.job_id},
+    ).scalar_one(), "the callback did not wake the yielded ingest job"
+
+    _poll(db_session, sessions, episode)
+    assert _provider_state(db_session, episode) == (
+        None,
+        None,
+        False,
+        "completed",
+        1,
+        "succeeded",
+    )
+    assert deepgram.submissions == []
+    segments = db_session.execute(
+        text(
+            """
+            SELECT canonical_text
+            FROM podcast_transcript_segments
+            WHERE media_id = :media_id
+            ORDER BY segment_idx
+            """
+        ),
+        {"media_id": episode.media_id},
+    ).scalars()
+    assert list(segments) == ["Welcome back.", "Today, tides."]
+
+
+def test_failed_diarized_delivery_resubmits_once_without_diarization(
+    db_session: Session,
+    sessions: sessionmaker[Session],
+    test_user: UserRecord,
+    deepgram: _QueuedDeepgram,
+) -> None:
+    episode = _awaiting_episode(
+        db_session,
+        test_user,
+        diarize=True,
+        submitted_at=datetime.now(UTC),
+        provider_result={"metadata": {"request_id": "dg-proof-0"}, "results": {"channels": []}},
+    )
+
+    with pytest.raises(TranscriptionAwaitingProvider):
+        _poll(db_session, sessions, episode)
+
+    assert deepgram.submissions == [False]
+    assert _provider_state(db_session, episode) == (
+        "dg-proof-1",
+        False,
+        False,
+        "running",
+        1,
+        "running",
+    )
+
+
+def test_missing_callback_times_out_and_clears_the_request_for_the_retry(
+    db_session: Session,
+    sessions: sessionmaker[Session],
+    test_user: UserRecord,
+    deepgram: _QueuedDeepgram,
+) -> None:
+    deadline = get_settings().podcast_transcription_callback_deadline_seconds
+    episode = _awaiting_episode(
+        db_session,
+        test_user,
+        diarize=True,
+        submitted_at=datetime.now(UTC) - timedelta(seconds=deadline + 60),
+    )
+
+    with pytest.raises(ApiError) as expired:
+        _poll(db_session, sessions, episode)
+
+    assert expired.value.code is ApiErrorCode.E_TRANSCRIPTION_TIMEOUT
+    assert deepgram.submissions == []
+    assert _provider_state(db_session, episode) == (
+        None,
+        None,
+        False,
+        "running",
+        1,
+        "running",
+    ), "an expired request must not survive into the job's retry"
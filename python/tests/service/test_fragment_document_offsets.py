@@ -0,0 +1,58 @@
+"""Priority proof: stored cumulative fragment offsets equal the prefix sums the
+readers used to compute per request."""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from nexus.db.models import Fragment, Media, MediaKind, ProcessingStatus
+from nexus.services.media_document_metrics import refresh_fragment_document_offsets
+
+
+def test_refresh_materializes_prefix_sums_over_lower_fragments(db_session: Session) -> None:
+    media_id = uuid4()
+    db_session.add(
+        Media(
+            id=media_id,
+            kind=MediaKind.epub.value,
+            title="Offset proof",
+            processing_status=ProcessingStatus.ready_for_reading,
+        )
+    )
+    for idx, body in enumerate(("One two three.", "Naïve café bar", "", "four  five")):
+        db_session.add(
+            Fragment(
+                media_id=media_id,
+                idx=idx,
+                canonical_text=body,
+                html_sanitized=f"<p>{body}</p>",
+            )
+        )
+    db_session.flush()
+
+    refresh_fragment_document_offsets(db_session, media_id)
+
+    stored = db_session.execute(
+        select(Fragment.idx, Fragment.document_word_start, Fragment.document_char_start)
+        .where(Fragment.media_id == media_id)
+        .order_by(Fragment.idx)
+    ).all()
+    reference = db_session.execute(
+        text(
+            """
+            SELECT idx,
+                   COALESCE(SUM(canonical_text_word_count) OVER prior, 0),
+                   COALESCE(SUM(char_length(canonical_text)) OVER prior, 0)
+            FROM fragments
+            WHERE media_id = :media_id
+            WINDOW prior AS (ORDER BY idx ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING)
+            ORDER BY idx
+            """
+        ),
+        {"media_id": media_id},
+    ).all()
+    assert [tuple(row) for row in stored] == [tuple(row) for row in reference]
+    assert [(row[1], row[2]) for row in stored] == [(0, 0), (3, 14), (6, 28), (6, 28)]
@@ -0,0 +1,133 @@
+"""Priority proof: Gutenberg Browse search follows a curator's author rename.
+
+The search documents used to be written only by the catalog sync, so a rename
+stayed invisible to Browse until the next sync ran. The proof renames through
+the contributor facade, runs no sync, and pages the results with a limit below
+the match count so the keyset cursor carries the second page.
+"""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from nexus.auth.middleware import Viewer
+from nexus.db.models import Contributor, ContributorCredit
+from nexus.schemas.contributors import ContributorRenameRequest
+from nexus.services import contributors as contributors_service
+from nexus.services.browse import gutenberg as gutenberg_browse
+from nexus.services.browse.models import BrowseKind, BrowseQuery, BrowseSource
+from nexus.services.contributor_taxonomy import (
+    RawCreditEntry,
+    assume_contributor_handle,
+    build_observation,
+)
+from nexus.services.gutenberg import refresh_project_gutenberg_search_documents
+from tests.testkit.auth import UserRecord
+
+_EBOOK_IDS = (990_001, 990_002, 990_003)
+
+
+def _browse(db: Session, viewer_id: UUID, query: str) -> tuple[list[tuple[str, str | None]], int]:
+    """Every page of one search as (title, first contributor display name), and the page count."""
+    found: list[tuple[str, str | None]] = []
+    cursor: str | None = None
+    pages = 0
+    while True:
+        items, cursor = gutenberg_browse.search(
+            db,
+            viewer_id=viewer_id,
+            query=BrowseQuery(
+                query=query,
+                kind=BrowseKind.Epub,
+                source=BrowseSource.ProjectGutenberg,
+                sort=None,
+                limit=2,
+                cursor=cursor,
+            ),
+        )
+        pages += 1
+        found.extend((item.title, item.contributors[0].contributor_display_name) for item in items)
+        if cursor is None:
+            break
+    return found, pages
+
+
+def test_browse_search_sees_a_rename_without_a_catalog_sync(
+    db_session: Session,
+    test_user: UserRecord,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        contributors_service,
+        "get_session_factory",
+        lambda: sessionmaker(
+            bind=db_session.get_bind(),
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        ),
+    )
+    for download_count, ebook_id in enumerate(_EBOOK_IDS):
+        db_session.execute(
+            text(
+                """
+                INSERT INTO project_gutenberg_catalog (ebook_id, title, download_count)
+                VALUES (:ebook_id, :title, :download_count)
+                """
+            ),
+            {
+                "ebook_id": ebook_id,
+                "title": f"Lantern Almanac {ebook_id}",
+                "download_count": download_count,
+            },
+        )
+        observation, _truncated = build_observation(
+            {"author": (RawCreditEntry(credited_name="Odile Marchbank"),)}
+        )
+        contributors_service.apply_observed_role_slices_in_current_transaction(
+            db_session,
+            target=contributors_service.GutenbergTarget(ebook_id),
+            observation=observation,
+            source="project_gutenberg_catalog",
+        )
+    db_session.flush()
+    refresh_project_gutenberg_search_documents(db_session)
+
+    before, pages = _browse(db_session, test_user.id, "marchbank")
+    assert pages == 2, "three matches at limit 2 must span two keyset pages"
+    assert [title for title, _name in before] == [
+        "Lantern Almanac 990003",
+        "Lantern Almanac 990002",
+        "Lantern Almanac 990001",
+    ]
+    assert _browse(db_session, test_user.id, "brightwater") == ([], 1)
+
+    handle = db_session.scalar(
+        select(Contributor.handle)
+        .join(ContributorCredit, ContributorCredit.contributor_id == Contributor.id)
+        .where(ContributorCredit.project_gutenberg_catalog_ebook_id == _EBOOK_IDS[0])
+    )
+    assert handle is not None
+    contributors_service.ensure_contributor_display_name(
+        viewer=Viewer(
+            user_id=test_user.id,
+            default_library_id=test_user.default_library_id,
+            roles=frozenset({"contributor_curator"}),
+        ),
+        contributor_handle=assume_contributor_handle(handle),
+        request=ContributorRenameRequest.model_validate(
+            {"clientMutationId": "gutenberg-rename-proof", "displayName": "Odile Brightwater"}
+        ),
+    )
+
+    assert _browse(db_session, test_user.id, "brightwater") == (
+        [
+            ("Lantern Almanac 990003", "Odile Brightwater"),
+            ("Lantern Almanac 990002", "Odile Brightwater"),
+            ("Lantern Almanac 990001", "Odile Brightwater"),
+        ],
+        2,
+    ), "the rename must reach the search documents without a catalog sync"
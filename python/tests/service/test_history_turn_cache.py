@@ -0,0 +1,124 @@
+"""Priority proof: cached history turns and batched tool refs assemble the same context."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from uuid import uuid4
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from nexus.db.models import Conversation, Message, MessageToolCall
+from nexus.services.context_assembler import (
+    HistoryUnit,
+    _history_turn_cache,
+    _load_tool_events,
+    load_recent_history_units,
+)
+from tests.testkit.auth import UserRecord
+
+
+@contextmanager
+def _capture_statements(db: Session) -> Iterator[list[str]]:
+    statements: list[str] = []
+    connection = db.connection()
+
+    def capture_statement(
+        _connection: object,
+        _cursor: object,
+        statement: str,
+        _parameters: object,
+        _context: object,
+        _executemany: bool,
+    ) -> None:
+        statements.append(" ".join(statement.split()))
+
+    event.listen(connection, "before_cursor_execute", capture_statement)
+    try:
+        yield statements
+    finally:
+        event.remove(connection, "before_cursor_execute", capture_statement)
+
+
+def test_cached_history_matches_the_uncached_read_with_fewer_queries(
+    db_session: Session,
+    test_user: UserRecord,
+) -> None:
+    """The warm path reads only the id/role path; rendered turns are byte-identical."""
+    conversation = Conversation(
+        id=uuid4(),
+        owner_user_id=test_user.id,
+        title="History cache proof",
+        sharing="private",
+        next_seq=6,
+    )
+    db_session.add(conversation)
+    db_session.flush()
+    turns = [
+        ("user", "What does chapter one argue?"),
+        ("assistant", "That attention is a scarce resource."),
+        ("user", "And chapter two?"),
+        ("assistant", "That habits shape what we notice."),
+        ("user", "Compare them."),
+    ]
+    parent_id = None
+    messages: list[Message] = []
+    for seq, (role, content) in enumerate(turns, start=1):
+        message = Message(
+            id=uuid4(),
+            conversation_id=conversation.id,
+            seq=seq,
+            role=role,
+            content=content,
+            status="complete",
+            parent_message_id=parent_id,
+        )
+        db_session.add(message)
+        db_session.flush()
+        messages.append(message)
+        parent_id = message.id
+    db_session.flush()
+
+    def load() -> list[HistoryUnit]:
+        return load_recent_history_units(
+            db_session, conversation_id=conversation.id, before_seq=len(turns)
+        )
+
+    _history_turn_cache.clear()
+    try:
+        with _capture_statements(db_session) as cold_statements:
+            cold = load()
+        with _capture_statements(db_session) as warm_statements:
+            warm = load()
+    finally:
+        _history_turn_cache.clear()
+
+    assert warm == cold
+    assert [turn.content for unit in cold for turn in unit.turns] == [
+        content for _, content in turns[:-1]
+    ]
+    assert len(cold_statements) == 2
+    assert len(warm_statements) == 1, "a warm history read must not refetch message content"
+
+    assistant = messages[3]
+    for index in range(3):
+        db_session.add(
+            MessageToolCall(
+                conversation_id=conversation.id,
+                user_message_id=messages[2].id,
+                assistant_message_id=assistant.id,
+                tool_name="app_search",
+                tool_call_index=index,
+                status="complete",
+            )
+        )
+    db_session.flush()
+
+    with _capture_statements(db_session) as tool_statements:
+        call_events, result_events = _load_tool_events(
+            db_session, assistant_message_id=assistant.id
+        )
+    assert [event["tool_call_index"] for event in call_events] == [0, 1, 2]
+    assert [event["result_count"] for event in result_events] == [0, 0, 0]
+    assert len(tool_statements) == 2, "retrieval refs must load in one query for every call"
@@ -0,0 +1,139 @@
+"""Priority proof: steady listening heartbeats stay fenced while skipping the
+serialized path, and read-state transitions still take it."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import Engine, select
+from sqlalchemy.orm import Session
+
+from nexus.db.models import (
+    ConsumptionCompletionFact,
+    Media,
+    MediaKind,
+    ProcessingStatus,
+    ViewerCollectionRevision,
+)
+from nexus.errors import ApiErrorCode, ConflictError
+from nexus.schemas.consumption import ListeningHeartbeatIn
+from nexus.services.bootstrap import ensure_user_and_default_library
+from nexus.services.collection_revisions import CollectionFamily
+from nexus.services.consumption import service as consumption
+from nexus.services.library_entries import ensure_media_in_default_library
+
+
+@dataclass(frozen=True, slots=True)
+class _ListenableEpisode:
+    viewer_id: UUID
+    media_id: UUID
+
+
+@contextmanager
+def _committed_episode(engine: Engine) -> Iterator[_ListenableEpisode]:
+    """Publish one externally visible episode for fresh service sessions."""
+    viewer_id = uuid4()
+    media_id = uuid4()
+    with Session(engine) as db:
+        ensure_user_and_default_library(
+            db,
+            viewer_id,
+            f"heartbeat-proof-{viewer_id}@example.invalid",
+        )
+        db.add(
+            Media(
+                id=media_id,
+                kind=MediaKind.podcast_episode.value,
+                title="Heartbeat fast-path proof",
+                processing_status=ProcessingStatus.ready_for_reading,
+                created_by_user_id=viewer_id,
+            )
+        )
+        db.flush()
+        ensure_media_in_default_library(db, viewer_id, media_id)
+        db.commit()
+
+    yield _ListenableEpisode(viewer_id, media_id)
+
+
+def _heartbeat(*, position_ms: int, revision: int, sequence: int) -> ListeningHeartbeatIn:
+    return ListeningHeartbeatIn.model_validate(
+        {
+            "positionMs": position_ms,
+            "durationMs": {"kind": "Present", "value": 100_000},
+            "episodePlaybackRate": {"kind": "Absent"},
+            "expectedWriteRevision": revision,
+            "expectedResetEpoch": 0,
+            "heartbeatGeneration": str(UUID(int=1)),
+            "heartbeatSequence": sequence,
+        }
+    )
+
+
+def _episode_revision(engine: Engine, viewer_id: UUID) -> int:
+    with Session(engine) as oracle:
+        return int(
+            oracle.scalar(
+                select(ViewerCollectionRevision.revision).where(
+                    ViewerCollectionRevision.viewer_id == viewer_id,
+                    ViewerCollectionRevision.family == CollectionFamily.PodcastEpisodes.value,
+                )
+            )
+            or 0
+        )
+
+
+def test_steady_heartbeats_coalesce_collection_bumps_and_transitions_do_not(
+    engine: Engine,
+) -> None:
+    """Only the first write and the Finished transition advance collections."""
+    with _committed_episode(engine) as episode:
+        first = consumption.record_listening_heartbeat(
+            episode.viewer_id,
+            episode.media_id,
+            _heartbeat(position_ms=10_000, revision=0, sequence=0),
+        )
+        assert first.listening_state.write_revision == 1
+        bumped = _episode_revision(engine, episode.viewer_id)
+        assert bumped >= 1, "the first heartbeat must take the full path and bump collections"
+
+        steady = consumption.record_listening_heartbeat(
+            episode.viewer_id,
+            episode.media_id,
+            _heartbeat(position_ms=20_000, revision=1, sequence=1),
+        )
+        assert steady.listening_state.write_revision == 2
+        assert steady.listening_state.position_ms == 20_000
+        assert _episode_revision(engine, episode.viewer_id) == bumped, (
+            "a steady heartbeat inside the bump window must not advance collections"
+        )
+
+        with pytest.raises(ConflictError) as raised:
+            consumption.record_listening_heartbeat(
+                episode.viewer_id,
+                episode.media_id,
+                _heartbeat(position_ms=30_000, revision=1, sequence=2),
+            )
+        assert raised.value.code == ApiErrorCode.E_STALE_LISTENING_REVISION
+
+        finished = consumption.record_listening_heartbeat(
+            episode.viewer_id,
+            episode.media_id,
+            _heartbeat(position_ms=99_000, revision=2, sequence=3),
+        )
+        assert finished.listening_state.write_revision == 3
+        assert _episode_revision(engine, episode.viewer_id) > bumped, (
+            "crossing the Finished threshold must take the full path and bump collections"
+        )
+        with Session(engine) as oracle:
+            completions = oracle.scalars(
+                select(ConsumptionCompletionFact.id).where(
+                    ConsumptionCompletionFact.user_id == episode.viewer_id,
+                    ConsumptionCompletionFact.media_id == episode.media_id,
+                )
+            ).all()
+        assert len(completions) == 1, f"Finished transition must record one fact: {completions!r}"
@@ -0,0 +1,88 @@
+"""Priority proof: media search matches contributor names through an index.
+
+Contributor names live in ``contributor_search_tsv`` (0219), kept current by
+triggers on credits, aliases and display names. The proof searches by author,
+by title and author together, and by the author's new name after a rename, and
+requires the search predicate to be servable by the expression index.
+"""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from nexus.services import contributors as contributors_service
+from nexus.services.contributor_taxonomy import RawCreditEntry, build_observation
+from nexus.services.search.retrievers.media import _search_media
+from tests.testkit.auth import UserRecord
+from tests.testkit.llm_tool_scenarios import create_readable_media
+
+
+def _found(db: Session, viewer_id: UUID, query: str) -> list[UUID]:
+    return [
+        result.id
+        for result in _search_media(db, viewer_id, query, True, "all", None, None, [], [], 10)
+    ]
+
+
+def test_media_search_matches_contributor_names_through_the_index(
+    db_session: Session,
+    test_user: UserRecord,
+) -> None:
+    media_id = create_readable_media(
+        db_session,
+        user_id=test_user.id,
+        default_library_id=test_user.default_library_id,
+        title="Dune",
+        canonical_text="Arrakis is a desert planet.",
+    )
+    observation, _truncated = build_observation(
+        {"author": (RawCreditEntry(credited_name="Frank Herbert"),)}
+    )
+    contributors_service.apply_observed_role_slices_in_current_transaction(
+        db_session,
+        target=contributors_service.MediaTarget(media_id),
+        observation=observation,
+        source="web_article_byline",
+    )
+    db_session.flush()
+
+    assert media_id in _found(db_session, test_user.id, "herbert")
+    assert media_id in _found(db_session, test_user.id, "dune herbert"), (
+        "a title word and an author name must match one document"
+    )
+
+    db_session.execute(
+        text(
+            """
+            UPDATE contributors c
+            SET display_name = 'Franklin Patrick Herbert'
+            FROM contributor_credits cc
+            WHERE cc.contributor_id = c.id AND cc.media_id = :media_id
+            """
+        ),
+        {"media_id": media_id},
+    )
+    assert media_id in _found(db_session, test_user.id, "patrick"), (
+        "a rename must refresh the stored contributor document"
+    )
+
+    with db_session.begin_nested() as scope:
+        db_session.execute(text("SELECT set_config('enable_seqscan', 'off', true)"))
+        plan = "\n".join(
+            db_session.execute(
+                text(
+                    """
+                    EXPLAIN
+                    SELECT m.id
+                    FROM media m
+                    WHERE (m.search_tsv || m.contributor_search_tsv)
+                          @@ websearch_to_tsquery('english', 'herbert')
+                    """
+                )
+            ).scalars()
+        )
+        scope.rollback()
+    assert "ix_media_search_document" in plan
@@ -0,0 +1,63 @@
+"""Priority proof: the API's /metrics answers a bearer scrape through the real stack.
+
+The request histogram must carry route templates recorded by the middleware,
+and the database-wide queue depth must come only from the process designated
+by ``METRICS_QUEUE_DEPTH``, so series summed across scrape targets stay true.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from nexus.config import get_settings
+from nexus.metrics import PROMETHEUS_CONTENT_TYPE
+
+_TOKEN = "metrics-scrape-proof-token"
+
+
+@pytest.fixture
+def metrics_client(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> Generator[TestClient, None, None]:
+    monkeypatch.setenv("METRICS_ENABLED", "true")
+    monkeypatch.setenv("METRICS_TOKEN", _TOKEN)
+    monkeypatch.setenv("METRICS_QUEUE_DEPTH", "true" if request.param else "false")
+    get_settings.cache_clear()
+    try:
+        app: FastAPI = request.getfixturevalue("nexus_app")
+        with TestClient(app) as client:
+            yield client
+    finally:
+        get_settings.cache_clear()
+
+
+@pytest.mark.parametrize("metrics_client", [True, False], indirect=True)
+def test_metrics_scrape_needs_the_token_and_exports_queue_depth_once(
+    metrics_client: TestClient,
+    request: pytest.FixtureRequest,
+) -> None:
+    designated = request.node.callspec.params["metrics_client"]
+
+    assert metrics_client.get("/metrics").status_code == 401
+    assert (
+        metrics_client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    )
+    assert metrics_client.get("/livez").status_code == 200
+
+    scrape = metrics_client.get("/metrics", headers={"Authorization": f"Bearer {_TOKEN}"})
+
+    assert scrape.status_code == 200
+    assert scrape.headers["content-type"] == PROMETHEUS_CONTENT_TYPE
+    lines = scrape.text.splitlines()
+    assert "# TYPE nexus_http_request_duration_seconds histogram" in lines
+    assert any(
+        line.startswith(
+            'nexus_http_request_duration_seconds_count{method="GET",route="/livez",status="200"}'
+        )
+        for line in lines
+    )
+    assert ("# TYPE nexus_job_queue_depth gauge" in lines) is designated
@@ -0,0 +1,121 @@
+"""Priority proof: the halfvec candidate stage ranks like full precision.
+
+``SEARCH_QUANTIZED_CANDIDATES`` swaps the hybrid tail's ANN scan onto the
+16-bit index and re-ranks the over-fetch by exact cosine. The candidate pool
+is shrunk below the corpus size so both stages actually cut, and the index is
+forced, so the proof compares the two HNSW paths rather than two full sorts.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import random
+from uuid import UUID
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from nexus.config import get_settings
+from nexus.db.models import Fragment
+from nexus.services import semantic_chunks
+from nexus.services.content_indexing import rebuild_fragment_content_index
+from nexus.services.search.retrievers import library_content
+from nexus.services.semantic_chunks import build_text_embedding
+from tests.testkit.auth import UserRecord
+from tests.testkit.llm_tool_scenarios import create_readable_media
+
+
+def _topical_unit_vectors(texts: list[str], *, dimensions: int) -> list[list[float]]:
+    """One shared direction plus per-text noise: every chunk clears the similarity floor."""
+    topic = random.Random(0)
+    base = [topic.gauss(0.0, 1.0) for _ in range(dimensions)]
+    base_norm = math.sqrt(sum(component * component for component in base))
+    vectors = []
+    for value in texts:
+        rng = random.Random(hashlib.sha256(value.encode()).digest())
+        noise = [rng.gauss(0.0, 1.0) for _ in range(dimensions)]
+        noise_norm = math.sqrt(sum(component * component for component in noise))
+        vector = [b / base_norm + 0.8 * n / noise_norm for b, n in zip(base, noise, strict=True)]
+        norm = math.sqrt(sum(component * component for component in vector))
+        vectors.append([component / norm for component in vector])
+    return vectors
+
+
+def _indexed_media(db: Session, user: UserRecord, body: str) -> UUID:
+    media_id = create_readable_media(
+        db,
+        user_id=user.id,
+        default_library_id=user.default_library_id,
+        title=body,
+        canonical_text=body,
+    )
+    rebuild_fragment_content_index(
+        db,
+        media_id=media_id,
+        source_kind="web_article",
+        fragments=list(db.scalars(select(Fragment).where(Fragment.media_id == media_id))),
+        reason="quantized_candidates_proof",
+    )
+    return media_id
+
+
+def _ranked(db: Session, user: UserRecord, query: str) -> list[tuple[UUID, float]]:
+    with db.begin_nested() as scope:
+        db.execute(text("SELECT set_config('enable_sort', 'off', true)"))
+        results = library_content._search_content_chunks(
+            db,
+            user.id,
+            query,
+            build_text_embedding(query),
+            True,
+            "all",
+            None,
+            None,
+            [],
+            [],
+            5,
+        )
+        scope.rollback()
+    return [(result.id, result.score.raw) for result in results]
+
+
+def test_quantized_candidates_rank_like_full_precision(
+    db_session: Session,
+    test_user: UserRecord,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(semantic_chunks, "_embed_with_openai", _topical_unit_vectors)
+    # ann_limit = max(10, 5 * 2) = 10 of 40 chunks; the halfvec stage fetches 20.
+    monkeypatch.setattr(library_content, "CONTENT_CHUNK_MIN_ANN_CANDIDATES", 10)
+    monkeypatch.setattr(library_content, "CONTENT_CHUNK_ANN_CANDIDATE_MULTIPLIER", 2)
+    settings = get_settings()
+    monkeypatch.setattr(settings, "search_quantized_rerank_factor", 2)
+
+    media_ids = [
+        _indexed_media(db_session, test_user, f"Tidal passage {index}") for index in range(40)
+    ]
+    assert (
+        db_session.execute(
+            text(
+                """
+                SELECT count(*)
+                FROM content_embeddings ce
+                JOIN content_chunks cc ON cc.id = ce.chunk_id
+                WHERE cc.owner_id = ANY(:media_ids) AND ce.embedding_halfvec IS NOT NULL
+                """
+            ),
+            {"media_ids": media_ids},
+        ).scalar_one()
+        == 40
+    ), "indexing must write the halfvec shadow alongside the full vector"
+
+    for query in ("unrelated words alpha", "unrelated words beta", "unrelated words gamma"):
+        monkeypatch.setattr(settings, "search_quantized_candidates", False)
+        full_precision = _ranked(db_session, test_user, query)
+        monkeypatch.setattr(settings, "search_quantized_candidates", True)
+        quantized = _ranked(db_session, test_user, query)
+
+        assert len(full_precision) == 5
+        assert quantized == full_precision
@@ -0,0 +1,113 @@
+"""Priority proof: batched read paths issue a fixed number of statements.
+
+Each budget is the exact statement count of the read, so a per-item query
+that creeps back in fails the proof even before the list grows large. Sessions
+open their savepoint before the budget so only the read itself is counted.
+"""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from nexus.db.models import Fragment
+from nexus.schemas.highlights import CreateHighlightRequest
+from nexus.services.content_indexing import rebuild_fragment_content_index
+from nexus.services.highlights import create_highlight_for_fragment, list_highlights_for_media
+from nexus.services.media_intelligence import current_content_fingerprints, read_batch
+from tests.testkit.auth import UserRecord
+from tests.testkit.llm_tool_scenarios import create_readable_media
+from tests.testkit.query_budget import assert_query_budget
+
+_TEXT = "Attention is the scarcest resource a reader has, and habits spend it first."
+
+
+def _indexed_media(db: Session, user: UserRecord, title: str) -> UUID:
+    media_id = create_readable_media(
+        db,
+        user_id=user.id,
+        default_library_id=user.default_library_id,
+        title=title,
+        canonical_text=_TEXT,
+    )
+    rebuild_fragment_content_index(
+        db,
+        media_id=media_id,
+        source_kind="web_article",
+        fragments=list(db.scalars(select(Fragment).where(Fragment.media_id == media_id))),
+        reason="query_budget_proof",
+    )
+    return media_id
+
+
+def test_read_batch_reads_summaries_and_fingerprints_once_for_every_media(
+    db_session: Session,
+    test_user: UserRecord,
+) -> None:
+    media_ids = [_indexed_media(db_session, test_user, f"Budget {index}") for index in range(4)]
+    current = current_content_fingerprints(db_session, media_ids=media_ids)
+    stale_id = media_ids[-1]
+    for media_id in media_ids:
+        # Indexing already queued a building head; publish it as ready.
+        db_session.execute(
+            text(
+                """
+                INSERT INTO media_summaries (media_id, content_fingerprint, summary_md,
+                                             model_name, status)
+                VALUES (:media_id, :fingerprint, :summary_md, 'budget-proof', 'ready')
+                ON CONFLICT (media_id) DO UPDATE
+                SET content_fingerprint = EXCLUDED.content_fingerprint,
+                    summary_md = EXCLUDED.summary_md,
+                    model_name = EXCLUDED.model_name,
+                    status = EXCLUDED.status
+                """
+            ),
+            {
+                "media_id": media_id,
+                "fingerprint": "stale" if media_id == stale_id else current[media_id],
+                "summary_md": f"Summary of {media_id}",
+            },
+        )
+
+    with assert_query_budget(2, max_repeats=1):
+        projections = read_batch(db_session, media_ids=media_ids)
+
+    assert set(projections) == set(media_ids[:-1]), "a stale head must be withheld"
+    assert {p.content_fingerprint for p in projections.values()} == {
+        current[media_id] for media_id in media_ids[:-1]
+    }
+
+
+def test_media_highlight_listing_does_not_load_anchors_per_highlight(
+    db_session: Session,
+    test_user: UserRecord,
+) -> None:
+    media_id = create_readable_media(
+        db_session,
+        user_id=test_user.id,
+        default_library_id=test_user.default_library_id,
+        title="Highlight budget",
+        canonical_text=_TEXT,
+    )
+    fragment_id = db_session.scalars(select(Fragment.id).where(Fragment.media_id == media_id)).one()
+    spans = [(0, 9), (13, 21), (35, 41), (47, 53)]
+    created = [
+        create_highlight_for_fragment(
+            db_session,
+            test_user.id,
+            fragment_id,
+            CreateHighlightRequest(start_offset=start, end_offset=end, color="yellow"),
+        )
+        for start, end in spans
+    ]
+    db_session.expire_all()
+    db_session.connection()
+
+    # media, can_read_media, highlights with anchors, linked conversations, linked notes
+    with assert_query_budget(5, max_repeats=1):
+        listed = list_highlights_for_media(db_session, test_user.id, media_id)
+
+    assert [out.id for out in listed] == [out.id for out in created]
+    assert [(out.anchor.start_offset, out.anchor.end_offset) for out in listed] == spans
@@ -0,0 +1,169 @@
+"""Priority proof: the materialized visible-media set follows every input of the rule.
+
+The rebuild job is the check behind the triggers; it must find and repair drift
+measured against the rule itself.
+"""
+
+from __future__ import annotations
+
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import delete, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from nexus.auth.permissions import visible_media_ids_cte_sql, visible_media_ids_rule_sql
+from nexus.db.models import (
+    BillingEntitlementOverride,
+    Library,
+    Media,
+    MediaKind,
+    MediaTeardownIntent,
+    Membership,
+    ProcessingStatus,
+    UserMediaDeletion,
+)
+from nexus.jobs.queue import JobExecutionContext, RescheduleRequested, enqueue_job
+from nexus.services.bootstrap import ensure_user_and_default_library
+from nexus.services.library_entries import ensure_entry, media_target
+from nexus.services.resource_grants import UserGrantAudience, create_grant, delete_grant
+from nexus.services.resource_graph.refs import ResourceRef
+from nexus.tasks import viewer_visible_media_rebuild as rebuild
+from tests.testkit.auth import UserRecord
+
+
+def _assert_visible(db: Session, viewer_id: UUID, step: str, expected: set[UUID]) -> None:
+    params = {"viewer_id": viewer_id}
+    materialized = set(db.execute(text(visible_media_ids_cte_sql()), params).scalars())
+    rule = set(db.execute(text(visible_media_ids_rule_sql()), params).scalars())
+    assert rule == expected, f"{step}: the rule admits {rule!r}, expected {expected!r}"
+    assert materialized == rule, f"{step}: viewer_visible_media {materialized!r} != rule {rule!r}"
+
+
+def test_viewer_visible_media_tracks_memberships_grants_tombstones_and_teardown(
+    db_session: Session,
+    test_user: UserRecord,
+) -> None:
+    """Each change to an input of the rule leaves the table equal to the rule."""
+    reader_id = uuid4()
+    ensure_user_and_default_library(db_session, reader_id, f"vvm-{reader_id}@example.invalid")
+    shelf_id = uuid4()
+    shared_id, granted_id = uuid4(), uuid4()
+    db_session.add(
+        Library(id=shelf_id, owner_user_id=test_user.id, name="Shared shelf", is_default=False)
+    )
+    for media_id, title in ((shared_id, "Shared"), (granted_id, "Granted")):
+        db_session.add(
+            Media(
+                id=media_id,
+                kind=MediaKind.web_article.value,
+                title=title,
+                requested_url=f"https://vvm.invalid/{media_id}",
+                processing_status=ProcessingStatus.ready_for_reading,
+                created_by_user_id=test_user.id,
+            )
+        )
+    db_session.add(
+        BillingEntitlementOverride(
+            user_id=test_user.id, plan_tier="plus", reason="viewer_visible_media priority proof"
+        )
+    )
+    db_session.flush()
+    db_session.add(Membership(library_id=shelf_id, user_id=test_user.id, role="admin"))
+    ensure_entry(db_session, shelf_id, media_target(shared_id))
+    ensure_entry(db_session, test_user.default_library_id, media_target(granted_id))
+    db_session.commit()
+
+    db_session.add(Membership(library_id=shelf_id, user_id=reader_id, role="member"))
+    db_session.commit()
+    _assert_visible(db_session, reader_id, "membership added", {shared_id})
+
+    grant = create_grant(
+        db_session,
+        viewer_user_id=test_user.id,
+        subject=ResourceRef("media", granted_id),
+        audience=UserGrantAudience(user_id=reader_id),
+    ).grant
+    _assert_visible(db_session, reader_id, "grant created", {shared_id, granted_id})
+
+    db_session.add(UserMediaDeletion(user_id=reader_id, media_id=shared_id))
+    db_session.commit()
+    _assert_visible(db_session, reader_id, "tombstone added", {granted_id})
+
+    db_session.execute(
+        delete(UserMediaDeletion).where(
+            UserMediaDeletion.user_id == reader_id, UserMediaDeletion.media_id == shared_id
+        )
+    )
+    db_session.commit()
+    _assert_visible(db_session, reader_id, "tombstone removed", {shared_id, granted_id})
+
+    delete_grant(db_session, viewer_user_id=test_user.id, handle=grant.handle)
+    _assert_visible(db_session, reader_id, "grant revoked", {shared_id})
+
+    db_session.add(MediaTeardownIntent(id=uuid4(), media_id=shared_id))
+    db_session.commit()
+    _assert_visible(db_session, reader_id, "teardown armed", set())
+
+
+def test_rebuild_repairs_rows_that_drifted_from_the_rule(
+    db_session: Session,
+    test_user: UserRecord,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        rebuild,
+        "get_session_factory",
+        lambda: sessionmaker(
+            bind=db_session.get_bind(),
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        ),
+    )
+    reader_id = uuid4()
+    ensure_user_and_default_library(db_session, reader_id, f"vvm-{reader_id}@example.invalid")
+    shelf_id = uuid4()
+    kept_id, hidden_id = uuid4(), uuid4()
+    db_session.add(
+        Library(id=shelf_id, owner_user_id=test_user.id, name="Drift shelf", is_default=False)
+    )
+    for media_id, title in ((kept_id, "Kept"), (hidden_id, "Hidden")):
+        db_session.add(
+            Media(
+                id=media_id,
+                kind=MediaKind.web_article.value,
+                title=title,
+                requested_url=f"https://vvm.invalid/{media_id}",
+                processing_status=ProcessingStatus.ready_for_reading,
+                created_by_user_id=test_user.id,
+            )
+        )
+    db_session.flush()
+    db_session.add(Membership(library_id=shelf_id, user_id=reader_id, role="member"))
+    ensure_entry(db_session, shelf_id, media_target(kept_id))
+    db_session.flush()
+    _assert_visible(db_session, reader_id, "before drift", {kept_id})
+
+    # Drift the table both ways behind the triggers' back.
+    db_session.execute(
+        text("DELETE FROM viewer_visible_media WHERE user_id = :user_id"), {"user_id": reader_id}
+    )
+    db_session.execute(
+        text("INSERT INTO viewer_visible_media (user_id, media_id) VALUES (:user_id, :media_id)"),
+        {"user_id": reader_id, "media_id": hidden_id},
+    )
+    # Start the walk at the reader: the batch then holds the reader and the
+    # users after it.
+    job = enqueue_job(
+        db_session,
+        kind=rebuild.VIEWER_VISIBLE_MEDIA_REBUILD_JOB_KIND,
+        payload={"afterUserId": str(UUID(int=reader_id.int - 1))},
+    )
+    db_session.flush()
+    context = JobExecutionContext(job_id=job.id, worker_id="vvm-rebuild-proof", attempt_no=1)
+
+    outcome = rebuild.viewer_visible_media_rebuild(payload=job.payload, context=context)
+
+    summary = outcome.payload if isinstance(outcome, RescheduleRequested) else outcome
+    assert summary is not None and summary["repairedPairs"] == 2
+    _assert_visible(db_session, reader_id, "after rebuild", {kept_id})
@@ -10,6 +10,8 @@ import os
 import re
 import socket
 import threading
+import time
+import urllib.request
 import wave
 from collections.abc import Iterator
 from contextlib import contextmanager
@@ -24,6 +26,7 @@ from urllib.parse import parse_qs, urlsplit
 PODCAST_API_KEY = "nexus-test-fixture-podcast-key"
 PODCAST_API_SECRET = "nexus-test-fixture-podcast-secret"
 OPENAI_API_KEY = "nexus-test-fixture-openai-key"
+DEEPGRAM_API_KEY = "nexus-test-fixture-deepgram-key"
 
 PODCAST_REF = "nasa-hwhap-real-media"
 EPISODE_REF = "nasa-hwhap-crew4"
@@ -91,8 +94,14 @@ class ExternalProtocolServer(ThreadingHTTPServer):
         self.corpus = corpus
         self._evidence_lock = threading.Lock()
         self._durable_ambiguity_requests = 0
+        self._deepgram_requests = 0
         super().__init__(("127.0.0.1", port), ExternalProtocolHandler)
 
+    def next_deepgram_request_id(self) -> str:
+        with self._evidence_lock:
+            self._deepgram_requests += 1
+            return f"dg-nexus-fixture-{self._deepgram_requests}"
+
     def record_durable_ambiguity_request(self) -> int:
         """Record what the provider boundary observed before accepting dispatch."""
         database_url = os.environ.get("DATABASE_URL", "").replace(
@@ -180,6 +189,9 @@ class ExternalProtocolHandler(BaseHTTPRequestHandler):
     def do_POST(self) -> None:  # noqa: N802 - stdlib handler API
         try:
             target = self._target()
+            if target.host == "127.0.0.1" and target.path == "/v1/listen":
+                self._serve_deepgram_listen(target)
+                return
             if target.host != "127.0.0.1" or target.query:
                 raise RequestRejected(404, "unknown_path")
             if target.path == "/v1/responses":
@@ -406,6 +418,39 @@ class ExternalProtocolHandler(BaseHTTPRequestHandler):
             },
         )
 
+    def _serve_deepgram_listen(self, target: RequestTarget) -> None:
+        """Pre-recorded listen: synchronous, or queued with a callback delivery."""
+        if self.headers.get("authorization") != f"Token {DEEPGRAM_API_KEY}":
+            raise RequestRejected(401, "invalid_deepgram_auth")
+        queries = _query(target.query)
+        _require_keys(
+            queries,
+            {"model", "diarize", "utterances", "smart_format", "punctuate", "language"},
+            optional={"callback"},
+        )
+        diarize = _one(queries, "diarize")
+        if diarize not in {"true", "false"}:
+            raise RequestRejected(400, "invalid_diarize")
+        if self._read_json_body().get("url") != self._audio_url():
+            raise RequestRejected(400, "unknown_audio_url")
+
+        request_id = self.server.next_deepgram_request_id()
+        payload = _deepgram_listen_payload(
+            self.server.corpus.transcript, request_id=request_id, diarize=diarize == "true"
+        )
+        if "callback" not in queries:
+            self._send_json(200, payload)
+            return
+        callback_url = _one(queries, "callback")
+        if urlsplit(callback_url).scheme not in {"http", "https"}:
+            raise RequestRejected(400, "invalid_callback_url")
+        self._send_json(200, {"request_id": request_id})
+        threading.Thread(
+            target=_deliver_deepgram_callback,
+            args=(callback_url, payload),
+            daemon=True,
+        ).start()
+
     def _read_openai_json(self) -> dict[str, Any]:
         if self.headers.get("authorization") != f"Bearer {OPENAI_API_KEY}":
             raise RequestRejected(401, "invalid_openai_auth")
@@ -500,6 +545,54 @@ def _deterministic_embedding(value: str, dimensions: int) -> list[float]:
     return [component / norm for component in vector] if norm else vector
 
 
+def _deepgram_listen_payload(
+    transcript: bytes, *, request_id: str, diarize: bool
+) -> dict[str, Any]:
+    """Deterministic utterances: one per transcript paragraph over the fixture audio."""
+    paragraphs = [
+        " ".join(paragraph.split())
+        for paragraph in transcript.decode("utf-8").split("\n\n")
+        if paragraph.strip()
+    ]
+    duration = 24.0
+    step = duration / max(len(paragraphs), 1)
+    utterances = [
+        {
+            "start": round(index * step, 3),
+            "end": round((index + 1) * step, 3),
+            "transcript": paragraph,
+            "speaker": index % 2 if diarize else None,
+        }
+        for index, paragraph in enumerate(paragraphs)
+    ]
+    return {
+        "metadata": {"request_id": request_id, "duration": duration, "channels": 1},
+        "results": {
+            "channels": [{"alternatives": [{"transcript": " ".join(paragraphs)}]}],
+            "utterances": utterances,
+        },
+    }
+
+
+def _deliver_deepgram_callback(callback_url: str, payload: dict[str, Any]) -> None:
+    """POST the finished result like Deepgram does, retrying non-2xx deliveries."""
+    body = json.dumps(payload, separators=(",", ":")).encode()
+    for delay in (0.05, 0.25, 1.0):
+        time.sleep(delay)
+        request = urllib.request.Request(
+            callback_url,
+            data=body,
+            headers={"content-type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=10) as response:
+                if 200 <= response.status < 300:
+                    return
+        except OSError:
+            continue
+
+
 def create_server(*, port: int, fixture_root: Path) -> ExternalProtocolServer:
     if not 0 <= port <= 65_535:
         raise ValueError("port must be between 0 and 65535")
@@ -0,0 +1,30 @@
+"""Query-budget assertions for proofs that lock in statement counts."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from nexus.db.query_stats import QueryStats, track_queries
+
+
+@contextmanager
+def assert_query_budget(
+    max_statements: int, *, max_repeats: int | None = None
+) -> Iterator[QueryStats]:
+    """Fail when the block runs more statements, or repeats one more often, than allowed.
+
+    ``max_repeats`` bounds the most-issued fingerprint, which is how a
+    per-item loop query (N+1) shows up even when the total stays small.
+    """
+    with track_queries() as stats:
+        yield stats
+    fingerprints = stats.fingerprints.most_common()
+    assert stats.statements <= max_statements, (
+        f"ran {stats.statements} statements, budget {max_statements}: {fingerprints}"
+    )
+    if max_repeats is not None and fingerprints:
+        statement, count = fingerprints[0]
+        assert count <= max_repeats, (
+            f"statement issued {count} times, budget {max_repeats}: {statement}"
+        )